@@ -18,6 +18,7 @@ from mstrio.server import (
     Project,
     list_change_journal_entries,
     purge_change_journal_entries,
+    tail_change_journal_entries,
 )
 
 
@@ -62,6 +63,14 @@ entries_time_period = list_change_journal_entries(
 )
 print(len(entries_time_period))
 
+# Stream only entries added since the previous run. The high-water mark of
+# already consumed entries is persisted in the provided JSON file, so polling
+# can be safely resumed after a restart
+CURSOR_FILE_PATH = $cursor_file_path
+for entry in tail_change_journal_entries(
+    conn, cursor=CURSOR_FILE_PATH, affected_projects=SELECTED_PROJECT_ID
+):
+    print(entry.timestamp_iso, entry.transaction)
 
 # Get change journal entries for specific objects
 OBJECT_ID_1 = $object_id_1
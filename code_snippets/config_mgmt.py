@@ -64,6 +64,25 @@ int | float | None, default: 86400 (24h)
 """
 config.default_request_timeout
 
+"""Time (in seconds) for which each connection remembers IDs of objects it
+resolved from their names (e.g. `project_name`), so the same name is not
+looked up again. If `None`, IDs are remembered until invalidated with
+`mstrio.utils.resolvers.invalidate_resolution_cache()`; if `0`, they are
+not remembered at all.
+int | float | None, default: 300 (5min)
+"""
+config.resolution_cache_ttl
+
+"""Time (in seconds) for which elements of attributes of cubes and reports
+are kept in memory, so they are not loaded again by other objects of the same
+cube or report. If `None`, elements are kept until the version of the cube or
+report changes or they are invalidated with
+`mstrio.utils.attribute_elements.attribute_element_cache.invalidate()`;
+if `0`, they are not kept at all.
+int | float | None, default: 600 (10min)
+"""
+config.attribute_element_cache_ttl
+
 # [Config Methods]:
 """Toggle mstrio-py's logger debug level between INFO (default) and DEBUG."""
 config.toggle_debug_mode()
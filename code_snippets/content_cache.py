@@ -4,6 +4,7 @@ is to present what can be done with this module and to ease its usage.
 
 from mstrio.connection import get_connection
 from mstrio.project_objects.content_cache import ContentCache
+from mstrio.project_objects import ContentCacheInventory
 
 # Define a variable which can be later used in a script
 PROJECT_NAME = $project_name  # Insert name of project here
@@ -68,3 +69,18 @@ ContentCache.invalidate_caches(connection=conn, cache_ids=to_be_invalid)
 
 # Delete multiple content caches
 ContentCache.delete_caches(connection=conn, cache_ids=[CACHE_ID, OTHER_CACHE_ID])
+
+# Build an inventory of caches of many projects fetched concurrently from all
+# nodes. Supported filters (e.g. `status`, `content_type`, `owner`) are applied
+# on the server side, the rest is filtered locally on the inventory DataFrame
+OTHER_PROJECT_ID = $other_project_id  # Insert ID of other project
+DB_CONNECTION_ID = $db_connection_id  # Insert ID of database connection
+inventory = ContentCacheInventory(
+    conn, project_ids=[conn.project_id, OTHER_PROJECT_ID], content_type='report'
+)
+print(inventory.caches.head())
+caches_for_connection = inventory.filter(db_connection_id=DB_CONNECTION_ID)
+
+# Load or delete filtered caches in parallel batches
+inventory.load(caches_for_connection)
+inventory.delete(inventory.filter(unloaded=True), force=True)
@@ -6,6 +6,7 @@ ease its usage.
 """
 
 from mstrio.datasources import (
+    connectivity_statistics,
     DatasourceConnection,
     DatasourceInstance,
     DatasourceLogin,
@@ -22,6 +23,7 @@ from mstrio.datasources import (
     list_datasource_mappings,
     list_drivers,
     list_gateways,
+    test_datasource_connectivity,
 )
 from mstrio.connection import get_connection
 from mstrio.server import list_languages, Language
@@ -194,6 +196,15 @@ datasources = list_datasource_instances(
 )
 print(datasources)
 
+# Test connectivity of all datasources. Connections shared by datasources are
+# tested once, concurrently, and every test is aborted after the timeout
+connectivity = test_datasource_connectivity(conn, timeout=10)
+print(connectivity[connectivity['status'] != 'succeeded'])
+
+# Latency statistics per DBMS or per gateway (database type)
+print(connectivity_statistics(connectivity, by='dbms'))
+print(connectivity_statistics(connectivity, by='database_type'))
+
 # Define variables which can be later used in a script
 # Insert ID for datasource instance here
 DATASOURCE_INSTANCE_ID = $datasource_instance_id
@@ -208,6 +219,15 @@ print(datasource_instance)
 datasource_instance = DatasourceInstance(conn, name=DATASOURCE_INSTANCE_NAME)
 print(datasource_instance)
 
+# Execute many SQL queries on a datasource instance concurrently. Results are
+# returned as DataFrames with typed columns as soon as queries finish
+queries = {
+    'users': 'SELECT COUNT(*) AS users FROM lu_user',
+    'orders': 'SELECT COUNT(*) AS orders FROM order_fact',
+}
+for result in datasource_instance.execute_queries(PROJECT_ID, queries, timeout=60):
+    print(result.key, result.data if result.succeeded else result.error)
+
 # List dbms
 dbms = list_available_dbms(connection=conn)
 print(dbms)
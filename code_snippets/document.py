@@ -7,6 +7,7 @@ from mstrio.modeling import Prompt
 from mstrio.project_objects.document import (
     Document, list_documents, list_documents_across_projects
 )
+from mstrio.project_objects.document_export import ExportFormat, ExportTarget
 
 # Define a variable which can be later used in a script
 PROJECT_NAME = $project_name  # Insert name of project here
@@ -180,3 +181,30 @@ document.answer_prompts(
 )
 # Publish document
 document.publish()
+
+# Export many documents to files concurrently. Every document gets its own
+# instance, files are streamed to the directory and failed exports are
+# retried. Results are saved in the manifest, so rerunning with
+# `skip_existing=True` continues an interrupted export.
+EXPORT_DIRECTORY = $export_directory  # Insert path of directory for exported files
+MANIFEST_PATH = $manifest_path  # Insert path of JSON manifest of the export
+VISUALIZATION_KEY = $visualization_key  # Insert key of visualization to export
+
+export_results = Document.bulk_export(
+    conn,
+    targets=list_documents(connection=conn, project_id=PROJECT_ID)
+    + [
+        ExportTarget(
+            document_id=DOCUMENT_ID,
+            export_format=ExportFormat.CSV,
+            node_key=VISUALIZATION_KEY,
+        )
+    ],
+    directory=EXPORT_DIRECTORY,
+    export_format=ExportFormat.PDF,
+    max_workers=4,
+    manifest_path=MANIFEST_PATH,
+    skip_existing=True,
+)
+failed_exports = [result for result in export_results if result.error]
+print(failed_exports)
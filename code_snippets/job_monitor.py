@@ -11,7 +11,15 @@ Note: Some functionality is missing when working with 11.3.2 I-Server
 """
 
 from mstrio.server import (
-    Job, JobStatus, JobType, kill_all_jobs, kill_jobs, list_jobs, ObjectType, PUName
+    Job,
+    JobMonitor,
+    JobStatus,
+    JobType,
+    kill_all_jobs,
+    kill_jobs,
+    list_jobs,
+    ObjectType,
+    PUName,
 )
 from mstrio.server import Project
 from mstrio.users_and_groups import User
@@ -101,3 +109,33 @@ result = kill_all_jobs(conn, pu_name=PUName.SQL_ENGINE, memory_usage='gt:800')
 
 # like kill_jobs, kill_all_jobs return Success, PartialSuccess or MSTRException
 print(result.succeeded)
+
+# keep an in-memory table of jobs refreshed in the background and react
+# only to changes between polls
+MEMORY_LIMIT = $memory_limit  # memory usage in bytes
+ELAPSED_TIME_LIMIT = $elapsed_time_limit  # elapsed time in milliseconds
+
+
+def kill_runaway_jobs(changed_jobs):
+    runaway = changed_jobs[changed_jobs['memory_usage'] >= MEMORY_LIMIT]
+    if not runaway.empty:
+        monitor.kill(runaway)
+
+
+monitor = JobMonitor(
+    conn,
+    interval=1,
+    on_new=lambda new_jobs: print(f"{len(new_jobs)} new job(s)"),
+    on_changed=kill_runaway_jobs,
+    on_finished=lambda finished_jobs: print(list(finished_jobs.index)),
+    project_name=PROJECT_NAME,
+)
+with monitor:
+    ...  # polling is done in the background thread
+
+# poll manually and filter the latest snapshot of jobs
+delta = monitor.poll()
+long_running = monitor.filter(
+    status=JobStatus.EXECUTING, min_elapsed_time=ELAPSED_TIME_LIMIT
+)
+monitor.kill(long_running)
@@ -5,6 +5,7 @@ present what can be done with this module and to ease its usage.
 
 from mstrio.connection import get_connection
 from mstrio.modeling import (
+    ChangesetSession,
     DataType,
     DefaultSubtotals,
     Dimensionality,
@@ -340,5 +341,15 @@ expression_example = Expression(
 # Apply the change
 metr.alter(expression=expression_example)
 
+# Make many changes in a single changeset, committed once. Operations run with
+# `run()`, `submit()` or `map()` are run concurrently with `max_workers` > 1
+# and their failures are reported instead of raised
+with ChangesetSession(conn, max_workers=4) as session:
+    session.map(
+        lambda metric: metric.alter(description=METRIC_NEW_DESCRIPTION),
+        list_metrics(conn, name=METRIC_NEW_NAME),
+    )
+print(session.committed, session.failed)
+
 # Deleting metrics
 metr.delete(force=True)
@@ -233,8 +233,16 @@ my_obj_mig.reuse(target_env=conn_target, target_project_name=REUSE_TARGET_PROJEC
 REVERSE_TARGET_PROJECT_ID = $reverse_target_project_id
 my_obj_mig.reverse(target_env=conn_target, target_project_id=REVERSE_TARGET_PROJECT_ID)
 
-# Download migration package to local storage
+# Download migration package to local storage; the package is streamed to
+# the file, its size and SHA-256 hash are computed while it is being
+# downloaded and an interrupted download is resumed when the method is called
+# again
 downloaded = my_obj_mig.download_package(save_path="./")
+print(downloaded["filepath"], downloaded["size"], downloaded["sha256"])
+
+# Download migration package and also return its content
+downloaded = my_obj_mig.download_package(save_path="./", include_binary=True)
+package_binary = downloaded["file_binary"]
 
 # Import a migration package in target environment without use of S3 bucket
 # or other shared folder
@@ -248,6 +256,41 @@ from_file_mig = Migration.migrate_from_file(
     target_project_name=FILE_MIG_TARGET_PROJECT_NAME,
 )
 
+# Migrate many packages at once with `MigrationOrchestrator`. Packages which
+# do not depend on each other are migrated concurrently, up to
+# `max_concurrent_per_env` at once in each environment. Progress is saved in
+# the journal, so a run which was interrupted or had failures can be resumed
+# by calling `run()` again.
+from mstrio.object_management.migration import MigrationOrchestrator
+
+JOURNAL_PATH = $journal_path
+orchestrator = MigrationOrchestrator(
+    conn_source, max_concurrent_per_env=4, journal_path=JOURNAL_PATH
+)
+orchestrator.add_step(
+    "metrics",
+    package=lambda: Migration.create_object_migration(
+        connection=conn_source,
+        toc_view=package_config,
+        name="metrics_mig",
+        project_id=conn_source.project_id,
+    ),
+    target_env=conn_target,
+    target_project=TARGET_PROJECT_NAME,
+    validate=True,
+)
+orchestrator.add_step(
+    "object_mig",
+    package=my_obj_mig.id,
+    target_env=conn_target,
+    target_project=TARGET_PROJECT_NAME,
+    depends_on=["metrics"],
+)
+orchestrator.run()
+
+# Print time spent by every package in each phase of the migration
+print(orchestrator.timing_report(to_dataframe=True))
+
 # Create an Administration migration
 
 # Create PackageConfig with information what object should be migrated and how.
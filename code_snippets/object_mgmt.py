@@ -7,8 +7,11 @@ ease its usage.
 """
 
 from mstrio.object_management import (
+    crawl_folder,
     Folder,
+    FolderIndex,
     full_search,
+    get_folder_id_from_path,
     get_my_personal_objects_contents,
     get_predefined_folder_contents,
     get_search_results,
@@ -74,6 +77,25 @@ folder = Folder(conn, id=FOLDER_ID)
 contents_objs = folder.get_contents()
 contents_dict = folder.get_contents(to_dictionary=True)
 
+# get contents of a folder and all its subfolders, which are fetched concurrently
+contents_all = folder.get_contents(include_subfolders=True)
+
+FOLDER_PATH = $folder_path  # e.g. '/MicroStrategy Tutorial/Public Objects'
+INDEX_FILE_PATH = $index_file_path  # e.g. 'public_objects_index.json'
+
+# crawl a folder tree concurrently, processing objects as soon as they are found
+for obj in crawl_folder(conn, FOLDER_PATH, project=PROJECT_ID):
+    print(obj['path'], obj['id'])
+
+# keep a local index of paths and IDs of a folder tree; the first refresh
+# crawls the whole tree, later ones fetch only folders with changes
+index = FolderIndex(conn, INDEX_FILE_PATH, folder=FOLDER_PATH, project=PROJECT_ID)
+index.refresh()
+
+# find folders by paths and list contents without walking the tree
+get_folder_id_from_path(conn, FOLDER_PATH + '/Reports', index=index)
+index.list_contents(FOLDER_PATH + '/Reports', recursive=True)
+
 # alter name and description of a folder
 folder.alter(name=FOLDER_NAME, description=FOLDER_DESCRIPTION)
 
@@ -6,12 +6,13 @@ Its basic goal is to present what can be done with this module and to
 ease its usage.
 """
 
+from datetime import datetime, timedelta, timezone
 from pprint import pprint
 from time import sleep
 
 from mstrio.connection import get_connection
 from mstrio.helpers import IServerError
-from mstrio.project_objects import OlapCube, list_olap_cubes
+from mstrio.project_objects import CubeRefreshPlanner, OlapCube, list_olap_cubes
 from mstrio.server import Job, JobStatus
 
 
@@ -83,3 +84,22 @@ print(selected_cube.show_status())
 # and after refresh. If they are different, the refresh was successful.
 if before_last_update_time != after_last_update_time:
     print("Refresh was successful.")
+
+# Refresh many OLAP cubes at once. The planner reads status, last update time,
+# caches, partition settings and Incremental Refresh Reports of all cubes and
+# decides which should be refreshed incrementally, fully or skipped. Refreshes
+# are then run concurrently, at most 2 at a time on every node.
+planner = CubeRefreshPlanner(conn, max_concurrent_per_node=2)
+refresh_plans = planner.plan(
+    cubes,
+    # skip cubes already refreshed in this window, e.g. after restart
+    fresh_since=datetime.now(timezone.utc) - timedelta(hours=6),
+    # refresh fully cubes not updated for a week
+    full_refresh_after=timedelta(days=7),
+)
+for refresh_plan in refresh_plans:
+    print(refresh_plan.cube_name, refresh_plan.mode, refresh_plan.reason)
+
+# Execute the plan and check which refreshes failed
+refresh_plans = planner.execute(refresh_plans, timeout=3600)
+pprint([plan.to_dict() for plan in refresh_plans if plan.error])
@@ -90,6 +90,12 @@ same_env_dup_2 = project.duplicate(
 same_env_dup_2.wait_for_stable_status()
 print(same_env_dup_2.status)
 
+# Many duplications can also be tracked at once without blocking. Their
+# statuses are polled by one shared poller and each future is resolved with
+# the stable status of its duplication.
+futures = [dup.poll_stable_status() for dup in (same_env_dup_1, same_env_dup_2)]
+print([future.result() for future in futures])
+
 
 # Cross-environment project duplication
 
@@ -5,9 +5,19 @@ This script will not work without replacing parameters with real values.
 Its basic goal is to present what can be done with this module and to
 ease its usage.
 """
-from mstrio.connection import get_connection
+from mstrio.connection import Connection, get_connection
 from mstrio.datasources import DatasourceInstance
-from mstrio.server import DuplicationConfig, Environment, Project, compare_project_settings, list_languages
+from mstrio.server import (
+    DuplicationConfig,
+    Environment,
+    Project,
+    SettingsAuditor,
+    SettingsScope,
+    SettingsSnapshot,
+    compare_project_settings,
+    compare_snapshots,
+    list_languages,
+)
 from mstrio.server.project import LockType
 from mstrio.server.setting_types import FailedEmailDelivery
 
@@ -144,6 +154,28 @@ project1 = Project(connection=conn, name=PROJECT_1_NAME)
 project2 = Project(connection=conn, name=PROJECT_2_NAME)
 df_cmp = compare_project_settings(projects=[project, project1, project2], show_diff_only=True)
 
+# Define variables which can be later used in a script
+QA_BASE_URL = $qa_base_url  # URL of the REST API server of the other environment
+QA_USERNAME = $qa_username
+QA_PASSWORD = $qa_password
+SNAPSHOT_FILE = $snapshot_file  # Path of the file with settings snapshot, e.g. 'settings.json.gz'
+PREVIOUS_SNAPSHOT_FILE = $previous_snapshot_file  # Path of the snapshot taken previously
+
+# take a snapshot of server, node and project settings of many environments
+# at once and compare them; environments are named by keys of the dict
+qa_conn = Connection(QA_BASE_URL, QA_USERNAME, QA_PASSWORD)
+auditor = SettingsAuditor({'dev': conn, 'qa': qa_conn})
+snapshot = auditor.snapshot()
+# settings of server and projects which differ between environments
+df_env_diff = snapshot.diff(by='environment')
+# settings of projects which differ within every environment
+df_project_diff = snapshot.diff(by='target', scope=SettingsScope.PROJECT)
+# save the snapshot and compare it with a snapshot taken previously
+snapshot.save(SNAPSHOT_FILE)
+df_drift = compare_snapshots(
+    {'previous': SettingsSnapshot.load(PREVIOUS_SNAPSHOT_FILE), 'current': snapshot}
+)
+
 # Get the list of all settings and their values
 project_settings = project.settings.list_properties()
 # Get the list of all settings and their values with the settings description
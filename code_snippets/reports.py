@@ -188,5 +188,13 @@ page_by_dataframe = REPORT.to_dataframe(page_element_id=PAGE_BY_ATTRS_ID)
 # Print current page-by elements that were applied to above dataframe
 print(REPORT.current_page_by)
 
+# Extract all valid combinations of page-by elements at once. Pages are
+# fetched concurrently and a column is added for every page-by attribute
+all_pages_dataframe = REPORT.to_dataframe(all_pages=True, max_workers=8)
+
+# Process pages one by one without keeping all of them in memory
+for page_element_ids, page_dataframe in REPORT.iter_page_dataframes():
+    print(page_element_ids, len(page_dataframe))
+
 # Get sql property of a report
 sql = REPORT.sql
@@ -51,6 +51,14 @@ task = schema_mgmt.get_task(task_index=0)
 # object
 task_st = schema_mgmt.get_task(task_index=-1)
 
+# wait until the last task is no longer running
+task_st = schema_mgmt.wait_for_task(task_index=-1, timeout=600)
+
+# or track it without blocking and get notified when it is finished
+future = schema_mgmt.poll_task(
+    task_index=-1, callback=lambda f: print(f"Reload finished: {f.result().status}")
+)
+
 # Reload schema without asynchronous response. This will guarantee that the
 # schema reload task is completed before the next operation is performed.
 # If the task fails, an exception will be raised. This does not return any
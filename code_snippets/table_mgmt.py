@@ -17,6 +17,7 @@ from mstrio.modeling.schema.table import (
     list_warehouse_tables,
     LogicalTable,
     PhysicalTable,
+    WarehouseCatalog,
 )
 
 # Define variables which can be later used in a script
@@ -77,6 +78,18 @@ print(lu_item_table.list_columns())
 # List dependent logical tables of a Warehouse Table.
 print(lu_item_table.list_dependent_logical_tables())
 
+# Keep a local snapshot of the warehouse catalog in a SQLite file. The first
+# refresh crawls namespaces, tables and columns of all connected datasources
+# concurrently; next refreshes fetch columns only in namespaces whose list of
+# tables changed and return the tables which were added, removed or changed
+with WarehouseCatalog(conn, 'warehouse_catalog.db') as catalog:
+    diff = catalog.refresh()
+    print(diff.added, diff.removed, diff.changed)
+
+    # Lookups use only the local snapshot
+    print(catalog.list_tables(name=WAREHOUSE_TABLE_NAME))
+    print(catalog.find_columns('%_id'))
+
 # Add a Warehouse Table to a project. This will automatically create both a
 # logical table object and physical table object on the server
 
@@ -235,6 +248,19 @@ sql_table.update_physical_table_structure(TableColumnMergeOption.REUSE_ANY)
 sql_table.update_physical_table_structure(TableColumnMergeOption.REUSE_COMPATIBLE_DATA_TYPE)
 sql_table.update_physical_table_structure(TableColumnMergeOption.REUSE_MATCHED_DATA_TYPE)
 
+# Update structures of all tables concurrently, e.g. after a warehouse change.
+# With a fingerprint cache, tables whose warehouse columns did not change since
+# the previous run are skipped, and with a single changeset all updates are
+# committed at once
+results = LogicalTable.update_physical_table_structure_for_all_tables(
+    conn,
+    col_merge_option=TableColumnMergeOption.REUSE_ANY,
+    max_workers=8,
+    single_changeset=True,
+    fingerprint_cache='table_fingerprints.json',
+)
+print([result.table.name for result in results if result.error])
+
 # Delete a physical table.
 physical_table.delete(force=True)
 
@@ -39,6 +39,12 @@ list_users(
     to_dictionary=False, # If True returns dict, by default (False) returns User objects.
     id=[USER_ID_1, USER_ID_2],  # Different filtering methods are available in the docstring.
 )
+# List users as compact read-only records, which use much less memory than
+# User objects or dicts when listing a large number of users
+user_records = list_users(connection=conn, to_records=True)
+print(user_records[0].name, user_records[0].abbreviation)
+# Upgrade a record to a full User object when needed
+user = user_records[0].to_entity()
 # Get user by name
 user = User(connection=conn, name=USERNAME_0)
 # Get user by username
@@ -1,4 +1,20 @@
 # flake8: noqa
-from .privilege import Privilege, PrivilegeList
-from .privilege_mode import PrivilegeMode
-from .security_role import SecurityRole, list_security_roles
+from typing import TYPE_CHECKING
+
+from mstrio.utils.lazy_loading import attach_lazy_exports
+
+if TYPE_CHECKING:
+    from .privilege import Privilege, PrivilegeList
+    from .privilege_mode import PrivilegeMode
+    from .security_role import SecurityRole, list_security_roles
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'Privilege': '.privilege',
+        'PrivilegeList': '.privilege',
+        'PrivilegeMode': '.privilege_mode',
+        'SecurityRole': '.security_role',
+        'list_security_roles': '.security_role',
+    },
+)
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 from mstrio.modeling.expression import ExpressionFormat
 from mstrio.utils.error_handlers import ErrorHandler
 from mstrio.utils.helper import get_enum_val
-from mstrio.utils.version_helper import is_server_min_version
+from mstrio.utils.version_helper import get_server_capabilities
 
 if TYPE_CHECKING:
     from mstrio.connection import Connection
@@ -51,6 +51,22 @@ def cube_info(connection: 'Connection', id: str):
     return connection.get(endpoint=f'/api/cubes/?id={id}')
 
 
+@ErrorHandler(err_msg="Error getting information about cubes.")
+def cubes_info(connection: 'Connection', ids: list[str]):
+    """Get information for many cubes in a specific project at once. For
+    every cube the request returns the same data as `cube_info`.
+
+    Args:
+        connection: Strategy REST API connection object.
+        ids (list[str]): Unique IDs of the cubes you wish to extract
+            information from.
+
+    Returns:
+        Complete HTTP response object.
+    """
+    return connection.get(endpoint='/api/cubes/', params={'id': ids})
+
+
 @ErrorHandler(err_msg="Error getting cube {id} metadata information.")
 def get_cube_status(connection: 'Connection', id: str):
     """Get the status of a specific cube in a specific project.
@@ -95,7 +111,7 @@ def cube_instance(
     """
     body = body or {}
     params = {'offset': offset, 'limit': limit}
-    if is_server_min_version(connection, '11.2.0200'):
+    if get_server_capabilities(connection).supports('instance_fields'):
         params['fields'] = CUBE_FIELDS
 
     return connection.post(
@@ -133,7 +149,7 @@ def cube_instance_id(
         Complete HTTP response object.
     """
     params = {'offset': offset, 'limit': limit}
-    if is_server_min_version(connection, '11.2.0200'):
+    if get_server_capabilities(connection).supports('instance_fields'):
         params['fields'] = CUBE_FIELDS
 
     return connection.get(
@@ -155,7 +171,7 @@ def cube_instance_id_coroutine(
         Complete Future object.
     """
     params = {'offset': offset, 'limit': limit}
-    if is_server_min_version(future_session.connection, '11.2.0200'):
+    if get_server_capabilities(future_session.connection).supports('instance_fields'):
         params['fields'] = CUBE_FIELDS
 
     endpoint = f'/api/v2/cubes/{cube_id}/instances/{instance_id}'
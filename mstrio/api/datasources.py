@@ -368,7 +368,7 @@ def create_datasource_connection(connection, body, error_msg=None):
 
 
 @ErrorHandler(err_msg="Error testing Datasource connection.")
-def test_datasource_connection(connection, body, error_msg=None):
+def test_datasource_connection(connection, body, error_msg=None, timeout=None):
     """Test a datasource connection. Either provide a connection id, or the
     connection parameters within connection object.
 
@@ -376,12 +376,16 @@ def test_datasource_connection(connection, body, error_msg=None):
         connection: Strategy REST API connection object.
         body: Datasource Connection info.
         error_msg (string, optional): Custom Error Message for Error Handling
+        timeout (float, optional): Time in seconds after which the test is
+            aborted with `requests.Timeout`. Defaults to the request timeout
+            of the connection.
 
     Returns:
         Complete HTTP response object. HTTP STATUS 204/400
     """
     endpoint = '/api/datasources/connections/test'
-    return connection.post(endpoint=endpoint, json=body)
+    kwargs = {'timeout': timeout} if timeout is not None else {}
+    return connection.post(endpoint=endpoint, json=body, **kwargs)
 
 
 @ErrorHandler(
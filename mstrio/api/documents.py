@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from requests import Response
 
 from mstrio.utils.error_handlers import ErrorHandler
+from mstrio.utils.helper import response_handler
 
 if TYPE_CHECKING:
     from mstrio.connection import Connection
@@ -468,6 +469,53 @@ def export_document_to_excel(
     )
 
 
+def stream_document_export(
+    connection: 'Connection',
+    document_id: str,
+    instance_id: str,
+    export_format: str,
+    body: dict,
+    node_key: str | None = None,
+    error_msg: str | None = None,
+) -> 'Response':
+    """Export a document instance, or a single visualization of it, and get
+    the exported file as a stream, without loading the whole content into
+    memory.
+
+    Args:
+        connection: Strategy REST API connection object
+        document_id (string): Document ID
+        instance_id (string): Document Instance ID
+        export_format (string): Format of the export: 'pdf', 'excel' or
+            'mstr' for a document, 'pdf' or 'csv' for a visualization
+        body: JSON-formatted information used to format the document
+        node_key (string, optional): Visualization node key. If provided,
+            only the visualization is exported.
+        error_msg (string, optional): Custom Error Message for Error Handling
+
+    Returns:
+        HTTP response object with not yet consumed body. Exports to PDF are
+        returned as JSON with the file encoded in base64 in `data` field.
+    """
+    endpoint = f'/api/documents/{document_id}/instances/{instance_id}'
+    if node_key:
+        endpoint += f'/visualizations/{node_key}'
+    response = connection.post(
+        endpoint=f'{endpoint}/{export_format}',
+        headers={'X-MSTR-ProjectID': connection.project_id},
+        json=body,
+        stream=True,
+    )
+    if not response.ok:
+        if error_msg is None:
+            error_msg = (
+                f"Error exporting document {document_id} to "
+                f"{export_format.upper()} file."
+            )
+        response_handler(response, error_msg)
+    return response
+
+
 @ErrorHandler(err_msg="Error setting document {document_id} to prompt status.")
 def set_document_to_prompt_status(
     connection: 'Connection',
@@ -1,8 +1,14 @@
+from typing import TYPE_CHECKING
+
 import requests
 
 from mstrio.connection import Connection
 from mstrio.utils.api_helpers import add_comment_to_dict
 from mstrio.utils.error_handlers import ErrorHandler
+from mstrio.utils.helper import response_handler
+
+if TYPE_CHECKING:
+    from mstrio.utils.file_transfer import MultipartFileStream
 
 
 @ErrorHandler(err_msg="Error while creating the package holder")
@@ -417,6 +423,41 @@ def download_migration_package(
     )
 
 
+def stream_migration_package(
+    connection: Connection,
+    package_id: str,
+    offset: int = 0,
+    error_msg: str | None = None,
+) -> requests.Response:
+    """Get binary of a migration package as a stream, without loading
+    the whole content into memory.
+
+    Args:
+        connection (Connection): Strategy REST API connection object
+        package_id (str): The ID of the migration package to be downloaded
+        offset (int, optional): Number of bytes from which the content should
+            be returned, used to resume an interrupted download. Sent as HTTP
+            `Range` header, which might be ignored by the server.
+        error_msg (str, optional): Custom Error Message for Error Handling
+
+    Returns:
+        HTTP response object with not yet consumed body. Expected status: 200,
+        or 206 when `offset` was accepted.
+    """
+    response = connection.get(
+        endpoint=f'/api/migrations/packages/{package_id}/binary',
+        headers={'Range': f'bytes={offset}-'} if offset else None,
+        stream=True,
+    )
+    if not response.ok:
+        if error_msg is None:
+            error_msg = (
+                f"Error downloading migration package binary with ID: {package_id}"
+            )
+        response_handler(response, error_msg)
+    return response
+
+
 @ErrorHandler(err_msg="Error while creating new migration")
 def create_new_migration(
     connection: Connection,
@@ -644,6 +685,41 @@ def storage_service_download_file_binary(
     )
 
 
+def storage_service_stream_file_binary(
+    connection: Connection,
+    file_id: str,
+    offset: int = 0,
+    error_msg: str | None = None,
+) -> requests.Response:
+    """Get a file binary from storage service as a stream, without loading
+    the whole content into memory.
+
+    Args:
+        connection (Connection): Strategy REST API connection object
+        file_id (str): file ID
+        offset (int, optional): Number of bytes from which the content should
+            be returned, used to resume an interrupted download. Sent as HTTP
+            `Range` header, which might be ignored by the server.
+        error_msg (str, optional): Custom Error Message for Error Handling
+
+    Returns:
+        HTTP response object with not yet consumed body. 200 on success, or
+            206 when `offset` was accepted.
+    """
+    response = connection.get(
+        endpoint=(
+            f'/api/mstrServices/library/storage/sharedFileStore/files/{file_id}/binary'
+        ),
+        headers={'Range': f'bytes={offset}-'} if offset else None,
+        stream=True,
+    )
+    if not response.ok:
+        if error_msg is None:
+            error_msg = f"Error downloading file binary for ID {file_id}."
+        response_handler(response, error_msg)
+    return response
+
+
 @ErrorHandler(err_msg="Error uploading file binary for ID {file_id}.")
 def storage_service_upload_file_binary(
     connection: Connection,
@@ -674,6 +750,38 @@ def storage_service_upload_file_binary(
     )
 
 
+@ErrorHandler(err_msg="Error uploading file binary for ID {file_id}.")
+def storage_service_upload_file_stream(
+    connection: Connection,
+    file_id: str,
+    body: 'MultipartFileStream',
+    fields: str | None = None,
+    error_msg: str | None = None,
+):
+    """Upload a file binary to storage service, streaming it in chunks
+    instead of loading the whole content into memory.
+
+    Args:
+        connection (Connection): Strategy REST API connection object
+        file_id (str): file ID
+        body (MultipartFileStream): multipart request body with the file
+        fields (str, optional): A comma-separated list of fields to include
+                in the response. By default, all fields are returned.
+        error_msg (str, optional): Custom Error Message for Error Handling
+
+    Returns:
+        Complete HTTP response object. 200 on success.
+    """
+    return connection.put(
+        endpoint=(
+            f'/api/mstrServices/library/storage/sharedFileStore/files/{file_id}/binary'
+        ),
+        params={'fields': fields},
+        headers={'Content-Type': body.content_type},
+        data=body,
+    )
+
+
 @ErrorHandler(err_msg="Error deleting file binary with ID: {file_id}.")
 def delete_file_binary(
     connection: Connection,
@@ -1223,6 +1223,76 @@ def get_contents_caches(
     )
 
 
+def get_contents_caches_async(
+    future_session: 'FuturesSessionWithRenewal',
+    project_id: str,
+    node: str,
+    offset: int = 0,
+    limit: int = 1000,
+    status: str | None = None,
+    content_type: str | None = None,
+    content_format: str | None = None,
+    size: str | None = None,
+    owner: str | None = None,
+    expiration: str | None = None,
+    last_updated: str | None = None,
+    hit_count: str | None = None,
+    sort_by: str | None = None,
+    fields: str | None = None,
+):
+    """Get cache objects asynchronously.
+
+    Args:
+        future_session(object): Future Session object to call Strategy REST
+            Server asynchronously
+        project_id(str): Field to filter on project id (exact
+            match),
+        node(str): Node name,
+        offset(int): Starting point within the collection of returned results.
+            Used to control paging behavior. Default value = 0,
+        limit(int): Maximum number of items returned for a single request.
+            Used to control paging behavior. Maximum and default value: 1000,
+        status(str, optional): Status of the content cache,
+        content_type(str, optional): type of content,
+        content_format(str, optional): Format of the content cache, intended for
+            dashboard and document cache,
+        size(str, optional): Size of the content cache (in KB),
+        owner(str, optional): Owner of the content cache. Exact match on the
+            owner's full name,
+        expiration(str, optional): Expiration time of the cache,
+        last_updated(str, optional): Last update of the cache,
+        hit_count(str, optional): Hit count of the cache,
+        sort_by(str, optional): Specify sorting criteria,
+        fields(str, optional): A whitelist of top-level fields separated by
+            commas. Allow the client to selectively retrieve fields in the
+            response.
+    Returns:
+        Future with HTTP response returned by the Strategy REST server as
+        a result.
+    """
+    params = {
+        'projectId': project_id,
+        'clusterNode': node,
+        'offset': offset,
+        'limit': limit,
+        'status': status,
+        'type': content_type,
+        'format': content_format,
+        'size': size,
+        'owner': owner,
+        'expiration': expiration,
+        'lastUpdated': last_updated,
+        'hitCount': hit_count,
+        'sortBy': sort_by,
+        'fields': fields,
+    }
+    params_delete_none = delete_none_values(params, recursion=True)
+    params_encoded = urlencode(params_delete_none, True, quote_via=quote)
+    return future_session.get(
+        endpoint='/api/monitors/caches/contents', params=params_encoded
+    )
+
+
 @ErrorHandler(err_msg='Error updating caches')
 def update_contents_caches(
     connection: 'Connection', node: str, body: dict, fields: str | None = None
@@ -1248,6 +1318,34 @@ def update_contents_caches(
     )
 
 
+def update_contents_caches_async(
+    future_session: 'FuturesSessionWithRenewal',
+    node: str,
+    body: dict,
+    fields: str | None = None,
+):
+    """Alter multiple content cache statuses or remove content caches entirely
+        in multiple projects at specific node asynchronously.
+
+    Args:
+        future_session(object): Future Session object to call Strategy REST
+            Server asynchronously
+        node(str): Node name,
+        body(dict): List of contents
+        fields(list, optional): Comma separated top-level field whitelist. This
+            allows client to selectively retrieve part of the response model.
+
+    Returns:
+        Future with HTTP response returned by the Strategy REST server as
+        a result.
+    """
+    return future_session.patch(
+        endpoint='/api/v2/monitors/caches/contents',
+        params={'clusterNode': node, 'fields': fields},
+        json=body,
+    )
+
+
 @ErrorHandler(err_msg='Error deleting caches')
 def delete_caches(connection: 'Connection', project_id: str, cache_type: str):
     """Delete element or object caches for a specific project.
@@ -4,7 +4,7 @@ from requests import Response
 
 from mstrio.connection import Connection
 from mstrio.utils.error_handlers import ErrorHandler
-from mstrio.utils.version_helper import is_server_min_version
+from mstrio.utils.version_helper import get_server_capabilities
 
 if TYPE_CHECKING:
     from mstrio.utils.sessions import FuturesSessionWithRenewal
@@ -88,7 +88,7 @@ def report_instance(
     if body is None:
         body = {}
     params = {'offset': offset, 'limit': limit}
-    if is_server_min_version(connection, '11.2.0200'):
+    if get_server_capabilities(connection).supports('instance_fields'):
         params['fields'] = CUBE_FIELDS
     if execution_stage:
         params['executionStage'] = execution_stage
@@ -134,7 +134,7 @@ def report_instance_id(
     """
     connection._validate_project_selected()
     params = {'offset': offset, 'limit': limit}
-    if is_server_min_version(connection, '11.2.0200'):
+    if get_server_capabilities(connection).supports('instance_fields'):
         params['fields'] = CUBE_FIELDS
 
     return connection.get(
@@ -156,7 +156,7 @@ def report_instance_id_coroutine(
         Complete Future object.
     """
     params = {'offset': offset, 'limit': limit}
-    if is_server_min_version(future_session.connection, '11.2.0200'):
+    if get_server_capabilities(future_session.connection).supports('instance_fields'):
         params['fields'] = CUBE_FIELDS
 
     endpoint = f'/api/v2/reports/{report_id}/instances/{instance_id}'
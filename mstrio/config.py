@@ -1,13 +1,10 @@
 import contextlib
+import importlib.abc
+import importlib.util
 import logging
 import sys
 import warnings
 
-from pandas import options
-
-with contextlib.suppress(ImportError):
-    from tqdm import TqdmWarning
-
 # FYI: when editing this file, make sure to update info in config code snippets
 
 verbose = True
@@ -32,10 +29,57 @@ It uses `requests` library's `timeout` parameter under the hood. (read more:
 """
 delay_between_polling: int | float = 5
 """Amount of time (in seconds) to wait between polling requests."""
+resolution_cache_ttl: int | float | None = 300
+"""Time (in seconds) for which each connection remembers IDs of objects it
+resolved from their names (e.g. `project_name`), so the same name is not
+looked up again. Default is 300 seconds (5 minutes). If `None`, IDs are
+remembered until invalidated; if `0`, they are not remembered at all.
+"""
+attribute_element_cache_ttl: int | float | None = 600
+"""Time (in seconds) for which elements of attributes of cubes and reports
+are kept in memory, so they are not loaded again by other objects of the same
+cube or report. Default is 600 seconds (10 minutes). If `None`, elements are
+kept until the version of the cube or report changes or they are invalidated;
+if `0`, they are not kept at all.
+"""
+
+
+def _set_pandas_display_options(pandas_module) -> None:
+    # Sets number of rows displayed for pandas DataFrame
+    options = pandas_module.options
+    options.display.max_rows = max(250, options.display.max_rows)
+    options.display.max_colwidth = max(100, options.display.max_colwidth)
+
+
+class _PandasImportHook(importlib.abc.MetaPathFinder):
+    """Apply pandas display options right after pandas is imported.
+
+    pandas is a heavy import, so it is not imported together with `config`.
+    The hook removes itself from `sys.meta_path` on first use.
+    """
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != 'pandas':
+            return None
+        with contextlib.suppress(ValueError):
+            sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is None or spec.loader is None:
+            return spec
+        exec_module = spec.loader.exec_module
+
+        def _exec_module(module):
+            exec_module(module)
+            _set_pandas_display_options(module)
+
+        spec.loader.exec_module = _exec_module
+        return spec
+
 
-# Sets number of rows displayed for pandas DataFrame
-options.display.max_rows = max(250, options.display.max_rows)
-options.display.max_colwidth = max(100, options.display.max_colwidth)
+if 'pandas' in sys.modules:
+    _set_pandas_display_options(sys.modules['pandas'])
+else:
+    sys.meta_path.insert(0, _PandasImportHook())
 
 # Warning settings: "error", "ignore", "always", "default", "module", "once"
 print_warnings = 'always'
@@ -51,10 +95,8 @@ def _custom_formatwarning(msg, category, *args, **kwargs):
 warnings.formatwarning = _custom_formatwarning
 
 # filters are applied in reversed order to the order of adding them (LIFO)
-if "TqdmWarning" in locals():
-    warnings.filterwarnings(
-        action="ignore", category=TqdmWarning, message=".*IProgress not found.*"
-    )
+# FYI: matched by message only, so that `tqdm` is not imported with `config`
+warnings.filterwarnings(action="ignore", message=".*IProgress not found.*")
 
 warnings.filterwarnings(action=print_warnings, module=module_path)
 warnings.filterwarnings(action='default', category=UserWarning, module=module_path)
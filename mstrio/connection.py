@@ -19,6 +19,7 @@ from requests import (  # NOQA F401 (imports for ease of access)
 from requests.adapters import HTTPAdapter, Retry
 from requests.cookies import RequestsCookieJar
 
+from mstrio.utils import replay
 from mstrio.utils.encoder import Encoder
 from mstrio.utils.enum_helper import get_enum_val
 from mstrio.utils.resolvers import get_project_id_from_params_set
@@ -34,6 +35,8 @@ if TYPE_CHECKING:
 
     from mstrio.project_objects.applications import Application
     from mstrio.server.project import Project
+    from mstrio.utils.resolvers import ResolutionCache
+    from mstrio.utils.version_helper import ServerCapabilities
 else:
     from requests.packages.urllib3.exceptions import (  # NOQA F401 (imports for ease of access)
         ConnectTimeoutError,
@@ -279,6 +282,10 @@ class Connection:
             provided explicitly, defaults to
             `mstrio.config.default_request_timeout` parameter value.
         deployment_type: Type of the connected Strategy deployment
+        capabilities: Parsed versions and supported features of the server,
+            computed once per connection
+        resolution_cache: IDs of objects resolved from their names by the
+            connection, see `config.resolution_cache_ttl`
     """
 
     def __init__(
@@ -422,6 +429,8 @@ class Connection:
         self._request_retry_on_timeout_count: int | None = None
         self.set_request_retry_on_timeout_count(request_retry_on_timeout_count)
         self._deployment_type: str | None = None
+        self._capabilities: 'ServerCapabilities | None' = None
+        self._resolution_cache: 'ResolutionCache | None' = None
         self._locale: Locale = None  # NOSONAR # (next line will assign it)
         self._set_locale(locale)
 
@@ -458,21 +467,19 @@ class Connection:
             )
             return
 
-        from mstrio.utils.version_helper import is_server_min_version
-
         # In some versions APPLICATION_TYPE_PYTHON is supported at login,
         # but several features are not available. Reconnect with
         # APPLICATION_TYPE_WEB if the server version is not compatible
         if (
             self._application_type
             and self._application_type != APPLICATION_TYPE_WEB
-            and not is_server_min_version(self, '11.5.0600')
+            and not self.capabilities.supports('python_application_type')
         ):
             self._application_type = APPLICATION_TYPE_WEB
             self.token = None
             self.connect()
 
-        if application_id and not is_server_min_version(self, '11.3.1200'):
+        if application_id and not self.capabilities.supports('application_login'):
             logger.warning(
                 "The `application_id` argument requires iServer version 11.3.1200 "
                 f"or later. Since your server version: {self._iserver_version} "
@@ -884,6 +891,8 @@ class Connection:
         Returns `True` if it expects early return from method using this one.
         """
 
+        # versions may change, e.g. after reconnecting to an upgraded server
+        self._capabilities = None
         resp = misc.server_status(self)
         if not resp:
             logger.warning(
@@ -985,7 +994,9 @@ class Connection:
             status_forcelist=status_forcelist,
             raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        # inside `HttpRecorder` or `HttpReplayer` of `mstrio.utils.replay`
+        # traffic is recorded or replayed
+        adapter = replay.wrap_adapter(HTTPAdapter(max_retries=retry))
         session.mount('http://', adapter)
         session.mount('https://', adapter)
 
@@ -1080,6 +1091,18 @@ class Connection:
 
         return self._iserver_version
 
+    @property
+    def capabilities(self) -> 'ServerCapabilities':
+        from mstrio.utils.version_helper import get_server_capabilities
+
+        return get_server_capabilities(self)
+
+    @property
+    def resolution_cache(self) -> 'ResolutionCache':
+        from mstrio.utils.resolvers import get_resolution_cache
+
+        return get_resolution_cache(self)
+
     @property
     def request_timeout(self) -> int | float | None:
         if self._request_timeout is not None:
@@ -1,26 +1,73 @@
 # flake8: noqa
+from typing import TYPE_CHECKING
 
-# isort: off
-from .dbms import Dbms, list_available_dbms
+from mstrio.utils.lazy_loading import attach_lazy_exports
 
-# isort: on
-from .database_connections import DatabaseConnections
-from .datasource_connection import (
-    CharEncoding,
-    DatasourceConnection,
-    DriverType,
-    ExecutionMode,
-    list_datasource_connections,
-)
-from .datasource_instance import (
-    DatasourceInstance,
-    DatasourceType,
-    list_connected_datasource_instances,
-    list_datasource_instances,
+if TYPE_CHECKING:
+    # isort: off
+    from .dbms import Dbms, list_available_dbms
+
+    # isort: on
+    from .connectivity import (
+        CONNECTIVITY_COLUMNS,
+        ConnectivityStatus,
+        connectivity_statistics,
+        test_datasource_connectivity,
+    )
+    from .database_connections import DatabaseConnections
+    from .datasource_connection import (
+        CharEncoding,
+        DatasourceConnection,
+        DriverType,
+        ExecutionMode,
+        list_datasource_connections,
+    )
+    from .datasource_instance import (
+        DatasourceInstance,
+        DatasourceType,
+        list_connected_datasource_instances,
+        list_datasource_instances,
+    )
+    from .datasource_login import DatasourceLogin, list_datasource_logins
+    from .datasource_map import DatasourceMap, list_datasource_mappings
+    from .driver import Driver, list_drivers
+    from .embedded_connection import EmbeddedConnection
+    from .query_batch import QueryResult, QueryStatus, execute_queries
+    from .gateway import Gateway, list_gateways
+    from .helpers import DBType, GatewayType
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'Dbms': '.dbms',
+        'list_available_dbms': '.dbms',
+        'CONNECTIVITY_COLUMNS': '.connectivity',
+        'ConnectivityStatus': '.connectivity',
+        'connectivity_statistics': '.connectivity',
+        'test_datasource_connectivity': '.connectivity',
+        'DatabaseConnections': '.database_connections',
+        'CharEncoding': '.datasource_connection',
+        'DatasourceConnection': '.datasource_connection',
+        'DriverType': '.datasource_connection',
+        'ExecutionMode': '.datasource_connection',
+        'list_datasource_connections': '.datasource_connection',
+        'DatasourceInstance': '.datasource_instance',
+        'DatasourceType': '.datasource_instance',
+        'list_connected_datasource_instances': '.datasource_instance',
+        'list_datasource_instances': '.datasource_instance',
+        'DatasourceLogin': '.datasource_login',
+        'list_datasource_logins': '.datasource_login',
+        'DatasourceMap': '.datasource_map',
+        'list_datasource_mappings': '.datasource_map',
+        'Driver': '.driver',
+        'list_drivers': '.driver',
+        'EmbeddedConnection': '.embedded_connection',
+        'QueryResult': '.query_batch',
+        'QueryStatus': '.query_batch',
+        'execute_queries': '.query_batch',
+        'Gateway': '.gateway',
+        'list_gateways': '.gateway',
+        'DBType': '.helpers',
+        'GatewayType': '.helpers',
+    },
 )
-from .datasource_login import DatasourceLogin, list_datasource_logins
-from .datasource_map import DatasourceMap, list_datasource_mappings
-from .driver import Driver, list_drivers
-from .embedded_connection import EmbeddedConnection
-from .gateway import Gateway, list_gateways
-from .helpers import DBType, GatewayType
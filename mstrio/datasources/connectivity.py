@@ -0,0 +1,229 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from enum import auto
+from typing import TYPE_CHECKING
+
+from pandas import DataFrame
+from requests import ConnectionError, HTTPError, Timeout
+from tqdm import tqdm
+
+from mstrio import config
+from mstrio.api import datasources
+from mstrio.datasources.datasource_instance import list_datasource_instances
+from mstrio.helpers import IServerError, MstrTimeoutError
+from mstrio.utils.enum_helper import AutoName
+from mstrio.utils.helper import get_parallel_number
+
+if TYPE_CHECKING:
+    from mstrio.connection import Connection
+    from mstrio.server.project import Project
+
+logger = logging.getLogger(__name__)
+
+CONNECTIVITY_COLUMNS = (
+    'datasource_id',
+    'datasource_name',
+    'dbms',
+    'database_type',
+    'database_version',
+    'connection_id',
+    'connection_name',
+    'login',
+    'status',
+    'latency',
+    'error',
+    'tested_at',
+)
+
+
+class ConnectivityStatus(AutoName):
+    SUCCEEDED = auto()
+    FAILED = auto()
+    TIMED_OUT = auto()
+    NOT_TESTED = auto()
+
+
+def test_datasource_connectivity(
+    connection: 'Connection',
+    datasource_ids: list[str] | None = None,
+    database_types: list[str] | None = None,
+    project: 'Project | str | None' = None,
+    timeout: float | None = 30,
+    max_workers: int | None = None,
+    progress_bar: bool = True,
+) -> DataFrame:
+    """Test connectivity of datasource instances to their databases.
+
+    Datasource connections shared by many datasource instances are tested
+    once, and tests of different connections run concurrently, each aborted
+    after `timeout` seconds, so the sweep takes about as long as the slowest
+    tests instead of the sum of all of them. Instances with an embedded
+    connection cannot be tested and are reported as not tested.
+
+    Args:
+        connection (Connection): Strategy One connection object returned by
+            `connection.Connection()`.
+        datasource_ids (list[str], optional): IDs of datasource instances to
+            test. Defaults to all datasource instances.
+        database_types (list[str], optional): Database types of datasource
+            instances to test, e.g. `['postgre_sql']`.
+        project (Project | str, optional): Project object or ID, whose
+            datasource instances are tested.
+        timeout (float, optional): Time in seconds after which a test is
+            aborted and reported as timed out. Defaults to 30. If None,
+            the request timeout of the connection is used.
+        max_workers (int, optional): Maximum number of tests run concurrently.
+            Defaults to `get_parallel_number()`.
+        progress_bar (bool, optional): If True, progress bar is shown.
+
+    Returns:
+        DataFrame with a row per datasource instance and columns
+        `CONNECTIVITY_COLUMNS`. `status` is a value of `ConnectivityStatus`,
+        `latency` is the duration of the test in seconds and `dbms` and
+        `database_type` identify the DBMS and the gateway of the instance.
+        Statistics of latency can be computed with `connectivity_statistics()`.
+
+    Examples:
+        >>> results = test_datasource_connectivity(conn, timeout=10)
+        >>> results[results.status != 'succeeded']
+        >>> connectivity_statistics(results, by='dbms')
+    """
+    instances = list_datasource_instances(
+        connection,
+        to_dictionary=True,
+        ids=datasource_ids,
+        database_types=database_types,
+        project=project,
+    )
+    connections = {}
+    for instance in instances:
+        ds_connection = instance.get('datasource_connection') or {}
+        if ds_connection.get('id') and not ds_connection.get('is_embedded'):
+            connections[ds_connection['id']] = ds_connection
+
+    results = {}
+    max_workers = max_workers or get_parallel_number(len(connections))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_test_connection, connection, connection_id, timeout)
+            for connection_id in connections
+        ]
+        with tqdm(
+            total=len(futures),
+            desc="Testing datasource connections...",
+            disable=not progress_bar or not config.verbose,
+        ) as pbar:
+            for future in as_completed(futures):
+                connection_id, result = future.result()
+                results[connection_id] = result
+                pbar.update()
+
+    not_tested = {
+        'status': ConnectivityStatus.NOT_TESTED.value,
+        'latency': None,
+        'error': "Embedded connections cannot be tested.",
+        'tested_at': None,
+    }
+    rows = []
+    for instance in instances:
+        ds_connection = instance.get('datasource_connection') or {}
+        login = ds_connection.get('datasource_login') or {}
+        rows.append(
+            {
+                'datasource_id': instance.get('id'),
+                'datasource_name': instance.get('name'),
+                'dbms': (instance.get('dbms') or {}).get('name'),
+                'database_type': instance.get('database_type'),
+                'database_version': instance.get('database_version'),
+                'connection_id': ds_connection.get('id'),
+                'connection_name': ds_connection.get('name'),
+                'login': login.get('name'),
+                **results.get(ds_connection.get('id'), not_tested),
+            }
+        )
+    frame = DataFrame(rows, columns=list(CONNECTIVITY_COLUMNS))
+    if config.verbose:
+        counts = frame['status'].value_counts()
+        logger.info(
+            f"Tested {len(connections)} connection(s) of {len(frame)} datasource "
+            f"instance(s): {counts.get('succeeded', 0)} succeeded, "
+            f"{counts.get('failed', 0)} failed, "
+            f"{counts.get('timed_out', 0)} timed out."
+        )
+    return frame
+
+
+def connectivity_statistics(
+    results: DataFrame, by: str | list[str] = 'dbms'
+) -> DataFrame:
+    """Compute statistics of results of `test_datasource_connectivity()`.
+
+    Args:
+        results (DataFrame): Results of `test_datasource_connectivity()`.
+        by (str | list[str], optional): Columns by which results are grouped,
+            e.g. `'dbms'` or `'database_type'`. Defaults to `'dbms'`.
+
+    Returns:
+        DataFrame indexed by `by`, with numbers of datasource instances per
+        status and minimum, mean, median, 95th percentile and maximum latency
+        of tests which did not time out, in seconds.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    tested = results[results['status'] != ConnectivityStatus.NOT_TESTED.value]
+    counts = (
+        results.groupby(by + ['status'], dropna=False)
+        .size()
+        .unstack('status', fill_value=0)
+        .reindex(columns=[status.value for status in ConnectivityStatus], fill_value=0)
+    )
+    latency = (
+        tested[tested['status'] != ConnectivityStatus.TIMED_OUT.value]
+        .groupby(by, dropna=False)['latency']
+        .agg(
+            latency_min='min',
+            latency_mean='mean',
+            latency_median='median',
+            latency_p95=lambda values: values.quantile(0.95),
+            latency_max='max',
+        )
+    )
+    stats = counts.join(latency, how='left')
+    stats.insert(0, 'instances', counts.sum(axis=1))
+    stats.columns.name = None
+    return stats
+
+
+def _test_connection(
+    connection: 'Connection', connection_id: str, timeout: float | None
+) -> tuple[str, dict]:
+    start = time.perf_counter()
+    tested_at = datetime.now(timezone.utc)
+    error = None
+    try:
+        response = datasources.test_datasource_connection(
+            connection, {'id': connection_id}, timeout=timeout
+        )
+        status = (
+            ConnectivityStatus.SUCCEEDED if response.ok else ConnectivityStatus.FAILED
+        )
+    except (Timeout, MstrTimeoutError) as err:
+        status = ConnectivityStatus.TIMED_OUT
+        error = f"Test timed out: {_first_line(err)}"
+    except (IServerError, HTTPError, ConnectionError) as err:
+        status = ConnectivityStatus.FAILED
+        error = _first_line(err)
+    return connection_id, {
+        'status': status.value,
+        'latency': time.perf_counter() - start,
+        'error': error,
+        'tested_at': tested_at,
+    }
+
+
+def _first_line(err: Exception) -> str:
+    # messages of server errors contain the whole response; the first line
+    # is enough for a report
+    message = str(err).strip()
+    return message.splitlines()[0] if message else repr(err)
@@ -544,14 +544,21 @@ class DatasourceConnection(Entity, CopyMixin, DeleteMixin, TenantMixin):
         return super().from_dict(source, connection, to_snake_case)
 
     @method_version_handler('11.3.0100')
-    def test_connection(self) -> bool:
+    def test_connection(self, timeout: float | None = None) -> bool:
         """Test datasource connection object.
 
+        Args:
+            timeout (float, optional): Time in seconds after which the test is
+                aborted with `requests.Timeout`. Defaults to the request
+                timeout of the connection.
+
         Returns:
             True if connection can be established, else False.
         """
         body = {"id": self.id}
-        return datasources.test_datasource_connection(self.connection, body).ok
+        return datasources.test_datasource_connection(
+            self.connection, body, timeout=timeout
+        ).ok
 
     @method_version_handler('11.3.0900')
     def convert_to_dsn_less(self):
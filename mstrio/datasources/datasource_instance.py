@@ -26,7 +26,10 @@ from mstrio.utils.version_helper import class_version_handler, method_version_ha
 from mstrio.utils.vldb_mixin import ModelVldbMixin
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from mstrio.connection import Connection
+    from mstrio.datasources.query_batch import QueryResult
 
 logger = logging.getLogger(__name__)
 
@@ -564,6 +567,32 @@ class DatasourceInstance(Entity, CopyMixin, DeleteMixin, ModelVldbMixin, TenantM
             retry_delay=retry_delay,
         )
 
+    def execute_queries(
+        self,
+        project_id: str | Project,
+        queries: list[str | Query] | dict[str, str | Query],
+        **kwargs,
+    ) -> 'Iterator[QueryResult]':
+        """Execute many SQL queries on the given datasource concurrently and
+        stream their results as DataFrames as the queries finish.
+
+        Args:
+            project_id (str | Project): project ID or Project class instance
+            queries (list | dict): queries to be executed, in a list or in
+                a dict by keys identifying them in results
+            **kwargs: other arguments of
+                `mstrio.datasources.execute_queries()`, e.g. `max_in_flight`,
+                `timeout` or `to_arrow`
+
+        Yields:
+            QueryResult for every query, in order of completion.
+        """
+        from mstrio.datasources.query_batch import execute_queries
+
+        return execute_queries(
+            self.connection, self, queries, project=project_id, **kwargs
+        )
+
     @staticmethod
     def _execute_query(
         connection: 'Connection',
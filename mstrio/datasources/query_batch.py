@@ -0,0 +1,251 @@
+import logging
+import time
+from collections import deque
+from collections.abc import Hashable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import auto
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+from pandas import DataFrame
+from pypika import Query
+from requests import ConnectionError, HTTPError, Timeout
+from tqdm import tqdm
+
+from mstrio import config
+from mstrio.datasources.datasource_instance import DatasourceInstance
+from mstrio.helpers import IServerError
+from mstrio.server.project import Project
+from mstrio.utils.encoder import Encoder
+from mstrio.utils.enum_helper import AutoName
+from mstrio.utils.response_processors import datasources as datasources_processors
+
+if TYPE_CHECKING:
+    from mstrio.connection import Connection
+
+logger = logging.getLogger(__name__)
+
+_REQUEST_ERRORS = (IServerError, HTTPError, ConnectionError, Timeout)
+
+# statuses of SQL executions returned by the I-Server
+_COMPLETED = 3
+_FAILED = 4
+_SUCCESS_WITH_INFO = 'Error type: Odbc success with info.'
+
+
+class QueryStatus(AutoName):
+    SUCCEEDED = auto()
+    FAILED = auto()
+    TIMED_OUT = auto()
+
+
+@dataclass
+class QueryResult:
+    """Result of a query executed by `execute_queries()`.
+
+    Attributes:
+        key (Hashable): Key of the query: its index in the list of queries or
+            its key in the dict of queries.
+        query (str): SQL query.
+        status (QueryStatus): Whether the query succeeded, failed or did not
+            finish in time.
+        data (DataFrame | pyarrow.Table, optional): Result set of the query
+            with typed columns. Empty for queries which do not return rows.
+        error (str, optional): Error message, if the query did not succeed.
+        execution_id (str, optional): ID of the SQL execution on the I-Server.
+        duration (float): Time from submission to result in seconds.
+    """
+
+    key: Hashable
+    query: str
+    status: QueryStatus
+    data: DataFrame | pa.Table | None = field(default=None, repr=False)
+    error: str | None = None
+    execution_id: str | None = None
+    duration: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == QueryStatus.SUCCEEDED
+
+
+@dataclass
+class _Execution:
+    key: Hashable
+    query: str
+    started: float
+    execution_id: str | None = None
+
+
+def execute_queries(
+    connection: 'Connection',
+    datasource: DatasourceInstance | str,
+    queries: list[str | Query] | dict[Hashable, str | Query],
+    project: Project | str | None = None,
+    max_in_flight: int = 8,
+    timeout: float | None = 600,
+    min_poll_interval: float = 0.2,
+    max_poll_interval: float = 5.0,
+    to_arrow: bool = False,
+    progress_bar: bool = True,
+) -> Iterator[QueryResult]:
+    """Execute many SQL queries on a datasource concurrently and stream their
+    results as they finish.
+
+    Up to `max_in_flight` queries are executed at once. All running queries
+    are polled together in a single loop, whose interval starts at
+    `min_poll_interval`, is reset whenever a query finishes and grows up to
+    `max_poll_interval` while none does, so short queries return in
+    a fraction of a second, instead of after the fixed delay of
+    `DatasourceInstance.execute_query()`. Errors of single queries do not
+    stop the others; they are returned as failed results.
+
+    Args:
+        connection (Connection): Strategy One connection object returned by
+            `connection.Connection()`.
+        datasource (DatasourceInstance | str): Datasource instance or its ID.
+        queries (list | dict): SQL queries as strings or `pypika` queries, in
+            a list or in a dict by keys identifying them in results.
+        project (Project | str, optional): Project or its ID. Defaults to the
+            project selected in `connection`.
+        max_in_flight (int, optional): Maximum number of queries executed at
+            once. Defaults to 8.
+        timeout (float, optional): Time in seconds after which a query which
+            did not finish is reported as timed out and no longer polled.
+            Defaults to 600. If None, queries are polled until they finish.
+        min_poll_interval (float, optional): Minimal interval of polling in
+            seconds. Defaults to 0.2.
+        max_poll_interval (float, optional): Maximal interval of polling in
+            seconds. Defaults to 5.
+        to_arrow (bool, optional): If True, result sets are returned as
+            `pyarrow.Table`, otherwise as DataFrames with Arrow-backed dtypes.
+        progress_bar (bool, optional): If True, progress bar is shown.
+
+    Yields:
+        QueryResult for every query, in order of completion.
+
+    Examples:
+        >>> queries = {table: f'SELECT COUNT(*) FROM {table}' for table in tables}
+        >>> for result in execute_queries(conn, datasource, queries):
+        ...     print(result.key, result.data if result.succeeded else result.error)
+    """
+    datasource_id = (
+        datasource.id if isinstance(datasource, DatasourceInstance) else datasource
+    )
+    if project is None:
+        connection._validate_project_selected()
+        project = connection.project_id
+    project_id = project.id if isinstance(project, Project) else project
+    items = queries.items() if isinstance(queries, dict) else enumerate(queries)
+    waiting = deque((key, str(query)) for key, query in items)
+    running: list[_Execution] = []
+    interval = min_poll_interval
+    max_in_flight = max(max_in_flight, 1)
+
+    def submit(execution: _Execution) -> _Execution:
+        execution.execution_id = datasources_processors.execute_query(
+            connection=connection,
+            body={'query': Encoder(execution.query).encoded_text},
+            id=datasource_id,
+            project_id=project_id,
+        ).get('id')
+        return execution
+
+    def poll(execution: _Execution) -> dict:
+        return datasources_processors.get_query_results(
+            connection=connection, id=execution.execution_id
+        )
+
+    with (
+        ThreadPoolExecutor(max_workers=max_in_flight) as executor,
+        tqdm(
+            total=len(waiting),
+            desc="Executing queries...",
+            disable=not progress_bar or not config.verbose,
+        ) as pbar,
+    ):
+        while waiting or running:
+            new = [
+                _Execution(*waiting.popleft(), started=time.perf_counter())
+                for _ in range(min(len(waiting), max_in_flight - len(running)))
+            ]
+            for execution, future in [(e, executor.submit(submit, e)) for e in new]:
+                try:
+                    running.append(future.result())
+                except _REQUEST_ERRORS as err:
+                    pbar.update()
+                    yield _result(execution, QueryStatus.FAILED, error=str(err))
+            if not running:
+                continue
+
+            time.sleep(interval)
+            finished = []
+            polls = [(e, executor.submit(poll, e)) for e in running]
+            for execution, future in polls:
+                try:
+                    state = future.result()
+                except _REQUEST_ERRORS as err:
+                    result = _result(execution, QueryStatus.FAILED, error=str(err))
+                else:
+                    result = _get_result(execution, state, timeout, to_arrow)
+                if result is not None:
+                    finished.append(execution)
+                    pbar.update()
+                    yield result
+            running = [e for e in running if e not in finished]
+            # poll quickly while queries keep finishing, back off otherwise
+            interval = (
+                min_poll_interval
+                if finished
+                else min(interval * 1.5, max_poll_interval)
+            )
+
+
+def _get_result(
+    execution: _Execution, state: dict, timeout: float | None, to_arrow: bool
+) -> QueryResult | None:
+    """Get the result of an execution from its state, or None if it is still
+    running."""
+    status = state.get('status')
+    message = state.get('message') or ''
+    if status == _COMPLETED or (status == _FAILED and _SUCCESS_WITH_INFO in message):
+        try:
+            data = _to_table(state.get('results'), to_arrow)
+        except (ValueError, TypeError, pa.ArrowException) as err:
+            return _result(
+                execution, QueryStatus.FAILED, error=f"Invalid result set: {err}"
+            )
+        return _result(execution, QueryStatus.SUCCEEDED, data=data)
+    if status == _FAILED:
+        return _result(execution, QueryStatus.FAILED, error=message)
+    if timeout is not None and time.perf_counter() - execution.started > timeout:
+        return _result(
+            execution,
+            QueryStatus.TIMED_OUT,
+            error=f"Query did not finish in {timeout} seconds.",
+        )
+    return None
+
+
+def _result(execution: _Execution, status: QueryStatus, **kwargs: Any) -> QueryResult:
+    if status != QueryStatus.SUCCEEDED:
+        logger.warning(f"Query {execution.key!r} {status.value}: {kwargs['error']}")
+    return QueryResult(
+        key=execution.key,
+        query=execution.query,
+        status=status,
+        execution_id=execution.execution_id,
+        duration=time.perf_counter() - execution.started,
+        **kwargs,
+    )
+
+
+def _to_table(results: dict | None, to_arrow: bool) -> DataFrame | pa.Table:
+    data = (results or {}).get('data') or {}
+    frame = DataFrame.from_dict(data) if isinstance(data, dict) else DataFrame(data)
+    # values come as JSON; infer proper types of columns
+    frame = frame.convert_dtypes(dtype_backend='pyarrow')
+    if to_arrow:
+        return pa.Table.from_pandas(frame, preserve_index=False)
+    return frame
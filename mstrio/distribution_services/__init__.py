@@ -1,6 +1,25 @@
 # flake8: noqa
-from .device import *
-from .event import Event, list_events
-from .schedule import *
-from .subscription import *
-from .transmitter import *
+from typing import TYPE_CHECKING
+
+from mstrio.utils.lazy_loading import attach_lazy_exports
+
+if TYPE_CHECKING:
+    from .device import *
+    from .event import Event, list_events
+    from .schedule import *
+    from .subscription import *
+    from .transmitter import *
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'Event': '.event',
+        'list_events': '.event',
+    },
+    star_modules=[
+        '.device',
+        '.schedule',
+        '.subscription',
+        '.transmitter',
+    ],
+)
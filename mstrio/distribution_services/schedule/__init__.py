@@ -1,7 +1,21 @@
 # flake8: noqa
+from typing import TYPE_CHECKING
 
-# isort: off
-from .schedule_time import ScheduleEnums, ScheduleTime
+from mstrio.utils.lazy_loading import attach_lazy_exports
 
-# isort: on
-from .schedule import Schedule, list_schedules
+if TYPE_CHECKING:
+    # isort: off
+    from .schedule_time import ScheduleEnums, ScheduleTime
+
+    # isort: on
+    from .schedule import Schedule, list_schedules
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'ScheduleEnums': '.schedule_time',
+        'ScheduleTime': '.schedule_time',
+        'Schedule': '.schedule',
+        'list_schedules': '.schedule',
+    },
+)
@@ -1,20 +1,53 @@
 # flake8: noqa
-from .base_subscription import Subscription
-from .cache_update_subscription import CacheUpdateSubscription
-from .content import Content
-from .delivery import (
-    CacheType,
-    ClientType,
-    Delivery,
-    Orientation,
-    SendContentAs,
-    ShortcutCacheFormat,
-    ZipSettings,
+from typing import TYPE_CHECKING
+
+from mstrio.utils.lazy_loading import attach_lazy_exports
+
+if TYPE_CHECKING:
+    from .base_subscription import Subscription
+    from .cache_update_subscription import CacheUpdateSubscription
+    from .content import Content
+    from .delivery import (
+        CacheType,
+        ClientType,
+        Delivery,
+        Orientation,
+        SendContentAs,
+        ShortcutCacheFormat,
+        ZipSettings,
+    )
+    from .dynamic_recipient_list import (
+        DynamicRecipientList,
+        list_dynamic_recipient_lists,
+    )
+    from .email_subscription import EmailSubscription
+    from .file_subscription import FileSubscription
+    from .ftp_subscription import FTPSubscription
+    from .history_list_subscription import HistoryListSubscription
+    from .mobile_subscription import MobileSubscription
+    from .subscription_manager import SubscriptionManager, list_subscriptions
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'Subscription': '.base_subscription',
+        'CacheUpdateSubscription': '.cache_update_subscription',
+        'Content': '.content',
+        'CacheType': '.delivery',
+        'ClientType': '.delivery',
+        'Delivery': '.delivery',
+        'Orientation': '.delivery',
+        'SendContentAs': '.delivery',
+        'ShortcutCacheFormat': '.delivery',
+        'ZipSettings': '.delivery',
+        'DynamicRecipientList': '.dynamic_recipient_list',
+        'list_dynamic_recipient_lists': '.dynamic_recipient_list',
+        'EmailSubscription': '.email_subscription',
+        'FileSubscription': '.file_subscription',
+        'FTPSubscription': '.ftp_subscription',
+        'HistoryListSubscription': '.history_list_subscription',
+        'MobileSubscription': '.mobile_subscription',
+        'SubscriptionManager': '.subscription_manager',
+        'list_subscriptions': '.subscription_manager',
+    },
 )
-from .dynamic_recipient_list import DynamicRecipientList, list_dynamic_recipient_lists
-from .email_subscription import EmailSubscription
-from .file_subscription import FileSubscription
-from .ftp_subscription import FTPSubscription
-from .history_list_subscription import HistoryListSubscription
-from .mobile_subscription import MobileSubscription
-from .subscription_manager import SubscriptionManager, list_subscriptions
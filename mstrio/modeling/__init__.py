@@ -1,11 +1,38 @@
 # flake8: noqa
+from typing import TYPE_CHECKING
 
-# isort: off
-from .filter import *
-from .schema import *
-from .expression import *
-from .metric import *
-from .prompt import *
-from .security_filter import *
+from mstrio.utils.lazy_loading import attach_lazy_exports
 
-# isort: on
+if TYPE_CHECKING:
+    from .changeset_session import (
+        ChangesetOperation,
+        ChangesetSession,
+        OperationStatus,
+    )
+
+    # isort: off
+    from .filter import *
+    from .schema import *
+    from .expression import *
+    from .metric import *
+    from .prompt import *
+    from .security_filter import *
+
+    # isort: on
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'ChangesetOperation': '.changeset_session',
+        'ChangesetSession': '.changeset_session',
+        'OperationStatus': '.changeset_session',
+    },
+    star_modules=[
+        '.filter',
+        '.schema',
+        '.expression',
+        '.metric',
+        '.prompt',
+        '.security_filter',
+    ],
+)
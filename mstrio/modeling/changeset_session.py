@@ -0,0 +1,378 @@
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, field
+from enum import auto
+from typing import TYPE_CHECKING, Any
+
+from mstrio import config
+from mstrio.api.changesets import (
+    commit_changeset_changes,
+    create_changeset,
+    delete_changeset,
+)
+from mstrio.utils.api_helpers import active_changeset_session
+from mstrio.utils.enum_helper import AutoName
+from mstrio.utils.helper import process_change_journal_comment
+
+if TYPE_CHECKING:
+    from contextvars import Token
+
+    from mstrio.connection import Connection
+
+logger = logging.getLogger(__name__)
+
+# writes made by the operation currently run in the context, see `_execute()`
+_operation_writes: ContextVar[list[int] | None] = ContextVar(
+    '_operation_writes', default=None
+)
+
+
+class OperationStatus(AutoName):
+    SUCCEEDED = auto()
+    FAILED = auto()
+
+
+@dataclass
+class ChangesetOperation:
+    """Outcome of a single operation run in a `ChangesetSession`.
+
+    Attributes:
+        label (str): Description of the operation.
+        status (OperationStatus): Whether the operation succeeded.
+        result (Any): Value returned by the operation, e.g. a created object.
+        error (str, optional): Error message, if the operation failed.
+        exception (Exception, optional): Exception raised by the operation.
+        duration (float): Time of the operation in seconds.
+        writes (int): Number of writes the operation made in the changeset.
+    """
+
+    label: str
+    status: OperationStatus
+    result: Any = None
+    error: str | None = None
+    exception: Exception | None = field(default=None, repr=False)
+    duration: float = 0.0
+    writes: int = 0
+
+
+class ChangesetSession:
+    """Session in which many modeling changes are made in a single changeset,
+    committed once.
+
+    By default every modeling write (e.g. `Metric.create()`,
+    `Attribute.alter()`, `Fact.alter()`, `Filter.create()`) creates its own
+    changeset, makes the change in it, commits it and deletes it. Inside
+    a session, all writes to the project of the session made with its
+    connection use the changeset of the session instead, which is committed
+    and deleted once, when the session ends. This saves three requests and
+    a commit on the server per change.
+
+    Writes can be made directly in the `with` block or with `run()`,
+    `submit()` and `map()`, which record the outcome of every operation in
+    `operations` instead of raising errors, and, with `max_workers` greater
+    than 1, run operations concurrently. If an exception leaves the `with`
+    block or, by default, if any operation fails, the changeset is discarded
+    without commit. With `atomic=False` changes of successful operations are
+    committed, as long as failed operations did not write anything to the
+    changeset: changes of a single operation cannot be discarded separately,
+    so partial changes of a failed operation discard the whole changeset.
+
+    Note:
+        Objects created in the session are saved in the metadata only when
+        the session ends, so until then they can be referenced only by writes
+        made in the session. For the same reason, `hidden` of metrics and
+        attributes created in the session is sent with their definition,
+        instead of being altered after creation. Writes made from threads
+        other than these started by `submit()` or `map()` do not join the
+        session.
+
+    Attributes:
+        connection (Connection): Strategy One connection object.
+        project_id (str): ID of the project in which changes are made.
+        schema_edit (bool): Whether the changeset is a schema edit changeset.
+        journal_comment (str, optional): Change journal comment of the commit.
+            If not provided, comments of all operations are used.
+        max_workers (int): Maximum number of operations run concurrently.
+        atomic (bool): Whether the changeset is discarded if any operation
+            fails, or only if a failed operation wrote to the changeset.
+        changeset_id (str, optional): ID of the changeset of the session.
+        operations (list[ChangesetOperation]): Outcomes of operations run with
+            `run()`, `submit()` or `map()`.
+        committed (bool): Whether the changes were committed.
+
+    Examples:
+        >>> with ChangesetSession(conn, max_workers=4) as session:
+        ...     session.map(
+        ...         lambda attr: attr.alter(description='Reviewed'), attributes
+        ...     )
+        >>> session.failed
+    """
+
+    def __init__(
+        self,
+        connection: 'Connection',
+        project_id: str | None = None,
+        schema_edit: bool = True,
+        journal_comment: str | None = None,
+        max_workers: int = 1,
+        atomic: bool = True,
+    ) -> None:
+        """Initialize the session. The changeset is created when the session
+        is entered with the `with` statement.
+
+        Args:
+            connection (Connection): Strategy One connection object.
+            project_id (str, optional): ID of the project in which changes are
+                made. Defaults to the project selected in `connection`.
+            schema_edit (bool, optional): Whether the changeset is a schema
+                edit changeset. Defaults to True, like for single writes.
+            journal_comment (str, optional): Change journal comment of the
+                commit. If not provided, comments of all operations are used.
+            max_workers (int, optional): Maximum number of operations run
+                concurrently by `submit()` and `map()`. Defaults to 1.
+            atomic (bool, optional): If True (default), the changeset is
+                discarded without commit if any operation fails. If False,
+                changes of successful operations are committed, unless
+                a failed operation made some changes before it failed.
+        """
+        if project_id is None:
+            connection._validate_project_selected()
+            project_id = connection.project_id
+        self.connection = connection
+        self.project_id = project_id
+        self.schema_edit = schema_edit
+        self.journal_comment = journal_comment
+        self.max_workers = max(max_workers, 1)
+        self.atomic = atomic
+        self.changeset_id: str | None = None
+        self.operations: list[ChangesetOperation] = []
+        self.committed = False
+        self._journal_comments: list[str] = []
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._token: 'Token | None' = None
+
+    def __repr__(self) -> str:
+        return (
+            f"ChangesetSession(changeset_id={self.changeset_id!r}, "
+            f"operations={len(self.operations)}, failed={len(self.failed)}, "
+            f"committed={self.committed})"
+        )
+
+    def __enter__(self) -> 'ChangesetSession':
+        if self.changeset_id is not None:
+            raise RuntimeError("Changeset session can be entered only once.")
+        response = create_changeset(
+            self.connection, project_id=self.project_id, schema_edit=self.schema_edit
+        )
+        self.changeset_id = response.json()['id']
+        self._token = active_changeset_session.set(self)
+        if self.max_workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+        finally:
+            active_changeset_session.reset(self._token)
+            self._token = None
+        try:
+            if exc_type is not None:
+                logger.warning(
+                    f"Changes of changeset session {self.changeset_id} are "
+                    "discarded due to an error."
+                )
+            elif self.atomic and self.failed:
+                logger.warning(
+                    f"Changes of changeset session {self.changeset_id} are "
+                    f"discarded, as {len(self.failed)} operation(s) failed."
+                )
+            elif partial := [op for op in self.failed if op.writes]:
+                logger.warning(
+                    f"Changes of changeset session {self.changeset_id} are "
+                    f"discarded, as {len(partial)} failed operation(s) made "
+                    "partial changes which cannot be discarded separately."
+                )
+            elif not self._writes or (self.operations and not self.succeeded):
+                logger.warning(
+                    f"There are no changes to commit in changeset session "
+                    f"{self.changeset_id}."
+                )
+            else:
+                self._commit()
+        finally:
+            delete_changeset(connection=self.connection, id=self.changeset_id)
+
+    @property
+    def succeeded(self) -> list[ChangesetOperation]:
+        """Operations which succeeded."""
+        return [op for op in self.operations if op.status == OperationStatus.SUCCEEDED]
+
+    @property
+    def failed(self) -> list[ChangesetOperation]:
+        """Operations which failed."""
+        return [op for op in self.operations if op.status == OperationStatus.FAILED]
+
+    def run(
+        self, func: Callable, *args, label: str | None = None, **kwargs
+    ) -> ChangesetOperation:
+        """Run an operation in the changeset of the session and record its
+        outcome. Errors raised by the operation are recorded, not raised.
+
+        Args:
+            func (Callable): Operation, e.g. `Metric.create` or `attr.alter`.
+            *args: Positional arguments of the operation.
+            label (str, optional): Description of the operation. Defaults to
+                the name of the function and of the object it is bound to.
+            **kwargs: Keyword arguments of the operation.
+
+        Returns:
+            ChangesetOperation with the outcome of the operation.
+        """
+        self._check_active()
+        return self._execute(func, args, kwargs, label)
+
+    def submit(
+        self, func: Callable, *args, label: str | None = None, **kwargs
+    ) -> 'Future[ChangesetOperation]':
+        """Schedule an operation to be run in the changeset of the session,
+        concurrently with other operations if `max_workers` is greater than 1.
+        Errors raised by the operation are recorded, not raised.
+
+        Args:
+            func (Callable): Operation, e.g. `Metric.create` or `attr.alter`.
+            *args: Positional arguments of the operation.
+            label (str, optional): Description of the operation. Defaults to
+                the name of the function and of the object it is bound to.
+            **kwargs: Keyword arguments of the operation.
+
+        Returns:
+            Future of ChangesetOperation with the outcome of the operation.
+        """
+        self._check_active()
+        if self._executor is None:
+            future = Future()
+            future.set_result(self._execute(func, args, kwargs, label))
+            return future
+        # every operation runs in a copy of the current context, so that it
+        # sees the session, also in threads of the executor
+        return self._executor.submit(
+            copy_context().run, self._execute, func, args, kwargs, label
+        )
+
+    def map(
+        self,
+        func: Callable,
+        items: Iterable,
+        label: Callable[[Any], str] | None = None,
+    ) -> list[ChangesetOperation]:
+        """Run an operation for every item in the changeset of the session,
+        concurrently if `max_workers` is greater than 1, and wait for all of
+        them. Errors raised by operations are recorded, not raised.
+
+        Args:
+            func (Callable): Operation taking a single item, e.g.
+                `lambda attr: attr.alter(hidden=True)`.
+            items (Iterable): Items passed to the operation.
+            label (Callable, optional): Function returning a description of
+                the operation for an item. Defaults to `str()` of the item.
+
+        Returns:
+            List of ChangesetOperation with outcomes of operations, in order of
+            `items`.
+        """
+        futures = [
+            self.submit(func, item, label=label(item) if label else str(item))
+            for item in items
+        ]
+        return [future.result() for future in futures]
+
+    def _execute(
+        self, func: Callable, args: tuple, kwargs: dict, label: str | None
+    ) -> ChangesetOperation:
+        label = label or self._default_label(func)
+        writes = [0]
+        token = _operation_writes.set(writes)
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as err:
+            operation = ChangesetOperation(
+                label=label,
+                status=OperationStatus.FAILED,
+                error=str(err),
+                exception=err,
+                duration=time.perf_counter() - start,
+                writes=writes[0],
+            )
+            logger.warning(f"Operation '{label}' failed: {err}")
+        else:
+            operation = ChangesetOperation(
+                label=label,
+                status=OperationStatus.SUCCEEDED,
+                result=result,
+                duration=time.perf_counter() - start,
+                writes=writes[0],
+            )
+        finally:
+            _operation_writes.reset(token)
+        with self._lock:
+            self.operations.append(operation)
+        return operation
+
+    @staticmethod
+    def _default_label(func: Callable) -> str:
+        name = getattr(func, '__qualname__', None) or repr(func)
+        owner = getattr(func, '__self__', None)
+        if owner is not None and isinstance(getattr(owner, 'name', None), str):
+            return f"{name} of '{owner.name}'"
+        return name
+
+    def _check_active(self) -> None:
+        if self._token is None:
+            raise RuntimeError(
+                "Operations can be run only inside of `with ChangesetSession(...)`."
+            )
+
+    def _accepts(
+        self, connection: 'Connection', project_id: str | None, schema_edit: bool
+    ) -> bool:
+        """Whether a write with the given parameters is made in the changeset
+        of the session."""
+        return (
+            self._token is not None
+            and connection is self.connection
+            and project_id == self.project_id
+            and schema_edit == self.schema_edit
+        )
+
+    def _record_write(self, journal_comment: str | None) -> None:
+        """Register a successful write made in the changeset of the session,
+        also for the operation in which it was made, if any."""
+        if (writes := _operation_writes.get()) is not None:
+            writes[0] += 1
+        with self._lock:
+            self._writes += 1
+            if journal_comment and journal_comment not in self._journal_comments:
+                self._journal_comments.append(journal_comment)
+
+    def _commit(self) -> None:
+        comment = self.journal_comment or '\n'.join(self._journal_comments) or None
+        body = {}
+        process_change_journal_comment(self.connection, body, '11.5.0600', comment)
+        commit_changeset_changes(
+            connection=self.connection, id=self.changeset_id, body=body
+        )
+        self.committed = True
+        if config.verbose:
+            logger.info(
+                f"Changeset {self.changeset_id} with {self._writes} change(s) "
+                "committed."
+            )
@@ -1,59 +1,126 @@
 # flake8: noqa
-from .dynamic_date_time import (
-    AdjustmentMonthlyByDay,
-    AdjustmentMonthlyByDayOfWeek,
-    AdjustmentMonthlyByReverseCount,
-    AdjustmentNone,
-    AdjustmentQuarterlyByDay,
-    AdjustmentQuarterlyByDayOfWeek,
-    AdjustmentQuarterlyByReverseCount,
-    AdjustmentWeeklyByDayOfWeek,
-    AdjustmentYearlyByDate,
-    AdjustmentYearlyByDayOfWeek,
-    DateMode,
-    DayOfWeek,
-    DynamicDateTimeStructure,
-    DynamicDateTimeType,
-    DynamicVersatileDate,
-    HourMode,
-    MinuteAndSecondMode,
-    StaticVersatileDate,
-    VersatileTime,
-)
-from .enums import *
-from .expression import Expression, Token, list_functions
-from .expression_nodes import (
-    AttributeFormPredicate,
-    BandingCountPredicate,
-    BandingDistinctPredicate,
-    BandingPointsPredicate,
-    BandingSizePredicate,
-    ColumnReference,
-    Constant,
-    CustomExpressionPredicate,
-    DynamicDateTime,
-    ElementListPredicate,
-    ExpressionFormShortcut,
-    ExpressionRelationship,
-    FilterQualificationPredicate,
-    JointElementListPredicate,
-    MetricPredicate,
-    ObjectReference,
-    Operator,
-    PromptPredicate,
-    ReportQualificationPredicate,
-    SetFromRelationshipPredicate,
-)
-from .fact_expression import FactExpression
-from .parameters import (
-    AttributeElement,
-    ConstantArrayParameter,
-    ConstantParameter,
-    DynamicDateTimeParameter,
-    ExpressionParameter,
-    FunctionProperty,
-    ObjectReferenceParameter,
-    PromptParameter,
-    Variant,
-    VariantType,
+from typing import TYPE_CHECKING
+
+from mstrio.utils.lazy_loading import attach_lazy_exports
+
+if TYPE_CHECKING:
+    from .dynamic_date_time import (
+        AdjustmentMonthlyByDay,
+        AdjustmentMonthlyByDayOfWeek,
+        AdjustmentMonthlyByReverseCount,
+        AdjustmentNone,
+        AdjustmentQuarterlyByDay,
+        AdjustmentQuarterlyByDayOfWeek,
+        AdjustmentQuarterlyByReverseCount,
+        AdjustmentWeeklyByDayOfWeek,
+        AdjustmentYearlyByDate,
+        AdjustmentYearlyByDayOfWeek,
+        DateMode,
+        DayOfWeek,
+        DynamicDateTimeStructure,
+        DynamicDateTimeType,
+        DynamicVersatileDate,
+        HourMode,
+        MinuteAndSecondMode,
+        StaticVersatileDate,
+        VersatileTime,
+    )
+    from .enums import *
+    from .expression import Expression, Token, list_functions
+    from .expression_nodes import (
+        AttributeFormPredicate,
+        BandingCountPredicate,
+        BandingDistinctPredicate,
+        BandingPointsPredicate,
+        BandingSizePredicate,
+        ColumnReference,
+        Constant,
+        CustomExpressionPredicate,
+        DynamicDateTime,
+        ElementListPredicate,
+        ExpressionFormShortcut,
+        ExpressionRelationship,
+        FilterQualificationPredicate,
+        JointElementListPredicate,
+        MetricPredicate,
+        ObjectReference,
+        Operator,
+        PromptPredicate,
+        ReportQualificationPredicate,
+        SetFromRelationshipPredicate,
+    )
+    from .fact_expression import FactExpression
+    from .parameters import (
+        AttributeElement,
+        ConstantArrayParameter,
+        ConstantParameter,
+        DynamicDateTimeParameter,
+        ExpressionParameter,
+        FunctionProperty,
+        ObjectReferenceParameter,
+        PromptParameter,
+        Variant,
+        VariantType,
+    )
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'AdjustmentMonthlyByDay': '.dynamic_date_time',
+        'AdjustmentMonthlyByDayOfWeek': '.dynamic_date_time',
+        'AdjustmentMonthlyByReverseCount': '.dynamic_date_time',
+        'AdjustmentNone': '.dynamic_date_time',
+        'AdjustmentQuarterlyByDay': '.dynamic_date_time',
+        'AdjustmentQuarterlyByDayOfWeek': '.dynamic_date_time',
+        'AdjustmentQuarterlyByReverseCount': '.dynamic_date_time',
+        'AdjustmentWeeklyByDayOfWeek': '.dynamic_date_time',
+        'AdjustmentYearlyByDate': '.dynamic_date_time',
+        'AdjustmentYearlyByDayOfWeek': '.dynamic_date_time',
+        'DateMode': '.dynamic_date_time',
+        'DayOfWeek': '.dynamic_date_time',
+        'DynamicDateTimeStructure': '.dynamic_date_time',
+        'DynamicDateTimeType': '.dynamic_date_time',
+        'DynamicVersatileDate': '.dynamic_date_time',
+        'HourMode': '.dynamic_date_time',
+        'MinuteAndSecondMode': '.dynamic_date_time',
+        'StaticVersatileDate': '.dynamic_date_time',
+        'VersatileTime': '.dynamic_date_time',
+        'Expression': '.expression',
+        'Token': '.expression',
+        'list_functions': '.expression',
+        'AttributeFormPredicate': '.expression_nodes',
+        'BandingCountPredicate': '.expression_nodes',
+        'BandingDistinctPredicate': '.expression_nodes',
+        'BandingPointsPredicate': '.expression_nodes',
+        'BandingSizePredicate': '.expression_nodes',
+        'ColumnReference': '.expression_nodes',
+        'Constant': '.expression_nodes',
+        'CustomExpressionPredicate': '.expression_nodes',
+        'DynamicDateTime': '.expression_nodes',
+        'ElementListPredicate': '.expression_nodes',
+        'ExpressionFormShortcut': '.expression_nodes',
+        'ExpressionRelationship': '.expression_nodes',
+        'FilterQualificationPredicate': '.expression_nodes',
+        'JointElementListPredicate': '.expression_nodes',
+        'MetricPredicate': '.expression_nodes',
+        'ObjectReference': '.expression_nodes',
+        'Operator': '.expression_nodes',
+        'PromptPredicate': '.expression_nodes',
+        'ReportQualificationPredicate': '.expression_nodes',
+        'SetFromRelationshipPredicate': '.expression_nodes',
+        'FactExpression': '.fact_expression',
+        'AttributeElement': '.parameters',
+        'ConstantArrayParameter': '.parameters',
+        'ConstantParameter': '.parameters',
+        'DynamicDateTimeParameter': '.parameters',
+        'ExpressionParameter': '.parameters',
+        'FunctionProperty': '.parameters',
+        'ObjectReferenceParameter': '.parameters',
+        'PromptParameter': '.parameters',
+        'Variant': '.parameters',
+        'VariantType': '.parameters',
+    },
+    star_modules=[
+        '.enums',
+    ],
 )
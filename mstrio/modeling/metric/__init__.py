@@ -1,14 +1,33 @@
 # flake8: noqa
-# isort: off
-from .dimensionality import Dimensionality, DimensionalityUnit
-from .metric_format import FormatProperty, MetricFormat
-from .metric import (
-    DefaultSubtotals,
-    FormatProperty,
-    list_metrics,
-    Metric,
-    MetricFormat,
-    Threshold,
-)
+from typing import TYPE_CHECKING
+
+from mstrio.utils.lazy_loading import attach_lazy_exports
+
+if TYPE_CHECKING:
+    # isort: off
+    from .dimensionality import Dimensionality, DimensionalityUnit
+    from .metric_format import FormatProperty, MetricFormat
+    from .metric import (
+        DefaultSubtotals,
+        FormatProperty,
+        list_metrics,
+        Metric,
+        MetricFormat,
+        Threshold,
+    )
 
-# isort: on
+    # isort: on
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'Dimensionality': '.dimensionality',
+        'DimensionalityUnit': '.dimensionality',
+        'FormatProperty': '.metric_format',
+        'MetricFormat': '.metric_format',
+        'DefaultSubtotals': '.metric',
+        'list_metrics': '.metric',
+        'Metric': '.metric',
+        'Threshold': '.metric',
+    },
+)
@@ -16,6 +16,7 @@ from mstrio.modeling.schema.helpers import (
 from mstrio.object_management import Folder, SearchPattern, search_operations
 from mstrio.types import ObjectSubTypes, ObjectTypes
 from mstrio.users_and_groups.user import User
+from mstrio.utils.api_helpers import in_changeset_session
 from mstrio.utils.entity import CopyMixin, DeleteMixin, Entity, MoveMixin
 from mstrio.utils.enum_helper import AutoName, get_enum_val
 from mstrio.utils.helper import (
@@ -739,6 +740,7 @@ class Metric(Entity, CopyMixin, MoveMixin, DeleteMixin, ModelVldbMixin):  # noqa
             folder=destination_folder,
             folder_path=destination_folder_path,
         )
+        in_session = in_changeset_session(connection)
         body = {
             'information': {
                 'name': name,
@@ -746,6 +748,9 @@ class Metric(Entity, CopyMixin, MoveMixin, DeleteMixin, ModelVldbMixin):  # noqa
                 'isEmbedded': is_embedded,
                 'description': description,
                 'destinationFolderId': dest_id,
+                # objects created in a changeset session cannot be altered
+                # before the session is committed
+                'hidden': hidden if in_session else None,
             },
             'expression': expression.to_dict() if expression else None,
             'dimty': dimensionality.to_dict() if dimensionality else None,
@@ -790,7 +795,7 @@ class Metric(Entity, CopyMixin, MoveMixin, DeleteMixin, ModelVldbMixin):  # noqa
         # Default value of 'hidden' attribute on IServer is False.
         # Because of that there is no reason to modify its value
         # after creation if 'hidden' parameter was provided as False.
-        if hidden:
+        if hidden and not in_session:
             metric.alter(hidden=hidden)
 
         return metric
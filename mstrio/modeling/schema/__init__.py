@@ -1,15 +1,40 @@
 # flake8: noqa
-from .attribute import *
-from .fact import *
-from .helpers import *
-from .schema_management import (
-    SchemaLockStatus,
-    SchemaLockType,
-    SchemaManagement,
-    SchemaTask,
-    SchemaTaskStatus,
-    SchemaUpdateType,
+from typing import TYPE_CHECKING
+
+from mstrio.utils.lazy_loading import attach_lazy_exports
+
+if TYPE_CHECKING:
+    from .attribute import *
+    from .fact import *
+    from .helpers import *
+    from .schema_management import (
+        SchemaLockStatus,
+        SchemaLockType,
+        SchemaManagement,
+        SchemaTask,
+        SchemaTaskStatus,
+        SchemaUpdateType,
+    )
+    from .table import *
+    from .transformation import *
+    from .user_hierarchy import *
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'SchemaLockStatus': '.schema_management',
+        'SchemaLockType': '.schema_management',
+        'SchemaManagement': '.schema_management',
+        'SchemaTask': '.schema_management',
+        'SchemaTaskStatus': '.schema_management',
+        'SchemaUpdateType': '.schema_management',
+    },
+    star_modules=[
+        '.attribute',
+        '.fact',
+        '.helpers',
+        '.table',
+        '.transformation',
+        '.user_hierarchy',
+    ],
 )
-from .table import *
-from .transformation import *
-from .user_hierarchy import *
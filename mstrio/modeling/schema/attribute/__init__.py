@@ -1,8 +1,24 @@
 # flake8: noqa
-from .attribute_form import AttributeForm
-from .relationship import Relationship, RelationshipType
+from typing import TYPE_CHECKING
 
-# isort: split
+from mstrio.utils.lazy_loading import attach_lazy_exports
 
-# This import has to be at the bottom due to circular import errors
-from .attribute import Attribute, list_attributes
+if TYPE_CHECKING:
+    from .attribute_form import AttributeForm
+    from .relationship import Relationship, RelationshipType
+
+    # isort: split
+
+    # This import has to be at the bottom due to circular import errors
+    from .attribute import Attribute, list_attributes
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'AttributeForm': '.attribute_form',
+        'Relationship': '.relationship',
+        'RelationshipType': '.relationship',
+        'Attribute': '.attribute',
+        'list_attributes': '.attribute',
+    },
+)
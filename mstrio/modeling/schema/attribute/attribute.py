@@ -25,6 +25,7 @@ from mstrio.object_management.folder import Folder
 from mstrio.object_management.search_enums import SearchPattern
 from mstrio.types import ObjectSubTypes, ObjectTypes
 from mstrio.users_and_groups.user import User
+from mstrio.utils.api_helpers import in_changeset_session
 from mstrio.utils.entity import CopyMixin, DeleteMixin, Entity, MoveMixin
 from mstrio.utils.enum_helper import get_enum_val
 from mstrio.utils.helper import (
@@ -478,6 +479,7 @@ class Attribute(Entity, CopyMixin, MoveMixin, DeleteMixin):  # noqa
             folder=destination_folder,
             folder_path=destination_folder_path,
         )
+        in_session = in_changeset_session(connection)
         body = {
             'information': {
                 'name': name,
@@ -485,6 +487,9 @@ class Attribute(Entity, CopyMixin, MoveMixin, DeleteMixin):  # noqa
                 'isEmbedded': is_embedded,
                 'description': description,
                 'destinationFolderId': dest_id,
+                # objects created in a changeset session cannot be altered
+                # before the session is committed
+                'hidden': hidden if in_session else None,
             },
             'forms': [form.to_dict() for form in forms] if forms else None,
             'attributeLookupTable': (
@@ -517,7 +522,7 @@ class Attribute(Entity, CopyMixin, MoveMixin, DeleteMixin):  # noqa
         # Default value of 'hidden' attribute on IServer is False.
         # Because of that there is no reason to modify its value
         # after creation if 'hidden' parameter was provided as False.
-        if hidden:
+        if hidden and not in_session:
             attribute.alter(hidden=hidden)
 
         return attribute
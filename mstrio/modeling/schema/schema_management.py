@@ -1,4 +1,6 @@
 import logging
+from collections.abc import Callable
+from concurrent.futures import Future
 from enum import auto
 from typing import TYPE_CHECKING, Optional, Union
 
@@ -7,6 +9,7 @@ from mstrio.connection import Connection
 from mstrio.utils.entity import auto_match_args_entity
 from mstrio.utils.enum_helper import AutoName, get_enum, get_enum_val
 from mstrio.utils.helper import Dictable, exception_handler
+from mstrio.utils.poller import get_status_poller
 from mstrio.utils.resolvers import get_project_id_from_params_set
 from mstrio.utils.time_helper import DatetimeFormats, map_str_to_datetime
 from mstrio.utils.version_helper import class_version_handler
@@ -391,6 +394,82 @@ class SchemaManagement:
         res = schema.read_task_status(self.connection, task_id, self.project_id)
         return self._save_task(res.json())
 
+    def poll_task(
+        self,
+        task_index: int = -1,
+        timeout: int | None = None,
+        interval: int | None = None,
+        callback: Callable[[Future], None] | None = None,
+    ) -> Future:
+        """Track the task which is stored at a given `task_index` in a list
+        from property `tasks` until it is no longer running, without blocking.
+
+        Status is polled by the poller shared within mstrio-py, so tasks of
+        many projects can be tracked at once.
+
+        Args:
+            task_index (int, optional): Index of the task in the list stored in
+                property `tasks`. Defaults to the last created task.
+            timeout (int, optional): Maximum time to wait in seconds. If not
+                provided, waits indefinitely.
+            interval (int, optional): Fixed time between status checks in
+                seconds. If not provided, the interval is adaptive and limited
+                by the value from mstrio-py's `config`.
+            callback (Callable, optional): Function called with the future
+                once it is done.
+
+        Returns:
+            Future resolved with the finished `SchemaTask`.
+
+        Raises:
+            `IndexError` when there is no task with the given index.
+        """
+        task_id = self.tasks[task_index].id
+
+        def get_status() -> 'SchemaTask':
+            res = schema.read_task_status(self.connection, task_id, self.project_id)
+            return self._save_task(res.json())
+
+        return get_status_poller().submit(
+            get_status,
+            lambda task: task.status != SchemaTaskStatus.RUNNING,
+            timeout=timeout,
+            interval=interval,
+            callback=callback,
+        )
+
+    def wait_for_task(
+        self,
+        task_index: int = -1,
+        timeout: int | None = None,
+        interval: int | None = None,
+    ) -> 'SchemaTask':
+        """Wait until the task which is stored at a given `task_index` in
+        a list from property `tasks` is no longer running.
+
+        Args:
+            task_index (int, optional): Index of the task in the list stored in
+                property `tasks`. Defaults to the last created task.
+            timeout (int, optional): Maximum time to wait in seconds. If not
+                provided, waits indefinitely.
+            interval (int, optional): Fixed time between status checks in
+                seconds. If not provided, the interval is adaptive and limited
+                by the value from mstrio-py's `config`.
+
+        Returns:
+            `SchemaTask` object with all details about the finished task.
+
+        Raises:
+            `IndexError` when there is no task with the given index.
+            `TimeoutError` when the task is still running after `timeout`.
+        """
+        future = self.poll_task(task_index, timeout=timeout, interval=interval)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
     def _save_task(self, task_info: dict) -> 'SchemaTask':
         """Helper method to save the task in property `tasks` based on the
         argument `task_info` provided as a dictionary. When task with the given
@@ -1,4 +1,21 @@
 # flake8: noqa
-from .logical_table import *
-from .physical_table import *
-from .warehouse_table import *
+from typing import TYPE_CHECKING
+
+from mstrio.utils.lazy_loading import attach_lazy_exports
+
+if TYPE_CHECKING:
+    from .logical_table import *
+    from .physical_table import *
+    from .warehouse_catalog import *
+    from .warehouse_table import *
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {},
+    star_modules=[
+        '.logical_table',
+        '.physical_table',
+        '.warehouse_catalog',
+        '.warehouse_table',
+    ],
+)
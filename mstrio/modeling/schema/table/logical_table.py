@@ -1,4 +1,11 @@
+import json
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from enum import auto
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from tqdm import tqdm
@@ -6,6 +13,7 @@ from tqdm import tqdm
 from mstrio import config
 from mstrio.api import tables as tables_api
 from mstrio.connection import Connection
+from mstrio.modeling.changeset_session import ChangesetSession
 from mstrio.modeling.schema import ObjectSubType, SchemaObjectReference
 from mstrio.modeling.schema.attribute import Attribute
 from mstrio.modeling.schema.fact import Fact
@@ -22,13 +30,15 @@ from mstrio.object_management.search_operations import full_search
 from mstrio.types import ObjectTypes
 from mstrio.users_and_groups import User
 from mstrio.utils.entity import DeleteMixin, Entity, MoveMixin
-from mstrio.utils.enum_helper import get_enum, get_enum_val
+from mstrio.utils.enum_helper import AutoName, get_enum, get_enum_val
 from mstrio.utils.helper import (
     delete_none_values,
     exception_handler,
     fetch_objects,
     get_args_from_func,
     get_default_args_from_func,
+    get_parallel_number,
+    write_json_atomic,
 )
 from mstrio.utils.resolvers import (
     FolderPathType,
@@ -296,6 +306,48 @@ def list_changeset_tables(
     return LogicalTable.bulk_from_dict(source_list=tables_list, connection=connection)
 
 
+class StructureUpdateStatus(AutoName):
+    UPDATED = auto()
+    SKIPPED = auto()
+    FAILED = auto()
+
+
+@dataclass
+class TableStructureUpdate:
+    """Outcome of updating the physical table structure of a logical table.
+
+    Attributes:
+        table (LogicalTable): Logical table.
+        status (StructureUpdateStatus): Whether the structure was updated,
+            skipped as unchanged or failed to be updated.
+        fingerprint (str, optional): Fingerprint of the columns of the
+            warehouse table, if it was checked.
+        error (str, optional): Error message, if the update failed.
+        duration (float): Time of the update in seconds.
+    """
+
+    table: "LogicalTable"
+    status: StructureUpdateStatus
+    fingerprint: str | None = None
+    error: str | None = None
+    duration: float = 0.0
+
+
+def _load_fingerprints(path: Path) -> dict[str, dict[str, str]]:
+    if not path.exists():
+        return {}
+    try:
+        with path.open(encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError) as err:
+        logger.warning(f"Ignoring unreadable fingerprint cache '{path}': {err}")
+        return {}
+
+
+def _save_fingerprints(path: Path, fingerprints: dict[str, dict[str, str]]) -> None:
+    write_json_atomic(path, fingerprints, indent=1, sort_keys=True)
+
+
 @class_version_handler('11.3.0100')
 class LogicalTable(Entity, DeleteMixin, MoveMixin):
     """An object representation of a logical table, referred to as Table in
@@ -1080,10 +1132,25 @@ class LogicalTable(Entity, DeleteMixin, MoveMixin):
         connection: "Connection",
         col_merge_option: TableColumnMergeOption | str | None = None,
         ignore_table_prefix: bool | None = None,
-    ):
+        max_workers: int | None = None,
+        single_changeset: bool = False,
+        journal_comment: str | None = None,
+        fingerprint_cache: str | os.PathLike | None = None,
+    ) -> list[TableStructureUpdate]:
         """Updates structure for every table in a project mapped to a
            connection.
 
+        Tables are updated concurrently. An error updating one table does not
+        stop the update of the others; outcomes of all tables are returned.
+
+        With `fingerprint_cache`, columns of the warehouse table of every
+        logical table are fetched first and their fingerprint is compared to
+        the one saved in the cache file after the previous successful update.
+        Tables whose warehouse columns did not change are skipped. Fetching
+        columns is much cheaper than updating the structure, so after a
+        warehouse change only affected tables are updated. Tables not mapped
+        to a warehouse table (e.g. free-form SQL tables) are always updated.
+
         Args:
             connection (Connection): Object representation of MSTR Connection.
             col_merge_option (enum, optional): Defines a column merge option
@@ -1114,21 +1181,164 @@ class LogicalTable(Entity, DeleteMixin, MoveMixin):
 
                 If not set, get the setting value from warehouse catalog. This
                 behavior is same as column merge options.
+            max_workers (int, optional): Maximum number of tables updated
+                concurrently. Defaults to `get_parallel_number()`. Use 1 to
+                update tables one by one.
+            single_changeset (bool, optional): If True, all tables are updated
+                in a single changeset committed once, instead of a changeset
+                per table. Defaults to False.
+            journal_comment (str, optional): Change journal comment of the
+                commit, used with `single_changeset`.
+            fingerprint_cache (str | os.PathLike, optional): Path to a JSON
+                file with fingerprints of warehouse columns of tables. If
+                provided, tables whose columns did not change since their last
+                update are skipped and the file is updated with fingerprints
+                of updated tables. The file is created if it does not exist.
+
+        Returns:
+            List of TableStructureUpdate with outcomes of all tables, in order
+            of `list_logical_tables()`.
+
+        Examples:
+            >>> results = LogicalTable.update_physical_table_structure_for_all_tables(
+            >>>     connection, max_workers=8, fingerprint_cache='tables.json'
+            >>> )
+            >>> [r.table.name for r in results if r.error]
         """
         col_merge_option = get_enum(col_merge_option, TableColumnMergeOption)
         logical_tables = list_logical_tables(connection)
+        max_workers = max_workers or get_parallel_number(len(logical_tables))
+        results: dict[str, TableStructureUpdate] = {}
+        fingerprints: dict[str, str] = {}
+
+        if fingerprint_cache is not None:
+            fingerprint_cache = Path(fingerprint_cache)
+            cache = _load_fingerprints(fingerprint_cache)
+            cached = cache.setdefault(connection.project_id, {})
+            fingerprints = cls._get_warehouse_fingerprints(
+                connection, logical_tables, max_workers
+            )
+            for table in logical_tables:
+                fingerprint = fingerprints.get(table.id)
+                if fingerprint and cached.get(table.id) == fingerprint:
+                    results[table.id] = TableStructureUpdate(
+                        table, StructureUpdateStatus.SKIPPED, fingerprint
+                    )
+
+        def update(table: "LogicalTable") -> None:
+            table.update_physical_table_structure(
+                col_merge_option=col_merge_option,
+                ignore_table_prefix=ignore_table_prefix,
+            )
+
+        def record(table: "LogicalTable", error: Exception | None, duration: float):
+            results[table.id] = TableStructureUpdate(
+                table=table,
+                status=(
+                    StructureUpdateStatus.FAILED
+                    if error
+                    else StructureUpdateStatus.UPDATED
+                ),
+                fingerprint=fingerprints.get(table.id),
+                error=str(error) if error else None,
+                duration=duration,
+            )
+            progress_bar.update()
+
+        to_update = [table for table in logical_tables if table.id not in results]
         with tqdm(
-            total=len(logical_tables),
+            total=len(to_update),
             desc="Updating structures...",
             disable=not config.verbose or not config.progress_bar,
             delay=3,
         ) as progress_bar:
-            for table in logical_tables:
-                table.update_physical_table_structure(
-                    col_merge_option=col_merge_option,
-                    ignore_table_prefix=ignore_table_prefix,
-                )
-                progress_bar.update()
+            if single_changeset and to_update:
+                with ChangesetSession(
+                    connection,
+                    journal_comment=journal_comment,
+                    max_workers=max_workers,
+                    atomic=False,
+                ) as session:
+                    futures = {
+                        session.submit(update, table, label=table.name): table
+                        for table in to_update
+                    }
+                    for future in as_completed(futures):
+                        operation = future.result()
+                        record(futures[future], operation.exception, operation.duration)
+                if not session.committed:
+                    for table in to_update:
+                        if results[table.id].status == StructureUpdateStatus.UPDATED:
+                            results[table.id].status = StructureUpdateStatus.FAILED
+                            results[table.id].error = "Changeset was not committed."
+            elif to_update:
+
+                def timed_update(table: "LogicalTable") -> float:
+                    start = time.perf_counter()
+                    update(table)
+                    return time.perf_counter() - start
+
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(timed_update, table): table
+                        for table in to_update
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            record(futures[future], None, future.result())
+                        except Exception as err:
+                            logger.warning(
+                                f"Failed to update structure of table "
+                                f"'{futures[future].name}': {err}"
+                            )
+                            record(futures[future], err, 0.0)
+
+        outcomes = [results[table.id] for table in logical_tables]
+        if fingerprint_cache is not None:
+            for result in outcomes:
+                if result.status == StructureUpdateStatus.FAILED:
+                    cached.pop(result.table.id, None)
+                elif result.fingerprint:
+                    cached[result.table.id] = result.fingerprint
+            _save_fingerprints(fingerprint_cache, cache)
+
+        failed = sum(r.status == StructureUpdateStatus.FAILED for r in outcomes)
+        skipped = sum(r.status == StructureUpdateStatus.SKIPPED for r in outcomes)
+        if config.verbose:
+            logger.info(
+                f"Structures of {len(outcomes) - failed - skipped} table(s) "
+                f"updated, {skipped} skipped as unchanged, {failed} failed."
+            )
+        return outcomes
+
+    @staticmethod
+    def _get_warehouse_fingerprints(
+        connection: "Connection",
+        logical_tables: list["LogicalTable"],
+        max_workers: int,
+    ) -> dict[str, str]:
+        """Get fingerprints of columns of warehouse tables upon which logical
+        tables depend, by ID of logical table. Tables whose columns could not
+        be fetched are omitted."""
+        from mstrio.modeling.schema.table.warehouse_table import (
+            _find_warehouse_tables,
+        )
+
+        warehouse_tables = _find_warehouse_tables(
+            connection, logical_tables, max_workers
+        )
+        fingerprints = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(table.get_columns_fingerprint): table_id
+                for table_id, table in warehouse_tables.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    fingerprints[futures[future]] = future.result()
+                except Exception as err:
+                    logger.warning(f"Could not fetch warehouse columns: {err}")
+        return fingerprints
 
     def __validate_physical_table_type(self) -> bool:
         """Validates whether a table can be modified by checking if a physical
@@ -0,0 +1,710 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from requests import RequestException
+from tqdm import tqdm
+
+from mstrio import config
+from mstrio.api import datasources
+from mstrio.connection import Connection
+from mstrio.datasources.datasource_instance import list_connected_datasource_instances
+from mstrio.helpers import IServerError
+from mstrio.modeling.schema.helpers import TableColumn
+from mstrio.modeling.schema.table.warehouse_table import (
+    WarehouseTable,
+    list_datasource_warehouse_tables,
+)
+from mstrio.utils.helper import get_parallel_number
+
+logger = logging.getLogger(__name__)
+
+_REQUEST_ERRORS = (IServerError, RequestException)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalog_info (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS namespaces (
+    datasource_id TEXT NOT NULL,
+    namespace_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    fingerprint TEXT,
+    refreshed_at TEXT,
+    PRIMARY KEY (datasource_id, namespace_id)
+);
+CREATE TABLE IF NOT EXISTS tables (
+    datasource_id TEXT NOT NULL,
+    namespace_id TEXT NOT NULL,
+    table_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    fingerprint TEXT,
+    refreshed_at TEXT,
+    PRIMARY KEY (datasource_id, namespace_id, table_id)
+);
+CREATE TABLE IF NOT EXISTS columns (
+    datasource_id TEXT NOT NULL,
+    namespace_id TEXT NOT NULL,
+    table_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT,
+    data_type TEXT,
+    definition TEXT NOT NULL,
+    PRIMARY KEY (datasource_id, namespace_id, table_id, position)
+);
+CREATE INDEX IF NOT EXISTS tables_name ON tables (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS columns_name ON columns (name COLLATE NOCASE);
+"""
+
+
+@dataclass
+class CatalogDiff:
+    """Changes found in the warehouse catalog by `WarehouseCatalog.refresh()`.
+
+    Tables are identified by tuples of datasource ID, namespace name and
+    table name.
+
+    Attributes:
+        added (list[tuple[str, str, str]]): Tables added to the warehouse.
+        removed (list[tuple[str, str, str]]): Tables removed from the
+            warehouse.
+        changed (list[tuple[str, str, str]]): Tables whose columns changed.
+        refreshed_namespaces (int): Number of namespaces whose tables and
+            columns were fetched.
+        unchanged_namespaces (int): Number of namespaces which were skipped,
+            as their list of tables did not change.
+        errors (list[str]): Errors of requests which failed. Catalog data
+            of datasources and namespaces which could not be fetched is kept.
+        duration (float): Time of the refresh in seconds.
+    """
+
+    added: list[tuple[str, str, str]] = field(default_factory=list)
+    removed: list[tuple[str, str, str]] = field(default_factory=list)
+    changed: list[tuple[str, str, str]] = field(default_factory=list)
+    refreshed_namespaces: int = 0
+    unchanged_namespaces: int = 0
+    errors: list[str] = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any table was added, removed or changed."""
+        return bool(self.added or self.removed or self.changed)
+
+
+class WarehouseCatalog:
+    """Local snapshot of the warehouse catalog of a project, stored in
+    a SQLite database.
+
+    `refresh()` crawls namespaces, tables and columns of connected
+    datasources concurrently and saves them with a fingerprint of columns of
+    every table. Later refreshes fetch the list of tables of every namespace
+    and fetch columns only in namespaces whose list of tables changed, unless
+    a full refresh is requested. Lookups, e.g. `list_tables()`,
+    `list_columns()` and `find_columns()`, use only the local database, so
+    schema tooling does not have to crawl the catalog on the I-Server every
+    time.
+
+    Note:
+        Changes of columns of a table which do not change the list of tables
+        in its namespace are detected by a full refresh, or by a refresh of
+        the namespace with `namespaces`.
+
+    Attributes:
+        connection (Connection, optional): Strategy One connection object
+            used to refresh the catalog. If not provided, the catalog can be
+            only read.
+        path (str): Path to the SQLite database file.
+        project_id (str, optional): ID of the project of the catalog.
+
+    Examples:
+        >>> with WarehouseCatalog(conn, 'catalog.db') as catalog:
+        ...     diff = catalog.refresh()
+        ...     columns = catalog.list_columns(datasource_id, 'public', 'sales')
+    """
+
+    def __init__(
+        self,
+        connection: Connection | None = None,
+        path: str | os.PathLike = ':memory:',
+    ) -> None:
+        """Open the catalog database, creating it if it does not exist.
+
+        Args:
+            connection (Connection, optional): Strategy One connection object
+                used to refresh the catalog.
+            path (str | os.PathLike, optional): Path to the SQLite database
+                file. Defaults to an in-memory database.
+
+        Raises:
+            ValueError: If the catalog was created for a different project
+                than the one selected in `connection`.
+        """
+        self.connection = connection
+        self.path = os.fspath(path)
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(_SCHEMA)
+        self.project_id = self._get_info('project_id')
+        if connection is not None and connection.project_id:
+            if self.project_id is None:
+                self._set_info('project_id', connection.project_id)
+                self._db.commit()
+                self.project_id = connection.project_id
+            elif self.project_id != connection.project_id:
+                self._db.close()
+                raise ValueError(
+                    f"Catalog '{self.path}' belongs to project {self.project_id}, "
+                    f"not to project {connection.project_id}."
+                )
+
+    def __repr__(self) -> str:
+        return f"WarehouseCatalog(path={self.path!r}, project_id={self.project_id!r})"
+
+    def __enter__(self) -> 'WarehouseCatalog':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the catalog database."""
+        self._db.close()
+
+    @property
+    def refreshed_at(self) -> datetime | None:
+        """Time of the last refresh of the catalog."""
+        value = self._get_info('refreshed_at')
+        return datetime.fromisoformat(value) if value else None
+
+    def refresh(
+        self,
+        datasource_ids: list[str] | None = None,
+        namespaces: list[str] | None = None,
+        full: bool = False,
+        refresh_warehouse: bool = False,
+        max_workers: int | None = None,
+        progress_bar: bool = True,
+    ) -> CatalogDiff:
+        """Refresh the catalog with the warehouse catalog from the I-Server.
+
+        Namespaces of all datasources and tables of all namespaces are
+        always fetched. Columns are fetched only for tables in namespaces
+        whose list of tables differs from the stored one, in namespaces
+        listed in `namespaces`, or for all tables if `full` is True.
+        Requests are sent concurrently.
+
+        Args:
+            datasource_ids (list[str], optional): IDs of datasources to
+                refresh. Defaults to all datasources connected to the project.
+                Data of other datasources is kept.
+            namespaces (list[str], optional): Names of namespaces whose columns
+                are fetched even if their list of tables did not change.
+            full (bool, optional): If True, columns of all tables are fetched.
+                Defaults to False.
+            refresh_warehouse (bool, optional): If True, the I-Server refreshes
+                its own cache of lists of tables from the warehouse. Defaults
+                to False.
+            max_workers (int, optional): Maximum number of concurrent requests.
+                Defaults to `get_parallel_number()`.
+            progress_bar (bool, optional): If True, progress bar is shown.
+
+        Returns:
+            CatalogDiff with tables which were added, removed or changed.
+        """
+        if self.connection is None:
+            raise ValueError("Connection is required to refresh the catalog.")
+        start = time.perf_counter()
+        diff = CatalogDiff()
+        if datasource_ids is None:
+            datasource_ids = [
+                datasource['id']
+                for datasource in list_connected_datasource_instances(
+                    self.connection, to_dictionary=True
+                )
+            ]
+        forced_namespaces = {name.lower() for name in namespaces or []}
+        max_workers = max_workers or get_parallel_number(len(datasource_ids))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            found_namespaces = self._fetch(
+                executor,
+                self._get_namespaces,
+                [(datasource_id,) for datasource_id in datasource_ids],
+                diff,
+                "Fetching namespaces...",
+                progress_bar,
+            )
+            found_tables = self._fetch(
+                executor,
+                lambda datasource_id, namespace: self._get_tables(
+                    datasource_id, namespace['id'], refresh_warehouse
+                ),
+                [
+                    (datasource_id, namespace)
+                    for (datasource_id,), items in found_namespaces
+                    for namespace in items
+                ],
+                diff,
+                "Fetching tables...",
+                progress_bar,
+            )
+
+            stored_namespaces = self._stored_namespaces(datasource_ids)
+            to_refresh = []
+            for (datasource_id, namespace), tables in found_tables:
+                fingerprint = _fingerprint(
+                    sorted((table['id'], table['name']) for table in tables)
+                )
+                stored = stored_namespaces.get((datasource_id, namespace['id']))
+                if (
+                    full
+                    or stored != fingerprint
+                    or namespace['name'].lower() in forced_namespaces
+                ):
+                    to_refresh.append((datasource_id, namespace, tables, fingerprint))
+                else:
+                    diff.unchanged_namespaces += 1
+
+            columns = {
+                (datasource_id, namespace['id'], table['id']): result
+                for (datasource_id, namespace, table), result in self._fetch(
+                    executor,
+                    self._get_columns,
+                    [
+                        (datasource_id, namespace, table)
+                        for datasource_id, namespace, tables, _ in to_refresh
+                        for table in tables
+                    ],
+                    diff,
+                    "Fetching columns...",
+                    progress_bar,
+                )
+            }
+
+        with self._db:
+            self._save(
+                datasource_ids,
+                found_namespaces,
+                found_tables,
+                to_refresh,
+                columns,
+                diff,
+            )
+            self._set_info('refreshed_at', datetime.now(timezone.utc).isoformat())
+        diff.duration = time.perf_counter() - start
+        if config.verbose:
+            logger.info(
+                f"Catalog refreshed: {len(diff.added)} table(s) added, "
+                f"{len(diff.removed)} removed, {len(diff.changed)} changed, "
+                f"{diff.unchanged_namespaces} namespace(s) unchanged."
+            )
+        return diff
+
+    def list_namespaces(self, datasource_id: str | None = None) -> list[dict]:
+        """List namespaces stored in the catalog.
+
+        Args:
+            datasource_id (str, optional): ID of a datasource.
+
+        Returns:
+            List of dicts with `datasource_id`, `id` and `name` of namespaces.
+        """
+        rows = self._query(
+            "SELECT datasource_id, namespace_id, name FROM namespaces "
+            "WHERE (:ds IS NULL OR datasource_id = :ds) ORDER BY datasource_id, name",
+            {'ds': datasource_id},
+        )
+        return [
+            {'datasource_id': ds, 'id': ns_id, 'name': name} for ds, ns_id, name in rows
+        ]
+
+    def list_tables(
+        self,
+        datasource_id: str | None = None,
+        namespace: str | None = None,
+        name: str | None = None,
+        to_dictionary: bool = False,
+    ) -> list[WarehouseTable] | list[dict]:
+        """List warehouse tables stored in the catalog. Names are matched
+        case-insensitively.
+
+        Args:
+            datasource_id (str, optional): ID of a datasource.
+            namespace (str, optional): Name of a namespace.
+            name (str, optional): Name of a table.
+            to_dictionary (bool, optional): If True, returns a list of dicts,
+                otherwise a list of WarehouseTable objects, whose
+                `list_columns()` returns columns from the catalog without
+                a request. Defaults to False.
+
+        Returns:
+            List of WarehouseTable objects or dicts.
+        """
+        rows = self._query(
+            "SELECT t.datasource_id, t.namespace_id, n.name, t.table_id, t.name, "
+            "t.fingerprint FROM tables t JOIN namespaces n "
+            "ON n.datasource_id = t.datasource_id AND n.namespace_id = t.namespace_id "
+            "WHERE (:ds IS NULL OR t.datasource_id = :ds) "
+            "AND (:ns IS NULL OR n.name = :ns COLLATE NOCASE) "
+            "AND (:name IS NULL OR t.name = :name COLLATE NOCASE) "
+            "ORDER BY t.datasource_id, n.name, t.name",
+            {'ds': datasource_id, 'ns': namespace, 'name': name},
+        )
+        tables = [
+            {
+                'id': table_id,
+                'name': table_name,
+                'datasource': {'id': ds},
+                'namespace_id': ns_id,
+                'namespace': ns_name,
+                'fingerprint': fingerprint,
+            }
+            for ds, ns_id, ns_name, table_id, table_name, fingerprint in rows
+        ]
+        if to_dictionary:
+            return tables
+        objects = []
+        for table in tables:
+            obj = WarehouseTable.from_dict(
+                {key: value for key, value in table.items() if key != 'fingerprint'},
+                connection=self.connection,
+            )
+            obj._columns = self._table_columns(
+                table['datasource']['id'], table['namespace_id'], table['id']
+            )
+            objects.append(obj)
+        return objects
+
+    def list_columns(
+        self,
+        datasource_id: str,
+        namespace: str,
+        table_name: str,
+        to_dictionary: bool = False,
+    ) -> list[TableColumn] | list[dict]:
+        """Get columns of a warehouse table stored in the catalog.
+
+        Args:
+            datasource_id (str): ID of a datasource.
+            namespace (str): Name of a namespace.
+            table_name (str): Name of a table.
+            to_dictionary (bool, optional): If True, returns a list of dicts.
+
+        Returns:
+            List of TableColumn objects or dicts.
+
+        Raises:
+            ValueError: If the table is not in the catalog.
+        """
+        tables = self.list_tables(datasource_id, namespace, table_name, True)
+        if not tables:
+            raise ValueError(
+                f"Table '{namespace}.{table_name}' of datasource {datasource_id} "
+                "is not in the catalog."
+            )
+        columns = self._table_columns(
+            datasource_id, tables[0]['namespace_id'], tables[0]['id'], to_dictionary
+        )
+        return columns
+
+    def find_columns(self, name: str) -> list[dict]:
+        """Find columns with the given name in all tables of the catalog.
+        Names are matched case-insensitively; `%` and `_` are wildcards.
+
+        Args:
+            name (str): Name or pattern of a column name.
+
+        Returns:
+            List of dicts with datasource ID, namespace, table, column name and
+            data type of matching columns.
+        """
+        rows = self._query(
+            "SELECT c.datasource_id, n.name, t.name, c.name, c.data_type "
+            "FROM columns c JOIN tables t ON t.datasource_id = c.datasource_id "
+            "AND t.namespace_id = c.namespace_id AND t.table_id = c.table_id "
+            "JOIN namespaces n ON n.datasource_id = c.datasource_id "
+            "AND n.namespace_id = c.namespace_id "
+            "WHERE c.name LIKE :name ORDER BY c.datasource_id, n.name, t.name",
+            {'name': name},
+        )
+        return [
+            {
+                'datasource_id': ds,
+                'namespace': namespace,
+                'table': table,
+                'column': column,
+                'data_type': data_type,
+            }
+            for ds, namespace, table, column, data_type in rows
+        ]
+
+    def get_table_fingerprint(
+        self, datasource_id: str, namespace: str, table_name: str
+    ) -> str | None:
+        """Get the fingerprint of columns of a table stored in the catalog,
+        equal to `WarehouseTable.get_columns_fingerprint()` at the time of the
+        last refresh of the table, or None if the table is not in the catalog.
+        """
+        tables = self.list_tables(datasource_id, namespace, table_name, True)
+        return tables[0]['fingerprint'] if tables else None
+
+    def _get_namespaces(self, datasource_id: str) -> list[dict]:
+        response = datasources.get_datasource_namespaces(
+            self.connection, id=datasource_id, project_id=self.connection.project_id
+        )
+        return response.json().get('namespaces', [])
+
+    def _get_tables(
+        self, datasource_id: str, namespace_id: str, refresh: bool
+    ) -> list[dict]:
+        return list_datasource_warehouse_tables(
+            self.connection,
+            datasource_id,
+            namespace_id,
+            refresh=refresh,
+            to_dictionary=True,
+        )
+
+    def _get_columns(
+        self, datasource_id: str, namespace: dict, table: dict
+    ) -> tuple[list[dict], str]:
+        warehouse_table = WarehouseTable.from_dict(
+            {
+                'namespace': namespace['name'],
+                **table,
+                'datasource': {'id': datasource_id},
+                'namespace_id': namespace['id'],
+            },
+            connection=self.connection,
+        )
+        columns = [column.to_dict() for column in warehouse_table.list_columns()]
+        return columns, warehouse_table.get_columns_fingerprint()
+
+    @staticmethod
+    def _fetch(
+        executor: ThreadPoolExecutor,
+        func,
+        args_list: list[tuple],
+        diff: CatalogDiff,
+        desc: str,
+        progress_bar: bool,
+    ) -> list[tuple[tuple, Any]]:
+        """Call `func` concurrently with every tuple of arguments and return
+        pairs of arguments and results. Calls which failed are omitted and
+        their errors are recorded in `diff`."""
+        futures = {executor.submit(func, *args): args for args in args_list}
+        results = []
+        with tqdm(
+            total=len(futures),
+            desc=desc,
+            disable=not progress_bar or not config.verbose,
+            delay=3,
+        ) as pbar:
+            for future in as_completed(futures):
+                args = futures[future]
+                try:
+                    result = future.result()
+                except _REQUEST_ERRORS as err:
+                    diff.errors.append(str(err))
+                    logger.warning(f"Could not fetch warehouse catalog: {err}")
+                else:
+                    results.append((args, result))
+                pbar.update()
+        return results
+
+    def _save(
+        self,
+        datasource_ids: list[str],
+        found_namespaces: list[tuple[tuple, list[dict]]],
+        found_tables: list[tuple[tuple, list[dict]]],
+        to_refresh: list[tuple],
+        columns: dict,
+        diff: CatalogDiff,
+    ) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        db = self._db
+        for (datasource_id,), namespaces in found_namespaces:
+            # namespaces of datasources which could not be fetched are kept
+            found_ids = {namespace['id'] for namespace in namespaces}
+            for (namespace_id,) in db.execute(
+                "SELECT namespace_id FROM namespaces WHERE datasource_id = ?",
+                (datasource_id,),
+            ).fetchall():
+                if namespace_id not in found_ids:
+                    self._delete_namespace(datasource_id, namespace_id, diff)
+
+        for datasource_id, namespace, tables, fingerprint in to_refresh:
+            namespace_id = namespace['id']
+            stored = dict(
+                db.execute(
+                    "SELECT table_id, fingerprint FROM tables "
+                    "WHERE datasource_id = ? AND namespace_id = ?",
+                    (datasource_id, namespace_id),
+                ).fetchall()
+            )
+            complete = True
+            for table in tables:
+                key = (datasource_id, namespace['name'], table['name'])
+                fetched = columns.get((datasource_id, namespace_id, table['id']))
+                if fetched is None:
+                    complete = False
+                    continue
+                table_columns, table_fingerprint = fetched
+                if table['id'] not in stored:
+                    diff.added.append(key)
+                elif stored[table['id']] != table_fingerprint:
+                    diff.changed.append(key)
+                self._save_table(
+                    datasource_id,
+                    namespace_id,
+                    table,
+                    table_columns,
+                    table_fingerprint,
+                    now,
+                )
+            found_ids = {table['id'] for table in tables}
+            for table_id in stored.keys() - found_ids:
+                name = db.execute(
+                    "SELECT name FROM tables WHERE datasource_id = ? "
+                    "AND namespace_id = ? AND table_id = ?",
+                    (datasource_id, namespace_id, table_id),
+                ).fetchone()[0]
+                diff.removed.append((datasource_id, namespace['name'], name))
+                self._delete_tables(datasource_id, namespace_id, table_id)
+            db.execute(
+                "INSERT OR REPLACE INTO namespaces VALUES (?, ?, ?, ?, ?)",
+                (
+                    datasource_id,
+                    namespace_id,
+                    namespace['name'],
+                    # a namespace with tables which could not be fetched is
+                    # refreshed again next time
+                    fingerprint if complete else None,
+                    now,
+                ),
+            )
+            diff.refreshed_namespaces += 1
+
+        # namespaces whose tables could not be listed keep their data
+        listed = {(ds, namespace['id']) for (ds, namespace), _ in found_tables}
+        for (datasource_id,), namespaces in found_namespaces:
+            for namespace in namespaces:
+                if (datasource_id, namespace['id']) not in listed:
+                    db.execute(
+                        "INSERT OR IGNORE INTO namespaces VALUES (?, ?, ?, NULL, ?)",
+                        (datasource_id, namespace['id'], namespace['name'], now),
+                    )
+
+    def _save_table(
+        self,
+        datasource_id: str,
+        namespace_id: str,
+        table: dict,
+        columns: list[dict],
+        fingerprint: str,
+        refreshed_at: str,
+    ) -> None:
+        self._delete_tables(datasource_id, namespace_id, table['id'])
+        self._db.execute(
+            "INSERT INTO tables VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                datasource_id,
+                namespace_id,
+                table['id'],
+                table['name'],
+                fingerprint,
+                refreshed_at,
+            ),
+        )
+        self._db.executemany(
+            "INSERT INTO columns VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    datasource_id,
+                    namespace_id,
+                    table['id'],
+                    position,
+                    column.get('name') or column.get('columnName'),
+                    (column.get('dataType') or {}).get('type'),
+                    json.dumps(column, separators=(',', ':')),
+                )
+                for position, column in enumerate(columns)
+            ],
+        )
+
+    def _delete_tables(
+        self, datasource_id: str, namespace_id: str, table_id: str | None = None
+    ) -> None:
+        for db_table in ('tables', 'columns'):
+            self._db.execute(
+                f"DELETE FROM {db_table} WHERE datasource_id = ? "  # nosec B608
+                "AND namespace_id = ? AND (? IS NULL OR table_id = ?)",
+                (datasource_id, namespace_id, table_id, table_id),
+            )
+
+    def _delete_namespace(
+        self, datasource_id: str, namespace_id: str, diff: CatalogDiff
+    ) -> None:
+        rows = self._db.execute(
+            "SELECT n.name, t.name FROM tables t JOIN namespaces n "
+            "ON n.datasource_id = t.datasource_id AND n.namespace_id = t.namespace_id "
+            "WHERE t.datasource_id = ? AND t.namespace_id = ?",
+            (datasource_id, namespace_id),
+        ).fetchall()
+        diff.removed.extend((datasource_id, ns, table) for ns, table in rows)
+        self._delete_tables(datasource_id, namespace_id)
+        self._db.execute(
+            "DELETE FROM namespaces WHERE datasource_id = ? AND namespace_id = ?",
+            (datasource_id, namespace_id),
+        )
+
+    def _stored_namespaces(self, datasource_ids: list[str]) -> dict:
+        rows = self._db.execute(
+            "SELECT datasource_id, namespace_id, fingerprint FROM namespaces"
+        ).fetchall()
+        datasource_ids = set(datasource_ids)
+        return {(ds, ns): fp for ds, ns, fp in rows if ds in datasource_ids}
+
+    def _table_columns(
+        self,
+        datasource_id: str,
+        namespace_id: str,
+        table_id: str,
+        to_dictionary: bool = False,
+    ) -> list[TableColumn] | list[dict]:
+        rows = self._query(
+            "SELECT definition FROM columns WHERE datasource_id = ? "
+            "AND namespace_id = ? AND table_id = ? ORDER BY position",
+            (datasource_id, namespace_id, table_id),
+        )
+        columns = [json.loads(definition) for (definition,) in rows]
+        if to_dictionary:
+            return columns
+        return TableColumn.bulk_from_dict(columns, connection=self.connection)
+
+    def _query(self, sql: str, params: dict | tuple) -> list[tuple]:
+        return self._db.execute(sql, params).fetchall()
+
+    def _get_info(self, key: str) -> str | None:
+        row = self._db.execute(
+            "SELECT value FROM catalog_info WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_info(self, key: str, value: str) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO catalog_info VALUES (?, ?)", (key, value)
+        )
+
+
+def _fingerprint(value) -> str:
+    data = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
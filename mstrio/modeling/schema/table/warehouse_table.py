@@ -1,8 +1,11 @@
+import hashlib
+import json
 import logging
-from concurrent.futures import Future, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from functools import cached_property
+from typing import TYPE_CHECKING
 
-from requests import HTTPError, ReadTimeout
+from requests import ConnectionError, HTTPError, ReadTimeout
 from tqdm import tqdm
 
 from mstrio import config
@@ -13,13 +16,26 @@ from mstrio.datasources.datasource_instance import (
     DatasourceInstance,
     list_connected_datasource_instances,
 )
+from mstrio.helpers import IServerError
 from mstrio.modeling.schema import ObjectSubType, SchemaObjectReference
-from mstrio.modeling.schema.helpers import TableColumn, TableColumnMergeOption
+from mstrio.modeling.schema.helpers import (
+    PhysicalTableType,
+    TableColumn,
+    TableColumnMergeOption,
+)
 from mstrio.modeling.schema.table.logical_table import LogicalTable, list_logical_tables
-from mstrio.utils.helper import Dictable, fetch_objects, get_response_json
+from mstrio.utils.helper import (
+    Dictable,
+    fetch_objects,
+    get_parallel_number,
+    get_response_json,
+)
 from mstrio.utils.sessions import FuturesSessionWithRenewal
 from mstrio.utils.version_helper import method_version_handler
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 logger = logging.getLogger(__name__)
 
 
@@ -300,6 +316,27 @@ class WarehouseTable(Dictable):
         self._columns = column_objects
         return column_objects
 
+    def get_columns_fingerprint(self, refresh: bool = False) -> str:
+        """Get a fingerprint of the structure of the table in the warehouse.
+
+        The fingerprint is a hash of the columns returned by `list_columns()`,
+        so it changes whenever a column is added, removed, renamed or its
+        data type changes, and stays the same otherwise.
+
+        Args:
+            refresh (bool, optional): If True, refetches columns instead of
+                using the cached version stored in WarehouseTable.columns.
+
+        Returns:
+            str: Hexadecimal SHA-256 hash of the columns of the table.
+        """
+        columns = sorted(
+            (column.to_dict() for column in self.list_columns(refresh=refresh)),
+            key=lambda column: str(column.get('name')),
+        )
+        data = json.dumps(columns, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
     @classmethod
     def _list_warehouse_tables(
         cls,
@@ -642,3 +679,124 @@ class WarehouseTable(Dictable):
     def columns(self):
         self._columns = self.list_columns()
         return self._columns
+
+
+def _prefetch_table_sources(
+    connection: Connection, logical_tables: 'list[LogicalTable]'
+) -> None:
+    """Set physical tables and primary data sources of logical tables from
+    a single listing of definitions of all tables, instead of fetching the
+    definition of every table separately when they are accessed."""
+    sources = ('physical_table', 'primary_data_source')
+    pending = {
+        table.id: table
+        for table in logical_tables
+        if not set(sources) <= table._fetched_attributes
+    }
+    if not pending:
+        return
+    definitions = fetch_objects(
+        connection,
+        tables_api.get_tables,
+        limit=None,
+        filters={},
+        dict_unpack_value="tables",
+        fields="information,physicalTable,primaryDataSource",
+    )
+    for definition in definitions:
+        table = pending.get(definition.get('id'))
+        if table is None:
+            continue
+        values = {key: definition[key] for key in sources if definition.get(key)}
+        table._set_object_attributes(**values)
+        table._add_to_fetched(tuple(values))
+
+
+def _find_warehouse_tables(
+    connection: Connection,
+    logical_tables: 'Iterable[LogicalTable]',
+    max_workers: int | None = None,
+) -> dict[str, WarehouseTable]:
+    """Find warehouse tables upon which logical tables depend.
+
+    Namespaces are fetched once per datasource and tables once per namespace,
+    concurrently, instead of searching all available warehouse tables.
+    Tables which are not mapped to a warehouse table (e.g. free-form SQL
+    tables) or whose warehouse table could not be found are omitted.
+
+    Args:
+        connection (Connection): Object representation of MSTR Connection.
+        logical_tables (Iterable[LogicalTable]): Logical tables.
+        max_workers (int, optional): Maximum number of concurrent requests.
+            Defaults to `get_parallel_number()`.
+
+    Returns:
+        dict[str, WarehouseTable]: Warehouse tables by ID of logical table.
+    """
+    logical_tables = list(logical_tables)
+    _prefetch_table_sources(connection, logical_tables)
+    locations: dict[str, tuple[str, str, str]] = {}
+    for table in logical_tables:
+        physical_table = table.physical_table
+        source = table.primary_data_source
+        if (
+            physical_table.table_type != PhysicalTableType.NORMAL
+            or not physical_table.table_name
+            or not physical_table.namespace
+            or not source
+            or not source.object_id
+        ):
+            continue
+        locations[table.id] = (
+            source.object_id,
+            physical_table.namespace,
+            physical_table.table_name,
+        )
+    if not locations:
+        return {}
+
+    def get_namespaces(datasource_id: str) -> dict[str, str]:
+        namespaces = datasources.get_datasource_namespaces(
+            connection, id=datasource_id, project_id=connection.project_id
+        ).json()
+        return {
+            namespace['name'].lower(): namespace['id']
+            for namespace in namespaces.get('namespaces', [])
+        }
+
+    def get_tables(datasource_id: str, namespace_id: str) -> dict[str, dict]:
+        tables = list_datasource_warehouse_tables(
+            connection, datasource_id, namespace_id, to_dictionary=True
+        )
+        return {table['name'].lower(): table for table in tables}
+
+    def get_results(func, keys: set) -> dict:
+        futures = {executor.submit(func, *key): key for key in keys}
+        results = {}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except (IServerError, HTTPError, ReadTimeout, ConnectionError) as err:
+                logger.warning(f"Could not fetch warehouse catalog: {err}")
+        return results
+
+    datasource_ids = {(datasource_id,) for datasource_id, _, _ in locations.values()}
+    max_workers = max_workers or get_parallel_number(len(locations))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        namespaces = get_results(get_namespaces, datasource_ids)
+        namespace_ids = {
+            (datasource_id, namespaces[(datasource_id,)][namespace.lower()])
+            for datasource_id, namespace, _ in locations.values()
+            if namespace.lower() in namespaces.get((datasource_id,), {})
+        }
+        tables = get_results(get_tables, namespace_ids)
+
+    warehouse_tables = {}
+    for table_id, (datasource_id, namespace, name) in locations.items():
+        namespace_id = namespaces.get((datasource_id,), {}).get(namespace.lower())
+        table = tables.get((datasource_id, namespace_id), {}).get(name.lower())
+        if table:
+            warehouse_tables[table_id] = WarehouseTable.from_dict(
+                {'namespace': namespace, **table}, connection=connection
+            )
+    return warehouse_tables
@@ -1,41 +1,88 @@
 # flake8: noqa
-from .object import Object, bulk_delete_objects, list_objects
-from .predefined_folders import PredefinedFolders
+from typing import TYPE_CHECKING
 
-# isort: off
-from .folder import (
-    Folder,
-    get_my_personal_objects_contents,
-    get_predefined_folder_contents,
-    list_folders,
-    get_folder_id_from_path,
-)
+from mstrio.utils.lazy_loading import attach_lazy_exports
 
-# isort: on
-from .search_enums import (
-    CertifiedStatus,
-    SearchDomain,
-    SearchPattern,
-    SearchResultsFormat,
-    SearchScope,
-)
-from .search_operations import (
-    CertifiedStatus,
-    DateQuery,
-    QuickSearchData,
-    SearchDomain,
-    SearchObject,
-    SearchPattern,
-    SearchResultsFormat,
-    find_objects_with_id,
-    full_search,
-    get_search_results,
-    get_search_suggestions,
-    list_search_objects,
-    quick_search,
-    quick_search_by_id,
-    quick_search_from_object,
-    start_full_search,
+if TYPE_CHECKING:
+    from .object import Object, bulk_delete_objects, list_objects
+    from .predefined_folders import PredefinedFolders
+
+    # isort: off
+    from .folder import (
+        Folder,
+        get_my_personal_objects_contents,
+        get_predefined_folder_contents,
+        list_folders,
+        get_folder_id_from_path,
+    )
+
+    # isort: on
+    from .folder_crawler import FolderIndex, FolderIndexRefresh, crawl_folder
+    from .search_enums import (
+        CertifiedStatus,
+        SearchDomain,
+        SearchPattern,
+        SearchResultsFormat,
+        SearchScope,
+    )
+    from .search_operations import (
+        CertifiedStatus,
+        DateQuery,
+        QuickSearchData,
+        SearchDomain,
+        SearchObject,
+        SearchPattern,
+        SearchResultsFormat,
+        find_objects_with_id,
+        full_search,
+        get_search_results,
+        get_search_suggestions,
+        list_search_objects,
+        quick_search,
+        quick_search_by_id,
+        quick_search_from_object,
+        start_full_search,
+    )
+    from .shortcut import Shortcut, ShortcutInfoFlags, get_shortcuts, list_shortcuts
+    from .translation import Translation, list_translations
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'Object': '.object',
+        'bulk_delete_objects': '.object',
+        'list_objects': '.object',
+        'PredefinedFolders': '.predefined_folders',
+        'Folder': '.folder',
+        'get_my_personal_objects_contents': '.folder',
+        'get_predefined_folder_contents': '.folder',
+        'list_folders': '.folder',
+        'get_folder_id_from_path': '.folder',
+        'FolderIndex': '.folder_crawler',
+        'FolderIndexRefresh': '.folder_crawler',
+        'crawl_folder': '.folder_crawler',
+        'CertifiedStatus': '.search_enums',
+        'SearchDomain': '.search_enums',
+        'SearchPattern': '.search_enums',
+        'SearchResultsFormat': '.search_enums',
+        'SearchScope': '.search_enums',
+        'DateQuery': '.search_operations',
+        'QuickSearchData': '.search_operations',
+        'SearchObject': '.search_operations',
+        'find_objects_with_id': '.search_operations',
+        'full_search': '.search_operations',
+        'get_search_results': '.search_operations',
+        'get_search_suggestions': '.search_operations',
+        'list_search_objects': '.search_operations',
+        'quick_search': '.search_operations',
+        'quick_search_by_id': '.search_operations',
+        'quick_search_from_object': '.search_operations',
+        'start_full_search': '.search_operations',
+        'Shortcut': '.shortcut',
+        'ShortcutInfoFlags': '.shortcut',
+        'get_shortcuts': '.shortcut',
+        'list_shortcuts': '.shortcut',
+        'Translation': '.translation',
+        'list_translations': '.translation',
+    },
 )
-from .shortcut import Shortcut, ShortcutInfoFlags, get_shortcuts, list_shortcuts
-from .translation import Translation, list_translations
@@ -9,6 +9,7 @@ from mstrio.helpers import IServerError
 from mstrio.object_management import PredefinedFolders
 from mstrio.types import ObjectTypes
 from mstrio.users_and_groups import User
+from mstrio.utils.dict_filter import filter_list_of_dicts
 from mstrio.utils.entity import CopyMixin, DeleteMixin, Entity, EntityBase, MoveMixin
 from mstrio.utils.helper import (
     fetch_objects_async,
@@ -25,6 +26,7 @@ from mstrio.utils.response_processors import objects as objects_processors
 
 if TYPE_CHECKING:
     from mstrio.connection import Connection
+    from mstrio.object_management.folder_crawler import FolderIndex
     from mstrio.server.project import Project
 
 logger = logging.getLogger(__name__)
@@ -251,6 +253,7 @@ def get_predefined_folder_contents(
 def get_folder_id_from_path(
     connection: "Connection",
     path: FolderPathType,
+    index: "FolderIndex | None" = None,
 ) -> str:
     """Get folder id from folder path.
 
@@ -263,10 +266,14 @@ def get_folder_id_from_path(
                     /MicroStrategy Tutorial/Public Objects/Metrics
                 if it's a root folder, example:
                     /CASTOR_SERVER_CONFIGURATION/Users
+        index (FolderIndex, optional): Index of a folder tree, in which the
+            path is looked up first, without walking the folders.
 
     Returns:
         Folder id.
     """
+    if index is not None and (folder_id := index.get_id(path)) is not None:
+        return folder_id
 
     def get_err_msg(f_name: str) -> str:
         return (
@@ -550,38 +557,39 @@ class Folder(Entity, CopyMixin, MoveMixin, DeleteMixin):
             Contents as Python objects (when `to_dictionary` is `False` (default
             value)) or contents as dictionaries otherwise.
         """
-        queue = deque([self.id])
-        objects = []
-
         validate_owner_key_in_filters(filters)
 
-        while queue and (limit is None or len(objects) < limit):
-            current_id = queue.popleft()
-            current_objects = fetch_objects_async(
+        if not include_subfolders:
+            objects = fetch_objects_async(
                 self.connection,
                 folders.get_folder_contents,
                 folders.get_folder_contents_async,
                 limit=limit,
                 chunk_size=1000,
-                id=current_id,
+                id=self.id,
                 filters=filters,
             )
-            objects.extend(current_objects)
+        else:
+            from mstrio.object_management.folder_crawler import _crawl_contents
 
-            if include_subfolders and (limit is None or len(objects) < limit):
-                current_objects = fetch_objects_async(
+            # subfolders are fetched concurrently, with all their contents; the
+            # crawl is closed explicitly to stop its requests once `limit` is met
+            objects = []
+            with contextlib.closing(
+                _crawl_contents(
                     self.connection,
-                    folders.get_folder_contents,
-                    folders.get_folder_contents_async,
-                    limit=limit,
+                    None,
+                    [(self.id, '')],
                     chunk_size=1000,
-                    id=current_id,
-                    filters={'type': 8},
+                    raise_errors=True,
                 )
-                child_folders = [
-                    child for child in current_objects if child.get('type') == 8
-                ]
-                queue.extend(child.get('id') for child in child_folders)
+            ) as pages:
+                for _, items in pages:
+                    for item in items:
+                        del item['path'], item['parent_id']
+                    objects.extend(filter_list_of_dicts(items, **filters))
+                    if limit is not None and len(objects) >= limit:
+                        break
 
         objects = objects[:limit]
         if to_dictionary:
@@ -0,0 +1,532 @@
+import json
+import logging
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from datetime import timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mstrio import config
+from mstrio.api import folders
+from mstrio.object_management.folder import Folder
+from mstrio.types import ObjectTypes
+from mstrio.utils.error_handlers import response_handler
+from mstrio.utils.helper import camel_to_snake, write_json_atomic
+from mstrio.utils.resolvers import (
+    FolderPathType,
+    get_folder_id_from_params_set,
+    get_project_id_from_params_set,
+)
+from mstrio.utils.sessions import FuturesSessionWithRenewal
+from mstrio.utils.time_helper import DatetimeFormats, str_to_datetime
+
+if TYPE_CHECKING:
+    from mstrio.connection import Connection
+    from mstrio.server.project import Project
+
+logger = logging.getLogger(__name__)
+
+_FOLDER_TYPE = ObjectTypes.FOLDER.value
+# fields of objects kept in the index
+_INDEXED_FIELDS = ('name', 'type', 'subtype', 'parent_id', 'date_modified')
+
+
+def crawl_folder(
+    connection: 'Connection',
+    folder: 'Folder | str | FolderPathType',
+    project: 'Project | str | None' = None,
+    include_objects: bool = True,
+    max_depth: int | None = None,
+    max_workers: int = 8,
+    chunk_size: int = 5000,
+) -> Iterator[dict]:
+    """Crawl a folder tree breadth-first and yield its contents as soon as
+    they are found.
+
+    Contents of up to `max_workers` folders are fetched concurrently, so
+    large trees are crawled many times faster than with `Folder.traversal()`
+    or `Folder.get_contents(include_subfolders=True)`, which fetch one folder
+    at a time. Folders whose contents cannot be fetched are skipped.
+
+    Args:
+        connection (Connection): Strategy connection object returned by
+            `connection.Connection()`
+        folder (Folder | str | FolderPathType): Folder object or ID or path
+            of the root folder of the crawled tree.
+        project (Project | str, optional): Project object or ID or name of
+            the folder. Defaults to the project selected in `connection`.
+        include_objects (bool, optional): If True (default), all objects are
+            yielded, otherwise only folders.
+        max_depth (int, optional): Maximal depth of crawled folders, where
+            1 means only direct contents of the root folder. By default the
+            whole tree is crawled.
+        max_workers (int, optional): Maximal number of concurrent requests.
+            Defaults to 8.
+        chunk_size (int, optional): Number of objects fetched from a folder
+            in a single request. Defaults to 5000.
+
+    Yields:
+        Dictionaries of objects, in order of discovery, with their `path`
+        (e.g. '/MicroStrategy Tutorial/Public Objects/Reports') and the ID of
+        their folder as `parent_id`.
+
+    Examples:
+        >>> for obj in crawl_folder(conn, '/MicroStrategy Tutorial/Public Objects'):
+        ...     print(obj['path'], obj['id'])
+    """
+    project_id = get_project_id_from_params_set(connection, project)
+    root_id, root_path = _get_root(connection, project_id, folder)
+    for _, items in _crawl_contents(
+        connection,
+        project_id,
+        [(root_id, root_path)],
+        max_depth=max_depth,
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+    ):
+        for item in items:
+            if include_objects or item.get('type') == _FOLDER_TYPE:
+                yield item
+
+
+@dataclass
+class FolderIndexRefresh:
+    """Summary of a refresh of a `FolderIndex`.
+
+    Attributes:
+        full (bool): Whether the whole tree was crawled.
+        folders_listed (int): Number of folders whose contents were fetched.
+        added (int): Number of objects added to the index.
+        updated (int): Number of objects changed in the index.
+        removed (int): Number of objects removed from the index.
+        duration (float): Duration of the refresh in seconds.
+    """
+
+    full: bool
+    folders_listed: int = 0
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    duration: float = 0.0
+
+
+class FolderIndex:
+    """Index of paths and IDs of objects in a folder tree, saved to a local
+    JSON file.
+
+    The first `refresh()` crawls the whole tree with `crawl_folder()`. Later
+    refreshes search only for objects modified since the newest modification
+    known to the index and fetch contents of the folders they are in, so
+    large, mostly unchanged trees are kept up to date with a few requests.
+    Path lookups and inventories of contents are then answered locally,
+    e.g. by `get_folder_id_from_path(..., index=index)`.
+
+    Note:
+        Removing or moving an object changes the modification time of its
+        folder, which is how removals are found. Changes done while the
+        index was refreshed may be picked up only by the next refresh.
+
+    Attributes:
+        connection (Connection): Strategy connection object.
+        file_path (Path): Path to the JSON file of the index.
+        project_id (str): ID of the project of the folder tree.
+        root_id (str): ID of the root folder of the tree.
+        root_path (str): Path of the root folder of the tree.
+        include_objects (bool): Whether objects other than folders are
+            indexed.
+        max_workers (int): Maximal number of concurrent requests.
+    """
+
+    _VERSION = 1
+
+    def __init__(
+        self,
+        connection: 'Connection',
+        file_path: str | Path,
+        folder: 'Folder | str | FolderPathType | None' = None,
+        project: 'Project | str | None' = None,
+        include_objects: bool = True,
+        max_workers: int = 8,
+    ) -> None:
+        """Load the index from `file_path`, or prepare a new one for the tree
+        of `folder`, which is built by the first `refresh()`.
+
+        Args:
+            connection (Connection): Strategy connection object returned by
+                `connection.Connection()`
+            file_path (str | Path): Path to the JSON file of the index.
+            folder (Folder | str | FolderPathType, optional): Folder object or
+                ID or path of the root folder of the indexed tree. Required if
+                the file does not exist yet.
+            project (Project | str, optional): Project object or ID or name of
+                the folder. Defaults to the project selected in `connection`.
+            include_objects (bool, optional): If True (default), all objects
+                are indexed, otherwise only folders.
+            max_workers (int, optional): Maximal number of concurrent requests.
+                Defaults to 8.
+        """
+        self.connection = connection
+        self.file_path = Path(file_path)
+        self.max_workers = max_workers
+        self._objects: dict[str, dict] = {}
+        self._watermark: str | None = None
+
+        if self.file_path.is_file():
+            self._load()
+            return
+        if folder is None:
+            raise ValueError(
+                f"Index file '{self.file_path}' does not exist. Please provide "
+                "the `folder` to index."
+            )
+        self.project_id = get_project_id_from_params_set(connection, project)
+        self.root_id, self.root_path = _get_root(connection, self.project_id, folder)
+        self.include_objects = include_objects
+        self._update_paths()
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __repr__(self) -> str:
+        return (
+            f"FolderIndex(file_path='{self.file_path}', "
+            f"root_path='{self.root_path}', objects={len(self)})"
+        )
+
+    def get_id(
+        self, path: FolderPathType, object_type: ObjectTypes | None = ObjectTypes.FOLDER
+    ) -> str | None:
+        """Get ID of an object by its path.
+
+        Args:
+            path (FolderPathType): Path of the object, as a string separated
+                with "/" or as a list or tuple of names.
+            object_type (ObjectTypes, optional): Type of the object, folder by
+                default. If None, the first object with the path is taken.
+
+        Returns:
+            ID of the object, or None if it is not in the index.
+        """
+        path = _join_path(path)
+        if path == self.root_path:
+            return self.root_id
+        for id in self._by_path.get(path, []):
+            if object_type is None or self._objects[id]['type'] == object_type.value:
+                return id
+        return None
+
+    def get_path(self, id: str) -> str | None:
+        """Get path of an object by its ID, or None if it is not in the index."""
+        return self.root_path if id == self.root_id else self._paths.get(id)
+
+    def list_contents(
+        self,
+        path: FolderPathType | None = None,
+        recursive: bool = False,
+        object_types: list[ObjectTypes] | None = None,
+    ) -> list[dict]:
+        """List indexed contents of a folder, without requests to the server.
+
+        Args:
+            path (FolderPathType, optional): Path of the folder. Defaults to
+                the root folder of the index.
+            recursive (bool, optional): If True, contents of subfolders are
+                listed as well.
+            object_types (list[ObjectTypes], optional): Types of listed
+                objects. By default all are listed.
+
+        Returns:
+            List of dictionaries with `id`, `name`, `type`, `subtype`,
+            `parent_id`, `date_modified` and `path` of objects.
+        """
+        folder_id = self.get_id(path) if path is not None else self.root_id
+        if folder_id is None:
+            raise ValueError(f"Folder '{_join_path(path)}' is not in the index.")
+        types = {t.value for t in object_types} if object_types else None
+        children = self._children()
+        queue = deque([folder_id])
+        contents = []
+        while queue:
+            for id in children.get(queue.popleft(), []):
+                obj = self._objects[id]
+                if types is None or obj['type'] in types:
+                    contents.append({'id': id, **obj, 'path': self._paths[id]})
+                if recursive and obj['type'] == _FOLDER_TYPE:
+                    queue.append(id)
+        return contents
+
+    def refresh(self, full: bool = False) -> FolderIndexRefresh:
+        """Update the index with changes on the server and save it.
+
+        Args:
+            full (bool, optional): If True, the whole tree is crawled again.
+                By default only folders with changes are, unless the index is
+                empty.
+
+        Returns:
+            FolderIndexRefresh with the numbers of listed folders and of
+            added, updated and removed objects.
+        """
+        start = time.perf_counter()
+        full = full or not self._objects
+        if full:
+            roots, expand = [self.root_id], None
+        else:
+            roots = self._find_changed_folders()
+            old_ids = self._objects.keys()
+
+            # unchanged subfolders are not listed, as their changes would
+            # have been found by the search; new ones are listed entirely
+            def expand(item: dict) -> bool:
+                return item['id'] not in old_ids
+
+        stats = FolderIndexRefresh(full=full)
+        listed = defaultdict(list)
+        failed: set[str] = set()
+        for folder_id, items in _crawl_contents(
+            self.connection,
+            self.project_id,
+            [(id, self.get_path(id)) for id in roots],
+            max_workers=self.max_workers,
+            expand=expand,
+            failed=failed,
+        ):
+            listed[folder_id].extend(
+                item
+                for item in items
+                if self.include_objects or item.get('type') == _FOLDER_TYPE
+            )
+        stats.folders_listed = len(listed) + len(failed - listed.keys())
+
+        objects = {} if full else dict(self._objects)
+        seen = set()
+        for folder_id, items in listed.items():
+            for item in items:
+                entry = {field: item.get(field) for field in _INDEXED_FIELDS}
+                old = self._objects.get(item['id'])
+                if old is None:
+                    stats.added += 1
+                elif old != entry:
+                    stats.updated += 1
+                objects[item['id']] = entry
+                seen.add(item['id'])
+        if not full:
+            # objects which are no longer in listed folders were removed or
+            # moved out of the tree, with their contents
+            removed = [
+                id
+                for id, entry in self._objects.items()
+                if entry['parent_id'] in listed
+                and entry['parent_id'] not in failed
+                and id not in seen
+            ]
+            children = self._children(objects)
+            while removed:
+                id = removed.pop()
+                if id in seen:
+                    continue  # moved to a listed folder
+                if objects.pop(id, None) is not None:
+                    stats.removed += 1
+                removed.extend(children.get(id, []))
+        else:
+            stats.removed = len(set(self._objects) - set(objects))
+
+        self._objects = objects
+        self._update_watermark(item for items in listed.values() for item in items)
+        self._update_paths()
+        self.save()
+        stats.duration = time.perf_counter() - start
+        if config.verbose:
+            logger.info(
+                f"Refreshed index of '{self.root_path}': listed "
+                f"{stats.folders_listed} folder(s), added {stats.added}, updated "
+                f"{stats.updated} and removed {stats.removed} object(s)."
+            )
+        return stats
+
+    def save(self) -> None:
+        """Save the index to its file. The file is replaced atomically, so an
+        interrupted save never leaves a corrupted index behind."""
+        index = {
+            'version': self._VERSION,
+            'projectId': self.project_id,
+            'rootId': self.root_id,
+            'rootPath': self.root_path,
+            'includeObjects': self.include_objects,
+            'watermark': self._watermark,
+            'objects': self._objects,
+        }
+        write_json_atomic(self.file_path, index, separators=(',', ':'))
+
+    def _load(self) -> None:
+        with open(self.file_path, encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') != self._VERSION:
+            raise ValueError(
+                f"Index file '{self.file_path}' has an unsupported version."
+            )
+        self.project_id = index['projectId']
+        self.root_id = index['rootId']
+        self.root_path = index['rootPath']
+        self.include_objects = index['includeObjects']
+        self._watermark = index['watermark']
+        self._objects = index['objects']
+        self._update_paths()
+
+    def _find_changed_folders(self) -> list[str]:
+        """Find folders with changes since the newest modification known to
+        the index, with a single search."""
+        from mstrio.object_management.search_operations import full_search
+
+        changed = {self.root_id}  # removals from the root are not searchable
+        since = str_to_datetime(self._watermark, DatetimeFormats.FULLDATETIME.value)
+        found = full_search(
+            self.connection,
+            project=self.project_id,
+            root_id=self.root_id,
+            begin_modification_time=since.astimezone(timezone.utc).strftime(
+                '%Y-%m-%dT%H:%M:%SZ'
+            ),
+            to_dictionary=True,
+        )
+        for obj in found:
+            parent = next(
+                (a['id'] for a in obj.get('ancestors') or [] if a.get('level') == 1),
+                None,
+            )
+            old = self._objects.get(obj['id'])
+            if (
+                old is not None
+                and old['date_modified'] == obj.get('date_modified')
+                and old['parent_id'] == parent
+            ):
+                continue  # modified at the watermark, already indexed
+            if obj.get('type') == _FOLDER_TYPE and old is not None:
+                changed.add(obj['id'])
+            for folder_id in (parent, old and old['parent_id']):
+                if folder_id == self.root_id or folder_id in self._objects:
+                    changed.add(folder_id)
+        return sorted(changed, key=lambda id: id != self.root_id)
+
+    def _update_watermark(self, items: Iterator[dict]) -> None:
+        dates = [item['date_modified'] for item in items if item.get('date_modified')]
+        if self._watermark:
+            dates.append(self._watermark)
+        if dates:
+            self._watermark = max(
+                dates,
+                key=lambda d: str_to_datetime(d, DatetimeFormats.FULLDATETIME.value),
+            )
+
+    def _children(self, objects: dict[str, dict] | None = None) -> dict:
+        children = defaultdict(list)
+        for id, entry in (self._objects if objects is None else objects).items():
+            children[entry['parent_id']].append(id)
+        return children
+
+    def _update_paths(self) -> None:
+        self._paths: dict[str, str] = {}
+        self._by_path: dict[str, list[str]] = defaultdict(list)
+        children = self._children()
+        queue = deque([(self.root_id, self.root_path)])
+        while queue:
+            parent_id, parent_path = queue.popleft()
+            for id in children.get(parent_id, []):
+                path = f"{parent_path}/{self._objects[id]['name']}"
+                self._paths[id] = path
+                self._by_path[path].append(id)
+                queue.append((id, path))
+
+
+def _join_path(path: FolderPathType) -> str:
+    parts = path.strip('/').split('/') if isinstance(path, str) else path
+    return '/' + '/'.join(parts)
+
+
+def _get_root(
+    connection: 'Connection', project_id: str, folder: 'Folder | str | FolderPathType'
+) -> tuple[str, str]:
+    """Get ID and path of a root folder of a crawl."""
+    if isinstance(folder, Folder):
+        return folder.id, folder.location
+    with connection.temporary_project_change(project_id):
+        folder_id = get_folder_id_from_params_set(connection, project_id, folder=folder)
+        with config.temp_verbose_disable():
+            return folder_id, Folder(connection, id=folder_id).location
+
+
+def _crawl_contents(
+    connection: 'Connection',
+    project_id: str | None,
+    roots: list[tuple[str, str]],
+    max_depth: int | None = None,
+    max_workers: int = 8,
+    chunk_size: int = 5000,
+    expand: Callable[[dict], bool] | None = None,
+    failed: set[str] | None = None,
+    raise_errors: bool = False,
+) -> Iterator[tuple[str, list[dict]]]:
+    """Fetch contents of folders breadth-first with a bounded number of
+    concurrent requests. Folders whose contents cannot be fetched are logged,
+    added to `failed` and skipped, unless `raise_errors` is True.
+
+    Yields:
+        ID of a folder and a page of its contents, with `path` and
+        `parent_id` of every object. Subfolders are fetched too, if they are
+        not deeper than `max_depth` and `expand` accepts them.
+    """
+    # (folder ID, path, depth, offset)
+    queue = deque((id, path, 1, 0) for id, path in roots)
+    with FuturesSessionWithRenewal(
+        connection=connection, max_workers=max_workers
+    ) as session:
+        pending = {}
+        try:
+            while queue or pending:
+                while queue and len(pending) < max_workers:
+                    task = queue.popleft()
+                    folder_id, _, _, offset = task
+                    future = folders.get_folder_contents_async(
+                        session, folder_id, project_id, offset=offset, limit=chunk_size
+                    )
+                    pending[future] = task
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder_id, path, depth, offset = pending.pop(future)
+                    response = future.result()
+                    if not response.ok:
+                        response_handler(
+                            response,
+                            f"Error getting contents of folder with ID: {folder_id}",
+                            throw_error=raise_errors,
+                        )
+                        if failed is not None:
+                            failed.add(folder_id)
+                        continue
+                    if offset == 0:
+                        # remaining pages of the folder are fetched next
+                        total = int(response.headers.get('x-mstr-total-count') or 0)
+                        queue.extendleft(
+                            (folder_id, path, depth, page_offset)
+                            for page_offset in reversed(
+                                range(chunk_size, total, chunk_size)
+                            )
+                        )
+                    items = camel_to_snake(response.json())
+                    for item in items:
+                        item['path'] = f"{path}/{item['name']}"
+                        item['parent_id'] = folder_id
+                        if (
+                            item.get('type') == _FOLDER_TYPE
+                            and (max_depth is None or depth < max_depth)
+                            and (expand is None or expand(item))
+                        ):
+                            queue.append((item['id'], item['path'], depth + 1, 0))
+                    yield folder_id, items
+        finally:
+            # requests not sent yet are dropped when the crawl is closed early
+            for future in pending:
+                future.cancel()
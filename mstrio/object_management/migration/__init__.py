@@ -1,15 +1,47 @@
 # flake8: noqa
-# isort: off
-from .package import (
-    Action,
-    PackageConfig,
-    PackageContentInfo,
-    PackageSettings,
-    MigrationPurpose,
-    PackageType,
-    PackageStatus,
-    ImportStatus,
-)
-from .migration import Migration, list_migrations, list_migration_possible_content
+from typing import TYPE_CHECKING
+
+from mstrio.utils.lazy_loading import attach_lazy_exports
+
+if TYPE_CHECKING:
+    # isort: off
+    from .package import (
+        Action,
+        PackageConfig,
+        PackageContentInfo,
+        PackageSettings,
+        MigrationPurpose,
+        PackageType,
+        PackageStatus,
+        ImportStatus,
+    )
+    from .migration import Migration, list_migrations, list_migration_possible_content
+    from .orchestrator import (
+        MigrationOrchestrator,
+        MigrationStep,
+        MigrationStepRecord,
+        MigrationStepStatus,
+    )
 
-# isort: on
+    # isort: on
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'Action': '.package',
+        'PackageConfig': '.package',
+        'PackageContentInfo': '.package',
+        'PackageSettings': '.package',
+        'MigrationPurpose': '.package',
+        'PackageType': '.package',
+        'PackageStatus': '.package',
+        'ImportStatus': '.package',
+        'Migration': '.migration',
+        'list_migrations': '.migration',
+        'list_migration_possible_content': '.migration',
+        'MigrationOrchestrator': '.orchestrator',
+        'MigrationStep': '.orchestrator',
+        'MigrationStepRecord': '.orchestrator',
+        'MigrationStepStatus': '.orchestrator',
+    },
+)
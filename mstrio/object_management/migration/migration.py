@@ -2,7 +2,7 @@ import logging
 import os
 from collections.abc import Callable
 from datetime import datetime
-from hashlib import sha256
+from typing import TYPE_CHECKING, BinaryIO
 
 from mstrio import config
 from mstrio.api import migration as migration_api
@@ -36,7 +36,13 @@ from mstrio.types import ObjectSubTypes, ObjectTypes
 from mstrio.users_and_groups import User
 from mstrio.utils.entity import DeleteMixin, EntityBase
 from mstrio.utils.enum_helper import get_enum_val
-from mstrio.utils.helper import camel_to_snake
+from mstrio.utils.file_transfer import (
+    CHUNK_SIZE,
+    MultipartFileStream,
+    PreparedFile,
+    StreamedDownload,
+)
+from mstrio.utils.helper import camel_to_snake, deprecation_warning
 from mstrio.utils.progress_bar_mixin import ProgressBarMixin
 from mstrio.utils.resolvers import (
     get_conn_and_env_from_mixed_param,
@@ -50,9 +56,35 @@ from mstrio.utils.version_helper import (
     method_version_handler,
 )
 
+if TYPE_CHECKING:
+    from mstrio.utils.file_transfer import FileSource
+
 logger = logging.getLogger(__name__)
 
 
+class _PackageDownload(dict):
+    """Result of `Migration.download_package()`. The deprecated
+    `file_binary` key, returned by default before, is read from the saved file
+    when it is accessed."""
+
+    def __missing__(self, key):
+        if key != 'file_binary':
+            raise KeyError(key)
+        deprecation_warning(
+            "Accessing `file_binary` returned without `include_binary=True` by "
+            "`Migration.download_package()`",
+            "`include_binary=True` or the file saved under `filepath`",
+            "11.6.9",
+            module=False,
+        )
+        with open(self['filepath'], 'rb') as f:
+            self[key] = f.read()
+        return self[key]
+
+    def get(self, key, default=None):
+        return self[key] if key in self or key == 'file_binary' else default
+
+
 def list_migration_possible_content(
     connection: Connection, package_type: PackageType
 ) -> list[ObjectTypes | ObjectSubTypes]:
@@ -538,9 +570,13 @@ class Migration(EntityBase, ProgressBarMixin, DeleteMixin):
         name: str,
         package_type: PackageType | str,
         migration_purpose: MigrationPurpose | str,
-        file: bytes,
+        file: 'FileSource',
     ):
         """
+        Upload a package to the storage service, streaming it in chunks.
+        `file` might be the content of the package, a path to it or a binary
+        file-like object.
+
         "packageType": str
             ("project", "project_security", "configuration"),
         "packagePurpose": str
@@ -552,33 +588,44 @@ class Migration(EntityBase, ProgressBarMixin, DeleteMixin):
         migration_purpose = get_enum_val(migration_purpose, MigrationPurpose)
 
         conn: Connection = connection
-        body = {
-            "name": name,
-            "extension": "mmp",
-            "type": "migrations.packages",
-            "size": len(file),
-            "sha256": sha256(file).hexdigest(),
-            "environment": {
-                "id": conn.base_url,
-                "name": conn.base_url,
-            },
-            "extraInfo": {
-                "packageType": package_type,
-                "packagePurpose": migration_purpose,
-            },
-        }
-        response = migration_api.storage_service_create_file_metadata(connection, body)
-        if response.ok:
-            cls._file_id = response.json()["id"]
-        return migration_api.storage_service_upload_file_binary(
-            connection, cls._file_id, file
-        )
+        # storage service requires size and hash of the file before its
+        # content, so they are computed in a separate pass over the file
+        with PreparedFile(file) as prepared_file:
+            body = {
+                "name": name,
+                "extension": "mmp",
+                "type": "migrations.packages",
+                "size": prepared_file.size,
+                "sha256": prepared_file.sha256,
+                "environment": {
+                    "id": conn.base_url,
+                    "name": conn.base_url,
+                },
+                "extraInfo": {
+                    "packageType": package_type,
+                    "packagePurpose": migration_purpose,
+                },
+            }
+            response = migration_api.storage_service_create_file_metadata(
+                connection, body
+            )
+            if response.ok:
+                cls._file_id = response.json()["id"]
+            return migration_api.storage_service_upload_file_stream(
+                connection,
+                cls._file_id,
+                MultipartFileStream(
+                    prepared_file,
+                    filename=prepared_file.name or f"{name or cls._file_id}.mmp",
+                    description="Uploading package",
+                ),
+            )
 
     @classmethod
     def migrate_from_file(
         cls,
         connection: 'Connection',
-        file_path: str,
+        file_path: 'str | os.PathLike | BinaryIO',
         package_type: PackageType | str,
         name: str | None = None,
         target_project: 'Project | str | None' = None,
@@ -591,7 +638,9 @@ class Migration(EntityBase, ProgressBarMixin, DeleteMixin):
 
         Args:
             connection (Connection): A Strategy connection object.
-            file_path (str): A full path to the package file.
+            file_path (str | PathLike | BinaryIO): A full path to the package
+                file or a binary file-like object with its content. The
+                package is uploaded in chunks, without loading it into memory.
             package_type (PackageType | str): Type of the package.
             name (str, optional): Name of the migration. Used for identification
                 purposes for the convenience of the user. Defaults to None.
@@ -614,15 +663,12 @@ class Migration(EntityBase, ProgressBarMixin, DeleteMixin):
         )
 
         package_type = get_enum_val(package_type, PackageType)
-        with open(file_path, mode='rb') as file:  # b is important -> binary
-            file_content = file.read()
-
         resp = cls._upload_binary(
             connection=connection,
             name=name,
             package_type=package_type,
             migration_purpose=MigrationPurpose.FROM_FILE,
-            file=file_content,
+            file=file_path,
         )
         file_id = resp.json()["id"]
         env_id = Migration._parse_base_url(connection.base_url)
@@ -853,28 +899,58 @@ class Migration(EntityBase, ProgressBarMixin, DeleteMixin):
             delete_response = True
         return delete_response
 
-    def download_package(self, save_path: str | None = None) -> dict:
+    def download_package(
+        self,
+        save_path: str | None = None,
+        include_binary: bool = False,
+        resume: bool = True,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> dict:
         """Download the package binary to the specified location.
 
+        The package is streamed to the file in chunks and its SHA-256 hash is
+        computed on the fly. Download interrupted e.g. by a network error can
+        be resumed by calling this method again.
+
         Args:
-            save_path: a full path where the package binary will be saved.
-            if None, the package will be saved in the current working directory.
+            save_path: a full path to the directory where the package binary
+                will be saved. If None, the package will be saved in
+                the current working directory.
+            include_binary (bool, optional): Whether to also read the saved
+                package into memory and return it under `file_binary` key.
+                Memory usage grows with the size of the package, so leave it
+                False for large packages. Defaults to False.
+            resume (bool, optional): Whether to continue an interrupted download
+                of the package to the same location, if the server supports it.
+                Defaults to True.
+            chunk_size (int, optional): Size of chunks in bytes. Defaults to
+                1 MiB.
 
         Returns:
-            Dictionary with the filepath and file binary.
+            Dictionary with the filepath, size and SHA-256 hash of the package
+            and, if `include_binary` is True, file binary. Before, the file
+            binary was always included; accessing it without `include_binary`
+            still reads it from the saved file, but it is deprecated.
         """
-        if not save_path:
-            save_path = os.getcwd()
-        response = migration_api.download_migration_package(
-            connection=self.connection, package_id=self.package_info.id
+        package_id = self.package_info.id
+        download = StreamedDownload(
+            lambda offset: migration_api.stream_migration_package(
+                connection=self.connection, package_id=package_id, offset=offset
+            ),
+            directory=save_path or os.getcwd(),
+            chunk_size=chunk_size,
+            resume=resume,
+            description="Downloading package",
+        )
+        filepath = str(download.run())
+        logger.info(f"Package binary saved to: {filepath}")
+        result = _PackageDownload(
+            filepath=filepath, size=download.size, sha256=download.sha256
         )
-        if response.ok:
-            filename = response.headers['Content-Disposition'].split('filename=')[1]
-            with open(filename, "wb") as f:
-                f.write(response.content)
-            filepath = os.path.join(save_path, filename)
-            logger.info(f"Package binary saved to: {filepath}")
-            return {"filepath": filepath, "file_binary": response.content}
+        if include_binary:
+            with open(filepath, 'rb') as f:
+                result["file_binary"] = f.read()
+        return result
 
     @classmethod
     def from_dict(
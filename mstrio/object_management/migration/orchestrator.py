@@ -0,0 +1,583 @@
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import auto
+from graphlib import CycleError, TopologicalSorter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from mstrio import config
+from mstrio.connection import Connection
+from mstrio.helpers import IServerError, IServerException
+from mstrio.object_management.migration.migration import Migration
+from mstrio.object_management.migration.package import (
+    ImportStatus,
+    PackageStatus,
+    ValidationStatus,
+)
+from mstrio.utils.enum_helper import AutoName
+from mstrio.utils.helper import Dictable, write_json_atomic
+from mstrio.utils.poller import get_status_poller
+from mstrio.utils.resolvers import get_conn_and_env_from_mixed_param
+from mstrio.utils.response_processors import migrations
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+    from mstrio.server import Environment
+    from mstrio.server.project import Project
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_PHASE = 'package'
+VALIDATION_PHASE = 'validation'
+IMPORT_PHASE = 'import'
+
+
+class MigrationStepStatus(AutoName):
+    """Status of a single step of `MigrationOrchestrator` run."""
+
+    PENDING = auto()
+    RUNNING = auto()
+    SUCCEEDED = auto()
+    FAILED = auto()
+    SKIPPED = auto()
+
+
+@dataclass
+class MigrationStep:
+    """Definition of a single package migrated by `MigrationOrchestrator`.
+
+    Attributes:
+        name (str): Unique name of the step, used to declare dependencies and
+            to identify the step in the run journal.
+        package (Migration | str | Callable): Migration object, ID of
+            an existing migration or a function without arguments creating
+            a new one, e.g. with `Migration.create_object_migration()`.
+            The function is not called again when a run is resumed.
+        target_env (Connection | Environment): Destination environment of
+            the package or a Connection to it.
+        target_project (Project | str, optional): Destination project object,
+            ID or name. Required in case of object migration.
+        depends_on (list[str]): Names of steps which have to succeed before
+            this one starts.
+        validate (bool): Whether to validate the package in the destination
+            environment before it is migrated.
+        generate_undo (bool): Whether to generate an undo package.
+        source_env (Connection, optional): Connection to the environment where
+            the package is stored, if it is not the one of the orchestrator,
+            e.g. for packages created with `Migration.migrate_from_file()`.
+    """
+
+    name: str
+    package: 'Migration | str | Callable[[], Migration]'
+    target_env: 'Connection | Environment'
+    target_project: 'Project | str | None' = None
+    depends_on: list[str] = field(default_factory=list)
+    validate: bool = False
+    generate_undo: bool = True
+    source_env: Connection | None = None
+
+
+@dataclass
+class MigrationStepRecord(Dictable):
+    """Progress and timing of a single step, as persisted in the run journal.
+
+    Attributes:
+        name (str): Name of the step.
+        status (MigrationStepStatus): Status of the step.
+        migration_id (str, optional): ID of the migration of the step, known
+            once its package is created.
+        phases_done (list[str]): Phases of the step which are finished:
+            'package', 'validation' and 'import'.
+        phase (str, optional): Phase which was started last.
+        queued_at (str, optional): ISO timestamp of the start of the run in
+            which the step was executed.
+        started_at (str, optional): ISO timestamp of the start of the step.
+        finished_at (str, optional): ISO timestamp of the end of the step.
+        durations (dict, optional): Time in seconds spent in every phase.
+        error (str, optional): Error which made the step fail.
+    """
+
+    _FROM_DICT_MAP = {'status': MigrationStepStatus}
+
+    name: str
+    status: MigrationStepStatus = MigrationStepStatus.PENDING
+    migration_id: str | None = None
+    phases_done: list[str] = field(default_factory=list)
+    phase: str | None = None
+    queued_at: str | None = None
+    started_at: str | None = None
+    finished_at: str | None = None
+    durations: dict[str, float] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """Time in seconds between the start and the end of the step."""
+        if not self.started_at or not self.finished_at:
+            return None
+        return (
+            datetime.fromisoformat(self.finished_at)
+            - datetime.fromisoformat(self.started_at)
+        ).total_seconds()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class MigrationOrchestrator:
+    """Run many migrations at once, respecting dependencies between them.
+
+    Steps form a directed acyclic graph: a step starts when all steps it
+    depends on have succeeded, and steps which do not depend on each other run
+    concurrently, up to `max_concurrent_per_env` steps using the same
+    environment (as the source or destination of a package). For every step
+    the package is created, optionally validated and migrated, and the
+    orchestrator waits for each of these phases using the status poller
+    shared within mstrio-py.
+
+    Progress of the run is persisted in a JSON journal after every change, so
+    an interrupted or partially failed run can be resumed: succeeded steps
+    are not repeated, already created packages are reused and finished phases
+    are skipped.
+
+    Attributes:
+        connection (Connection): Connection to the source environment of
+            the packages.
+        max_concurrent_per_env (int): Maximum number of steps using the same
+            environment at once.
+        journal_path (Path, optional): Path to the JSON run journal.
+        timeout (float, optional): Maximum time in seconds to wait for every
+            phase of a step.
+        interval (float, optional): Fixed time in seconds between status
+            checks. Adaptive if not provided.
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        max_concurrent_per_env: int = 2,
+        journal_path: str | Path | None = None,
+        timeout: float | None = None,
+        interval: float | None = None,
+    ) -> None:
+        """Initialize the orchestrator.
+
+        Args:
+            connection (Connection): Connection to the source environment of
+                the packages.
+            max_concurrent_per_env (int, optional): Maximum number of steps
+                using the same environment at once. Defaults to 2.
+            journal_path (str | Path, optional): Path to the JSON file where
+                progress of the run is persisted. If not provided, the run
+                cannot be resumed.
+            timeout (float, optional): Maximum time in seconds to wait for
+                every phase of a step. Waits indefinitely if not provided.
+            interval (float, optional): Fixed time in seconds between status
+                checks. If not provided, the interval is adaptive and limited
+                by the value from mstrio-py's `config`.
+        """
+        if max_concurrent_per_env < 1:
+            raise ValueError("`max_concurrent_per_env` has to be a positive number.")
+        self.connection = connection
+        self.max_concurrent_per_env = max_concurrent_per_env
+        self.journal_path = Path(journal_path) if journal_path else None
+        self.timeout = timeout
+        self.interval = interval
+        self._steps: dict[str, MigrationStep] = {}
+        self._records: dict[str, MigrationStepRecord] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def steps(self) -> list[MigrationStep]:
+        """Steps of the orchestrator, in order of addition."""
+        return list(self._steps.values())
+
+    @property
+    def records(self) -> list[MigrationStepRecord]:
+        """Records of the steps from the last run."""
+        return list(self._records.values())
+
+    def add_step(
+        self,
+        name: str,
+        package: 'Migration | str | Callable[[], Migration]',
+        target_env: 'Connection | Environment',
+        target_project: 'Project | str | None' = None,
+        depends_on: list[str] | None = None,
+        validate: bool = False,
+        generate_undo: bool = True,
+        source_env: Connection | None = None,
+    ) -> MigrationStep:
+        """Add a package to migrate. See `MigrationStep` for the description
+        of the arguments.
+
+        Returns:
+            MigrationStep object.
+        """
+        if name in self._steps:
+            raise ValueError(f"Step with name '{name}' already exists.")
+        step = MigrationStep(
+            name=name,
+            package=package,
+            target_env=target_env,
+            target_project=target_project,
+            depends_on=list(depends_on or []),
+            validate=validate,
+            generate_undo=generate_undo,
+            source_env=source_env,
+        )
+        self._steps[name] = step
+        return step
+
+    def run(
+        self, resume: bool = True, fail_fast: bool = False
+    ) -> list[MigrationStepRecord]:
+        """Migrate all packages.
+
+        A failed step does not stop the run, but steps depending on it,
+        directly or not, are skipped.
+
+        Args:
+            resume (bool, optional): Whether to continue the run saved in
+                the journal. Defaults to True.
+            fail_fast (bool, optional): Whether to stop starting new steps
+                after the first failure. Running steps are still finished and
+                the remaining ones stay pending, so they are run when the run
+                is resumed. Defaults to False.
+
+        Returns:
+            List of records of all steps.
+        """
+        self._check_graph()
+        self._records = self._load_records() if resume else {}
+        queued_at = _now()
+        for name in self._steps:
+            record = self._records.setdefault(name, MigrationStepRecord(name=name))
+            if record.status != MigrationStepStatus.SUCCEEDED:
+                record.status, record.error = MigrationStepStatus.PENDING, None
+                record.queued_at = queued_at
+        self._save_journal()
+
+        running: dict[Future, set[str]] = {}
+        env_usage = Counter()
+        workers = self.max_concurrent_per_env * len(self._env_keys_of_all_steps())
+        with ThreadPoolExecutor(
+            max_workers=max(workers, 1), thread_name_prefix='mstrio-migration'
+        ) as executor:
+            while True:
+                self._skip_blocked_steps()
+                stop = fail_fast and self._any_with(MigrationStepStatus.FAILED)
+                for step in [] if stop else self._ready_steps():
+                    env_keys = self._env_keys(step)
+                    if any(
+                        env_usage[key] >= self.max_concurrent_per_env
+                        for key in env_keys
+                    ):
+                        continue
+                    env_usage.update(env_keys)
+                    self._records[step.name].status = MigrationStepStatus.RUNNING
+                    running[executor.submit(self._run_step, step)] = env_keys
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    env_usage.subtract(running.pop(future))
+
+        self._save_journal()
+        if config.verbose:
+            counts = Counter(record.status.value for record in self.records)
+            logger.info(
+                "Migration run finished: "
+                + ", ".join(f"{count} {status}" for status, count in counts.items())
+            )
+        return self.records
+
+    def timing_report(
+        self, to_dataframe: bool = False
+    ) -> 'list[dict[str, Any]] | DataFrame':
+        """Get per-package timing of the last run.
+
+        Every row contains the name, status and migration ID of the step,
+        the time it waited for its dependencies and free slots (`queued`),
+        the time of every phase and the total duration, in seconds.
+
+        Args:
+            to_dataframe (bool, optional): If True, return the report as
+                a pandas DataFrame. Defaults to False.
+
+        Returns:
+            List of dicts or DataFrame with one row per step.
+        """
+        report = []
+        for record in self.records:
+            queued = None
+            if record.queued_at and record.started_at:
+                queued = (
+                    datetime.fromisoformat(record.started_at)
+                    - datetime.fromisoformat(record.queued_at)
+                ).total_seconds()
+            report.append(
+                {
+                    'name': record.name,
+                    'status': record.status.value,
+                    'migration_id': record.migration_id,
+                    'started_at': record.started_at,
+                    'finished_at': record.finished_at,
+                    'queued': queued,
+                    PACKAGE_PHASE: record.durations.get(PACKAGE_PHASE),
+                    VALIDATION_PHASE: record.durations.get(VALIDATION_PHASE),
+                    IMPORT_PHASE: record.durations.get(IMPORT_PHASE),
+                    'duration': record.duration,
+                    'error': record.error,
+                }
+            )
+        if to_dataframe:
+            import pandas as pd
+
+            return pd.DataFrame(report)
+        return report
+
+    def _check_graph(self) -> None:
+        graph = {}
+        for step in self._steps.values():
+            if unknown := [dep for dep in step.depends_on if dep not in self._steps]:
+                raise ValueError(
+                    f"Step '{step.name}' depends on unknown steps: {unknown}."
+                )
+            graph[step.name] = step.depends_on
+        try:
+            TopologicalSorter(graph).prepare()
+        except CycleError as err:
+            raise ValueError(
+                f"Dependencies of steps form a cycle: {' -> '.join(err.args[1])}."
+            ) from err
+
+    def _any_with(self, status: MigrationStepStatus) -> bool:
+        return any(record.status == status for record in self._records.values())
+
+    def _ready_steps(self) -> list[MigrationStep]:
+        return [
+            step
+            for step in self._steps.values()
+            if self._records[step.name].status == MigrationStepStatus.PENDING
+            and all(
+                self._records[dep].status == MigrationStepStatus.SUCCEEDED
+                for dep in step.depends_on
+            )
+        ]
+
+    def _skip_blocked_steps(self) -> None:
+        blocked = {MigrationStepStatus.FAILED, MigrationStepStatus.SKIPPED}
+        changed = True
+        while changed:
+            changed = False
+            for step in self._steps.values():
+                record = self._records[step.name]
+                if record.status != MigrationStepStatus.PENDING:
+                    continue
+                failed = [
+                    dep
+                    for dep in step.depends_on
+                    if self._records[dep].status in blocked
+                ]
+                if failed:
+                    record.status = MigrationStepStatus.SKIPPED
+                    record.error = f"Skipped, as steps it depends on failed: {failed}."
+                    changed = True
+        self._save_journal()
+
+    def _source_connection(self, step: MigrationStep) -> Connection:
+        if step.source_env is not None:
+            return step.source_env
+        if isinstance(step.package, Migration):
+            return step.package.connection
+        return self.connection
+
+    @staticmethod
+    def _env_key(env: 'Connection | Environment') -> str:
+        connection, _ = get_conn_and_env_from_mixed_param(env)
+        return connection.base_url.rstrip('/')
+
+    def _env_keys(self, step: MigrationStep) -> set[str]:
+        return {
+            self._env_key(self._source_connection(step)),
+            self._env_key(step.target_env),
+        }
+
+    def _env_keys_of_all_steps(self) -> set[str]:
+        return set().union(*(self._env_keys(step) for step in self._steps.values()))
+
+    def _run_step(self, step: MigrationStep) -> None:
+        record = self._records[step.name]
+        record.started_at, record.finished_at = _now(), None
+        self._save_journal()
+        try:
+            migration = self._run_phase(step, PACKAGE_PHASE, self._create_package)
+            if step.validate:
+                self._run_phase(step, VALIDATION_PHASE, self._validate, migration)
+            self._run_phase(step, IMPORT_PHASE, self._import, migration)
+        except Exception as err:  # NOSONAR: failure of one step is recorded
+            logger.error(f"Migration step '{step.name}' failed: {err}")
+            record.status, record.error = MigrationStepStatus.FAILED, str(err)
+        else:
+            record.status = MigrationStepStatus.SUCCEEDED
+            if config.verbose:
+                logger.info(f"Migration step '{step.name}' succeeded.")
+        record.finished_at = _now()
+        self._save_journal()
+
+    def _run_phase(self, step: MigrationStep, phase: str, func: Callable, *args):
+        record = self._records[step.name]
+        if phase in record.phases_done and phase != PACKAGE_PHASE:
+            return None
+        resumed = record.phase == phase
+        record.phase = phase
+        self._save_journal()
+
+        start = time.monotonic()
+        result = func(step, record, resumed, *args)
+        with self._lock:
+            record.durations[phase] = record.durations.get(phase, 0) + (
+                time.monotonic() - start
+            )
+            if phase not in record.phases_done:
+                record.phases_done.append(phase)
+        self._save_journal()
+        return result
+
+    def _wait(self, migration: Migration, info: str, in_progress: list):
+        """Poll only the given status section (`packageInfo`, `importInfo` or
+        `validation`) of the migration until it is not in progress."""
+        attribute = migrations.REST_ATTRIBUTES_MAP.get(info, info)
+
+        def poll():
+            section = migrations.get_status_info(
+                migration.connection, migration.id, info
+            )
+            if not section:
+                return None
+            migration._set_object_attributes(**{attribute: section})
+            return getattr(migration, f'_{attribute}').status
+
+        future = get_status_poller().submit(
+            poll,
+            lambda status: status not in in_progress,
+            timeout=self.timeout,
+            interval=self.interval,
+        )
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def _create_package(
+        self, step: MigrationStep, record: MigrationStepRecord, resumed: bool
+    ) -> Migration:
+        connection = self._source_connection(step)
+        if record.migration_id:
+            migration = Migration(connection, id=record.migration_id)
+        elif isinstance(step.package, Migration):
+            migration = step.package
+        elif isinstance(step.package, str):
+            migration = Migration(connection, id=step.package)
+        else:
+            migration = step.package()
+        record.migration_id = migration.id
+        self._save_journal()
+
+        if PACKAGE_PHASE in record.phases_done:
+            return migration
+        status = self._wait(migration, 'packageInfo', [PackageStatus.CREATING])
+        if status != PackageStatus.CREATED:
+            if callable(step.package) and not isinstance(step.package, Migration):
+                # a new package is created when the run is resumed
+                record.migration_id = None
+            raise IServerException(
+                f"Package of migration '{migration.id}' is not created, its status "
+                f"is '{status.value if status else status}': "
+                f"{migration.package_info.message}"
+            )
+        return migration
+
+    def _validate(
+        self,
+        step: MigrationStep,
+        record: MigrationStepRecord,
+        resumed: bool,
+        migration: Migration,
+    ) -> None:
+        def get_status(mig: Migration):
+            return mig.validation.status if mig.validation else None
+
+        in_progress = [ValidationStatus.VALIDATING]
+        if not (resumed and get_status(migration) in in_progress):
+            migration.trigger_validation(
+                target_env=step.target_env, target_project=step.target_project
+            )
+        status = self._wait(migration, 'validation', in_progress)
+        if status != ValidationStatus.VALIDATED:
+            raise IServerException(
+                f"Validation of migration '{migration.id}' failed: "
+                f"{migration._validation.message if migration._validation else status}"
+            )
+
+    def _import(
+        self,
+        step: MigrationStep,
+        record: MigrationStepRecord,
+        resumed: bool,
+        migration: Migration,
+    ) -> None:
+        target_connection, _ = get_conn_and_env_from_mixed_param(step.target_env)
+        in_progress = [ImportStatus.PENDING, ImportStatus.IMPORTING]
+
+        status = None
+        if resumed:
+            # import might have been started before the run was interrupted
+            try:
+                target_migration = Migration(target_connection, id=migration.id)
+                status = target_migration.import_info.status
+            except IServerError:
+                status = None
+        if status not in in_progress + [ImportStatus.IMPORTED]:
+            migration.migrate(
+                target_env=step.target_env,
+                target_project=step.target_project,
+                generate_undo=step.generate_undo,
+            )
+            target_migration = Migration(target_connection, id=migration.id)
+
+        status = self._wait(target_migration, 'importInfo', in_progress)
+        if status != ImportStatus.IMPORTED:
+            raise IServerException(
+                f"Import of migration '{migration.id}' failed: "
+                f"{target_migration.import_info.message}"
+            )
+
+    def _load_records(self) -> dict[str, MigrationStepRecord]:
+        if not self.journal_path or not self.journal_path.is_file():
+            return {}
+        with open(self.journal_path, encoding='utf-8') as f:
+            journal = json.load(f)
+        records = MigrationStepRecord.bulk_from_dict(journal.get('steps', []))
+        return {record.name: record for record in records if record.name in self._steps}
+
+    def _save_journal(self) -> None:
+        if not self.journal_path:
+            return
+        with self._lock:
+            journal = {
+                'updatedAt': _now(),
+                'steps': [record.to_dict() for record in self._records.values()],
+            }
+            write_json_atomic(self.journal_path, journal, indent=2)
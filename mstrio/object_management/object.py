@@ -21,6 +21,7 @@ from mstrio.utils.helper import (
     get_default_args_from_func,
     get_owner_id,
 )
+from mstrio.utils.records import Record, make_records
 from mstrio.utils.resolvers import (
     FolderPathType,
     get_project_id_from_params_set,
@@ -51,8 +52,9 @@ def list_objects(
     folder_path: FolderPathType | None = None,
     to_dictionary: bool = False,
     limit: int = None,
+    to_records: bool = False,
     **filters,
-) -> list["Object"] | list[dict]:
+) -> list["Object"] | list[dict] | list[Record]:
     """Get list of objects or dicts. Optionally filter the
     objects by specifying filters.
 
@@ -94,6 +96,9 @@ def list_objects(
             (False) returns Objects.
         limit (int, optional): limit the number of elements returned. If `None`
             (default), all objects are returned.
+        to_records (bool, optional): If True, returns compact read-only
+            records, which can be upgraded to Objects with `to_entity()`.
+            Takes precedence over `to_dictionary`.
         **filters: Available filter parameters: ['id', 'name', 'description',
             'date_created', 'date_modified', 'acg', 'owner', 'ext_type']
 
@@ -123,6 +128,7 @@ def list_objects(
         folder_name=folder_name,
         folder_path=folder_path,
         limit=limit,
+        to_records=to_records,
         **filters,
     )
 
@@ -403,8 +409,9 @@ class Object(Entity, ACLMixin, CertifyMixin, CopyMixin, MoveMixin, DeleteMixin):
         folder_name: str | None = None,
         folder_path: FolderPathType | None = None,
         limit: int | None = None,
+        to_records: bool = False,
         **filters,
-    ) -> list["Object"] | list[dict]:
+    ) -> list["Object"] | list[dict] | list[Record]:
         objects = full_search(
             connection,
             object_types=object_type,
@@ -419,6 +426,8 @@ class Object(Entity, ACLMixin, CertifyMixin, CopyMixin, MoveMixin, DeleteMixin):
             limit=limit,
             **filters,
         )
+        if to_records:
+            return make_records(objects, connection, cls)
         if to_dictionary:
             return objects
         return [cls.from_dict(source=obj, connection=connection) for obj in objects]
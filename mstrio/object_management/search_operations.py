@@ -35,6 +35,7 @@ from mstrio.utils.helper import (
     merge_id_and_type,
     snake_to_camel,
 )
+from mstrio.utils.records import Record, make_records
 from mstrio.utils.resolvers import (
     FolderPathType,
     get_folder_id_from_params_set,
@@ -1153,8 +1154,9 @@ def full_search(
     limit: int | None = None,
     offset: int | None = None,
     to_dictionary: bool = True,
+    to_records: bool = False,
     **filters,
-) -> list[dict] | list[Entity]:
+) -> list[dict] | list[Entity] | list[Record]:
     """Perform a full metadata search and return results.
 
     Note:
@@ -1247,6 +1249,9 @@ def full_search(
         results_format(SearchResultsFormat): either a list or a tree format
         to_dictionary (bool): If False returns objects, by default
             (True) returns dictionaries.
+        to_records (bool, optional): If True, returns compact read-only
+            records, which can be upgraded to objects with `to_entity()`.
+            Takes precedence over `to_dictionary`. Defaults to False.
         limit (int): limit the number of elements returned. If `None` (default),
             all objects are returned.
         offset (int): Starting point within the collection of returned
@@ -1255,7 +1260,7 @@ def full_search(
             'date_created', 'date_modified', 'acg']
 
     Returns:
-        list of objects or list of dictionaries
+        list of objects, list of dictionaries or list of records
     """
     passed_params = locals()
     start_search_args = get_args_from_func(start_full_search)
@@ -1553,6 +1558,7 @@ def get_search_results(
     limit: int | None = None,
     offset: int | None = None,
     to_dictionary: bool = False,
+    to_records: bool = False,
     **filters,
 ):
     """Retrieve the results of a full metadata search previously stored in
@@ -1571,6 +1577,9 @@ def get_search_results(
         results_format(SearchResultsFormat): either a list or a tree format
         to_dictionary (bool): If True returns dicts, by default
             (False) returns objects.
+        to_records (bool, optional): If True, returns compact read-only
+            records, which can be upgraded to objects with `to_entity()`.
+            Takes precedence over `to_dictionary`. Defaults to False.
         limit (int): limit the number of elements returned. If `None` (default),
             all objects are returned.
         offset (int): Starting point within the collection of returned
@@ -1579,7 +1588,7 @@ def get_search_results(
             'date_created', 'date_modified', 'acg']
 
     Returns:
-        list of objects or list of dictionaries
+        list of objects, list of dictionaries or list of records
     """
     from mstrio.server.project import Project
 
@@ -1594,7 +1603,9 @@ def get_search_results(
             ' in a dictionary format.'
         )
         return _get_search_result_tree_format(**get_result_params)
-    get_result_params.update({**filters, 'to_dictionary': to_dictionary})
+    get_result_params.update(
+        {**filters, 'to_dictionary': to_dictionary, 'to_records': to_records}
+    )
     return _get_search_result_list_format(**get_result_params)
 
 
@@ -1605,6 +1616,7 @@ def _get_search_result_list_format(
     limit: int | None = None,
     offset: int | None = None,
     to_dictionary: bool = True,
+    to_records: bool = False,
     **filters,
 ):
     from mstrio.utils.object_mapping import map_objects_list
@@ -1627,6 +1639,8 @@ def _get_search_result_list_format(
         raise e
     objects = _prepare_objects(response.json(), filters, project_id=project_id)
 
+    if to_records:
+        return make_records(objects, connection)
     if to_dictionary:
         return objects
     return map_objects_list(connection, objects)
@@ -1,32 +1,96 @@
 # flake8: noqa
-# this order of imports is important to avoid circular imports
-from .applications import Application, list_applications
-from .ai_dataset_collection import AIDatasetCollection, list_ai_dataset_collections
-from .agents import Agent, list_agents
-from .content_cache import ContentCache
-from .content_group import ContentGroup, list_content_groups
-from .datasets import *
-from .document import Document, list_documents, list_documents_across_projects
-from .dashboard import (
-    ChapterPage,
-    Dashboard,
-    DashboardChapter,
-    PageSelector,
-    PageVisualization,
-    VisualizationSelector,
-    list_dashboards,
-    list_dashboards_across_projects,
-)
-from .incremental_refresh_report import (
-    IncrementalRefreshReport,
-    list_incremental_refresh_reports,
+from typing import TYPE_CHECKING
+
+from mstrio.utils.lazy_loading import attach_lazy_exports
+
+if TYPE_CHECKING:
+    # this order of imports is important to avoid circular imports
+    from .applications import Application, list_applications
+    from .ai_dataset_collection import AIDatasetCollection, list_ai_dataset_collections
+    from .agents import Agent, list_agents
+    from .content_cache import ContentCache
+    from .content_group import ContentGroup, list_content_groups
+    from .datasets import *
+    from .document_export import (
+        DocumentExporter,
+        ExportFormat,
+        ExportResult,
+        ExportStatus,
+        ExportTarget,
+    )
+    from .document import Document, list_documents, list_documents_across_projects
+    from .dashboard import (
+        ChapterPage,
+        Dashboard,
+        DashboardChapter,
+        PageSelector,
+        PageVisualization,
+        VisualizationSelector,
+        list_dashboards,
+        list_dashboards_across_projects,
+    )
+    from .incremental_refresh_report import (
+        IncrementalRefreshReport,
+        list_incremental_refresh_reports,
+    )
+    from .library import Library
+    from .mosaic_model import MosaicModel, list_mosaic_models
+    from .palette import Palette, list_palettes
+    from .report import Report, list_reports
+    from mstrio.utils.cache import ContentCacheInventory
+    from mstrio.project_objects.prompt import Prompt
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'Application': '.applications',
+        'list_applications': '.applications',
+        'AIDatasetCollection': '.ai_dataset_collection',
+        'list_ai_dataset_collections': '.ai_dataset_collection',
+        'Agent': '.agents',
+        'list_agents': '.agents',
+        'ContentCache': '.content_cache',
+        'ContentGroup': '.content_group',
+        'list_content_groups': '.content_group',
+        'DocumentExporter': '.document_export',
+        'ExportFormat': '.document_export',
+        'ExportResult': '.document_export',
+        'ExportStatus': '.document_export',
+        'ExportTarget': '.document_export',
+        'Document': '.document',
+        'list_documents': '.document',
+        'list_documents_across_projects': '.document',
+        'ChapterPage': '.dashboard',
+        'Dashboard': '.dashboard',
+        'DashboardChapter': '.dashboard',
+        'PageSelector': '.dashboard',
+        'PageVisualization': '.dashboard',
+        'VisualizationSelector': '.dashboard',
+        'list_dashboards': '.dashboard',
+        'list_dashboards_across_projects': '.dashboard',
+        'IncrementalRefreshReport': '.incremental_refresh_report',
+        'list_incremental_refresh_reports': '.incremental_refresh_report',
+        'Library': '.library',
+        'MosaicModel': '.mosaic_model',
+        'list_mosaic_models': '.mosaic_model',
+        'Palette': '.palette',
+        'list_palettes': '.palette',
+        'Report': '.report',
+        'list_reports': '.report',
+        'ContentCacheInventory': 'mstrio.utils.cache',
+        'Prompt': 'mstrio.project_objects.prompt',
+    },
+    star_modules=[
+        '.datasets',
+    ],
 )
-from .library import Library
-from .mosaic_model import MosaicModel, list_mosaic_models
-from .palette import Palette, list_palettes
-from .report import Report, list_reports
 
 import warnings as _w
+
+# `config` adds its own warning filters on import, so it is loaded before
+# the ones below are set up
+from mstrio import config as _config
+
 with _w.catch_warnings():  # FYI: simpler setup was added in 3.11
     _w.simplefilter(action="ignore", category=DeprecationWarning)
     from mstrio.project_objects.prompt import Prompt
@@ -1,16 +1,50 @@
 # flake8: noqa
-from .cube import list_all_cubes, load_cube
-from .cube_cache import (
-    CubeCache,
-    delete_cube_cache,
-    delete_cube_caches,
-    list_cube_caches,
-)
-from .olap_cube import OlapCube, list_olap_cubes
-from .super_cube import (
-    SuperCube,
-    SuperCubeAttribute,
-    SuperCubeAttributeForm,
-    SuperCubeFormExpression,
-    list_super_cubes,
+from typing import TYPE_CHECKING
+
+from mstrio.utils.lazy_loading import attach_lazy_exports
+
+if TYPE_CHECKING:
+    from .cube import list_all_cubes, load_cube
+    from .cube_cache import (
+        CubeCache,
+        delete_cube_cache,
+        delete_cube_caches,
+        list_cube_caches,
+    )
+    from .olap_cube import OlapCube, list_olap_cubes
+    from .refresh_planner import (
+        CubeRefreshPlan,
+        CubeRefreshPlanner,
+        RefreshMode,
+        RefreshStatus,
+    )
+    from .super_cube import (
+        SuperCube,
+        SuperCubeAttribute,
+        SuperCubeAttributeForm,
+        SuperCubeFormExpression,
+        list_super_cubes,
+    )
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'list_all_cubes': '.cube',
+        'load_cube': '.cube',
+        'CubeCache': '.cube_cache',
+        'delete_cube_cache': '.cube_cache',
+        'delete_cube_caches': '.cube_cache',
+        'list_cube_caches': '.cube_cache',
+        'OlapCube': '.olap_cube',
+        'list_olap_cubes': '.olap_cube',
+        'CubeRefreshPlan': '.refresh_planner',
+        'CubeRefreshPlanner': '.refresh_planner',
+        'RefreshMode': '.refresh_planner',
+        'RefreshStatus': '.refresh_planner',
+        'SuperCube': '.super_cube',
+        'SuperCubeAttribute': '.super_cube',
+        'SuperCubeAttributeForm': '.super_cube',
+        'SuperCubeFormExpression': '.super_cube',
+        'list_super_cubes': '.super_cube',
+    },
 )
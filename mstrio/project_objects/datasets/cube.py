@@ -18,6 +18,12 @@ from mstrio.server import Job
 from mstrio.types import ObjectSubTypes, ObjectTypes
 from mstrio.users_and_groups.user import User
 from mstrio.utils.ai import EnableForAiMixin
+from mstrio.utils.attribute_elements import (
+    SourceKey,
+    fetch_attribute_elements,
+    fetch_attribute_elements_async,
+    get_source_key,
+)
 from mstrio.utils.certified_info import CertifiedInfo
 from mstrio.utils.entity import DeleteMixin, Entity, VldbMixin
 from mstrio.utils.filter import Filter
@@ -26,7 +32,6 @@ from mstrio.utils.helper import (
     exception_handler,
     fallback_on_timeout,
     get_parallel_number,
-    get_total_count_of_objects,
     key_fn_for_sort_object_properties,
     response_handler,
 )
@@ -828,48 +833,37 @@ class _Cube(Entity, EnableForAiMixin, VldbMixin, DeleteMixin):
             filter(lambda x: x['name'] not in row_counts, self._metrics)
         )
 
+    def _attr_elements_source_key(self) -> SourceKey | None:
+        """Key of the cube's data in the attribute element cache. The cube is
+        republished when its data changes, so the last update time is part of
+        its version."""
+        version = self.version
+        if version:
+            version = f"{version}:{self.last_update_time}"
+        return get_source_key(self._connection, self._id, version)
+
     def __get_attr_elements(self, limit=50000):
         """Get elements of report attributes synchronously.
 
         Implements GET /reports/<report_id>/attributes/<attribute_id>/elements.
         """
+        source_key = self._attr_elements_source_key()
+
+        def fetch_page(attribute_id, offset, limit):
+            return cubes.cube_single_attribute_elements(
+                connection=self._connection,
+                cube_id=self._id,
+                attribute_id=attribute_id,
+                offset=offset,
+                limit=limit,
+            )
 
         def fetch_for_attribute(attribute):
             @fallback_on_timeout()
             def fetch_for_attribute_given_limit(limit):
-                response = cubes.cube_single_attribute_elements(
-                    connection=self._connection,
-                    cube_id=self._id,
-                    attribute_id=attribute['id'],
-                    offset=0,
-                    limit=limit,
+                return fetch_attribute_elements(
+                    attribute, fetch_page, limit, source_key=source_key
                 )
-                # Get total number of rows
-                total = get_total_count_of_objects(response)
-                # Get attribute elements from the response.
-                elements = response.json()
-
-                assert isinstance(limit, int) and limit > 0
-                assert isinstance(total, int) and total >= 0
-
-                # If total number of elements is bigger than the chunk size
-                # (limit), fetch them incrementally.
-                for _offset in range(limit, total, limit):
-                    response = cubes.cube_single_attribute_elements(
-                        connection=self._connection,
-                        cube_id=self._id,
-                        attribute_id=attribute['id'],
-                        offset=_offset,
-                        limit=limit,
-                    )
-                    elements.extend(response.json())
-
-                # Return attribute data.
-                return {
-                    'attribute_name': attribute['name'],
-                    'attribute_id': attribute['id'],
-                    'elements': elements,
-                }
 
             return fetch_for_attribute_given_limit(limit)[0]
 
@@ -887,69 +881,29 @@ class _Cube(Entity, EnableForAiMixin, VldbMixin, DeleteMixin):
         return attr_elements
 
     def __get_attr_elements_async(self, limit=50000):
-        """Get attribute elements.
+        """Get attribute elements. All pages of elements of all attributes
+        are fetched concurrently.
 
         Implements GET /cubes/<cube_id>/attributes/<attribute_id>/elements.
         """
 
-        attr_elements = []
-        if self.attributes:
-            threads = get_parallel_number(len(self.attributes))
-            with FuturesSessionWithRenewal(
-                connection=self._connection, max_workers=threads
-            ) as session:
-                # Fetch first chunk of attribute elements.
-                futures = self.__fetch_attribute_elements_chunks(session, limit)
-                pbar = tqdm(
-                    futures,
-                    desc="Loading attribute elements",
-                    leave=False,
-                    disable=not self._progress_bar or not config.verbose,
-                )
-                for i, future in enumerate(pbar):
-                    attr = self.attributes[i]
-                    response = future.result()
-                    if not response.ok:
-                        response_handler(
-                            response, f"Error getting attribute {attr['name']} elements"
-                        )
-                    elements = response.json()
-                    # Get total number of rows
-                    total = get_total_count_of_objects(response)
-                    for _offset in range(limit, total, limit):
-                        response = cubes.cube_single_attribute_elements(
-                            connection=self._connection,
-                            cube_id=self._id,
-                            attribute_id=attr['id'],
-                            offset=_offset,
-                            limit=limit,
-                        )
-                        elements.extend(response.json())
-                    # Append attribute data to the list of attributes.
-                    attr_elements.append(
-                        {
-                            'attribute_name': attr['name'],
-                            'attribute_id': attr['id'],
-                            'elements': elements,
-                        }
-                    )
-                pbar.close()
-
-            return attr_elements
-
-    def __fetch_attribute_elements_chunks(self, future_session, limit):
-        """Fetch add'l rows from this object instance from the Intelligence
-        Server"""
-        return [
-            cubes.cube_single_attribute_elements_coroutine(
-                future_session,
+        def fetch_page(session, attribute_id, offset, limit):
+            return cubes.cube_single_attribute_elements_coroutine(
+                session,
                 cube_id=self._id,
-                attribute_id=attribute['id'],
-                offset=0,
+                attribute_id=attribute_id,
+                offset=offset,
                 limit=limit,
             )
-            for attribute in self.attributes
-        ]
+
+        return fetch_attribute_elements_async(
+            self._connection,
+            self.attributes,
+            fetch_page,
+            limit,
+            source_key=self._attr_elements_source_key(),
+            progress_bar=self._progress_bar,
+        )
 
     def refresh(self) -> Job:
         """Refresh a Cube without interaction.
@@ -0,0 +1,484 @@
+import logging
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import auto
+from typing import TYPE_CHECKING
+
+from mstrio import config
+from mstrio.api import cubes as cubes_api
+from mstrio.project_objects.datasets.cube import CubeStates
+from mstrio.project_objects.datasets.cube_cache import list_cube_caches
+from mstrio.project_objects.datasets.helpers import CubeOptions, DataRefreshType
+from mstrio.server.cluster import Cluster
+from mstrio.server.job_monitor import Job, JobStatus
+from mstrio.utils.enum_helper import AutoName
+from mstrio.utils.helper import Dictable, get_parallel_number
+from mstrio.utils.poller import get_status_poller
+from mstrio.utils.response_processors import cubes as cube_processors
+from mstrio.utils.version_helper import is_server_min_version
+
+if TYPE_CHECKING:
+    from mstrio.connection import Connection
+    from mstrio.project_objects.datasets.olap_cube import OlapCube
+    from mstrio.project_objects.incremental_refresh_report import (
+        IncrementalRefreshReport,
+    )
+
+logger = logging.getLogger(__name__)
+
+CUBES_INFO_CHUNK_SIZE = 100
+"""Number of cubes whose information is fetched with a single request."""
+
+LAST_UPDATE_TIME_FORMAT = '%m/%d/%Y %H:%M:%S'
+"""Format of last update time of a cube returned by I-Server (in UTC)."""
+
+_FINAL_JOB_STATES = (JobStatus.COMPLETED, JobStatus.ERROR, JobStatus.STOPPED)
+
+
+class RefreshMode(AutoName):
+    FULL = auto()
+    INCREMENTAL = auto()
+    SKIP = auto()
+
+
+class RefreshStatus(AutoName):
+    PLANNED = auto()
+    RUNNING = auto()
+    SUCCEEDED = auto()
+    FAILED = auto()
+    SKIPPED = auto()
+
+
+@dataclass
+class CubeRefreshPlan(Dictable):
+    """Decision how to refresh a single OLAP cube, together with the data it
+    was based on and the outcome of the refresh.
+
+    Attributes:
+        cube_id (str): ID of the cube.
+        mode (RefreshMode): Chosen kind of refresh.
+        reason (str): Explanation of the decision.
+        cube_name (str, optional): Name of the cube.
+        states (list[str]): Names of states of the cube (see `CubeStates`).
+        last_update_time (datetime, optional): Time of the last update of
+            the cube data.
+        size (int, optional): Size of the cube, used to start the biggest
+            refreshes first.
+        node (str, optional): Name of the node holding the cube cache, whose
+            concurrency budget the refresh counts against.
+        partition_attribute_id (str, optional): ID of the partition attribute.
+        number_of_partitions (int, optional): Number of data partitions.
+        weight (int): Number of slots of the node budget taken by the refresh.
+            Cubes fetching data slices in parallel take one slot per
+            partition.
+        data_refresh (DataRefreshType, optional): Refresh type set in
+            the cube options.
+        incremental_report_id (str, optional): ID of the Incremental Refresh
+            Report targeting the cube, executed for incremental refresh.
+        status (RefreshStatus): Status of the refresh.
+        job_id (str, optional): ID of the job of the refresh.
+        started_at (datetime, optional): Time when the refresh was started.
+        duration (float, optional): Time of the refresh in seconds.
+        error (str, optional): Error message, if the refresh failed.
+    """
+
+    _FROM_DICT_MAP = {
+        'mode': RefreshMode,
+        'data_refresh': DataRefreshType,
+        'status': RefreshStatus,
+    }
+
+    cube_id: str
+    mode: RefreshMode
+    reason: str
+    cube_name: str | None = None
+    states: list[str] = field(default_factory=list)
+    last_update_time: datetime | None = None
+    size: int | None = None
+    node: str | None = None
+    partition_attribute_id: str | None = None
+    number_of_partitions: int | None = None
+    weight: int = 1
+    data_refresh: DataRefreshType | None = None
+    incremental_report_id: str | None = None
+    status: RefreshStatus = RefreshStatus.PLANNED
+    job_id: str | None = None
+    started_at: datetime | None = None
+    duration: float | None = None
+    error: str | None = None
+
+
+class CubeRefreshPlanner:
+    """Planner and executor of refreshes of many OLAP cubes.
+
+    `plan()` reads, for all given cubes at once, their status and last update
+    time (one request per 100 cubes), options with partition settings and
+    refresh type (concurrently), caches (one listing per node of the cluster)
+    and Incremental Refresh Reports targeting them. Based on that every cube
+    gets one of the refresh modes, checked in the following order:
+
+    - `SKIP` if the cube is being processed or was updated after
+      `fresh_since`,
+    - `FULL` if the cube is not published, is dirty or was last updated
+      before `full_refresh_after` ago,
+    - `INCREMENTAL` if an Incremental Refresh Report targets the cube (it is
+      executed) or the cube options define a refresh type other than
+      `REPLACE` (the cube is republished, which appends or updates data),
+    - `FULL` otherwise.
+
+    `execute()` starts the planned refreshes, the biggest cubes first, keeping
+    at most `max_concurrent_per_node` slots of every node busy, and tracks
+    the created jobs with the shared status poller. A refresh of a cube is
+    counted against the node holding its cache; cubes without cache share
+    the budget of a `None` node.
+
+    Attributes:
+        connection (Connection): Strategy One connection object with
+            a selected project.
+        max_concurrent_per_node (int | dict[str, int]): Number of slots of
+            every node, or of the named nodes (others get 1).
+    """
+
+    def __init__(
+        self,
+        connection: 'Connection',
+        max_concurrent_per_node: int | dict[str, int] = 2,
+        max_workers: int | None = None,
+    ) -> None:
+        """Initialize the planner.
+
+        Args:
+            connection (Connection): Strategy One connection object with
+                a selected project.
+            max_concurrent_per_node (int | dict[str, int], optional): Number
+                of refresh slots of every node, or a mapping of names of nodes
+                to their numbers of slots (nodes not listed get 1 slot).
+                Defaults to 2.
+            max_workers (int, optional): Maximum number of requests sent at
+                once while planning. Defaults to the number of threads used by
+                mstrio-py for parallel requests.
+        """
+        connection._validate_project_selected()
+        self.connection = connection
+        self.max_concurrent_per_node = max_concurrent_per_node
+        self._max_workers = max_workers or get_parallel_number(0)
+
+    def _budget(self, node: str | None) -> int:
+        if isinstance(self.max_concurrent_per_node, dict):
+            return self.max_concurrent_per_node.get(node, 1)
+        return self.max_concurrent_per_node
+
+    def plan(
+        self,
+        cubes: list['OlapCube | str'],
+        fresh_since: datetime | None = None,
+        full_refresh_after: timedelta | None = None,
+        incremental_reports: list['IncrementalRefreshReport'] | None = None,
+    ) -> list[CubeRefreshPlan]:
+        """Decide how every cube should be refreshed.
+
+        Args:
+            cubes (list[OlapCube | str]): OLAP cubes or their IDs.
+            fresh_since (datetime, optional): Cubes updated after this time
+                are skipped, e.g. when the plan is made again after
+                an interrupted refresh window. Naive datetimes are treated as
+                UTC.
+            full_refresh_after (timedelta, optional): Cubes not updated for
+                longer than this are fully refreshed even if they could be
+                refreshed incrementally.
+            incremental_reports (list[IncrementalRefreshReport], optional):
+                Incremental Refresh Reports which can be used. By default all
+                Incremental Refresh Reports of the project are checked.
+
+        Returns:
+            List of plans, in order of `cubes`.
+        """
+        ids = [cube if isinstance(cube, str) else cube.id for cube in cubes]
+        infos = self._get_infos(ids)
+        caches = self._get_cache_nodes(set(ids))
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            options = dict(zip(ids, executor.map(self._get_options, ids)))
+            reports = self._get_incremental_reports(
+                set(ids), incremental_reports, executor
+            )
+
+        now = datetime.now(timezone.utc)
+        if fresh_since and fresh_since.tzinfo is None:
+            fresh_since = fresh_since.replace(tzinfo=timezone.utc)
+        return [
+            self._plan_cube(
+                cube_id,
+                infos.get(cube_id, {}),
+                caches.get(cube_id),
+                options[cube_id],
+                reports.get(cube_id),
+                now,
+                fresh_since,
+                full_refresh_after,
+            )
+            for cube_id in ids
+        ]
+
+    def _get_infos(self, ids: list[str]) -> dict[str, dict]:
+        infos = {}
+        for start in range(0, len(ids), CUBES_INFO_CHUNK_SIZE):
+            chunk = ids[start : start + CUBES_INFO_CHUNK_SIZE]
+            response = cubes_api.cubes_info(self.connection, chunk)
+            for info in response.json().get('cubesInfos', []):
+                infos[info['id']] = info
+        return infos
+
+    def _get_cache_nodes(self, ids: set[str]) -> dict[str, str]:
+        nodes = Cluster(self.connection).list_nodes(
+            project=self.connection.project_id, to_dictionary=True
+        )
+        cache_nodes = {}
+        for node in [node.get('name') for node in nodes]:
+            for cache in list_cube_caches(self.connection, node, to_dictionary=True):
+                cube_id = cache.get('source', {}).get('id')
+                if cube_id in ids:
+                    cache_nodes.setdefault(cube_id, node)
+        return cache_nodes
+
+    def _get_options(self, cube_id: str) -> CubeOptions | None:
+        if not is_server_min_version(self.connection, '11.3.0800'):
+            return None
+        try:
+            definition = cube_processors.get(self.connection, cube_id)
+        except Exception as err:  # NOSONAR: plan is made without options
+            logger.warning(f"Failed to get options of cube {cube_id}: {err}")
+            return None
+        if options := definition.get('options'):
+            return CubeOptions.from_dict(options)
+        return None
+
+    def _get_incremental_reports(
+        self,
+        ids: set[str],
+        reports: list['IncrementalRefreshReport'] | None,
+        executor: ThreadPoolExecutor,
+    ) -> dict[str, str]:
+        from mstrio.project_objects.incremental_refresh_report import (
+            list_incremental_refresh_reports,
+        )
+
+        if reports is None:
+            reports = list_incremental_refresh_reports(self.connection)
+
+        def target(report: 'IncrementalRefreshReport') -> str | None:
+            # target cube is fetched lazily, so reports are read concurrently
+            return report.target_cube.object_id if report.target_cube else None
+
+        targets = {}
+        for report, cube_id in zip(reports, executor.map(target, reports)):
+            if cube_id in ids:
+                targets.setdefault(cube_id, report.id)
+        return targets
+
+    def _plan_cube(
+        self,
+        cube_id: str,
+        info: dict,
+        node: str | None,
+        options: CubeOptions | None,
+        report_id: str | None,
+        now: datetime,
+        fresh_since: datetime | None,
+        full_refresh_after: timedelta | None,
+    ) -> CubeRefreshPlan:
+        status = info.get('status') or 0
+        last_update_time = None
+        if value := info.get('lastUpdateTime'):
+            last_update_time = datetime.strptime(
+                value, LAST_UPDATE_TIME_FORMAT
+            ).replace(tzinfo=timezone.utc)
+        partition = options.data_partition if options else None
+        partition_attribute = partition and partition.partition_attribute
+        number_of_partitions = partition.number_of_partitions if partition else None
+        weight = 1
+        if partition and partition.fetch_data_slices_in_parallel:
+            weight = max(1, number_of_partitions or 1)
+
+        plan = CubeRefreshPlan(
+            cube_id=cube_id,
+            mode=RefreshMode.FULL,
+            reason="No incremental refresh is defined for the cube.",
+            cube_name=info.get('name'),
+            states=[state.name for state in CubeStates if status & state.value],
+            last_update_time=last_update_time,
+            size=info.get('size'),
+            node=node,
+            partition_attribute_id=(
+                partition_attribute.object_id if partition_attribute else None
+            ),
+            number_of_partitions=number_of_partitions,
+            weight=weight,
+            data_refresh=options.data_refresh if options else None,
+            incremental_report_id=report_id,
+        )
+
+        def decide(mode: RefreshMode, reason: str) -> CubeRefreshPlan:
+            plan.mode, plan.reason = mode, reason
+            if mode == RefreshMode.SKIP:
+                plan.status = RefreshStatus.SKIPPED
+            return plan
+
+        if not info:
+            return decide(RefreshMode.SKIP, "Cube was not found.")
+        if status & (CubeStates.PROCESSING.value | CubeStates.LOAD_PENDING.value):
+            return decide(RefreshMode.SKIP, "Cube is being processed.")
+        if fresh_since and last_update_time and last_update_time >= fresh_since:
+            return decide(RefreshMode.SKIP, "Cube was updated after `fresh_since`.")
+        published = status & (CubeStates.READY.value | CubeStates.PERSISTED.value)
+        if not published and node is None:
+            return decide(RefreshMode.FULL, "Cube is not published.")
+        if status & CubeStates.DIRTY.value:
+            return decide(RefreshMode.FULL, "Cube is dirty.")
+        if (
+            full_refresh_after
+            and last_update_time
+            and now - last_update_time > full_refresh_after
+        ):
+            return decide(
+                RefreshMode.FULL, "Cube was not updated for `full_refresh_after`."
+            )
+        if report_id:
+            return decide(
+                RefreshMode.INCREMENTAL,
+                f"Incremental Refresh Report {report_id} targets the cube.",
+            )
+        if plan.data_refresh not in (None, DataRefreshType.REPLACE):
+            return decide(
+                RefreshMode.INCREMENTAL,
+                f"Cube refresh type is {plan.data_refresh.name}.",
+            )
+        return plan
+
+    def execute(
+        self, plans: list[CubeRefreshPlan], timeout: float | None = None
+    ) -> list[CubeRefreshPlan]:
+        """Run planned refreshes concurrently within the node budgets and wait
+        for them to finish. Errors of single refreshes do not stop the run;
+        they are stored in the plans.
+
+        Args:
+            plans (list[CubeRefreshPlan]): Plans made by `plan()`, possibly
+                edited.
+            timeout (float, optional): Time in seconds after which a single
+                refresh is marked as failed. Waits indefinitely if not
+                provided.
+
+        Returns:
+            The same list of plans, with updated status, job ID, duration and
+            error.
+        """
+        queue = sorted(
+            (
+                plan
+                for plan in plans
+                if plan.mode != RefreshMode.SKIP
+                and plan.status == RefreshStatus.PLANNED
+            ),
+            key=lambda plan: plan.size or 0,
+            reverse=True,
+        )
+        used: Counter[str | None] = Counter()
+        running: dict[Future, CubeRefreshPlan] = {}
+        try:
+            while queue or running:
+                for plan in list(queue):
+                    # refresh bigger than the whole budget runs alone on the node
+                    if used[plan.node] and (
+                        used[plan.node] + plan.weight > self._budget(plan.node)
+                    ):
+                        continue
+                    queue.remove(plan)
+                    if future := self._start(plan, timeout):
+                        running[future] = plan
+                        used[plan.node] += plan.weight
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    plan = running.pop(future)
+                    used[plan.node] -= plan.weight
+                    self._finish(plan, future)
+        finally:
+            for future in running:
+                future.cancel()
+        return plans
+
+    def _start(self, plan: CubeRefreshPlan, timeout: float | None) -> Future | None:
+        plan.status = RefreshStatus.RUNNING
+        plan.started_at = datetime.now(timezone.utc)
+        plan.error = None
+        try:
+            if plan.mode == RefreshMode.INCREMENTAL and plan.incremental_report_id:
+                job = self._execute_incremental_report(plan.incremental_report_id)
+            else:
+                response = cubes_api.publish(self.connection, plan.cube_id)
+                job = Job.from_dict(response.json(), self.connection)
+        except Exception as err:  # NOSONAR: other refreshes go on
+            plan.status, plan.error = RefreshStatus.FAILED, str(err)
+            return None
+        plan.job_id = job.id
+        if config.verbose:
+            logger.info(
+                f"{plan.mode.name.capitalize()} refresh of cube "
+                f"'{plan.cube_name or plan.cube_id}' was started."
+            )
+
+        def get_status() -> JobStatus:
+            job.refresh_status()
+            return job.status
+
+        return get_status_poller().submit(
+            get_status, lambda status: status in _FINAL_JOB_STATES, timeout=timeout
+        )
+
+    def _execute_incremental_report(self, report_id: str) -> Job:
+        from mstrio.project_objects.incremental_refresh_report import (
+            IncrementalRefreshReport,
+        )
+
+        report = IncrementalRefreshReport(self.connection, id=report_id)
+        return report.execute(project_id=self.connection.project_id)
+
+    @staticmethod
+    def _finish(plan: CubeRefreshPlan, future: Future) -> None:
+        elapsed = datetime.now(timezone.utc) - plan.started_at
+        plan.duration = round(elapsed.total_seconds(), 3)
+        try:
+            job_status = future.result()
+        except Exception as err:  # NOSONAR: stored in the plan
+            plan.status, plan.error = RefreshStatus.FAILED, str(err) or repr(err)
+            return
+        if job_status == JobStatus.COMPLETED:
+            plan.status = RefreshStatus.SUCCEEDED
+        else:
+            plan.status = RefreshStatus.FAILED
+            plan.error = f"Job {plan.job_id} finished with status {job_status}."
+
+    def run(
+        self,
+        cubes: list['OlapCube | str'],
+        fresh_since: datetime | None = None,
+        full_refresh_after: timedelta | None = None,
+        incremental_reports: list['IncrementalRefreshReport'] | None = None,
+        timeout: float | None = None,
+    ) -> list[CubeRefreshPlan]:
+        """Plan and execute refreshes of the cubes. See `plan()` and
+        `execute()` for description of arguments.
+
+        Returns:
+            List of executed plans, in order of `cubes`.
+        """
+        plans = self.plan(
+            cubes,
+            fresh_since=fresh_since,
+            full_refresh_after=full_refresh_after,
+            incremental_reports=incremental_reports,
+        )
+        return self.execute(plans, timeout=timeout)
@@ -1,4 +1,5 @@
 import logging
+import os
 from typing import TYPE_CHECKING
 
 from pandas import DataFrame, concat
@@ -9,6 +10,12 @@ from mstrio.connection import Connection
 from mstrio.helpers import IServerError
 from mstrio.object_management import Folder, SearchPattern, search_operations
 from mstrio.project_objects import OlapCube, SuperCube
+from mstrio.project_objects.document_export import (
+    DocumentExporter,
+    ExportFormat,
+    ExportResult,
+    ExportTarget,
+)
 from mstrio.project_objects.palette import Palette
 from mstrio.server.environment import Environment
 from mstrio.types import ObjectSubTypes
@@ -403,6 +410,74 @@ class Document(
             object_types=ObjectTypes.PALETTE, to_dictionary=to_dictionary
         )
 
+    @classmethod
+    def bulk_export(
+        cls,
+        connection: Connection,
+        targets: list["ExportTarget | Document | str"],
+        directory: str | os.PathLike = '.',
+        export_format: ExportFormat | str = ExportFormat.PDF,
+        max_workers: int | None = None,
+        retries: int = 2,
+        manifest_path: str | os.PathLike | None = None,
+        skip_existing: bool = False,
+        instance_body: dict | None = None,
+    ) -> list[ExportResult]:
+        """Export many objects of this type, or their visualizations, to files
+        concurrently.
+
+        For every object one instance is created and deleted once all its
+        files are exported. Files are streamed to `directory` and failed
+        exports are retried. See `DocumentExporter` for details.
+
+        Args:
+            connection (Connection): Strategy One connection object with
+                a selected project.
+            targets (list[ExportTarget | Document | str]): Files to export.
+                Objects and IDs are exported as a whole in `export_format`.
+            directory (str | PathLike, optional): Directory where files are
+                saved. Defaults to the current working directory.
+            export_format (ExportFormat | str, optional): Format of objects
+                given as objects or IDs. Defaults to PDF.
+            max_workers (int, optional): Maximum number of objects exported at
+                once. Defaults to the number of threads used by mstrio-py for
+                parallel requests.
+            retries (int, optional): Number of retries of a failed export.
+                Defaults to 2.
+            manifest_path (str | PathLike, optional): Path to the JSON file
+                where results of the exports are saved.
+            skip_existing (bool, optional): Whether to skip files exported
+                successfully according to the manifest, e.g. to continue
+                an interrupted run. Defaults to False.
+            instance_body (dict, optional): JSON-formatted body of requests
+                creating instances, e.g. with prompt answers.
+
+        Returns:
+            List of results of exports, in order of `targets`.
+        """
+        targets = [
+            (
+                target
+                if isinstance(target, ExportTarget)
+                else ExportTarget(
+                    document_id=target.id if isinstance(target, Document) else target,
+                    export_format=export_format,
+                    name=target.name if isinstance(target, Document) else None,
+                )
+            )
+            for target in targets
+        ]
+        exporter = DocumentExporter(
+            connection,
+            directory=directory,
+            max_workers=max_workers,
+            retries=retries,
+            manifest_path=manifest_path,
+            instance_getter=cls._DOCUMENT_INSTANCE_GETTER,
+            instance_body=instance_body,
+        )
+        return exporter.export(targets, skip_existing=skip_existing)
+
     @property
     def instance_id(self) -> str:
         if not self.get('_instance_id'):
@@ -0,0 +1,425 @@
+import base64
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from enum import Enum, auto
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tqdm.auto import tqdm
+
+from mstrio import config
+from mstrio.api import documents
+from mstrio.utils.enum_helper import AutoName
+from mstrio.utils.file_transfer import CHUNK_SIZE, StreamedDownload
+from mstrio.utils.helper import Dictable, get_parallel_number, write_json_atomic
+
+if TYPE_CHECKING:
+    from requests import Response
+
+    from mstrio.connection import Connection
+
+logger = logging.getLogger(__name__)
+
+
+class ExportFormat(Enum):
+    """Format of an exported document or visualization."""
+
+    PDF = 'pdf'
+    EXCEL = 'excel'
+    CSV = 'csv'
+    MSTR = 'mstr'
+
+
+class ExportStatus(AutoName):
+    SUCCEEDED = auto()
+    FAILED = auto()
+    SKIPPED = auto()
+
+
+_EXTENSIONS = {
+    ExportFormat.PDF: 'pdf',
+    ExportFormat.EXCEL: 'xlsx',
+    ExportFormat.CSV: 'csv',
+    ExportFormat.MSTR: 'mstr',
+}
+_DOCUMENT_FORMATS = (ExportFormat.PDF, ExportFormat.EXCEL, ExportFormat.MSTR)
+_VISUALIZATION_FORMATS = (ExportFormat.PDF, ExportFormat.CSV)
+
+
+@dataclass
+class ExportTarget:
+    """Single file to be exported by `DocumentExporter`.
+
+    Attributes:
+        document_id (str): ID of the document or dashboard.
+        export_format (ExportFormat, str, optional): Format of the file.
+            Documents can be exported to PDF, Excel or .mstr file and
+            visualizations to PDF or CSV file. Defaults to PDF.
+        node_key (str, optional): Key of the visualization to be exported.
+            If not provided, the whole document is exported.
+        body (dict, optional): JSON-formatted settings of the export, as
+            described in REST API documentation of the used endpoint.
+        filename (str, optional): Name of the file. Defaults to the name (or
+            ID) of the document, followed by the visualization key.
+        name (str, optional): Name of the document, used in the default name
+            of the file.
+    """
+
+    document_id: str
+    export_format: ExportFormat | str = ExportFormat.PDF
+    node_key: str | None = None
+    body: dict | None = None
+    filename: str | None = None
+    name: str | None = None
+
+    def __post_init__(self):
+        self.export_format = ExportFormat(self.export_format)
+        allowed = _VISUALIZATION_FORMATS if self.node_key else _DOCUMENT_FORMATS
+        if self.export_format not in allowed:
+            raise ValueError(
+                f"{'Visualization' if self.node_key else 'Document'} cannot be "
+                f"exported to {self.export_format.name} format. Allowed formats: "
+                f"{', '.join(item.name for item in allowed)}."
+            )
+
+    def get_filename(self) -> str:
+        """Name of the exported file."""
+        if self.filename:
+            return self.filename
+        stem = re.sub(r'[\\/:*?"<>|]+', '_', self.name or self.document_id).strip()
+        if self.node_key:
+            stem = f'{stem}_{self.node_key}'
+        return f'{stem}.{_EXTENSIONS[self.export_format]}'
+
+
+@dataclass
+class ExportResult(Dictable):
+    """Outcome of the export of a single `ExportTarget`, as saved in
+    the manifest.
+
+    Attributes:
+        document_id (str): ID of the document or dashboard.
+        export_format (ExportFormat): Format of the file.
+        path (str): Path of the exported file.
+        status (ExportStatus): Status of the export.
+        node_key (str, optional): Key of the exported visualization.
+        size (int, optional): Size of the file in bytes.
+        sha256 (str, optional): Hex digest of SHA-256 hash of the file.
+        attempts (int): Number of attempts made.
+        duration (float, optional): Time of the export in seconds, including
+            retries.
+        finished_at (str, optional): Time when the export finished,
+            in ISO format.
+        error (str, optional): Message of the last error, if the export
+            failed.
+    """
+
+    _FROM_DICT_MAP = {'export_format': ExportFormat, 'status': ExportStatus}
+
+    document_id: str
+    export_format: ExportFormat
+    path: str
+    status: ExportStatus
+    node_key: str | None = None
+    size: int | None = None
+    sha256: str | None = None
+    attempts: int = 0
+    duration: float | None = None
+    finished_at: str | None = None
+    error: str | None = None
+
+
+@dataclass
+class _DocumentJob:
+    document_id: str
+    targets: list[tuple[int, ExportTarget, Path]] = field(default_factory=list)
+    instance_id: str | None = None
+
+
+class DocumentExporter:
+    """Bulk export of documents, dashboards and their visualizations to files.
+
+    Targets are grouped by document and documents are exported concurrently,
+    at most `max_workers` at a time. For every document one instance is
+    created and all its targets are exported from it one after another, after
+    which the instance is deleted. Exported files are streamed to disk in
+    chunks, so they are never held in memory, except for PDF files, which
+    the REST API returns as base64-encoded `data` of a JSON response; it is
+    decoded in chunks while the file is written. Failed exports are retried
+    with a new instance, with exponentially growing delay between attempts.
+
+    Results of all exports are returned and, if `manifest_path` is given,
+    saved in a JSON manifest after every finished export, together with
+    results of earlier runs saved in the same manifest. With `skip_existing`,
+    files already listed as exported in the manifest and present on disk are
+    not exported again, so an interrupted or crashed run can be continued.
+
+    Attributes:
+        connection (Connection): Strategy One connection object with
+            a selected project.
+        directory (Path): Directory where files are saved.
+        max_workers (int): Maximum number of documents exported at once.
+        retries (int): Number of retries of a failed export.
+        retry_delay (float): Time in seconds before the first retry.
+        manifest_path (Path, optional): Path to the JSON manifest.
+    """
+
+    def __init__(
+        self,
+        connection: 'Connection',
+        directory: str | os.PathLike = '.',
+        max_workers: int | None = None,
+        retries: int = 2,
+        retry_delay: float = 1.0,
+        manifest_path: str | os.PathLike | None = None,
+        instance_getter: Callable[..., 'Response'] = (
+            documents.create_new_document_instance
+        ),
+        instance_body: dict | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        """Initialize the exporter.
+
+        Args:
+            connection (Connection): Strategy One connection object with
+                a selected project.
+            directory (str | PathLike, optional): Directory where files are
+                saved. Defaults to the current working directory.
+            max_workers (int, optional): Maximum number of documents exported
+                at once. Defaults to the number of threads used by mstrio-py
+                for parallel requests.
+            retries (int, optional): Number of retries of a failed export.
+                Defaults to 2.
+            retry_delay (float, optional): Time in seconds before the first
+                retry, doubled before every next one. Defaults to 1.
+            manifest_path (str | PathLike, optional): Path to the JSON file
+                where results of the exports are saved.
+            instance_getter (Callable, optional): API function creating
+                an instance of the exported document. Defaults to
+                `documents.create_new_document_instance`; use
+                `documents.create_dashboard_instance` for dashboards.
+            instance_body (dict, optional): JSON-formatted body of the request
+                creating an instance, e.g. with prompt answers.
+            chunk_size (int, optional): Size of chunks written to files in
+                bytes. Defaults to 1 MiB.
+        """
+        connection._validate_project_selected()
+        self.connection = connection
+        self.directory = Path(directory)
+        self.max_workers = max_workers or get_parallel_number(0)
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self._instance_getter = instance_getter
+        self._instance_body = instance_body or {}
+        self._chunk_size = chunk_size
+        self._lock = threading.Lock()
+        self._manifest: dict[str, ExportResult] = {}
+
+    def export(
+        self,
+        targets: list[ExportTarget],
+        skip_existing: bool = False,
+        progress_bar: bool = True,
+    ) -> list[ExportResult]:
+        """Export all targets.
+
+        Args:
+            targets (list[ExportTarget]): Files to be exported.
+            skip_existing (bool, optional): Whether to skip targets which were
+                exported successfully according to the manifest and whose
+                files still exist. Defaults to False.
+            progress_bar (bool, optional): Whether to display a progress bar,
+                if verbose mode is enabled in mstrio-py's `config`. Defaults
+                to True.
+
+        Returns:
+            List of results, in order of `targets`. Failed exports do not
+            raise errors; their results have `FAILED` status and the error
+            message.
+        """
+        paths = [self.directory / target.get_filename() for target in targets]
+        if duplicates := {str(p) for p in paths if paths.count(p) > 1}:
+            raise ValueError(
+                f"Multiple targets would be exported to the same files: "
+                f"{', '.join(sorted(duplicates))}. Provide unique `filename`s."
+            )
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._manifest = self._load_manifest()
+        done = self._manifest if skip_existing else {}
+        results: dict[int, ExportResult] = {}
+        jobs: dict[str, _DocumentJob] = {}
+        for index, (target, path) in enumerate(zip(targets, paths)):
+            previous = done.get(str(path))
+            if (
+                previous
+                and path.is_file()
+                and previous.status
+                in (
+                    ExportStatus.SUCCEEDED,
+                    ExportStatus.SKIPPED,
+                )
+            ):
+                results[index] = replace(previous, status=ExportStatus.SKIPPED)
+                continue
+            job = jobs.setdefault(target.document_id, _DocumentJob(target.document_id))
+            job.targets.append((index, target, path))
+
+        with (
+            tqdm(
+                total=len(targets),
+                initial=len(results),
+                desc="Exporting documents",
+                disable=not progress_bar or not config.verbose,
+            ) as pbar,
+            ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix='mstrio-export'
+            ) as executor,
+        ):
+            pending = {
+                executor.submit(self._export_document, job, results, pbar)
+                for job in jobs.values()
+            }
+            try:
+                while pending:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        failed = sum(r.status == ExportStatus.FAILED for r in results.values())
+        if failed and config.verbose:
+            logger.warning(f"{failed} of {len(targets)} exports failed.")
+        return [results[i] for i in range(len(targets))]
+
+    def _export_document(self, job: _DocumentJob, results: dict, pbar) -> None:
+        try:
+            for index, target, path in job.targets:
+                result = self._export_target(job, target, path)
+                with self._lock:
+                    results[index] = result
+                    self._manifest[result.path] = result
+                    self._save_manifest()
+                pbar.update()
+        finally:
+            self._delete_instance(job)
+
+    def _export_target(
+        self, job: _DocumentJob, target: ExportTarget, path: Path
+    ) -> ExportResult:
+        result = ExportResult(
+            document_id=target.document_id,
+            export_format=target.export_format,
+            path=str(path),
+            status=ExportStatus.FAILED,
+            node_key=target.node_key,
+        )
+        start = time.monotonic()
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.retry_delay * 2 ** (attempt - 1))
+            result.attempts = attempt + 1
+            try:
+                download = self._download(job, target, path)
+            except Exception as err:  # NOSONAR: every error is retried
+                result.error = str(err)
+                logger.debug(f"Attempt {attempt + 1} to export '{path}' failed: {err}")
+                # instance might have expired, so a new one is used in retry
+                self._delete_instance(job)
+                continue
+            result.status, result.error = ExportStatus.SUCCEEDED, None
+            result.size, result.sha256 = download.size, download.sha256
+            break
+        result.duration = round(time.monotonic() - start, 3)
+        result.finished_at = datetime.now(timezone.utc).isoformat()
+        return result
+
+    def _download(
+        self, job: _DocumentJob, target: ExportTarget, path: Path
+    ) -> StreamedDownload:
+        if job.instance_id is None:
+            job.instance_id = self._instance_getter(
+                self.connection, target.document_id, self._instance_body
+            ).json()['mid']
+
+        def get_response(_offset: int) -> 'Response':
+            # every export is generated anew, so it cannot be resumed
+            return documents.stream_document_export(
+                self.connection,
+                document_id=target.document_id,
+                instance_id=job.instance_id,
+                export_format=target.export_format.value,
+                body=target.body or {},
+                node_key=target.node_key,
+            )
+
+        download = StreamedDownload(
+            get_response,
+            path=path,
+            chunk_size=self._chunk_size,
+            resume=False,
+            progress_bar=False,
+            iter_content=self._iter_content,
+        )
+        download.run()
+        return download
+
+    def _iter_content(self, response: 'Response') -> Iterator[bytes]:
+        content_type = response.headers.get('Content-Type', '')
+        if 'json' not in content_type.lower():
+            yield from response.iter_content(chunk_size=self._chunk_size)
+            return
+        data = response.json().get('data')
+        if not isinstance(data, str):
+            raise ValueError(
+                "Export returned JSON without base64-encoded `data` instead of "
+                "a file."
+            )
+        # every 4 base64 characters encode 3 bytes, so slices of a multiple of
+        # 4 characters can be decoded separately
+        step = max(self._chunk_size // 3, 1) * 4
+        for start in range(0, len(data), step):
+            yield base64.b64decode(data[start : start + step], validate=True)
+
+    def _delete_instance(self, job: _DocumentJob) -> None:
+        if job.instance_id is None:
+            return
+        instance_id, job.instance_id = job.instance_id, None
+        try:
+            documents.delete_document_instance(
+                self.connection, job.document_id, instance_id
+            )
+        except Exception as err:  # NOSONAR: cleanup must not fail the export
+            logger.debug(f"Failed to delete instance {instance_id}: {err}")
+
+    def _load_manifest(self) -> dict[str, ExportResult]:
+        if not self.manifest_path or not self.manifest_path.is_file():
+            return {}
+        with open(self.manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        return {
+            result.path: result
+            for result in ExportResult.bulk_from_dict(manifest.get('exports', []))
+        }
+
+    def _save_manifest(self) -> None:
+        if not self.manifest_path:
+            return
+        manifest = {
+            'createdAt': datetime.now(timezone.utc).isoformat(),
+            'projectId': self.connection.project_id,
+            'exports': [result.to_dict() for result in self._manifest.values()],
+        }
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json_atomic(self.manifest_path, manifest, indent=2)
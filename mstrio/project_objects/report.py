@@ -1,4 +1,6 @@
 import logging
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import pandas as pd
@@ -14,6 +16,12 @@ from mstrio.modeling import Prompt
 from mstrio.object_management.search_operations import SearchPattern, full_search
 from mstrio.users_and_groups.user import User
 from mstrio.utils.ai import EnableForAiMixin
+from mstrio.utils.attribute_elements import (
+    SourceKey,
+    fetch_attribute_elements,
+    fetch_attribute_elements_async,
+    get_source_key,
+)
 from mstrio.utils.cache import CacheSource, ContentCacheMixin
 from mstrio.utils.certified_info import CertifiedInfo
 from mstrio.utils.entity import (
@@ -34,7 +42,6 @@ from mstrio.utils.helper import (
     fallback_on_timeout,
     find_object_with_name,
     get_parallel_number,
-    get_total_count_of_objects,
     key_fn_for_sort_object_properties,
     response_handler,
 )
@@ -48,7 +55,7 @@ from mstrio.utils.resolvers import (
 from mstrio.utils.response_processors import objects as objects_processors
 from mstrio.utils.response_processors import reports as reports_processors_api
 from mstrio.utils.sessions import FuturesSessionWithRenewal
-from mstrio.utils.version_helper import meets_minimal_version
+from mstrio.utils.version_helper import get_server_capabilities
 from mstrio.utils.vldb_mixin import ModelVldbMixin, VldbSetting
 
 if TYPE_CHECKING:
@@ -341,6 +348,7 @@ class Report(
         self._dataframe = None
         self._attr_elements = None
         self._page_by_elements = {}
+        self._page_by_element_names = {}
         self._sql = None
         self._current_page_by = []
         self._valid_page_by_elements = []
@@ -390,13 +398,15 @@ class Report(
         limit: int | None = None,
         page_element_id: str | list[str] | dict[str, str] | None = None,
         prompt_answers: list[Prompt] | None = None,
+        all_pages: bool = False,
+        max_workers: int | None = None,
     ) -> pd.DataFrame:
         """Extract contents of a report instance into a Pandas `DataFrame`.
 
         Note:
             If the report has page-by attributes and `page_element_id` is not
             provided, the first valid combination of page-by elements will be
-            used.
+            used, unless `all_pages` is True.
 
         Args:
             limit (None or int, optional): Used to control data extract
@@ -416,6 +426,14 @@ class Report(
             prompt_answers (None or list of Prompts, optional): List of Prompt
                 class objects answering the prompts of the report. Only needed
                 if the report has prompts.
+            all_pages (bool, optional): If True, contents of all valid
+                combinations of page-by elements are extracted, concurrently,
+                and concatenated into one data frame, with a column with
+                the name of the element added for every page-by attribute.
+                `page_element_id` is ignored in this mode. Defaults to False.
+            max_workers (int, optional): Maximum number of pages extracted at
+                once when `all_pages` is True. By default it is calculated
+                based on the number of pages.
 
         Returns:
             Pandas Data Frame containing the report contents.
@@ -423,6 +441,18 @@ class Report(
         if limit:
             self._initial_limit = limit
 
+        if all_pages and self.page_by_attributes:
+            frames = [
+                df
+                for _, df in self.iter_page_dataframes(
+                    limit=limit, prompt_answers=prompt_answers, max_workers=max_workers
+                )
+            ]
+            self._dataframe = self.__apply_cross_tab_filter(
+                pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+            )
+            return self._dataframe
+
         attr_ids = [a['id'] for a in self.page_by_attributes]
         if isinstance(page_element_id, str):
             page_element_id = [page_element_id]
@@ -453,23 +483,9 @@ class Report(
 
         # Answer prompts if provided
         if prompt_answers:
-            json = {"prompts": [prompt.to_dict() for prompt in prompt_answers]}
-            reports_api.answer_report_prompts(
-                connection=self._connection,
-                report_id=self.id,
-                instance_id=self._instance_id,
-                body=json,
-                project_id=self.project_id,
+            _instance = self.__answer_prompts(
+                self._instance_id, prompt_answers, self._initial_limit
             )
-            # Get the instance results again, as they weren't generated
-            # properly until the prompts were answered
-            _instance = reports_api.report_instance_id(
-                connection=self.connection,
-                report_id=self.id,
-                instance_id=self._instance_id,
-                offset=0,
-                limit=self._initial_limit,
-            ).json()
 
         if not self._current_page_by and self.valid_page_by_elements:
             self._current_page_by = self.get_selected_page_by_elements(
@@ -534,7 +550,144 @@ class Report(
                 self.__fetch_chunks(p, paging, it_total, self._instance_id, limit)
 
         # return parsed data as a data frame
-        self._dataframe = p.dataframe
+        self._dataframe = self.__apply_cross_tab_filter(p.dataframe)
+        return self._dataframe
+
+    def iter_page_dataframes(
+        self,
+        limit: int | None = None,
+        prompt_answers: list[Prompt] | None = None,
+        max_workers: int | None = None,
+    ) -> Iterator[tuple[list[str], pd.DataFrame]]:
+        """Extract contents of every valid combination of page-by elements of
+        the report, page by page.
+
+        Pages are extracted concurrently, each one in a separate instance of
+        the report, and yielded in order of `valid_page_by_elements` as soon
+        as they are ready, so they can be processed without keeping all of
+        them in memory. A column with the name of the element is added to
+        every page for each page-by attribute. Filters applied to
+        the report are respected, but crosstab filtering of columns and
+        elements is done only in `to_dataframe()`.
+
+        Args:
+            limit (None or int, optional): Number of rows per chunk. By default
+                it is calculated automatically, as in `to_dataframe()`.
+            prompt_answers (None or list of Prompts, optional): List of Prompt
+                class objects answering the prompts of the report, used for
+                every page.
+            max_workers (int, optional): Maximum number of pages extracted at
+                once. By default it is calculated based on the number of pages.
+
+        Yields:
+            Tuple of IDs of page-by elements of the page and Pandas Data Frame
+            with its contents.
+        """
+        pages = [
+            self.get_selected_page_by_elements(combination)
+            for combination in self.valid_page_by_elements
+        ] or [[]]
+        max_workers = max_workers or get_parallel_number(len(pages))
+        if not self._parallel:
+            max_workers = 1
+
+        with (
+            ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix='mstrio-report-pages'
+            ) as executor,
+            tqdm(
+                desc="Downloading pages",
+                total=len(pages),
+                disable=not self._progress_bar or not config.verbose,
+            ) as fetch_pbar,
+        ):
+            futures = [
+                executor.submit(self.__extract_page, page, limit, prompt_answers)
+                for page in pages
+            ]
+            try:
+                for page, future in zip(pages, futures):
+                    df = future.result()
+                    fetch_pbar.update()
+                    yield page, self.__add_page_by_columns(df, page)
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def __extract_page(
+        self,
+        page_element_id: list[str],
+        limit: int | None,
+        prompt_answers: list[Prompt] | None,
+    ) -> pd.DataFrame:
+        """Extract contents of one page in a new instance of the report,
+        without altering the state of the object."""
+        initial_limit = limit or self._initial_limit
+        res = self.__initialize_report(
+            initial_limit, current_page_by=page_element_id, progress_bar=False
+        )
+        _instance = res.json()
+        instance_id = _instance['instanceId']
+        if prompt_answers:
+            _instance = self.__answer_prompts(
+                instance_id, prompt_answers, initial_limit
+            )
+        if _instance['status'] == 2:
+            raise ValueError(
+                f"No data available for report \"{self.name}\". "
+                "There are unanswered prompts."
+            )
+
+        paging = _instance['data']['paging']
+        p = Parser(response=_instance, parse_cube=False)
+        p.parse(response=_instance)
+        if not limit:
+            limit = max(
+                1000, int((initial_limit * self._SIZE_LIMIT) / len(res.content))
+            )
+        for _offset in range(initial_limit, paging['total'], limit):
+            response = self.__get_chunk(
+                instance_id=instance_id, offset=_offset, limit=limit
+            )
+            p.parse(response=response.json())
+        return p.dataframe
+
+    def __add_page_by_columns(
+        self, df: pd.DataFrame, page_element_id: list[str]
+    ) -> pd.DataFrame:
+        for position, (attr, element_id) in enumerate(
+            zip(self.page_by_attributes, page_element_id)
+        ):
+            df.insert(
+                position,
+                attr['name'],
+                self._page_by_element_names.get(element_id, element_id),
+                allow_duplicates=True,
+            )
+        return df
+
+    def __answer_prompts(
+        self, instance_id: str, prompt_answers: list[Prompt], limit: int
+    ) -> dict:
+        json = {"prompts": [prompt.to_dict() for prompt in prompt_answers]}
+        reports_api.answer_report_prompts(
+            connection=self._connection,
+            report_id=self.id,
+            instance_id=instance_id,
+            body=json,
+            project_id=self.project_id,
+        )
+        # Get the instance results again, as they weren't generated
+        # properly until the prompts were answered
+        return reports_api.report_instance_id(
+            connection=self.connection,
+            report_id=self.id,
+            instance_id=instance_id,
+            offset=0,
+            limit=limit,
+        ).json()
+
+    def __apply_cross_tab_filter(self, dataframe: pd.DataFrame) -> pd.DataFrame:
 
         # filter dataframe if report had crosstabs and filters were applied
         if self._cross_tab_filter != {}:
@@ -549,7 +702,7 @@ class Report(
                         )
                     )
                 ]
-                self._dataframe = self._dataframe.drop(metr_names, axis=1)
+                dataframe = dataframe.drop(metr_names, axis=1)
 
             if self._cross_tab_filter['attr_elements'] is not None:
                 # create dict of attributes and elements to iterate through
@@ -558,7 +711,7 @@ class Report(
                     key = attribute[:32]
                     attr_dict.setdefault(key, []).append(attribute[33:])
                 # initialize indexes series for filter
-                indexes = pd.Series([False] * len(self._dataframe))
+                indexes = pd.Series([False] * len(dataframe))
 
                 # logical OR for filtered attribute elements
                 for attribute in attr_dict:
@@ -568,9 +721,9 @@ class Report(
                         )
                     )[0]['name']
                     elements = attr_dict[attribute]
-                    indexes = indexes | self._dataframe[attr_name].isin(elements)
+                    indexes = indexes | dataframe[attr_name].isin(elements)
                 # select dataframe indexes with
-                self._dataframe = self._dataframe[indexes]
+                dataframe = dataframe[indexes]
 
             if self._cross_tab_filter['attributes'] is not None:
                 attr_names = [
@@ -589,7 +742,7 @@ class Report(
                 for attr in attr_names:
                     forms = [
                         column
-                        for column in self._dataframe.columns
+                        for column in dataframe.columns
                         if column.startswith(attr + '@')
                     ]
                     if forms:
@@ -599,8 +752,8 @@ class Report(
                     attr_names.remove(elem)
                 attr_names.extend(to_be_added)
                 # drop filtered out columns
-                self._dataframe = self._dataframe.drop(attr_names, axis=1)
-        return self._dataframe
+                dataframe = dataframe.drop(attr_names, axis=1)
+        return dataframe
 
     def __fetch_chunks_future(self, future_session, pagination, instance_id, limit):
         """Fetch added rows from this object instance from the Intelligence
@@ -636,23 +789,30 @@ class Report(
                 )
                 parser.parse(response=response.json())
 
-    def __initialize_report(self, limit: int) -> requests.Response:
+    def __initialize_report(
+        self,
+        limit: int,
+        current_page_by: list[str] | None = None,
+        progress_bar: bool = True,
+    ) -> requests.Response:
         inst_pbar = tqdm(
             desc='Initializing an instance of a report. Please wait...',
             bar_format='{desc}',
             leave=False,
             ncols=285,
-            disable=not self._progress_bar or not config.verbose,
+            disable=not progress_bar or not self._progress_bar or not config.verbose,
         )
 
         # Switch off subtotals if I-Server version is higher than 11.2.1
         body = self._filter._request_body()
-        if meets_minimal_version(self._connection.iserver_version, "11.2.0100"):
+        if get_server_capabilities(self._connection).supports('report_subtotals'):
             self._subtotals["visible"] = False
             body["subtotals"] = {"visible": self._subtotals["visible"]}
 
-        if self._current_page_by:
-            body["currentPageBy"] = [{"id": el} for el in self._current_page_by]
+        if current_page_by is None:
+            current_page_by = self._current_page_by
+        if current_page_by:
+            body["currentPageBy"] = [{"id": el} for el in current_page_by]
 
         # Request a new instance, set instance id
         response = reports_api.report_instance(
@@ -760,7 +920,7 @@ class Report(
         grid = response["definition"]["grid"]
         available_objects = response['definition']['availableObjects']
 
-        if meets_minimal_version(self._connection.iserver_version, "11.2.0100"):
+        if get_server_capabilities(self._connection).supports('report_subtotals'):
             self._subtotals = grid["subtotals"]
         self.name = response["name"]
         self._cross_tab = grid["crossTab"]
@@ -821,48 +981,32 @@ class Report(
         attrs = [a for a in attrs if a["type"] == "attribute"]
         return attrs
 
+    def _attr_elements_source_key(self) -> SourceKey | None:
+        """Key of the report in the attribute element cache."""
+        return get_source_key(self._connection, self._id, self.version)
+
     def __get_attr_elements(self, limit: int = 50000) -> list:
         """Get elements of report attributes synchronously.
 
         Implements GET /reports/<report_id>/attributes/<attribute_id>/elements.
         """
+        source_key = self._attr_elements_source_key()
+
+        def fetch_page(attribute_id, offset, limit):
+            return reports_api.report_single_attribute_elements(
+                connection=self._connection,
+                report_id=self._id,
+                attribute_id=attribute_id,
+                offset=offset,
+                limit=limit,
+            )
 
         def fetch_for_attribute(attribute):
             @fallback_on_timeout()
             def fetch_for_attribute_given_limit(limit):
-                response = reports_api.report_single_attribute_elements(
-                    connection=self._connection,
-                    report_id=self._id,
-                    attribute_id=attribute['id'],
-                    offset=0,
-                    limit=limit,
+                return fetch_attribute_elements(
+                    attribute, fetch_page, limit, source_key=source_key
                 )
-                # Get total number of rows
-                total = get_total_count_of_objects(response)
-                # Get attribute elements from the response.
-                elements = response.json()
-
-                assert isinstance(limit, int) and limit > 0
-                assert isinstance(total, int) and total >= 0
-
-                # If total number of elements is bigger than the chunk size
-                # (limit), fetch them incrementally.
-                for _offset in range(limit, total, limit):
-                    response = reports_api.report_single_attribute_elements(
-                        connection=self._connection,
-                        report_id=self._id,
-                        attribute_id=attribute['id'],
-                        offset=_offset,
-                        limit=limit,
-                    )
-                    elements.extend(response.json())
-
-                # Return attribute data.
-                return {
-                    "attribute_name": attribute['name'],
-                    "attribute_id": attribute['id'],
-                    "elements": elements,
-                }
 
             return fetch_for_attribute_given_limit(limit)[0]
 
@@ -879,70 +1023,29 @@ class Report(
         return attr_elements
 
     def __get_attr_elements_async(self, limit: int = 50000) -> list:
-        """Get elements of report attributes asynchronously.
+        """Get elements of report attributes asynchronously. All pages of
+        elements of all attributes are fetched concurrently.
 
         Implements GET /reports/<report_id>/attributes/<attribute_id>/elements.
         """
 
-        attrs = self._get_pure_attributes()
-        attr_elements = []
-
-        if attrs:
-            threads = get_parallel_number(len(attrs))
-            with FuturesSessionWithRenewal(
-                connection=self._connection, max_workers=threads
-            ) as session:
-                # Fetch first chunk of attribute elements.
-                futures = self.__fetch_attribute_elements_chunks(session, limit)
-                pbar = tqdm(
-                    futures,
-                    desc="Loading attribute elements",
-                    leave=False,
-                    disable=not self._progress_bar or not config.verbose,
-                )
-                for i, future in enumerate(pbar):
-                    attr = attrs[i]
-                    response = future.result()
-                    if not response.ok:
-                        response_handler(
-                            response, f"Error getting attribute {attr['name']} elements"
-                        )
-                    elements = response.json()
-                    # Get total number of rows
-                    total = get_total_count_of_objects(response)
-                    for _offset in range(limit, total, limit):
-                        response = reports_api.report_single_attribute_elements(
-                            connection=self._connection,
-                            report_id=self._id,
-                            attribute_id=attr["id"],
-                            offset=_offset,
-                            limit=limit,
-                        )
-                        elements.extend(response.json())
-                    # Append attribute data to the list of attributes.
-                    attr_elements.append(
-                        {
-                            "attribute_name": attr['name'],
-                            "attribute_id": attr['id'],
-                            "elements": elements,
-                        }
-                    )
-                pbar.close()
-
-        return attr_elements
-
-    def __fetch_attribute_elements_chunks(self, future_session, limit: int) -> list:
-        # Fetch add'l rows from this object instance
-        return [
-            reports_api.report_single_attribute_elements_coroutine(
-                future_session,
+        def fetch_page(session, attribute_id, offset, limit):
+            return reports_api.report_single_attribute_elements_coroutine(
+                session,
                 report_id=self._id,
-                attribute_id=attribute['id'],
-                offset=0,
+                attribute_id=attribute_id,
+                offset=offset,
                 limit=limit,
             )
-            for attribute in self._get_pure_attributes()
-        ]
+
+        return fetch_attribute_elements_async(
+            self._connection,
+            self._get_pure_attributes(),
+            fetch_page,
+            limit,
+            source_key=self._attr_elements_source_key(),
+            progress_bar=self._progress_bar,
+        )
 
     def list_properties(self):
         """List all properties of the object."""
@@ -1072,6 +1175,13 @@ class Report(
                 for attr in elements.get('page_by', [])
             }
         )
+        self._page_by_element_names.update(
+            {
+                el['id']: el.get('name', el['id'])
+                for attr in elements.get('page_by', [])
+                for el in attr['elements']
+            }
+        )
         self._valid_page_by_elements = elements.get('valid_page_by_elements', {}).get(
             'items', []
         )
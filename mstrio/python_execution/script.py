@@ -3,8 +3,8 @@ import contextlib
 import json
 import logging
 import re
-import time
 from collections.abc import Callable
+from concurrent.futures import Future
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import date, datetime
@@ -33,6 +33,7 @@ from mstrio.utils.entity import (
 )
 from mstrio.utils.enum_helper import AutoName, get_enum_val
 from mstrio.utils.helper import Dictable, delete_none_values
+from mstrio.utils.poller import get_status_poller
 from mstrio.utils.resolvers import (
     FolderPathType,
     get_folder_id_from_params_set,
@@ -564,6 +565,38 @@ class Code:
         raw_status = self.get_execution_details().get('status')
         return ExecutionStatus(raw_status) if raw_status is not None else None
 
+    def poll_execution_finish(
+        self,
+        interval: int | None = None,
+        callback: Callable[[Future], None] | None = None,
+    ) -> Future:
+        """Track the code execution without blocking.
+
+        Status is polled by the poller shared within mstrio-py, so many
+        executions can be tracked at once. Unlike `wait_for_execution_finish`,
+        the execution is not stopped when tracking is cancelled.
+
+        Args:
+            interval (int, optional): Fixed time interval in seconds between
+                polling requests for status. If not provided, the interval is
+                adaptive and limited by the value from mstrio-py's `config`.
+            callback (Callable, optional): Function called with the future
+                once it is done.
+
+        Returns:
+            Future resolved with the final `ExecutionStatus`.
+        """
+
+        if not self._evaluation_id:
+            self.get_execution_details()  # FYI: will throw
+
+        return get_status_poller().submit(
+            self.get_current_execution_status,
+            ExecutionStatus.is_done,
+            interval=interval,
+            callback=callback,
+        )
+
     def wait_for_execution_finish(
         self, pipe_logs: bool = False, interval: int | None = None
     ) -> ExecutionStatus:
@@ -573,22 +606,20 @@ class Code:
             pipe_logs (bool, optional): Whether to pipe the execution logs of
                 the Code to the console of this requester script. Defaults to
                 False.
-            interval (int, optional): Time interval in seconds between polling
-                requests for status. If not provided, the value is taken from
-                mstrio-py's `config`.
+            interval (int, optional): Fixed time interval in seconds between
+                polling requests for status. If not provided, the interval is
+                adaptive and limited by the value from mstrio-py's `config`.
 
         Returns:
             ExecutionStatus: Final status of the code execution.
         """
 
-        if not self._evaluation_id:
-            self.get_execution_details()  # FYI: will throw
-
+        future = self.poll_execution_finish(interval=interval)
         try:
-            while not ExecutionStatus.is_done(self.get_current_execution_status()):
-                time.sleep(interval or config.delay_between_polling)
+            future.result()
 
         except BaseException as err:
+            future.cancel()
             # At this point the code run on I-Server pod and this requester
             # script should be synchronized. If something happens with this
             # script, we should do something similar to the code run on
@@ -992,9 +1023,9 @@ class Script(
             pipe_logs (bool, optional): Whether to pipe the execution logs of
                 the Script to the console of this requester script. Defaults to
                 False.
-            interval (int, optional): Time interval in seconds between polling
-                requests for status. If not provided, the value is taken from
-                mstrio-py's `config`.
+            interval (int, optional): Fixed time interval in seconds between
+                polling requests for status. If not provided, the interval is
+                adaptive and limited by the value from mstrio-py's `config`.
 
         Returns:
             ExecutionStatus: Final status of the Script execution.
@@ -1004,6 +1035,28 @@ class Script(
             pipe_logs=pipe_logs, interval=interval
         )
 
+    def poll_execution_finish(
+        self,
+        interval: int | None = None,
+        callback: Callable[[Future], None] | None = None,
+    ) -> Future:
+        """Track the Script execution without blocking.
+
+        Args:
+            interval (int, optional): Fixed time interval in seconds between
+                polling requests for status. If not provided, the interval is
+                adaptive and limited by the value from mstrio-py's `config`.
+            callback (Callable, optional): Function called with the future
+                once it is done.
+
+        Returns:
+            Future resolved with the final `ExecutionStatus`.
+        """
+
+        return self._script_content.poll_execution_finish(
+            interval=interval, callback=callback
+        )
+
     def get_execution_details(self) -> dict:
         """Retrieve details about the Script current execution.
 
@@ -1,73 +1,166 @@
 # flake8: noqa
-from .change_journal import (
-    ChangeJournalEntry,
-    ChangeType,
-    TransactionType,
-    list_change_journal_entries,
-    purge_change_journal_entries,
-)
-from .cluster import Cluster, GroupBy, ServiceAction
-from .documentation import (
-    DocApplicationType,
-    DocBasicProperty,
-    EnumDocumentationStatus,
-    DocFolderType,
-    DocMdxCubeType,
-    DocSchemaType,
-    Documentation,
-    DocumentationDefinition,
-    DocumentationObject,
-    DocumentationStatus,
-    ResourceFolder,
-    list_documentation_definitions,
-    list_documentations,
-    get_documentations_statuses,
-)
-from .environment import Environment
-from .language import Language, list_interface_languages, list_languages
-from .license import (
-    ActivationInfo,
-    ContactInformation,
-    InstallationUse,
-    License,
-    MachineInfo,
-    PrivilegeInfo,
-    Product,
-    Record,
-    UserLicense,
-)
-from .lock import LockStatus, LockType
-from .node import Node
-from .project import (
-    AdminObjectRule,
-    CrossDuplicationConfig,
-    DuplicationConfig,
-    IdleMode,
-    Project,
-    ProjectDuplication,
-    ProjectDuplicationRule,
-    ProjectDuplicationStatus,
-    ProjectInfo,
-    ProjectSettings,
-    ProjectStatus,
-    compare_project_settings,
-    list_projects,
-    list_projects_duplications,
-)
-from .server import ServerSettings
-from .timezone import TimeZone, list_timezones
+from typing import TYPE_CHECKING
 
-# isort: off
-from .job_monitor import (
-    Job,
-    JobStatus,
-    JobType,
-    kill_all_jobs,
-    kill_jobs,
-    list_jobs,
-    ObjectType,
-    PUName,
-    SubscriptionType,
-)
+from mstrio.utils.lazy_loading import attach_lazy_exports
 
-# isort: on
+if TYPE_CHECKING:
+    from .change_journal import (
+        ChangeJournalCursor,
+        ChangeJournalEntry,
+        ChangeType,
+        TransactionType,
+        list_change_journal_entries,
+        purge_change_journal_entries,
+        tail_change_journal_entries,
+    )
+    from .cluster import Cluster, GroupBy, ServiceAction
+    from .documentation import (
+        DocApplicationType,
+        DocBasicProperty,
+        EnumDocumentationStatus,
+        DocFolderType,
+        DocMdxCubeType,
+        DocSchemaType,
+        Documentation,
+        DocumentationDefinition,
+        DocumentationObject,
+        DocumentationStatus,
+        ResourceFolder,
+        list_documentation_definitions,
+        list_documentations,
+        get_documentations_statuses,
+    )
+    from .environment import Environment
+    from .language import Language, list_interface_languages, list_languages
+    from .license import (
+        ActivationInfo,
+        ContactInformation,
+        InstallationUse,
+        License,
+        MachineInfo,
+        PrivilegeInfo,
+        Product,
+        Record,
+        UserLicense,
+    )
+    from .lock import LockStatus, LockType
+    from .node import Node
+    from .project import (
+        AdminObjectRule,
+        CrossDuplicationConfig,
+        DuplicationConfig,
+        IdleMode,
+        Project,
+        ProjectDuplication,
+        ProjectDuplicationRule,
+        ProjectDuplicationStatus,
+        ProjectInfo,
+        ProjectSettings,
+        ProjectStatus,
+        compare_project_settings,
+        list_projects,
+        list_projects_duplications,
+    )
+    from .server import ServerSettings
+    from .settings_audit import (
+        SettingsAuditor,
+        SettingsScope,
+        SettingsSnapshot,
+        compare_snapshots,
+    )
+    from .timezone import TimeZone, list_timezones
+
+    # isort: off
+    from .job_monitor import (
+        Job,
+        JobMonitor,
+        JobsDelta,
+        JobStatus,
+        JobType,
+        kill_all_jobs,
+        kill_jobs,
+        list_jobs,
+        ObjectType,
+        PUName,
+        SubscriptionType,
+    )
+
+    # isort: on
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'ChangeJournalCursor': '.change_journal',
+        'ChangeJournalEntry': '.change_journal',
+        'ChangeType': '.change_journal',
+        'TransactionType': '.change_journal',
+        'list_change_journal_entries': '.change_journal',
+        'purge_change_journal_entries': '.change_journal',
+        'tail_change_journal_entries': '.change_journal',
+        'Cluster': '.cluster',
+        'GroupBy': '.cluster',
+        'ServiceAction': '.cluster',
+        'DocApplicationType': '.documentation',
+        'DocBasicProperty': '.documentation',
+        'EnumDocumentationStatus': '.documentation',
+        'DocFolderType': '.documentation',
+        'DocMdxCubeType': '.documentation',
+        'DocSchemaType': '.documentation',
+        'Documentation': '.documentation',
+        'DocumentationDefinition': '.documentation',
+        'DocumentationObject': '.documentation',
+        'DocumentationStatus': '.documentation',
+        'ResourceFolder': '.documentation',
+        'list_documentation_definitions': '.documentation',
+        'list_documentations': '.documentation',
+        'get_documentations_statuses': '.documentation',
+        'Environment': '.environment',
+        'Language': '.language',
+        'list_interface_languages': '.language',
+        'list_languages': '.language',
+        'ActivationInfo': '.license',
+        'ContactInformation': '.license',
+        'InstallationUse': '.license',
+        'License': '.license',
+        'MachineInfo': '.license',
+        'PrivilegeInfo': '.license',
+        'Product': '.license',
+        'Record': '.license',
+        'UserLicense': '.license',
+        'LockStatus': '.lock',
+        'LockType': '.lock',
+        'Node': '.node',
+        'AdminObjectRule': '.project',
+        'CrossDuplicationConfig': '.project',
+        'DuplicationConfig': '.project',
+        'IdleMode': '.project',
+        'Project': '.project',
+        'ProjectDuplication': '.project',
+        'ProjectDuplicationRule': '.project',
+        'ProjectDuplicationStatus': '.project',
+        'ProjectInfo': '.project',
+        'ProjectSettings': '.project',
+        'ProjectStatus': '.project',
+        'compare_project_settings': '.project',
+        'list_projects': '.project',
+        'list_projects_duplications': '.project',
+        'ServerSettings': '.server',
+        'SettingsAuditor': '.settings_audit',
+        'SettingsScope': '.settings_audit',
+        'SettingsSnapshot': '.settings_audit',
+        'compare_snapshots': '.settings_audit',
+        'TimeZone': '.timezone',
+        'list_timezones': '.timezone',
+        'Job': '.job_monitor',
+        'JobMonitor': '.job_monitor',
+        'JobsDelta': '.job_monitor',
+        'JobStatus': '.job_monitor',
+        'JobType': '.job_monitor',
+        'kill_all_jobs': '.job_monitor',
+        'kill_jobs': '.job_monitor',
+        'list_jobs': '.job_monitor',
+        'ObjectType': '.job_monitor',
+        'PUName': '.job_monitor',
+        'SubscriptionType': '.job_monitor',
+    },
+)
@@ -1,16 +1,23 @@
+import json
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from enum import auto
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from mstrio import config
 from mstrio.api import change_journal
 from mstrio.connection import Connection
 from mstrio.utils.enum_helper import AutoName
-from mstrio.utils.helper import Dictable
+from mstrio.utils.helper import Dictable, write_json_atomic
 from mstrio.utils.resolvers import get_project_id_from_params_set
-from mstrio.utils.response_processors.change_journal import get_change_journals_loop
+from mstrio.utils.response_processors.change_journal import (
+    get_change_journals_loop,
+    iter_change_journals_pages,
+)
+from mstrio.utils.time_helper import DatetimeFormats, str_to_datetime
 from mstrio.utils.version_helper import method_version_handler
 
 if TYPE_CHECKING:
@@ -36,6 +43,76 @@ class ChangeJournalEntry(Dictable):
     timestamp_iso: str | None = None
 
 
+@dataclass
+class ChangeJournalCursor(Dictable):
+    """High-water mark of already consumed change journal entries.
+
+    The cursor remembers the transaction ID and timestamp of the newest entry
+    returned by `tail_change_journal_entries()`, so that subsequent calls fetch
+    only entries which were added in the meantime. It can be persisted to and
+    restored from a local JSON file to resume tailing after a restart.
+
+    Attributes:
+        transaction_id (int, optional): ID of the newest consumed transaction.
+        timestamp (str, optional): ISO timestamp of the newest consumed entry.
+    """
+
+    transaction_id: int | None = None
+    timestamp: str | None = None
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'ChangeJournalCursor':
+        """Load the cursor from a JSON file. If the file does not exist, an
+        empty cursor is returned, which means tailing will start from the
+        oldest available entry.
+
+        Args:
+            path (str | Path): Path to the JSON file with the cursor.
+
+        Returns:
+            ChangeJournalCursor object.
+        """
+        path = Path(path)
+        if not path.is_file():
+            return cls()
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    def save(self, path: str | Path) -> None:
+        """Save the cursor to a JSON file. The file is replaced atomically, so
+        an interrupted save never leaves a corrupted cursor behind.
+
+        Args:
+            path (str | Path): Path to the JSON file with the cursor.
+        """
+        write_json_atomic(path, self.to_dict(), indent=2)
+
+    def is_consumed(self, entry: dict) -> bool:
+        """Check whether the entry is not newer than the high-water mark."""
+        transaction_id = _get_transaction_id(entry)
+        if self.transaction_id is not None and transaction_id is not None:
+            return transaction_id <= self.transaction_id
+        if self.timestamp and entry.get('timestamp_iso'):
+            return _parse_iso_timestamp(entry['timestamp_iso']) < (
+                _parse_iso_timestamp(self.timestamp)
+            )
+        return False
+
+    def advance(self, entry: dict) -> None:
+        """Move the high-water mark to the entry if it is newer."""
+        transaction_id = _get_transaction_id(entry)
+        if transaction_id is not None and (
+            self.transaction_id is None or transaction_id > self.transaction_id
+        ):
+            self.transaction_id = transaction_id
+            self.timestamp = entry.get('timestamp_iso') or self.timestamp
+        elif transaction_id is None and entry.get('timestamp_iso'):
+            if not self.timestamp or _parse_iso_timestamp(
+                entry['timestamp_iso']
+            ) > _parse_iso_timestamp(self.timestamp):
+                self.timestamp = entry['timestamp_iso']
+
+
 class TransactionType(AutoName):
     """Enumeration of possible transaction types in the change journal."""
 
@@ -139,6 +216,194 @@ def list_change_journal_entries(
         List of ChangeJournalEntry objects matching the filters.
     """
 
+    filter_criteria = _build_filter_criteria(
+        connection,
+        transaction_sources=transaction_sources,
+        transaction_types=transaction_types,
+        change_types=change_types,
+        session_ids=session_ids,
+        machines=machines,
+        users=users,
+        affected_projects=affected_projects,
+        affected_objects=affected_objects,
+        begin_transaction_id=begin_transaction_id,
+        end_transaction_id=end_transaction_id,
+        begin_time=begin_time,
+        end_time=end_time,
+    )
+
+    with (
+        config.temp_verbose_disable(),
+        connection.temporary_project_change(project=None),
+    ):
+        search_id = (
+            change_journal.create_change_journal_search_instance(
+                connection, filter_criteria
+            )
+            .json()
+            .get('searchId')
+        )
+        res = get_change_journals_loop(
+            connection, search_id, offset=0, limit=limit or -1
+        )
+
+    if to_dictionary:
+        return res
+    return [ChangeJournalEntry(**entry) for entry in res]
+
+
+@method_version_handler('11.4.0900')
+def tail_change_journal_entries(
+    connection: Connection,
+    cursor: 'ChangeJournalCursor | str | Path | None' = None,
+    page_size: int = 100,
+    to_dictionary: bool = False,
+    **filters,
+) -> Iterator[ChangeJournalEntry | dict]:
+    """Stream change journal entries added since the last call.
+
+    Entries are fetched page by page and yielded one by one, so memory usage
+    does not depend on the number of new entries. The high-water mark of
+    consumed entries is kept in `cursor`. When `cursor` is a path, it is loaded
+    from that file before the search and saved back to it once all new
+    entries were yielded. An interrupted iteration does not move the persisted
+    cursor, so no entries are lost after a restart, but some of them may be
+    yielded again.
+
+    Args:
+        connection (Connection): Strategy connection object returned by
+            `connection.Connection()`
+        cursor (ChangeJournalCursor | str | Path, optional): Cursor object
+            which is advanced in place, or path to the JSON file in which the
+            cursor is persisted. If not provided, all matching entries are
+            streamed.
+        page_size (int, optional): Number of entries fetched with a single
+            request. Defaults to 100.
+        to_dictionary (bool, optional): If True, yields dictionaries instead of
+            ChangeJournalEntry objects. Defaults to False.
+        **filters: Filters accepted by `list_change_journal_entries()`, except
+            for `begin_transaction_id` and `begin_time`, which are resolved
+            from the cursor if it is set.
+
+    Yields:
+        ChangeJournalEntry objects (or dictionaries) newer than the cursor.
+    """
+    cursor_path = None
+    if cursor is None:
+        cursor = ChangeJournalCursor()
+    elif not isinstance(cursor, ChangeJournalCursor):
+        cursor_path = Path(cursor)
+        cursor = ChangeJournalCursor.load(cursor_path)
+
+    if cursor.transaction_id is not None:
+        filters['begin_transaction_id'] = cursor.transaction_id
+    elif cursor.timestamp:
+        filters['begin_time'] = _parse_iso_timestamp(cursor.timestamp)
+    filter_criteria = _build_filter_criteria(connection, **filters)
+
+    with (
+        config.temp_verbose_disable(),
+        connection.temporary_project_change(project=None),
+    ):
+        search_id = (
+            change_journal.create_change_journal_search_instance(
+                connection, filter_criteria
+            )
+            .json()
+            .get('searchId')
+        )
+
+    high_water_mark = ChangeJournalCursor(cursor.transaction_id, cursor.timestamp)
+    # the project is deselected only for requests, as the connection must not
+    # stay changed while entries are yielded
+    pages = iter_change_journals_pages(
+        connection, search_id, page_size=page_size, without_project=True
+    )
+    for page in pages:
+        for entry in page:
+            if cursor.is_consumed(entry):
+                continue
+            high_water_mark.advance(entry)
+            yield entry if to_dictionary else ChangeJournalEntry(**entry)
+
+    cursor.transaction_id = high_water_mark.transaction_id
+    cursor.timestamp = high_water_mark.timestamp
+    if cursor_path:
+        cursor.save(cursor_path)
+
+
+@method_version_handler('11.4.0900')
+def purge_change_journal_entries(
+    connection: Connection,
+    projects: 'list[str | Project] | Project | str | None' = None,
+    comment: str | None = None,
+    timestamp: str | datetime | None = None,
+) -> None:
+    """Purge change journal entries up to a specified timestamp for given
+    projects.
+
+    Note: If no projects are provided, all loaded projects will be targeted.
+
+    Args:
+        connection (Connection): Strategy connection object returned by
+            `connection.Connection()`
+        projects (str | Project | list[str | Project]): Project(s) to purge
+            change journal entries from. Can be a single project ID,
+            project_name, Project object or a list of project
+            IDs/names/objects.
+        comment (str, optional): Comment for the purge operation.
+        timestamp (str | datetime, optional): Timestamp up to which to purge
+            entries. Format: 'MM/DD/YYYY HH:MM:SS AM/PM' for string input or a
+            datetime object. If not provided, all entries will be purged.
+    """
+
+    if projects is None:
+        projects = connection.environment.list_loaded_projects()
+
+    if projects and not isinstance(projects, list):
+        projects = [projects]
+    selected_projects = [
+        get_project_id_from_params_set(
+            connection,
+            project=elem,
+            no_fallback_from_connection=True,
+        )
+        for elem in projects
+    ]
+    selected_projects = ",".join(selected_projects)
+
+    if isinstance(timestamp, datetime):
+        timestamp = _format_timestamp_for_api_purge(timestamp)
+
+    res = change_journal.purge_change_journal_entries(
+        connection, comment=comment, timestamp=timestamp, projects_ids=selected_projects
+    )
+    if config.verbose and res.ok:
+        logger.info(
+            "Request to purge change journal entries in selected projects was "
+            "successfully sent."
+        )
+
+
+def _build_filter_criteria(
+    connection: Connection,
+    transaction_sources: str | list[str] | None = None,
+    transaction_types: (
+        str | TransactionType | list[str | TransactionType] | None
+    ) = None,
+    change_types: str | ChangeType | list[str | ChangeType] | None = None,
+    session_ids: str | list[str] | None = None,
+    machines: str | list[str] | None = None,
+    users: str | list[str] | None = None,
+    affected_projects: str | list[str] | None = None,
+    affected_objects: 'str | Entity | list[str | Entity] | None' = None,
+    begin_transaction_id: int | None = None,
+    end_transaction_id: int | None = None,
+    begin_time: str | datetime | None = None,
+    end_time: str | datetime | None = None,
+) -> dict:
+    """Prepare body of the change journal search instance request based on
+    provided filters."""
     from mstrio.utils.entity import Entity
 
     filter_criteria = {}
@@ -215,77 +480,22 @@ def list_change_journal_entries(
             end_time = end_time.strftime("%m/%d/%Y %I:%M:%S %p")
         filter_criteria['endTime'] = end_time
 
-    with (
-        config.temp_verbose_disable(),
-        connection.temporary_project_change(project=None),
-    ):
-        search_id = (
-            change_journal.create_change_journal_search_instance(
-                connection, filter_criteria
-            )
-            .json()
-            .get('searchId')
-        )
-        res = get_change_journals_loop(
-            connection, search_id, offset=0, limit=limit or -1
-        )
-
-    if to_dictionary:
-        return res
-    return [ChangeJournalEntry(**entry) for entry in res]
-
-
-@method_version_handler('11.4.0900')
-def purge_change_journal_entries(
-    connection: Connection,
-    projects: 'list[str | Project] | Project | str | None' = None,
-    comment: str | None = None,
-    timestamp: str | datetime | None = None,
-) -> None:
-    """Purge change journal entries up to a specified timestamp for given
-    projects.
-
-    Note: If no projects are provided, all loaded projects will be targeted.
-
-    Args:
-        connection (Connection): Strategy connection object returned by
-            `connection.Connection()`
-        projects (str | Project | list[str | Project]): Project(s) to purge
-            change journal entries from. Can be a single project ID,
-            project_name, Project object or a list of project
-            IDs/names/objects.
-        comment (str, optional): Comment for the purge operation.
-        timestamp (str | datetime, optional): Timestamp up to which to purge
-            entries. Format: 'MM/DD/YYYY HH:MM:SS AM/PM' for string input or a
-            datetime object. If not provided, all entries will be purged.
-    """
+    return filter_criteria
 
-    if projects is None:
-        projects = connection.environment.list_loaded_projects()
 
-    if projects and not isinstance(projects, list):
-        projects = [projects]
-    selected_projects = [
-        get_project_id_from_params_set(
-            connection,
-            project=elem,
-            no_fallback_from_connection=True,
-        )
-        for elem in projects
-    ]
-    selected_projects = ",".join(selected_projects)
+def _get_transaction_id(entry: dict) -> int | None:
+    """Get numeric transaction ID of the change journal entry, if present."""
+    transaction_id = (entry.get('transaction') or {}).get('id')
+    if isinstance(transaction_id, int) or (
+        isinstance(transaction_id, str) and transaction_id.isdigit()
+    ):
+        return int(transaction_id)
+    return None
 
-    if isinstance(timestamp, datetime):
-        timestamp = _format_timestamp_for_api_purge(timestamp)
 
-    res = change_journal.purge_change_journal_entries(
-        connection, comment=comment, timestamp=timestamp, projects_ids=selected_projects
-    )
-    if config.verbose and res.ok:
-        logger.info(
-            "Request to purge change journal entries in selected projects was "
-            "successfully sent."
-        )
+def _parse_iso_timestamp(timestamp: str) -> datetime:
+    """Parse `timestamp_iso` value of the change journal entry."""
+    return str_to_datetime(timestamp, DatetimeFormats.FULLDATETIME.value)
 
 
 def _format_timestamp_for_api_purge(dt: datetime) -> str:
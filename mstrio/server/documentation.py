@@ -1,5 +1,6 @@
 import logging
-import time
+from collections.abc import Callable
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
@@ -19,6 +20,7 @@ from mstrio.utils.helper import (
     get_owner_id,
     normalize_enum_list,
 )
+from mstrio.utils.poller import get_status_poller
 from mstrio.utils.resolvers import (
     get_project_id_from_params_set,
     get_tenant_id_from_params_set,
@@ -960,6 +962,33 @@ class Documentation(Entity, DeleteMixin):
 
         return current_status
 
+    def poll_execution_finish(
+        self,
+        interval: int | None = None,
+        callback: Callable[[Future], None] | None = None,
+    ) -> Future:
+        """Track documentation execution without blocking.
+
+        Status is polled by the poller shared within mstrio-py, so many
+        documentations can be tracked at once.
+
+        Args:
+            interval (int, optional): Fixed time interval in seconds between
+                polling requests for status. If not provided, the interval is
+                adaptive and limited by the value from mstrio-py's `config`.
+            callback (Callable, optional): Function called with the future
+                once it is done.
+
+        Returns:
+            Future resolved with the final `DocumentationStatus`.
+        """
+        return get_status_poller().submit(
+            self.get_status,
+            lambda status: status.status != EnumDocumentationStatus.RUNNING,
+            interval=interval,
+            callback=callback,
+        )
+
     def wait_for_execution_finish(
         self,
         interval: int | None = None,
@@ -967,18 +996,19 @@ class Documentation(Entity, DeleteMixin):
         """Wait until documentation execution is completed.
 
         Args:
-            interval (int, optional): Time interval in seconds between polling
-                requests for status. If not provided, the value is taken from
-                mstrio-py's `config`.
+            interval (int, optional): Fixed time interval in seconds between
+                polling requests for status. If not provided, the interval is
+                adaptive and limited by the value from mstrio-py's `config`.
 
         Returns:
             DocumentationStatus: Final status of the documentation execution.
         """
-        current_status = self.get_status()
-
-        while current_status.status == EnumDocumentationStatus.RUNNING:
-            time.sleep(interval or config.delay_between_polling)
-            current_status = self.get_status()
+        future = self.poll_execution_finish(interval=interval)
+        try:
+            current_status = future.result()
+        except BaseException:
+            future.cancel()
+            raise
 
         if config.verbose:
             if current_status.message:
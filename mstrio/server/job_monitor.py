@@ -1,8 +1,14 @@
 import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, Union
 
 from packaging import version
+from pandas import DataFrame, Series, concat, to_numeric
 
 from mstrio import config
 from mstrio.api import monitors
@@ -16,9 +22,10 @@ from mstrio.helpers import (
 )
 from mstrio.server import Node, Project
 from mstrio.utils.entity import Entity, EntityBase
-from mstrio.utils.enum_helper import AutoName
+from mstrio.utils.enum_helper import AutoName, get_enum_val
 from mstrio.utils.helper import exception_handler, validate_param_value
-from mstrio.utils.monitors import all_nodes_async
+from mstrio.utils.monitors import all_nodes_async, get_running_node_names
+from mstrio.utils.records import Record, make_records
 from mstrio.utils.time_helper import DatetimeFormats, map_str_to_datetime
 from mstrio.utils.version_helper import class_version_handler, method_version_handler
 
@@ -271,8 +278,9 @@ def list_jobs(
     sort_by: SortBy | str | None = None,
     to_dictionary: bool = False,
     limit: int | None = None,
+    to_records: bool = False,
     **filters,
-) -> list["Job"] | list[dict]:
+) -> list["Job"] | list[dict] | list[Record]:
     """List jobs objects or job dictionaires.
     Args:
         connection(object): Strategy connection object returned by
@@ -313,6 +321,9 @@ def list_jobs(
             Currently, the server supports sorting only by single field.
         to_dictionary(bool, optional): if True, return Schedules as
             list of dicts
+        to_records(bool, optional): if True, return compact read-only
+            records, which can be upgraded to Job objects with `to_entity()`.
+            Takes precedence over `to_dictionary`.
         limit(int, optional): maximum number of schedules returned
         **filters(optional): Local filter parameters
 
@@ -320,7 +331,8 @@ def list_jobs(
         >>> list_jobs_v1(connection, duration='gt:100')
 
     Returns:
-        List[Job] | List[dict]: list of Job objects or dictionaries.
+        List[Job] | List[dict] | List[Record]: list of Job objects,
+            dictionaries or records.
     """
     user = user.full_name if isinstance(user, Entity) else user
     subscription_recipient = (
@@ -361,6 +373,7 @@ def list_jobs(
             user=user,
             limit=limit,
             to_dictionary=to_dictionary,
+            to_records=to_records,
             **filters,
         )
     else:
@@ -391,6 +404,8 @@ def list_jobs(
             fields=['jobs'],
         )
 
+    if to_records:
+        return make_records(objects, connection, Job)
     if to_dictionary:
         return objects
     else:
@@ -409,8 +424,9 @@ def list_jobs_v1(
     sort_by: SortBy | str | None = None,
     to_dictionary: bool = False,
     limit: int | None = None,
+    to_records: bool = False,
     **filters,
-) -> list["Job"] | list[dict]:
+) -> list["Job"] | list[dict] | list[Record]:
     """List job objects or job dictionaries. Optionally filter list.
     NOTE: list_jobs can return up to 1024 jobs per request.
 
@@ -427,6 +443,9 @@ def list_jobs_v1(
         sort_by(SortBy, optional): Specifies sorting criteria to sort by
         to_dictionary(bool, optional): if True, return Schedules as
             list of dicts
+        to_records(bool, optional): if True, return compact read-only
+            records, which can be upgraded to Job objects with `to_entity()`.
+            Takes precedence over `to_dictionary`.
         limit(int, optional): maximum number of schedules returned.
         **filters: Available filter parameters:[id, description, status,
             jobType, duration, jobId, objectd]
@@ -440,7 +459,8 @@ def list_jobs_v1(
         >>> list_jobs_v1(connection, duration='gt:100')
 
     Returns:
-        List[Job] | List[dict]: list of Job objects or dictionaries.
+        List[Job] | List[dict] | List[Record]: list of Job objects,
+            dictionaries or records.
     """
     project_id = project.id if isinstance(project, Project) else project
     user_full_name = user.full_name if isinstance(user, Entity) else user
@@ -466,6 +486,8 @@ def list_jobs_v1(
         sort_by=sort_by,
     )
 
+    if to_records:
+        return make_records(objects, connection, Job)
     if to_dictionary:
         return objects
     else:
@@ -992,3 +1014,351 @@ class Job(EntityBase):
             return self._username
         else:
             return None
+
+
+@dataclass
+class JobsDelta:
+    """Changes in the list of jobs detected by a single `JobMonitor` poll.
+
+    Every attribute is a DataFrame indexed by job ID with the same columns as
+    `JobMonitor.jobs`.
+
+    Attributes:
+        new: Jobs which appeared since the previous poll.
+        changed: Jobs of which any of the tracked properties (e.g. status,
+            processing unit or memory usage) changed since the previous poll.
+        finished: Jobs which are no longer listed by the I-Server or reached
+            one of the final statuses since the previous poll.
+    """
+
+    new: DataFrame
+    changed: DataFrame
+    finished: DataFrame
+
+    @property
+    def empty(self) -> bool:
+        return self.new.empty and self.changed.empty and self.finished.empty
+
+
+class JobMonitor:
+    """Session object keeping an indexed, in-memory table of jobs running on
+    all nodes of the cluster.
+
+    Every poll lists jobs on all running nodes concurrently with a single
+    request per node, compares the result with the previous snapshot and
+    emits the delta to the registered callbacks. Polling can be done manually
+    with `poll()` or in a background thread with `start()` and `stop()`.
+    The monitor can also be used as a context manager, which starts and stops
+    the background polling.
+
+    Note: Requires I-Server 11.3.3 or newer.
+
+    Attributes:
+        connection: A Strategy connection object
+        interval: Time (in seconds) between polls in the background thread
+        jobs: DataFrame with the latest snapshot of jobs indexed by job ID
+        last_poll_time: Time of the latest successful poll
+    """
+
+    _TRACKED_COLUMNS = [
+        'status',
+        'step_id',
+        'pu_name',
+        'completed_tasks',
+        'total_tasks',
+        'memory_usage',
+    ]
+    _NUMERIC_COLUMNS = [
+        'memory_usage',
+        'elapsed_time',
+        'step_elapsed_time',
+        'completed_tasks',
+        'total_tasks',
+    ]
+    _FINAL_STATUSES = [
+        JobStatus.COMPLETED.value,
+        JobStatus.ERROR.value,
+        JobStatus.STOPPED.value,
+    ]
+
+    @method_version_handler('11.3.0300')
+    def __init__(
+        self,
+        connection: Connection,
+        interval: int | float | None = None,
+        on_new: Callable[[DataFrame], Any] | None = None,
+        on_changed: Callable[[DataFrame], Any] | None = None,
+        on_finished: Callable[[DataFrame], Any] | None = None,
+        nodes_refresh_interval: int | float = 60,
+        **filters,
+    ) -> None:
+        """Initialize the JobMonitor object. No requests are sent until the
+        first poll.
+
+        Args:
+            connection: Strategy connection object returned by
+                `connection.Connection()`
+            interval (int | float, optional): Time (in seconds) between polls
+                in the background thread. If not provided, the value is taken
+                from mstrio-py's `config`.
+            on_new (Callable, optional): Callback called with DataFrame of new
+                jobs
+            on_changed (Callable, optional): Callback called with DataFrame of
+                changed jobs
+            on_finished (Callable, optional): Callback called with DataFrame of
+                finished jobs
+            nodes_refresh_interval (int | float, optional): Time (in seconds)
+                after which the list of running nodes is fetched again.
+                Defaults to 60.
+            **filters: Filters applied on the server side, accepted by
+                `list_jobs()` for 11.3.3+ I-Servers, e.g. `project_name`,
+                `status`, `memory_usage` or `elapsed_time`.
+        """
+        self.connection = connection
+        self.interval = interval or config.delay_between_polling
+        self._callbacks = {
+            'new': [on_new] if on_new else [],
+            'changed': [on_changed] if on_changed else [],
+            'finished': [on_finished] if on_finished else [],
+        }
+        self._nodes_refresh_interval = nodes_refresh_interval
+        self._filters = {
+            key: get_enum_val(val) if isinstance(val, Enum) else val
+            for key, val in filters.items()
+        }
+        self._node_names: list[str] = []
+        self._nodes_fetch_time: float | None = None
+        self._jobs = DataFrame()
+        self.last_poll_time: datetime | None = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> 'JobMonitor':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return (
+            f"JobMonitor(connection, interval={self.interval}, "
+            f"jobs={len(self._jobs)}, running={self.is_running})"
+        )
+
+    @property
+    def jobs(self) -> DataFrame:
+        with self._lock:
+            return self._jobs.copy()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def add_callback(self, event: str, callback: Callable[[DataFrame], Any]) -> None:
+        """Register additional callback for one of the events: 'new',
+        'changed' or 'finished'."""
+        if event not in self._callbacks:
+            raise ValueError(
+                f"Unknown event '{event}'. Available events: "
+                f"{', '.join(self._callbacks)}."
+            )
+        self._callbacks[event].append(callback)
+
+    def poll(self) -> JobsDelta:
+        """Fetch jobs from all running nodes, update the in-memory table and
+        emit the delta to the registered callbacks.
+
+        Returns:
+            JobsDelta object with new, changed and finished jobs.
+        """
+        snapshot = self._to_frame(self._fetch_jobs())
+
+        with self._lock:
+            previous = self._jobs
+            delta = self._compute_delta(previous, snapshot)
+            self._jobs = snapshot
+            self.last_poll_time = datetime.now()
+
+        for event in ('new', 'changed', 'finished'):
+            rows = getattr(delta, event)
+            if rows.empty:
+                continue
+            for callback in self._callbacks[event]:
+                callback(rows)
+        return delta
+
+    def start(self) -> None:
+        """Start polling in a background thread."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name='mstrio-job-monitor', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: int | float | None = None) -> None:
+        """Stop polling in the background thread and wait for it to finish.
+
+        Args:
+            timeout (int | float, optional): Maximum time (in seconds) to wait
+                for the background thread.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def filter(
+        self,
+        status: JobStatus | str | list[JobStatus | str] | None = None,
+        min_memory_usage: int | float | None = None,
+        max_memory_usage: int | float | None = None,
+        min_elapsed_time: int | float | None = None,
+        max_elapsed_time: int | float | None = None,
+        **filters,
+    ) -> DataFrame:
+        """Filter the latest snapshot of jobs using vectorised conditions.
+
+        Args:
+            status (JobStatus | str | list, optional): Job status or list of
+                job statuses to keep
+            min_memory_usage (int | float, optional): Keep jobs with memory
+                usage (in bytes) greater than or equal to this value
+            max_memory_usage (int | float, optional): Keep jobs with memory
+                usage (in bytes) less than or equal to this value
+            min_elapsed_time (int | float, optional): Keep jobs with elapsed
+                time (in milliseconds) greater than or equal to this value
+            max_elapsed_time (int | float, optional): Keep jobs with elapsed
+                time (in milliseconds) less than or equal to this value
+            **filters: Exact match conditions on any other column, e.g.
+                `project_name` or `user`
+
+        Returns:
+            DataFrame with jobs meeting all the conditions.
+        """
+        jobs = self.jobs
+        if jobs.empty:
+            return jobs
+
+        mask = Series(True, index=jobs.index)
+        if status is not None:
+            statuses = status if isinstance(status, list) else [status]
+            mask &= jobs['status'].isin([get_enum_val(s, JobStatus) for s in statuses])
+        for column, lower, upper in (
+            ('memory_usage', min_memory_usage, max_memory_usage),
+            ('elapsed_time', min_elapsed_time, max_elapsed_time),
+        ):
+            if lower is not None:
+                mask &= jobs[column] >= lower
+            if upper is not None:
+                mask &= jobs[column] <= upper
+        for column, value in filters.items():
+            if column not in jobs.columns:
+                raise ValueError(f"Unknown column '{column}' of the jobs table.")
+            mask &= jobs[column] == (value.value if isinstance(value, Enum) else value)
+        return jobs[mask]
+
+    def kill(
+        self, jobs: 'DataFrame | list[Job | str]'
+    ) -> Success | PartialSuccess | MstrException:
+        """Kill jobs given as DataFrame (e.g. result of `filter()` or one of
+        the deltas) or list of Job objects or job IDs."""
+        if isinstance(jobs, DataFrame):
+            jobs = list(jobs.index)
+        return kill_jobs(self.connection, jobs)
+
+    def to_jobs(self, jobs: DataFrame | None = None) -> list[Job]:
+        """Convert rows of the jobs table into Job objects.
+
+        Args:
+            jobs (DataFrame, optional): Subset of the jobs table. If not
+                provided, the whole latest snapshot is converted.
+        """
+        jobs = self.jobs if jobs is None else jobs
+        records = jobs.astype(object).where(jobs.notna(), None).reset_index()
+        return [
+            Job.from_dict(source=record, connection=self.connection)
+            for record in records.to_dict(orient='records')
+        ]
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+            except Exception as err:
+                logger.warning(f"Polling jobs failed: {err}")
+            self._stop_event.wait(self.interval)
+
+    def _get_node_names(self) -> list[str]:
+        now = time.monotonic()
+        if (
+            not self._node_names
+            or self._nodes_fetch_time is None
+            or now - self._nodes_fetch_time >= self._nodes_refresh_interval
+        ):
+            self._node_names = get_running_node_names(self.connection)
+            self._nodes_fetch_time = now
+        return self._node_names
+
+    def _fetch_jobs(self) -> list[dict]:
+        return all_nodes_async(
+            self.connection,
+            async_api=monitors.get_jobs_v2_async,
+            filters={},
+            error_msg="Error fetching chunk of jobs.",
+            unpack_value='jobs',
+            node_names=self._get_node_names(),
+            fields=['jobs'],
+            **self._filters,
+        )
+
+    def _to_frame(self, jobs: list[dict]) -> DataFrame:
+        frame = DataFrame.from_records(jobs)
+        if frame.empty:
+            return DataFrame(columns=['id']).set_index('id')
+        frame = frame.drop_duplicates(subset='id', keep='last').set_index('id')
+        for column in self._NUMERIC_COLUMNS:
+            if column in frame.columns:
+                frame[column] = to_numeric(frame[column], errors='coerce')
+        return frame
+
+    def _is_final(self, jobs: DataFrame) -> Series:
+        if 'status' not in jobs.columns:
+            return Series(False, index=jobs.index)
+        return jobs['status'].isin(self._FINAL_STATUSES)
+
+    def _compute_delta(self, previous: DataFrame, current: DataFrame) -> JobsDelta:
+        was_final = self._is_final(previous)
+        is_final = self._is_final(current)
+        new_ids = current.index.difference(previous.index)
+        # jobs already reported as finished are not reported again
+        gone_ids = previous.index.difference(current.index).difference(
+            previous.index[was_final.to_numpy()]
+        )
+        common_ids = current.index.intersection(previous.index)
+
+        columns = [
+            col
+            for col in self._TRACKED_COLUMNS
+            if col in current.columns and col in previous.columns
+        ]
+        current_common = current.loc[common_ids, columns]
+        previous_common = previous.loc[common_ids, columns]
+        changed_mask = (
+            current_common.ne(previous_common)
+            & ~(current_common.isna() & previous_common.isna())
+        ).any(axis=1)
+        changed_ids = common_ids[changed_mask.to_numpy()]
+        just_finished = changed_ids[
+            (is_final.loc[changed_ids] & ~was_final.loc[changed_ids]).to_numpy()
+        ]
+        changed_ids = changed_ids.difference(just_finished)
+
+        return JobsDelta(
+            new=current.loc[new_ids],
+            changed=current.loc[changed_ids],
+            finished=concat([previous.loc[gone_ids], current.loc[just_finished]]),
+        )
@@ -1,10 +1,10 @@
 import csv
 import json
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from enum import auto
-from time import sleep
 from typing import TYPE_CHECKING
 
 import humps
@@ -21,6 +21,7 @@ from mstrio.utils.helper import (
     camel_to_snake,
     key_fn_for_sort_object_properties,
 )
+from mstrio.utils.poller import get_status_poller
 from mstrio.utils.version_helper import class_version_handler
 
 if TYPE_CHECKING:
@@ -697,31 +698,53 @@ class License(Dictable):
         self.run_compliance_check()
         start_time = datetime.now()
 
-        # Wait for compliance check status to change to not running
-        while (
-            self.compliance_running
-            and (datetime.now() - start_time).total_seconds() < timeout
-        ):
-            sleep(retry_interval)
+        def get_running_status():
             self.get_compliance_check_status()
+            return self._compliance_running
 
-        if self.compliance_running:
-            raise TimeoutError(
-                "Compliance check did not complete within the allowed timeout."
-            )
+        # Wait for compliance check status to change to not running
+        self._wait_for(
+            get_running_status,
+            lambda running: not running,
+            timeout=timeout,
+            retry_interval=retry_interval,
+            error_msg="Compliance check did not complete within the allowed timeout.",
+        )
 
-        # Fetch results and wait for compliance_time to update
-        while (
-            self.compliance_time == initial_compliance_time
-            and (datetime.now() - start_time).total_seconds() < timeout
-        ):
-            sleep(retry_interval)
+        def get_compliance_time():
             self.get_compliance_check()
+            return self._compliance_time
 
-        if self.compliance_time == initial_compliance_time:
-            raise TimeoutError(
-                "Compliance check results were not updated within the allowed timeout."
-            )
+        # Fetch results and wait for compliance_time to update
+        self._wait_for(
+            get_compliance_time,
+            lambda compliance_time: compliance_time != initial_compliance_time,
+            timeout=max(timeout - (datetime.now() - start_time).total_seconds(), 0),
+            retry_interval=retry_interval,
+            error_msg=(
+                "Compliance check results were not updated within the allowed "
+                "timeout."
+            ),
+        )
+
+    @staticmethod
+    def _wait_for(
+        get_status: Callable,
+        is_done: Callable,
+        timeout: float,
+        retry_interval: float,
+        error_msg: str,
+    ) -> None:
+        future = get_status_poller().submit(
+            get_status, is_done, timeout=timeout, interval=retry_interval
+        )
+        try:
+            future.result()
+        except TimeoutError:
+            raise TimeoutError(error_msg) from None
+        except BaseException:
+            future.cancel()
+            raise
 
     def run_audit(self) -> dict:
         """Run a license audit.
@@ -773,20 +796,19 @@ class License(Dictable):
         """
         initial_audit_time = self.audit_time
         self.run_audit()
-        start_time = datetime.now()
 
-        # Wait for audit time to update
-        while (
-            self.audit_time == initial_audit_time
-            and (datetime.now() - start_time).total_seconds() < timeout
-        ):
-            sleep(retry_interval)
+        def get_audit_time():
             self.get_audit()
+            return self._audit_time
 
-        if self.audit_time == initial_audit_time:
-            raise TimeoutError(
-                "Audit results were not updated within the allowed timeout."
-            )
+        # Wait for audit time to update
+        self._wait_for(
+            get_audit_time,
+            lambda audit_time: audit_time != initial_audit_time,
+            timeout=timeout,
+            retry_interval=retry_interval,
+            error_msg="Audit results were not updated within the allowed timeout.",
+        )
 
     def fetch_all_products_users_privileges(self) -> None:
         """Fetch all products and their users' privileges."""
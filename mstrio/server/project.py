@@ -2,6 +2,7 @@ import logging
 import os
 import time
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum, IntEnum, auto
@@ -326,6 +327,16 @@ def compare_project_settings(
     to_be_compared = {}
     df = DataFrame({}, columns=['initial'])
 
+    # settings not fetched yet are fetched concurrently; the first project is
+    # fetched alone, as it loads the settings config shared by all of them
+    not_fetched = [project for project in projects if not hasattr(project, '_settings')]
+    if len(not_fetched) > 1:
+        not_fetched[0].settings
+        with ThreadPoolExecutor(
+            max_workers=helper.get_parallel_number(len(not_fetched) - 1)
+        ) as executor:
+            list(executor.map(lambda project: project.settings, not_fetched[1:]))
+
     for project in projects:
         to_be_compared[project.name] = project.settings.to_dataframe().reset_index()
         if df.empty:
@@ -2891,6 +2902,14 @@ class ProjectDuplication(EntityBase, ChangeJournalMixin, DeleteMixin):
             f"target_project='{self.target.project.get('name')}')"
         )
 
+    _NOT_STABLE_STATUSES = [
+        ProjectDuplicationStatus.CANCELLING,
+        ProjectDuplicationStatus.EXPORTING,
+        ProjectDuplicationStatus.EXPORT_SYNCING,
+        ProjectDuplicationStatus.IMPORTING,
+        ProjectDuplicationStatus.IMPORT_SYNCING,
+    ]
+
     def wait_for_stable_status(
         self, timeout: int = 240, interval: int | None = None
     ) -> 'ProjectDuplication':
@@ -2898,22 +2917,53 @@ class ProjectDuplication(EntityBase, ChangeJournalMixin, DeleteMixin):
 
         Args:
             timeout (int, optional): Maximum time to wait in seconds.
-            interval (int, optional): Time between status checks in seconds.
-                If not provided, the value is taken from mstrio-py's `config`.
+            interval (int, optional): Fixed time between status checks in
+                seconds. If not provided, the interval is adaptive and limited
+                by the value from mstrio-py's `config`.
 
         Returns:
             ProjectDuplication: The project duplication object with updated
                 status.
         """
-        not_stable_statuses = [
-            ProjectDuplicationStatus.CANCELLING,
-            ProjectDuplicationStatus.EXPORTING,
-            ProjectDuplicationStatus.EXPORT_SYNCING,
-            ProjectDuplicationStatus.IMPORTING,
-            ProjectDuplicationStatus.IMPORT_SYNCING,
-        ]
         return helper.wait_for_stable_status(
-            self, 'status', not_stable_statuses, timeout=timeout, interval=interval
+            self,
+            'status',
+            self._NOT_STABLE_STATUSES,
+            timeout=timeout,
+            interval=interval,
+        )
+
+    def poll_stable_status(
+        self,
+        timeout: int | None = None,
+        interval: int | None = None,
+        callback: Callable[[Future], None] | None = None,
+    ) -> Future:
+        """Track the project duplication until it reaches a stable status,
+        without blocking.
+
+        Status is polled by the poller shared within mstrio-py, so many
+        duplications can be tracked at once.
+
+        Args:
+            timeout (int, optional): Maximum time to wait in seconds. If not
+                provided, waits indefinitely.
+            interval (int, optional): Fixed time between status checks in
+                seconds. If not provided, the interval is adaptive and limited
+                by the value from mstrio-py's `config`.
+            callback (Callable, optional): Function called with the future
+                once it is done.
+
+        Returns:
+            Future resolved with the stable `ProjectDuplicationStatus`.
+        """
+        return helper.poll_for_stable_status(
+            self,
+            'status',
+            self._NOT_STABLE_STATUSES,
+            timeout=timeout,
+            interval=interval,
+            callback=callback,
         )
 
     @method_version_handler('11.5.1200')
@@ -0,0 +1,459 @@
+import gzip
+import json
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from enum import auto
+from itertools import chain, zip_longest
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pandas import DataFrame, concat, factorize
+from tqdm.auto import tqdm
+
+from mstrio import config
+from mstrio.api import administration, monitors, projects
+from mstrio.utils.enum_helper import AutoName, get_enum_val
+from mstrio.utils.helper import get_parallel_number, write_json_atomic
+
+if TYPE_CHECKING:
+    from mstrio.connection import Connection
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_COLUMNS = ('environment', 'scope', 'target', 'setting', 'value')
+"""Columns of settings stored in a `SettingsSnapshot`."""
+
+_KEY_COLUMNS = SNAPSHOT_COLUMNS[:-1]
+
+
+class SettingsScope(AutoName):
+    SERVER = auto()
+    PROJECT = auto()
+    NODE = auto()
+
+
+def _value_key(value):
+    # lists, dicts and booleans are compared by their canonical JSON
+    # representation, which is hashable and distinguishes e.g. 1 and True
+    if type(value) in (str, int, float):
+        return value
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _diff(
+    settings: DataFrame,
+    by: str,
+    index: list[str],
+    show_diff_only: bool,
+    include_missing: bool = False,
+) -> DataFrame:
+    """Pivot settings so that every value of the `by` column becomes a column,
+    and optionally keep only rows whose values are not all equal. Missing
+    values are skipped in the comparison, unless `include_missing` is True."""
+    if settings.empty:
+        return DataFrame(columns=index).set_index(index)
+    result = settings.pivot(index=index, columns=by, values='value')
+    if show_diff_only:
+        # values are replaced with integer codes, so rows are compared at once
+        codes, _ = factorize(settings['value'].map(_value_key))
+        codes = (
+            settings[index + [by]]
+            .assign(value=codes)
+            .pivot(index=index, columns=by, values='value')
+            .reindex(index=result.index, columns=result.columns)
+            .fillna(-1)
+            .to_numpy()
+        )
+        if include_missing:
+            differs = (codes != codes[:, :1]).any(axis=1)
+        else:
+            present = codes >= 0
+            highest = np.where(present, codes, -np.inf).max(axis=1)
+            lowest = np.where(present, codes, np.inf).min(axis=1)
+            differs = highest > lowest
+        result = result[differs]
+    result.columns.name = None
+    return result
+
+
+class SettingsSnapshot:
+    """Settings of servers, their nodes and projects of one or many
+    environments, taken at a given time.
+
+    Settings are stored in a long `DataFrame` with a row per setting of every
+    target, with columns `environment`, `scope`, `target` (name of a project
+    or node, empty for server settings), `setting` and `value`. Values are
+    stored as returned by the REST API, e.g. sizes in bytes.
+
+    Attributes:
+        settings (DataFrame): Settings with their values.
+        taken_at (datetime): Time when the snapshot was taken.
+        errors (list[dict]): Targets whose settings could not be fetched, with
+            `environment`, `scope`, `target` and `error` keys.
+    """
+
+    def __init__(
+        self,
+        settings: DataFrame,
+        taken_at: datetime | None = None,
+        errors: list[dict] | None = None,
+    ) -> None:
+        self.settings = settings
+        self.taken_at = taken_at or datetime.now(timezone.utc)
+        self.errors = errors or []
+
+    def __repr__(self) -> str:
+        return (
+            f"SettingsSnapshot(taken_at={self.taken_at.isoformat()}, "
+            f"settings={len(self.settings)}, errors={len(self.errors)})"
+        )
+
+    @property
+    def environments(self) -> list[str]:
+        """Names of environments in the snapshot."""
+        return list(self.settings['environment'].unique())
+
+    def diff(
+        self,
+        by: str = 'environment',
+        scope: SettingsScope | str | None = None,
+        show_diff_only: bool = True,
+        include_missing: bool = False,
+    ) -> DataFrame:
+        """Compare settings across all environments, or across all targets
+        (projects or nodes) of every environment, at once.
+
+        With `by='target'`, settings are compared only between targets of
+        the same scope, i.e. projects with projects and nodes with nodes.
+        Columns of targets of other scopes are empty in rows of a scope, and
+        columns of targets without any of the returned settings are left out.
+
+        Args:
+            by (str, optional): Column whose values are compared with each
+                other: 'environment' compares the server settings and settings
+                of projects with the same names across environments, 'target'
+                compares settings of all projects (or nodes) within every
+                environment. Defaults to 'environment'.
+            scope (SettingsScope | str, optional): If provided, only settings
+                of this scope are compared. Node settings are compared across
+                environments only if requested with this parameter, as names
+                of nodes differ between environments.
+            show_diff_only (bool, optional): Whether to return only settings
+                which are not equal everywhere. Defaults to True.
+            include_missing (bool, optional): Whether a setting missing in some
+                of the compared environments or targets, e.g. a project
+                present in only one environment, counts as a difference.
+                Defaults to False.
+
+        Returns:
+            DataFrame indexed by the remaining key columns, with a column of
+            values for every compared environment or target.
+        """
+        if by not in ('environment', 'target'):
+            raise ValueError("`by` must be either 'environment' or 'target'.")
+        settings = self.settings
+        if scope is not None:
+            scope = get_enum_val(scope, SettingsScope)
+            settings = settings[settings['scope'] == scope]
+        elif by == 'environment':
+            settings = settings[settings['scope'] != SettingsScope.NODE.value]
+        index = [column for column in _KEY_COLUMNS if column != by]
+        result = _diff(settings, by, index, show_diff_only, include_missing)
+        if by == 'target':
+            # columns of targets without any of the returned settings, e.g.
+            # nodes when only project settings differ, are left out
+            result = result.dropna(axis=1, how='all')
+        return result
+
+    def save(self, path: str | os.PathLike) -> Path:
+        """Save the snapshot to a gzip-compressed JSON file, with settings
+        stored by columns.
+
+        Args:
+            path (str | PathLike): Path of the file, usually with `.json.gz`
+                extension.
+
+        Returns:
+            Path of the saved file.
+        """
+        path = Path(path)
+        data = {
+            'takenAt': self.taken_at.isoformat(),
+            'columns': {
+                column: self.settings[column].tolist() for column in SNAPSHOT_COLUMNS
+            },
+            'errors': self.errors,
+        }
+        return write_json_atomic(
+            path, data, compress=True, separators=(',', ':'), default=str
+        )
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> 'SettingsSnapshot':
+        """Load a snapshot saved with `save()`.
+
+        Args:
+            path (str | PathLike): Path of the file.
+
+        Returns:
+            SettingsSnapshot object.
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            data = json.load(file)
+        return cls(
+            settings=DataFrame(data['columns'], columns=list(SNAPSHOT_COLUMNS)),
+            taken_at=datetime.fromisoformat(data['takenAt']),
+            errors=data.get('errors'),
+        )
+
+
+def compare_snapshots(
+    snapshots: dict[str, SettingsSnapshot] | list[SettingsSnapshot],
+    show_diff_only: bool = True,
+    include_missing: bool = False,
+) -> DataFrame:
+    """Compare settings from many snapshots, e.g. taken at different times
+    to detect configuration drift.
+
+    Args:
+        snapshots (dict[str, SettingsSnapshot] | list[SettingsSnapshot]):
+            Snapshots to compare, labelled by keys of the dict or, for a list,
+            by the time they were taken.
+        show_diff_only (bool, optional): Whether to return only settings which
+            are not equal in all snapshots. Defaults to True.
+        include_missing (bool, optional): Whether a setting missing in some of
+            the snapshots, e.g. of a project added in the meantime, counts as
+            a difference. Defaults to False.
+
+    Returns:
+        DataFrame indexed by environment, scope, target and setting, with
+        a column of values for every snapshot.
+    """
+    if not isinstance(snapshots, dict):
+        snapshots = {snapshot.taken_at.isoformat(): snapshot for snapshot in snapshots}
+    if len(snapshots) < 2:
+        raise ValueError("Provide at least two snapshots to compare.")
+    settings = concat(
+        [
+            snapshot.settings.assign(snapshot=label)
+            for label, snapshot in snapshots.items()
+        ],
+        ignore_index=True,
+    )
+    return _diff(
+        settings, 'snapshot', list(_KEY_COLUMNS), show_diff_only, include_missing
+    )
+
+
+def _flatten_settings(settings: dict) -> dict:
+    return {
+        key: value['value'] if isinstance(value, dict) and 'value' in value else value
+        for key, value in settings.items()
+    }
+
+
+class SettingsAuditor:
+    """Auditor taking snapshots of settings of many environments at once.
+
+    `snapshot()` first lists loaded projects and cluster nodes of every
+    environment, and then fetches server, node and project settings of all
+    of them concurrently, with requests to different environments
+    interleaved, so that no single server gets all of them at once. Targets
+    whose settings cannot be fetched are reported in `errors` of the snapshot
+    instead of failing the whole audit.
+
+    Attributes:
+        connections (dict[str, Connection]): Connections to audited
+            environments, by their names.
+        projects (list[str], optional): Names or IDs of audited projects.
+            If not provided, all loaded projects are audited.
+        scopes (list[SettingsScope]): Audited kinds of settings.
+        max_workers (int, optional): Maximum number of concurrent requests.
+    """
+
+    def __init__(
+        self,
+        connections: 'dict[str, Connection] | list[Connection]',
+        projects: list[str] | None = None,
+        scopes: list[SettingsScope | str] | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Initialize the auditor.
+
+        Args:
+            connections (dict[str, Connection] | list[Connection]):
+                Connections to audited environments, by their names. If a list
+                is given, environments are named by base URLs of connections.
+            projects (list[str], optional): Names or IDs of audited projects.
+                If not provided, all loaded projects are audited.
+            scopes (list[SettingsScope | str], optional): Audited kinds of
+                settings. Defaults to all of them.
+            max_workers (int, optional): Maximum number of concurrent
+                requests. Defaults to the number of threads used by mstrio-py
+                for parallel downloads.
+        """
+        if not isinstance(connections, dict):
+            connections = {conn.base_url: conn for conn in connections}
+        self.connections = connections
+        self.projects = projects
+        self.scopes = [
+            SettingsScope(get_enum_val(scope, SettingsScope))
+            for scope in (scopes or list(SettingsScope))
+        ]
+        self.max_workers = max_workers
+
+    def snapshot(self, progress_bar: bool = True) -> SettingsSnapshot:
+        """Fetch settings of all audited environments.
+
+        Args:
+            progress_bar (bool, optional): Whether to display a progress bar,
+                if verbose mode is enabled in mstrio-py's `config`. Defaults to
+                True.
+
+        Returns:
+            SettingsSnapshot object.
+        """
+        taken_at = datetime.now(timezone.utc)
+        errors: list[dict] = []
+        tasks = self._list_tasks(errors)
+        rows = []
+
+        threads = self.max_workers or get_parallel_number(len(tasks))
+        with (
+            ThreadPoolExecutor(max_workers=max(threads, 1)) as executor,
+            tqdm(
+                total=len(tasks),
+                desc="Fetching settings",
+                disable=not progress_bar or not config.verbose,
+            ) as pbar,
+        ):
+            futures = {executor.submit(fetch): key for *key, fetch in tasks}
+            for future in as_completed(futures):
+                environment, scope, target = futures[future]
+                pbar.update()
+                try:
+                    settings = future.result()
+                except Exception as err:
+                    self._report_error(errors, environment, scope, target, err)
+                    continue
+                rows.extend(
+                    (environment, scope.value, target, setting, value)
+                    for setting, value in sorted(settings.items())
+                )
+
+        rows.sort(key=lambda row: row[:4])
+        return SettingsSnapshot(
+            settings=DataFrame(rows, columns=list(SNAPSHOT_COLUMNS)),
+            taken_at=taken_at,
+            errors=errors,
+        )
+
+    def _list_tasks(self, errors: list[dict]) -> list[tuple]:
+        """List fetches of settings of all targets, with requests to
+        different environments interleaved."""
+        with ThreadPoolExecutor(
+            max_workers=max(min(len(self.connections), get_parallel_number(0)), 1)
+        ) as executor:
+            futures = {
+                name: executor.submit(self._list_environment_tasks, name, conn)
+                for name, conn in self.connections.items()
+            }
+        per_environment = []
+        for name, future in futures.items():
+            try:
+                per_environment.append(future.result())
+            except Exception as err:
+                self._report_error(errors, name, None, None, err)
+        return [
+            task
+            for task in chain.from_iterable(zip_longest(*per_environment))
+            if task is not None
+        ]
+
+    def _list_environment_tasks(
+        self, environment: str, connection: 'Connection'
+    ) -> list[tuple[str, SettingsScope, str, Callable[[], dict]]]:
+        tasks = []
+        if SettingsScope.SERVER in self.scopes:
+            tasks.append(
+                (
+                    environment,
+                    SettingsScope.SERVER,
+                    '',
+                    lambda: _flatten_settings(
+                        administration.get_iserver_settings(connection).json()
+                    ),
+                )
+            )
+        if SettingsScope.NODE in self.scopes:
+            nodes = monitors.get_node_info(connection).json()['nodes']
+            tasks.extend(
+                (
+                    environment,
+                    SettingsScope.NODE,
+                    node['name'],
+                    lambda node=node['name']: _flatten_settings(
+                        administration.get_iserver_node_settings(
+                            connection, node
+                        ).json()
+                    ),
+                )
+                for node in nodes
+            )
+        if SettingsScope.PROJECT in self.scopes:
+            loaded = projects.get_projects(connection).json()
+            tasks.extend(
+                (
+                    environment,
+                    SettingsScope.PROJECT,
+                    project['name'],
+                    lambda project_id=project['id']: self._fetch_project_settings(
+                        connection, project_id
+                    ),
+                )
+                for project in loaded
+                if not self.projects
+                or project['name'] in self.projects
+                or project['id'] in self.projects
+            )
+        return tasks
+
+    @staticmethod
+    def _fetch_project_settings(connection: 'Connection', project_id: str) -> dict:
+        response = projects.get_project_settings(
+            connection, project_id, whitelist=[('ERR001', 404)]
+        )
+        if not response.ok:
+            raise ValueError(
+                "Settings could not be fetched. It may be because the project is "
+                "not loaded in the Intelligence Server or the project is idle."
+            )
+        return _flatten_settings(response.json())
+
+    @staticmethod
+    def _report_error(
+        errors: list[dict],
+        environment: str,
+        scope: SettingsScope | None,
+        target: str | None,
+        error: Exception,
+    ) -> None:
+        errors.append(
+            {
+                'environment': environment,
+                'scope': scope.value if scope else None,
+                'target': target,
+                'error': str(error),
+            }
+        )
+        if scope is None:
+            what = 'targets'
+        else:
+            what = f"{scope.value} '{target}'" if target else scope.value
+        logger.warning(
+            f"Settings of {what} of '{environment}' could not be fetched: {error}"
+        )
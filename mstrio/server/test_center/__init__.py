@@ -1,24 +1,52 @@
 # flake8: noqa
+from typing import TYPE_CHECKING
 
-from .baseline import (
-    Baseline,
-    BaselineTest,
-    BaselineTestSettings,
-    ObjectBaseline,
-    ObjectBaselineStatus,
-    PromptAnswerSource,
-    list_baseline_results,
-    list_baseline_tests,
-)
-from .commons import TestExecutionStatus
-from .comparison import (
-    ComparisonMethod,
-    ComparisonTest,
-    ComparisonTestResult,
-    ComparisonTestSettings,
-    ObjectComparison,
-    ObjectComparisonStatus,
-    list_comparison_test_results,
-    list_comparison_tests,
+from mstrio.utils.lazy_loading import attach_lazy_exports
+
+if TYPE_CHECKING:
+    from .baseline import (
+        Baseline,
+        BaselineTest,
+        BaselineTestSettings,
+        ObjectBaseline,
+        ObjectBaselineStatus,
+        PromptAnswerSource,
+        list_baseline_results,
+        list_baseline_tests,
+    )
+    from .commons import TestExecutionStatus
+    from .comparison import (
+        ComparisonMethod,
+        ComparisonTest,
+        ComparisonTestResult,
+        ComparisonTestSettings,
+        ObjectComparison,
+        ObjectComparisonStatus,
+        list_comparison_test_results,
+        list_comparison_tests,
+    )
+    from .settings import TestCenterSettings
+
+__getattr__, __dir__ = attach_lazy_exports(
+    __name__,
+    {
+        'Baseline': '.baseline',
+        'BaselineTest': '.baseline',
+        'BaselineTestSettings': '.baseline',
+        'ObjectBaseline': '.baseline',
+        'ObjectBaselineStatus': '.baseline',
+        'PromptAnswerSource': '.baseline',
+        'list_baseline_results': '.baseline',
+        'list_baseline_tests': '.baseline',
+        'TestExecutionStatus': '.commons',
+        'ComparisonMethod': '.comparison',
+        'ComparisonTest': '.comparison',
+        'ComparisonTestResult': '.comparison',
+        'ComparisonTestSettings': '.comparison',
+        'ObjectComparison': '.comparison',
+        'ObjectComparisonStatus': '.comparison',
+        'list_comparison_test_results': '.comparison',
+        'list_comparison_tests': '.comparison',
+        'TestCenterSettings': '.settings',
+    },
 )
-from .settings import TestCenterSettings
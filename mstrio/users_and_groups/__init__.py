@@ -1,19 +1,58 @@
 # flake8: noqa
-from typing import TypeAlias, Union
+from typing import TYPE_CHECKING, TypeAlias, Union
 
-from .user import User, create_users_from_csv, list_users
-from .user_connections import UserConnections
-from .user_group import UserGroup, list_user_groups
+from mstrio.utils.lazy_loading import attach_lazy_exports
 
-# isort: split
+if TYPE_CHECKING:
+    from .user import User, create_users_from_csv, list_users
+    from .user_connections import UserConnections
+    from .user_group import UserGroup, list_user_groups
 
-# those import has to be below import of `User` to avoid circular imports
-from .contact import Contact, ContactAddress, ContactDeliveryType, list_contacts
-from .contact_group import (
-    ContactGroup,
-    ContactGroupMember,
-    ContactGroupMemberType,
-    list_contact_groups,
+    # isort: split
+
+    # those import has to be below import of `User` to avoid circular imports
+    from .contact import Contact, ContactAddress, ContactDeliveryType, list_contacts
+    from .contact_group import (
+        ContactGroup,
+        ContactGroupMember,
+        ContactGroupMemberType,
+        list_contact_groups,
+    )
+
+    UserOrGroup: TypeAlias = Union[str, User, UserGroup]
+
+_getattr, _dir = attach_lazy_exports(
+    __name__,
+    {
+        'User': '.user',
+        'create_users_from_csv': '.user',
+        'list_users': '.user',
+        'UserConnections': '.user_connections',
+        'UserGroup': '.user_group',
+        'list_user_groups': '.user_group',
+        'Contact': '.contact',
+        'ContactAddress': '.contact',
+        'ContactDeliveryType': '.contact',
+        'list_contacts': '.contact',
+        'ContactGroup': '.contact_group',
+        'ContactGroupMember': '.contact_group',
+        'ContactGroupMemberType': '.contact_group',
+        'list_contact_groups': '.contact_group',
+    },
 )
 
-UserOrGroup: TypeAlias = Union[str, User, UserGroup]
+
+def __getattr__(name: str):
+    # `UserOrGroup` needs both classes, so it is built on first access as well
+    global UserOrGroup, __all__
+    if name == 'UserOrGroup':
+        UserOrGroup = Union[str, _getattr('User'), _getattr('UserGroup')]
+        return UserOrGroup
+    if name == '__all__':
+        __all__ = [*_getattr(name), 'UserOrGroup']
+        return __all__
+    return _getattr(name)
+
+
+def __dir__() -> list[str]:
+    return sorted({*_dir(), 'UserOrGroup'})
@@ -28,6 +28,7 @@ from mstrio.utils.helper import (
     process_change_journal_comment,
     process_delete_change_journal_comment,
 )
+from mstrio.utils.records import Record, make_records
 from mstrio.utils.related_subscription_mixin import RelatedSubscriptionMixin
 from mstrio.utils.resolvers import (
     FolderPathType,
@@ -69,8 +70,9 @@ def list_users(
     abbreviation_begins: str | None = None,
     to_dictionary: bool = False,
     limit: int | None = None,
+    to_records: bool = False,
     **filters,
-) -> list["User"] | list[dict]:
+) -> list["User"] | list[dict] | list[Record]:
     """Get list of user objects or user dicts. Optionally filter the users by
     specifying 'name_begins', 'abbreviation_begins' or other filters.
 
@@ -90,6 +92,9 @@ def list_users(
             (False) returns User objects.
         limit (int, optional): limit the number of elements returned. If `None`
             (default), all objects are returned.
+        to_records (bool, optional): If True, returns compact read-only
+            records, which can be upgraded to User objects with
+            `to_entity()`. Takes precedence over `to_dictionary`.
         **filters: Available filter parameters: ['id', 'name', 'abbreviation',
             'description', 'type', 'subtype', 'date_created', 'date_modified',
             'version', 'acg', 'icon_path', 'owner', 'initials', 'enabled']
@@ -107,6 +112,7 @@ def list_users(
         abbreviation_begins=abbreviation_begins,
         to_dictionary=to_dictionary,
         limit=limit,
+        to_records=to_records,
         **filters,
     )
 
@@ -562,8 +568,9 @@ class User(Entity, TrusteeACLMixin, RelatedSubscriptionMixin, TenantMixin):
         abbreviation_begins: str | None = None,
         to_dictionary: bool = False,
         limit: int | None = None,
+        to_records: bool = False,
         **filters,
-    ) -> list["User"] | list[dict]:
+    ) -> list["User"] | list[dict] | list[Record]:
         validate_owner_key_in_filters(filters)
 
         if filters.get('initials') and to_dictionary:
@@ -582,6 +589,8 @@ class User(Entity, TrusteeACLMixin, RelatedSubscriptionMixin, TenantMixin):
             filters=filters,
         )
 
+        if to_records:
+            return make_records(objects, connection, cls)
         if to_dictionary:
             return objects
 
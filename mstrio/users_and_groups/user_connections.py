@@ -1,4 +1,5 @@
 import logging
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
 from mstrio import config
@@ -6,6 +7,7 @@ from mstrio.api import monitors
 from mstrio.connection import Connection
 from mstrio.server import Cluster
 from mstrio.utils import helper
+from mstrio.utils.sessions import FuturesSessionWithRenewal
 from mstrio.utils.version_helper import class_version_handler, meets_minimal_version
 
 if TYPE_CHECKING:
@@ -25,6 +27,8 @@ class UserConnections:
         user_connections: All active user connections on the environment
     """
 
+    _INDEXED_KEYS = ('username', 'node', 'project_id', 'application_type')
+
     def __init__(self, connection: Connection):
         """Initialize the `UserConnections` object.
 
@@ -34,11 +38,56 @@ class UserConnections:
         """
         self.connection = connection
         self.user_connections: list[dict[str, Any]] = []
+        self._index: dict[str, dict[Any, list[int]]] = {}
 
     def fetch(self) -> None:
         """Populate the `UserConnections` object by retrieving all active user
-        connections on the environment."""
+        connections on the environment. Connections of all nodes are fetched
+        concurrently and indexed by username, node, project and application
+        type, so they can be looked up with `get_connections()`."""
         self.user_connections = self.list_connections()
+        self._index = {key: defaultdict(list) for key in self._INDEXED_KEYS}
+        for position, user_connection in enumerate(self.user_connections):
+            for key in self._INDEXED_KEYS:
+                self._index[key][user_connection.get(key)].append(position)
+
+    def get_connections(
+        self,
+        username: str | list[str] | None = None,
+        node: str | list[str] | None = None,
+        project_id: str | list[str] | None = None,
+        application_type: str | list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Look up user connections stored in the `UserConnections` object
+        using indexes built by `fetch()`. Every parameter accepts a single
+        value or a list of values. Connections matching all provided
+        parameters are returned.
+
+        Args:
+            username (str | list[str], optional): Username(s) of the users
+            node (str | list[str], optional): Name(s) of the nodes
+            project_id (str | list[str], optional): ID(s) of the projects
+            application_type (str | list[str], optional): Application type(s)
+        """
+        if not self._index:
+            self.fetch()
+
+        positions = None
+        for key, values in (
+            ('username', username),
+            ('node', node),
+            ('project_id', project_id),
+            ('application_type', application_type),
+        ):
+            if values is None:
+                continue
+            values = values if isinstance(values, list) else [values]
+            matching = {pos for val in values for pos in self._index[key].get(val, [])}
+            positions = matching if positions is None else positions & matching
+
+        if positions is None:
+            return list(self.user_connections)
+        return [self.user_connections[pos] for pos in sorted(positions)]
 
     def filter_connections(self, **filters) -> list[dict[str, Any]] | None:
         """Filter the user connections stored in the `UserConnections` object
@@ -84,27 +133,60 @@ class UserConnections:
                 'config_level', 'application_type', 'last_action']
         """
         all_nodes = Cluster(self.connection).list_nodes(to_dictionary=True)
-        all_connections = []
         if nodes is None:
             nodes = [node['name'] for node in all_nodes if node['status'] == 'running']
         else:
             nodes = nodes if isinstance(nodes, list) else [nodes]
 
+        helper.validate_param_value(
+            'limit', limit, int, min_val=1, special_values=[None]
+        )
+        chunk_size = min(limit, 1000) if limit else 1000
         msg = 'Error fetching chunk of active user connections.'
-        for node in nodes:
-            all_connections.extend(
-                helper.fetch_objects_async(
-                    self.connection,
-                    monitors.get_user_connections,
-                    monitors.get_user_connections_async,
-                    dict_unpack_value="userConnections",
-                    limit=limit,
-                    chunk_size=1000,
-                    error_msg=msg,
-                    node_name=node,
-                    filters=filters,
+        all_connections = []
+        with FuturesSessionWithRenewal(
+            connection=self.connection, max_workers=helper.get_parallel_number(0)
+        ) as session:
+
+            def collect(response, node) -> None:
+                if not response.ok:
+                    helper.response_handler(response, msg, throw_error=False)
+                    return
+                node_connections = helper._prepare_objects(
+                    response.json(), filters, 'userConnections'
                 )
-            )
+                for user_connection in node_connections:
+                    user_connection.setdefault('node', node)
+                all_connections.extend(node_connections)
+
+            # first pages of all nodes are fetched at once, remaining pages are
+            # scheduled as soon as the total count of connections is known
+            first_pages = {
+                node: monitors.get_user_connections_async(
+                    session, node, offset=0, limit=chunk_size
+                )
+                for node in nodes
+            }
+            next_pages = []
+            for node, future in first_pages.items():
+                response = future.result()
+                collect(response, node)
+                if not response.ok:
+                    continue
+                total = helper.get_total_count_of_objects(response)
+                total = min(limit, total) if limit else total
+                next_pages.extend(
+                    (
+                        node,
+                        monitors.get_user_connections_async(
+                            session, node, offset=offset, limit=chunk_size
+                        ),
+                    )
+                    for offset in range(chunk_size, total, chunk_size)
+                )
+            for node, future in next_pages:
+                collect(future.result(), node)
+
         return all_connections
 
     def disconnect_users(
@@ -113,6 +195,7 @@ class UserConnections:
         users: list["User"] | list[str] | None = None,
         nodes: str | list[str] | None = None,
         force: bool = False,
+        max_workers: int | None = None,
         **filters,
     ) -> list[dict] | None:
         """Disconnect user connections by passing in users (objects) or
@@ -126,6 +209,10 @@ class UserConnections:
             nodes: Node (server) names on which users will be disconnected
             force: if True, no additional prompt will be shown before
                 disconnecting users
+            max_workers: if provided, every connection is disconnected with
+                a separate request and at most `max_workers` requests are sent
+                concurrently. Otherwise the bulk disconnect endpoint is used
+                if the I-Server supports it.
             **filters: Available filter parameters: ['id', 'parent_id',
                 'username', 'user_full_name', 'project_index', 'project_id',
                 'project_name', 'open_jobs_count', 'project_type',
@@ -160,32 +247,32 @@ class UserConnections:
 
         if connection_ids:
             # disconnect specific user connections without fetching connections
-            return self.__disconnect_by_connection_id(connection_ids)
+            return self.__disconnect_by_connection_id(connection_ids, max_workers)
 
         # get all user connections to filter locally
         all_connections = self.list_connections(nodes, **filters)
         if users:  # filter user connections by user objects
             users = users if isinstance(users, list) else [users]
-            usernames = []
+            usernames = set()
             for user in users:
                 if isinstance(user, User):
-                    usernames.append(user.username)
+                    usernames.add(user.username)
                 elif isinstance(user, str):
-                    usernames.append(user)
+                    usernames.add(user)
                 else:
                     helper.exception_handler(
                         "'user' param must be a list of User objects or usernames.",
                         exception_type=TypeError,
                     )
 
-            all_connections = list(
-                filter(lambda conn: conn['username'] in usernames, all_connections)
-            )
+            all_connections = [
+                conn for conn in all_connections if conn.get('username') in usernames
+            ]
 
         if all_connections:
             # extract connection ids and disconnect
             connection_ids = [conn['id'] for conn in all_connections]
-            return self.__disconnect_by_connection_id(connection_ids)
+            return self.__disconnect_by_connection_id(connection_ids, max_workers)
         elif config.verbose:
             logger.info('No active user connections.')
 
@@ -213,8 +300,62 @@ class UserConnections:
 
         return self.disconnect_users(force=force)
 
+    def disconnect_connections(
+        self, connection_ids: str | list[str], max_workers: int = 8
+    ) -> list[dict]:
+        """Disconnect user connections with given IDs. Every connection is
+        disconnected with a separate request and at most `max_workers`
+        requests are sent concurrently.
+
+        Args:
+            connection_ids: IDs of the connections to disconnect, e.g.
+                retrieved with `get_connections()` or `list_connections()`
+            max_workers: maximum number of concurrent requests
+
+        Returns:
+            List of dictionaries with `id`, `status` (HTTP status code) and
+            `message` (error message from the I-Server, if any) for every
+            connection.
+        """
+        helper.validate_param_value('max_workers', max_workers, int, min_val=1)
+        connection_ids = (
+            connection_ids if isinstance(connection_ids, list) else [connection_ids]
+        )
+        statuses: list[dict[str, str | int | None]] = []
+        with FuturesSessionWithRenewal(
+            connection=self.connection, max_workers=max_workers
+        ) as session:
+            futures = {
+                connection_id: monitors.delete_user_connection_async(
+                    session, connection_id
+                )
+                for connection_id in connection_ids
+            }
+            for connection_id, future in futures.items():
+                try:
+                    response = future.result()
+                except Exception as err:
+                    statuses.append(
+                        {'id': connection_id, 'status': 500, 'message': str(err)}
+                    )
+                    continue
+                message = None
+                if not response.ok:
+                    try:
+                        message = response.json().get('message')
+                    except ValueError:
+                        message = response.reason
+                statuses.append(
+                    {
+                        'id': connection_id,
+                        'status': response.status_code,
+                        'message': message,
+                    }
+                )
+        return self._prepare_disconnect_by_id_message(statuses=statuses)
+
     def __disconnect_by_connection_id(
-        self, connection_ids: str | list[str]
+        self, connection_ids: str | list[str], max_workers: int | None = None
     ) -> list[dict] | None:
         """It disconnects connections which ids are provided in
         'connection_ids'. It prints information about executed operations.
@@ -232,7 +373,7 @@ class UserConnections:
 
         # use monitors.delete_user_connections
         # or monitors.delete_user_connection depending on the server version
-        if meets_minimal_version(server_version, '11.3.1'):
+        if max_workers is None and meets_minimal_version(server_version, '11.3.1'):
             res = monitors.delete_user_connections(
                 connection=self.connection, ids=connection_ids
             )
@@ -248,13 +389,7 @@ class UserConnections:
                     response=res, msg=err_msg, throw_error=False
                 )
         else:
-            statuses: list[dict[str, str | int]] = []
-            for connection_id in connection_ids:
-                response = monitors.delete_user_connection(
-                    self.connection, connection_id, bulk=True
-                )
-                statuses.append({'id': connection_id, 'status': response.status_code})
-            return self._prepare_disconnect_by_id_message(statuses=statuses)
+            return self.disconnect_connections(connection_ids, max_workers or 8)
 
     @staticmethod
     def _prepare_disconnect_by_id_message(statuses: list[dict]) -> list[dict]:
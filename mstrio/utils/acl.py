@@ -3,8 +3,6 @@ from contextlib import suppress
 from enum import auto
 from typing import TYPE_CHECKING, Any, TypeVar
 
-import pandas as pd
-
 from mstrio import config
 from mstrio.connection import Connection
 from mstrio.helpers import (
@@ -21,6 +19,8 @@ from mstrio.utils.response_processors import objects as objects_processors
 from mstrio.utils.version_helper import is_server_min_version
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from mstrio.server import Project
     from mstrio.users_and_groups import UserOrGroup
 
@@ -159,7 +159,7 @@ class ACLMixin:
 
     def list_acl(
         self, to_dataframe: bool = False, to_dictionary: bool = False, **filters
-    ) -> pd.DataFrame | list[dict | ACE]:
+    ) -> 'pd.DataFrame | list[dict | ACE]':
         """Get Access Control List (ACL) for this object. Optionally filter
         ACLs by specifying filters.
 
@@ -176,6 +176,8 @@ class ACLMixin:
         """
         acl = filter_obj_list(self.acl, **filters)
         if to_dataframe:
+            import pandas as pd
+
             return pd.DataFrame(acl)
         elif to_dictionary:
             return [acl_obj.to_dict() for acl_obj in acl]
@@ -1,5 +1,6 @@
 from concurrent.futures import as_completed
 from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
 from json import dumps
 from typing import TYPE_CHECKING, Any
@@ -23,6 +24,13 @@ from mstrio.utils.sessions import FuturesSessionWithRenewal
 
 if TYPE_CHECKING:
     from mstrio.connection import Connection
+    from mstrio.modeling.changeset_session import ChangesetSession
+
+active_changeset_session: ContextVar['ChangesetSession | None'] = ContextVar(
+    'active_changeset_session', default=None
+)
+"""Changeset session in which modeling changes are currently made, if any.
+It is set by `ChangesetSession` for the code run inside it."""
 
 
 def unpack_information(func):
@@ -109,6 +117,20 @@ def unpack_records(response_json, field):
     return copy
 
 
+def in_changeset_session(
+    connection: 'Connection', project_id: str | None = None, schema_edit: bool = True
+) -> bool:
+    """Whether modeling writes with the given parameters are made in the
+    changeset of an active `ChangesetSession`, so that objects created by them
+    are not saved in the metadata until the session ends."""
+    session = active_changeset_session.get()
+    if session is None:
+        return False
+    return session._accepts(
+        connection, project_id or connection.project_id, schema_edit
+    )
+
+
 @contextmanager
 def changeset_manager(
     connection: 'Connection',
@@ -120,6 +142,17 @@ def changeset_manager(
     if project_id is None:
         connection._validate_project_selected()
         project_id = connection.project_id
+    session = active_changeset_session.get()
+    if session is not None and session._accepts(connection, project_id, schema_edit):
+        # changes are made in the changeset of the session, which is committed
+        # and deleted once for all of them when the session ends
+        if journal_comment is None:
+            journal_comment = extract_comment_from_body(body)
+        yield session.changeset_id
+        # only writes which succeeded are recorded, as a failed request makes
+        # no changes in the changeset
+        session._record_write(journal_comment)
+        return
     response = create_changeset(
         connection, schema_edit=schema_edit, project_id=project_id
     )
@@ -0,0 +1,275 @@
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import TYPE_CHECKING
+
+from tqdm.auto import tqdm
+
+from mstrio import config
+from mstrio.utils.helper import (
+    get_parallel_number,
+    get_total_count_of_objects,
+    response_handler,
+)
+from mstrio.utils.sessions import FuturesSessionWithRenewal
+
+if TYPE_CHECKING:
+    from requests import Response
+
+    from mstrio.connection import Connection
+
+logger = logging.getLogger(__name__)
+
+SourceKey = tuple[str, str | None, str, str]
+"""Key of a source of attribute elements: (base URL of the environment,
+project ID, ID of the cube or report, version of its data)."""
+
+# Function sending a request for one page of elements of an attribute,
+# taking the session, attribute ID, offset and limit.
+PageFetcher = Callable[[FuturesSessionWithRenewal, str, int, int], Future]
+
+
+class AttributeElementCache:
+    """Process-wide cache of elements of attributes of cubes and reports.
+
+    Elements are stored per source (cube or report), version of its data and
+    attribute, so they are loaded only once per version of a cube, even by
+    different objects of the same cube, e.g. created anew in every run of
+    a loop. Entries expire after `config.attribute_element_cache_ttl` seconds,
+    as set at the time they are read, so changes of warehouse data behind
+    a report are picked up even though the version of the report is the same.
+    Least recently used entries are evicted when the number of cached
+    attributes exceeds `max_entries`.
+
+    Elements are kept serialized and every `get()` returns new objects, so
+    changes made by the caller do not affect the cache.
+
+    Attributes:
+        max_entries (int): Maximum number of cached attributes.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        # (*source key, attribute ID) -> (time of caching, pickled elements)
+        self._entries: OrderedDict[tuple, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, source_key: SourceKey | None, attribute_id: str) -> list | None:
+        """Get a copy of cached elements of the attribute of the source, or
+        None if they are not cached or expired."""
+        if source_key is None:
+            return None
+        key = (*source_key, attribute_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored, elements = entry
+            ttl = config.attribute_element_cache_ttl
+            if ttl is not None and time.monotonic() - stored >= ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return pickle.loads(elements)
+
+    def put(
+        self, source_key: SourceKey | None, attribute_id: str, elements: list
+    ) -> None:
+        """Cache a copy of elements of the attribute of the source."""
+        ttl = config.attribute_element_cache_ttl
+        if (
+            source_key is None
+            or self.max_entries <= 0
+            or (ttl is not None and ttl <= 0)
+        ):
+            return
+        key = (*source_key, attribute_id)
+        entry = (time.monotonic(), pickle.dumps(elements, pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, source_id: str | None = None) -> None:
+        """Remove cached elements of a cube or report, or all cached elements
+        if `source_id` is not provided."""
+        with self._lock:
+            if source_id is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[2] == source_id]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+attribute_element_cache = AttributeElementCache()
+"""Cache of attribute elements shared by all cubes and reports."""
+
+
+def get_source_key(
+    connection: 'Connection', source_id: str, version: str | None
+) -> SourceKey | None:
+    """Build a key of a source of attribute elements. Returns None, which
+    disables caching, if the version of the source is unknown."""
+    if not version:
+        return None
+    return (connection.base_url, connection.project_id, source_id, version)
+
+
+def _attribute_data(attribute: dict, elements: list) -> dict:
+    return {
+        'attribute_name': attribute['name'],
+        'attribute_id': attribute['id'],
+        'elements': elements,
+    }
+
+
+def fetch_attribute_elements_async(
+    connection: 'Connection',
+    attributes: list[dict],
+    fetch_page: PageFetcher,
+    limit: int,
+    source_key: SourceKey | None = None,
+    progress_bar: bool = True,
+) -> list[dict]:
+    """Fetch all elements of many attributes concurrently.
+
+    First pages of all attributes are requested at once and, as soon as
+    the first page of an attribute returns its total number of elements,
+    requests for all its remaining pages are scheduled on the same pool.
+    Attributes already present in `attribute_element_cache` for `source_key`
+    are not fetched, and fetched ones are added to it.
+
+    Args:
+        connection (Connection): Strategy REST API connection object.
+        attributes (list[dict]): Attributes with `id` and `name` keys.
+        fetch_page (Callable): Function sending a request for one page of
+            elements, taking the session, attribute ID, offset and limit, and
+            returning a Future of the response.
+        limit (int): Number of elements per page.
+        source_key (SourceKey, optional): Key of the cube or report in
+            the cache. Caching is disabled if not provided.
+        progress_bar (bool, optional): Whether to display a progress bar, if
+            verbose mode is enabled in mstrio-py's `config`. Defaults to True.
+
+    Returns:
+        List of dicts with `attribute_name`, `attribute_id` and `elements` of
+        every attribute, in order of `attributes`.
+    """
+    elements = {
+        attribute['id']: attribute_element_cache.get(source_key, attribute['id'])
+        for attribute in attributes
+    }
+    missing = [
+        attribute for attribute in attributes if elements[attribute['id']] is None
+    ]
+
+    if missing:
+        pages: dict[str, dict[int, list]] = {attr['id']: {} for attr in missing}
+        # pages of all attributes share the pool, so it gets all threads
+        threads = get_parallel_number(0)
+        with (
+            FuturesSessionWithRenewal(
+                connection=connection, max_workers=threads
+            ) as session,
+            tqdm(
+                total=len(missing),
+                desc="Loading attribute elements",
+                leave=False,
+                disable=not progress_bar or not config.verbose,
+            ) as pbar,
+        ):
+            pending = {
+                fetch_page(session, attr['id'], 0, limit): (attr, 0) for attr in missing
+            }
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        attr, offset = pending.pop(future)
+                        response = future.result()
+                        if not response.ok:
+                            response_handler(
+                                response,
+                                f"Error getting attribute {attr['name']} elements",
+                            )
+                        pages[attr['id']][offset] = response.json()
+                        if offset == 0:
+                            total = get_total_count_of_objects(response)
+                            next_offsets = range(limit, total, limit)
+                            pending.update(
+                                {
+                                    fetch_page(session, attr['id'], _offset, limit): (
+                                        attr,
+                                        _offset,
+                                    )
+                                    for _offset in next_offsets
+                                }
+                            )
+                            pbar.total += len(next_offsets)
+                        pbar.update()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        for attr in missing:
+            attr_pages = pages[attr['id']]
+            elements[attr['id']] = [
+                element
+                for offset in sorted(attr_pages)
+                for element in attr_pages[offset]
+            ]
+            attribute_element_cache.put(source_key, attr['id'], elements[attr['id']])
+
+    return [_attribute_data(attr, elements[attr['id']]) for attr in attributes]
+
+
+def fetch_attribute_elements(
+    attribute: dict,
+    fetch_page: Callable[[str, int, int], 'Response'],
+    limit: int,
+    source_key: SourceKey | None = None,
+) -> dict:
+    """Fetch all elements of one attribute, page by page.
+
+    Elements present in `attribute_element_cache` for `source_key` are not
+    fetched, and fetched ones are added to it.
+
+    Args:
+        attribute (dict): Attribute with `id` and `name` keys.
+        fetch_page (Callable): Function sending a request for one page of
+            elements, taking the attribute ID, offset and limit, and returning
+            the response.
+        limit (int): Number of elements per page.
+        source_key (SourceKey, optional): Key of the cube or report in
+            the cache. Caching is disabled if not provided.
+
+    Returns:
+        Dict with `attribute_name`, `attribute_id` and `elements` of
+        the attribute.
+    """
+    elements = attribute_element_cache.get(source_key, attribute['id'])
+    if elements is None:
+        response = fetch_page(attribute['id'], 0, limit)
+        # Get total number of rows
+        total = get_total_count_of_objects(response)
+        # Get attribute elements from the response.
+        elements = response.json()
+
+        assert isinstance(limit, int) and limit > 0
+        assert isinstance(total, int) and total >= 0
+
+        # If total number of elements is bigger than the chunk size
+        # (limit), fetch them incrementally.
+        for _offset in range(limit, total, limit):
+            elements.extend(fetch_page(attribute['id'], _offset, limit).json())
+        attribute_element_cache.put(source_key, attribute['id'], elements)
+
+    return _attribute_data(attribute, elements)
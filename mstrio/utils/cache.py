@@ -1,8 +1,9 @@
 import logging
 from dataclasses import dataclass
-from enum import auto
+from enum import Enum, auto
 from typing import TYPE_CHECKING
 
+from pandas import DataFrame, Series, json_normalize
 from requests import Response
 
 from mstrio import config
@@ -10,8 +11,19 @@ from mstrio.api import monitors
 from mstrio.connection import Connection
 from mstrio.server import Cluster
 from mstrio.utils.enum_helper import AutoName, get_enum_val
-from mstrio.utils.helper import Dictable, camel_to_snake, validate_param_value
-from mstrio.utils.response_processors.monitors import get_contents_caches_loop
+from mstrio.utils.helper import (
+    Dictable,
+    camel_to_snake,
+    delete_none_values,
+    get_parallel_number,
+    response_handler,
+    validate_param_value,
+)
+from mstrio.utils.response_processors.monitors import (
+    get_contents_caches_concurrently,
+    get_contents_caches_loop,
+)
+from mstrio.utils.sessions import FuturesSessionWithRenewal
 
 if TYPE_CHECKING:
     from mstrio.project_objects import ContentCache
@@ -466,12 +478,9 @@ class ContentCacheMixin:
                 'db_login_id', 'owner', 'status', 'size', 'wh_tables',
                 'security_filter_id']
         """
-        cache_ids = [cache.id for cache in cls.list_caches(connection, **filters)]
-        if cache_ids:
-            cls.load_caches(
-                connection=connection,
-                cache_ids=cache_ids,
-            )
+        inventory, caches = cls._filter_cache_inventory(connection, **filters)
+        if not caches.empty:
+            inventory.load(caches)
         elif config.verbose:
             logger.info(NO_CACHE_LOG)
 
@@ -493,12 +502,9 @@ class ContentCacheMixin:
                 'db_login_id', 'owner', 'status', 'size', 'wh_tables',
                 'security_filter_id']
         """
-        cache_ids = [cache.id for cache in cls.list_caches(connection, **filters)]
-        if cache_ids:
-            cls.unload_caches(
-                connection=connection,
-                cache_ids=cache_ids,
-            )
+        inventory, caches = cls._filter_cache_inventory(connection, **filters)
+        if not caches.empty:
+            inventory.unload(caches)
         elif config.verbose:
             logger.info(NO_CACHE_LOG)
 
@@ -523,16 +529,373 @@ class ContentCacheMixin:
                 'db_login_id', 'owner', 'status', 'size', 'wh_tables',
                 'security_filter_id']
         """
-        cache_ids = [
-            cache.id
-            for cache in cls.list_caches(connection, **filters)
-            if cache.status.ready
-        ]
-        if cache_ids:
-            cls.delete_caches(
-                connection=connection,
-                cache_ids=cache_ids,
-                force=force,
-            )
+        inventory, caches = cls._filter_cache_inventory(connection, **filters)
+        if 'status_ready' in caches.columns:
+            caches = caches[caches['status_ready'].fillna(False).astype(bool)]
+        if not caches.empty:
+            inventory.delete(caches, force=bool(force))
         elif config.verbose:
             logger.info(NO_CACHE_LOG)
+
+    @classmethod
+    def _filter_cache_inventory(
+        cls,
+        connection: 'Connection',
+        status: str | None = 'ready',
+        project_id: str | None = None,
+        nodes: list[str] | str | None = None,
+        content_type: CacheSource.Type | str | None = None,
+        size: str | None = None,
+        owner: str | None = None,
+        **filters,
+    ) -> tuple['ContentCacheInventory', DataFrame]:
+        """Fetch inventory of caches of the class type and filter it with
+        parameters accepted by `list_caches`."""
+        unloaded = status == 'unloaded'
+        inventory = ContentCacheInventory(
+            connection,
+            project_ids=project_id,
+            nodes=nodes,
+            content_type=content_type or cls._CACHE_TYPE,
+            status='ready' if unloaded else status,
+            size=size,
+            owner=owner,
+        )
+        return inventory, inventory.filter(unloaded=unloaded, **filters)
+
+
+class ContentCacheInventory:
+    """Columnar inventory of content caches of many projects on many nodes.
+
+    Caches are paged from all (project, node) pairs concurrently. Filters
+    supported by the REST API (`status`, `content_type`, `content_format`,
+    `size`, `owner`, `expiration`, `last_updated`, `hit_count`) are applied on
+    the server side, the remaining ones (e.g. cache ID, database connection or
+    security filter) are applied with vectorised operations on the inventory
+    DataFrame. Bulk operations are sent in parallel batches per node.
+
+    Attributes:
+        connection: A Strategy connection object
+        project_nodes: Mapping of project IDs to names of nodes on which
+            caches are searched
+        caches: DataFrame with one row per cache. Nested properties are
+            flattened, e.g. `status_loaded` or `source_type`.
+    """
+
+    def __init__(
+        self,
+        connection: 'Connection',
+        project_ids: str | list[str] | None = None,
+        nodes: str | list[str] | None = None,
+        content_type: CacheSource.Type | str | None = None,
+        status: str | None = 'ready',
+        content_format: str | None = None,
+        size: str | None = None,
+        owner: str | None = None,
+        expiration: str | None = None,
+        last_updated: str | None = None,
+        hit_count: str | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Initialize the inventory and fetch content caches.
+
+        Args:
+            connection (Connection): Strategy connection object returned by
+                `connection.Connection()`.
+            project_ids (str | list[str], optional): IDs of projects of which
+                caches will be fetched. Defaults to the project selected in
+                the connection.
+            nodes (str | list[str], optional): Names of nodes on which caches
+                will be searched. By default, all nodes of every project are
+                loaded from the cluster.
+            content_type (str | CacheSource.Type, optional): When provided,
+                only caches of given type will be fetched.
+            status (str, optional): When provided, only caches with given
+                status will be fetched. Default value `ready`.
+            content_format (str, optional): Format of the content cache.
+            size (str, optional): Size condition for the content cache (in KB).
+            owner (str, optional): Exact match on the owner's full name.
+            expiration (str, optional): Expiration time condition.
+            last_updated (str, optional): Last update time condition.
+            hit_count (str, optional): Hit count condition.
+            max_workers (int, optional): Maximum number of concurrent requests.
+        """
+        project_ids = project_ids or connection.project_id
+        if isinstance(project_ids, str):
+            project_ids = [project_ids]
+        if isinstance(nodes, str):
+            nodes = [nodes]
+        self.connection = connection
+        self.project_nodes = {
+            project_id: nodes or ContentCacheMixin.fetch_nodes(connection, project_id)
+            for project_id in project_ids
+        }
+        self._max_workers = max_workers
+        self._server_filters = {
+            'content_type': get_enum_val(content_type, CacheSource.Type),
+            'status': status,
+            'content_format': content_format,
+            'size': size,
+            'owner': owner,
+            'expiration': expiration,
+            'last_updated': last_updated,
+            'hit_count': hit_count,
+        }
+        self._records: list[dict] = []
+        self._caches = DataFrame()
+        self.refresh()
+
+    def __repr__(self) -> str:
+        return (
+            f"ContentCacheInventory(connection, projects={len(self.project_nodes)}, "
+            f"caches={len(self._caches)})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._caches)
+
+    @property
+    def caches(self) -> DataFrame:
+        return self._caches
+
+    def refresh(self) -> None:
+        """Fetch content caches again from all projects and nodes."""
+        self._records = get_contents_caches_concurrently(
+            self.connection,
+            self.project_nodes,
+            max_workers=self._max_workers,
+            **delete_none_values(self._server_filters, recursion=False),
+        )
+        self._caches = (
+            json_normalize(camel_to_snake(self._records), sep='_', max_level=1)
+            if self._records
+            else DataFrame(columns=['id', 'combined_id', 'project_id', 'node'])
+        )
+
+    def filter(
+        self,
+        id: str | list[str] | None = None,
+        db_connection_id: str | None = None,
+        db_login_id: str | None = None,
+        security_filter_id: str | None = None,
+        wh_tables: str | list[str] | None = None,
+        unloaded: bool = False,
+        limit: int | None = None,
+        **filters,
+    ) -> DataFrame:
+        """Filter the inventory with vectorised conditions.
+
+        Args:
+            id (str | list[str], optional): ID or IDs of caches to keep.
+            db_connection_id (str, optional): Keep only caches for the database
+                connection with given ID.
+            db_login_id (str, optional): Keep only caches for the database
+                login with given ID.
+            security_filter_id (str, optional): Keep only caches using given
+                security filter.
+            wh_tables (str | list[str], optional): Keep only caches using any
+                of given warehouse tables.
+            unloaded (bool, optional): If True, keep only unloaded caches.
+            limit (int, optional): Cut-off value for the number of rows.
+            **filters: Exact match conditions on any other column of the
+                inventory, e.g. `source_type` or `node`.
+
+        Returns:
+            DataFrame with caches meeting all the conditions.
+        """
+        validate_param_value('limit', limit, int, min_val=1, special_values=[None])
+        caches = self._caches
+        if caches.empty:
+            return caches
+
+        mask = Series(True, index=caches.index)
+        if id:
+            mask &= caches['id'].isin(id if isinstance(id, list) else [id])
+        for column, value in (
+            ('database_connection_id', db_connection_id),
+            ('database_login_id', db_login_id),
+            ('security_filter_id', security_filter_id),
+            *filters.items(),
+        ):
+            if value is None:
+                continue
+            if column not in caches.columns:
+                mask &= False
+                continue
+            mask &= caches[column] == (
+                value.value if isinstance(value, Enum) else value
+            )
+        if wh_tables:
+            wh_tables = set([wh_tables] if isinstance(wh_tables, str) else wh_tables)
+            used = caches.get('warehouse_tables_used', Series(index=caches.index))
+            mask &= used.map(
+                lambda tables: isinstance(tables, list)
+                and bool(wh_tables & set(tables))
+            )
+        if unloaded and 'status_loaded' in caches.columns:
+            mask &= ~caches['status_loaded'].fillna(False).astype(bool)
+
+        result = caches[mask]
+        return result.head(limit) if limit else result
+
+    def to_caches(self, caches: DataFrame | None = None) -> list['ContentCache']:
+        """Convert rows of the inventory into ContentCache objects.
+
+        Args:
+            caches (DataFrame, optional): Subset of the inventory, e.g. result
+                of `filter()`. If not provided, all caches are converted.
+        """
+        from mstrio.project_objects import ContentCache
+
+        caches = self._caches if caches is None else caches
+        return ContentCache.from_dict(
+            self.connection, [self._records[i] for i in caches.index]
+        )
+
+    def load(
+        self, caches: DataFrame | None = None, batch_size: int = 100
+    ) -> list[Response]:
+        """Load caches in parallel batches.
+
+        Args:
+            caches (DataFrame, optional): Subset of the inventory, e.g. result
+                of `filter()`. If not provided, all caches are loaded.
+            batch_size (int, optional): Number of caches altered with a single
+                request. Defaults to 100.
+
+        Returns:
+            List of Response objects, one per batch.
+        """
+        return self._alter_status(caches, 'replace', True, 'loaded', batch_size)[0]
+
+    def unload(
+        self, caches: DataFrame | None = None, batch_size: int = 100
+    ) -> list[Response]:
+        """Unload caches in parallel batches.
+
+        Args:
+            caches (DataFrame, optional): Subset of the inventory, e.g. result
+                of `filter()`. If not provided, all caches are unloaded.
+            batch_size (int, optional): Number of caches altered with a single
+                request. Defaults to 100.
+
+        Returns:
+            List of Response objects, one per batch.
+        """
+        return self._alter_status(caches, 'replace', False, 'loaded', batch_size)[0]
+
+    def invalidate(
+        self, caches: DataFrame | None = None, batch_size: int = 100
+    ) -> list[Response]:
+        """Invalidate caches in parallel batches.
+
+        Args:
+            caches (DataFrame, optional): Subset of the inventory, e.g. result
+                of `filter()`. If not provided, all caches are invalidated.
+            batch_size (int, optional): Number of caches altered with a single
+                request. Defaults to 100.
+
+        Returns:
+            List of Response objects, one per batch.
+        """
+        return self._alter_status(caches, 'replace', True, 'invalid', batch_size)[0]
+
+    def delete(
+        self,
+        caches: DataFrame | None = None,
+        force: bool = False,
+        batch_size: int = 100,
+    ) -> list[Response]:
+        """Delete caches in parallel batches. Successfully deleted caches are
+        removed from the inventory.
+
+        Args:
+            caches (DataFrame, optional): Subset of the inventory, e.g. result
+                of `filter()`. If not provided, all caches are deleted.
+            force (bool, optional): If True, then no additional prompt will be
+                shown before deleting caches.
+            batch_size (int, optional): Number of caches deleted with a single
+                request. Defaults to 100.
+
+        Returns:
+            List of Response objects, one per batch.
+        """
+        caches = self._caches if caches is None else caches
+        if not force:
+            user_input = (
+                input(
+                    f'Are you sure you want to delete {len(caches)} content '
+                    'cache(s)? [Y/N]: '
+                )
+                or 'N'
+            )
+            if user_input != 'Y':
+                return []
+        responses, deleted = self._alter_status(
+            caches, 'remove', None, None, batch_size
+        )
+        self._caches = self._caches.drop(index=deleted, errors='ignore')
+        return responses
+
+    def _alter_status(
+        self,
+        caches: DataFrame | None,
+        op: str,
+        value: bool | None,
+        status: str | None,
+        batch_size: int,
+    ) -> tuple[list[Response], list]:
+        """Send batches of operations and return responses together with
+        inventory index labels of caches which were altered successfully."""
+        validate_param_value('batch_size', batch_size, int, min_val=1)
+        caches = self._caches if caches is None else caches
+        if caches.empty:
+            if config.verbose:
+                logger.info(NO_CACHE_LOG)
+            return [], []
+
+        batches = []
+        for node, node_caches in caches.groupby('node'):
+            for start in range(0, len(node_caches), batch_size):
+                batch = node_caches.iloc[start : start + batch_size]
+                operations = [
+                    {
+                        'op': op,
+                        'path': (
+                            f'/contentCaches/{combined_id}/status/{status}'
+                            if status
+                            else f'/contentCaches/{combined_id}'
+                        ),
+                        'value': value,
+                    }
+                    for combined_id in batch['combined_id']
+                ]
+                batches.append((node, batch.index, {'operationList': operations}))
+
+        with FuturesSessionWithRenewal(
+            connection=self.connection,
+            max_workers=self._max_workers or get_parallel_number(len(batches)),
+        ) as session:
+            futures = [
+                monitors.update_contents_caches_async(session, node, body)
+                for node, _, body in batches
+            ]
+            responses = [future.result() for future in futures]
+
+        succeeded = []
+        for (_, index, _), response in zip(batches, responses):
+            if response.ok:
+                succeeded.extend(index)
+            else:
+                response_handler(
+                    response, 'Error updating content caches.', throw_error=False
+                )
+        failed = len(caches) - len(succeeded)
+        if failed:
+            logger.warning(
+                f"{len(succeeded)} content cache(s) processed successfully, "
+                f"{failed} failed."
+            )
+        elif config.verbose:
+            logger.info(f"{len(succeeded)} content cache(s) processed successfully.")
+        return responses, succeeded
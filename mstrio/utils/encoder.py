@@ -1,9 +1,10 @@
 import contextlib
 import datetime as dt
 from base64 import b64decode, b64encode
+from typing import TYPE_CHECKING
 
-from pandas import DataFrame, Series
-from pandas.api.types import is_datetime64_any_dtype
+if TYPE_CHECKING:
+    from pandas import DataFrame, Series
 
 
 class Encoder:
@@ -119,7 +120,7 @@ class PandasDataframeEncoder:
             data sets, "multi".
     """
 
-    def __init__(self, data_frame: DataFrame, dataset_type: str):
+    def __init__(self, data_frame: 'DataFrame', dataset_type: str):
         """Inits Encoder with given data_frame and type.
 
         Args:
@@ -127,7 +128,7 @@ class PandasDataframeEncoder:
             dataset_type (str): Dataset type. One of `single` or `multi` to
                 correspond with single-table or multi-table sources.
         """
-        self.data_frame: DataFrame = data_frame
+        self.data_frame: 'DataFrame' = data_frame
         self._b64_data: str | None = None
         self.orientation: str | None = None
         # Mapping used when converting DataFrame rows
@@ -142,7 +143,10 @@ class PandasDataframeEncoder:
         self.orientation = _table_type_orient_map[dataset_type]
 
     @staticmethod
-    def _wrangle_date(x: Series) -> Series:
+    def _wrangle_date(x: 'Series') -> 'Series':
+        # pandas is imported here to keep `import mstrio.connection` light
+        from pandas.api.types import is_datetime64_any_dtype
+
         if is_datetime64_any_dtype(x):
             return x
         if isinstance(x.iloc[0], dt.date):
@@ -10,7 +10,6 @@ from sys import version_info
 from typing import TYPE_CHECKING, Any, TypeVar
 
 import humps
-from pandas import DataFrame
 
 from mstrio import config
 from mstrio.api import objects
@@ -31,6 +30,7 @@ from mstrio.utils.resolvers import (
     FolderPathType,
     get_folder_id_from_params_set,
     get_project_id_from_params_set,
+    invalidate_resolution_cache,
 )
 from mstrio.utils.response_processors import objects as objects_processors
 from mstrio.utils.time_helper import (
@@ -42,6 +42,8 @@ from mstrio.utils.translation_mixin import TranslationMixin
 from mstrio.utils.version_helper import class_version_handler, method_version_handler
 
 if TYPE_CHECKING:
+    from pandas import DataFrame
+
     from mstrio.modeling import Prompt
     from mstrio.object_management import Folder, Shortcut
     from mstrio.server import ChangeJournalEntry, Project
@@ -667,12 +669,14 @@ class EntityBase(helper.Dictable):
             for key in sorted(attributes, key=helper.key_fn_for_sort_object_properties)
         }
 
-    def to_dataframe(self) -> DataFrame:
+    def to_dataframe(self) -> 'DataFrame':
         """Converts all properties of the object to a dataframe.
 
         Returns:
             DataFrame: A `DataFrame` object containing object properties.
         """
+        from pandas import DataFrame
+
         return DataFrame.from_dict(
             self.list_properties(), orient='index', columns=['value']
         )
@@ -1031,6 +1035,9 @@ class EntityBase(helper.Dictable):
             return None
 
         changed = self._send_proper_patch_request(properties)
+        if {'name', 'username'} & properties.keys():
+            # the object may no longer be found by its old name
+            invalidate_resolution_cache(self.connection, object_id=self.id)
 
         if config.verbose and all(changed):
             msg = (
@@ -1180,10 +1187,13 @@ class EntityBase(helper.Dictable):
         if hasattr(self, "_fetched_attributes") and hasattr(self, "_find_func"):
             _name = name[1:] if name.startswith("_") else name
             was_fetched = _name in self._fetched_attributes
+            # FYI: cheap checks go first, as this runs on every attribute access
             can_fetch = (
-                self._find_func(_name) is not None and "id" in self._fetched_attributes
+                not was_fetched
+                and "id" in self._fetched_attributes
+                and self._find_func(_name) is not None
             )
-            if can_fetch and not was_fetched:
+            if can_fetch:
                 self.fetch(_name)  # fetch the relevant object data
             val = super().__getattribute__(name)
 
@@ -1655,6 +1665,8 @@ class DeleteMixin:
             )
             logger.info(msg)
 
+        if response.ok:
+            invalidate_resolution_cache(self.connection, object_id=self._id)
         return response.ok
 
 
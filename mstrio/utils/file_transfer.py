@@ -0,0 +1,391 @@
+import io
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from hashlib import sha256
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+from mstrio import config
+from mstrio.utils.progress_bar_mixin import ProgressBarMixin
+
+if TYPE_CHECKING:
+    from requests import Response
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+"""Default size (in bytes) of chunks read from and written to files."""
+
+FileSource = str | os.PathLike | bytes | IO[bytes]
+
+
+def _show_progress() -> bool:
+    return config.verbose and config.progress_bar
+
+
+class PreparedFile:
+    """Binary file source with known size and SHA-256 hash, read in chunks.
+
+    Files given by path and seekable file-like objects are read from their
+    current position, while other streams are spooled to a temporary file, so
+    the whole content is never held in memory (unless `bytes` are given
+    directly). The hash and size are computed in a single pass over the
+    content before it is sent.
+
+    Attributes:
+        name (str): Name of the file, if it can be determined.
+        size (int): Size of the content in bytes.
+        sha256 (str): Hex digest of SHA-256 hash of the content.
+    """
+
+    def __init__(self, source: FileSource, chunk_size: int = CHUNK_SIZE) -> None:
+        """Initialize the file source and compute its size and hash.
+
+        Args:
+            source (str | PathLike | bytes | file-like): Path to the file,
+                its content or a binary file-like object.
+            chunk_size (int, optional): Size of chunks in bytes. Defaults to
+                1 MiB.
+        """
+        self.chunk_size = chunk_size
+        self._owns_file = False
+        self.name = None
+
+        if isinstance(source, (str, os.PathLike)):
+            self.name = Path(source).name
+            self._file = open(source, mode='rb')  # noqa: SIM115
+            self._owns_file = True
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            self._file = io.BytesIO(source)
+            self._owns_file = True
+        else:
+            self.name = Path(getattr(source, 'name', '') or '').name or None
+            self._file = source
+
+        if self._is_seekable(self._file):
+            self._start = self._file.tell()
+            digest, self.size = self._hash(self._file)
+            self._file.seek(self._start)
+        else:
+            digest, self.size = self._spool()
+        self.sha256 = digest.hexdigest()
+
+    @staticmethod
+    def _is_seekable(file: IO[bytes]) -> bool:
+        try:
+            return file.seekable()
+        except (AttributeError, ValueError):
+            return False
+
+    def _hash(self, file: IO[bytes], spool: IO[bytes] | None = None):
+        digest, size = sha256(), 0
+        while chunk := file.read(self.chunk_size):
+            digest.update(chunk)
+            size += len(chunk)
+            if spool is not None:
+                spool.write(chunk)
+        return digest, size
+
+    def _spool(self):
+        # non-seekable stream can be read only once, so it is copied to
+        # a temporary file while being hashed
+        spool = tempfile.SpooledTemporaryFile(max_size=self.chunk_size)
+        digest, size = self._hash(self._file, spool)
+        spool.seek(0)
+        self._file, self._start, self._owns_file = spool, 0, True
+        return digest, size
+
+    def rewind(self) -> None:
+        """Move back to the beginning of the content, e.g. to retry
+        a transfer."""
+        self._file.seek(self._start)
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Iterate over the content in chunks of `chunk_size` bytes."""
+        while chunk := self._file.read(self.chunk_size):
+            yield chunk
+
+    def close(self) -> None:
+        """Close the underlying file if it was opened by this object."""
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> 'PreparedFile':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class MultipartFileStream(ProgressBarMixin):
+    """Request body with a single file in `multipart/form-data` encoding,
+    streamed in chunks.
+
+    It can be passed as `data` to `requests`, which sends it with
+    `Content-Length` header, reading it chunk by chunk. Progress of sending is
+    displayed with a progress bar if enabled in mstrio-py's `config`.
+    """
+
+    def __init__(
+        self,
+        file: PreparedFile,
+        field_name: str = 'file',
+        filename: str | None = None,
+        content_type: str = 'application/octet-stream',
+        description: str = 'Uploading',
+    ) -> None:
+        """Initialize the request body.
+
+        Args:
+            file (PreparedFile): Content of the file.
+            field_name (str, optional): Name of the form field. Defaults to
+                'file'.
+            filename (str, optional): Name of the file sent in the form.
+                Defaults to the name of `file` or to `field_name`.
+            content_type (str, optional): MIME type of the file. Defaults to
+                'application/octet-stream'.
+            description (str, optional): Description of the progress bar.
+        """
+        self._file = file
+        self._boundary = uuid.uuid4().hex
+        filename = filename or file.name or field_name
+        self._head = (
+            f'--{self._boundary}\r\n'
+            f'Content-Disposition: form-data; name="{field_name}"; '
+            f'filename="{filename}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'
+        ).encode('utf-8')
+        self._tail = f'\r\n--{self._boundary}--\r\n'.encode()
+        self._description = description
+        self._chunk, self._offset = b'', 0
+        self._parts: Iterator[bytes] | None = None
+
+    @property
+    def content_type(self) -> str:
+        """Value of `Content-Type` header for the request."""
+        return f'multipart/form-data; boundary={self._boundary}'
+
+    def __len__(self) -> int:
+        return len(self._head) + self._file.size + len(self._tail)
+
+    def _iter_parts(self) -> Iterator[bytes]:
+        # every pass starts from the beginning, so the request can be resent
+        self._file.rewind()
+        if _show_progress():
+            self._display_progress_bar(
+                desc=self._description,
+                total=self._file.size,
+                unit='B',
+                unit_scale=True,
+                unit_divisor=1024,
+            )
+        try:
+            yield self._head
+            for chunk in self._file.iter_chunks():
+                self._update_progress_bar_if_needed(update_increment=len(chunk))
+                yield chunk
+            yield self._tail
+        finally:
+            if self._progress_bar is not None:
+                self._close_progress_bar()
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._iter_parts()
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to `size` bytes of the body (all remaining if negative)."""
+        if self._parts is None:
+            self._parts = self._iter_parts()
+        pieces, missing = [], size
+        while size < 0 or missing > 0:
+            if self._offset >= len(self._chunk):
+                self._chunk, self._offset = next(self._parts, b''), 0
+                if not self._chunk:
+                    break
+            end = len(self._chunk) if size < 0 else self._offset + missing
+            piece = self._chunk[self._offset : end]
+            self._offset += len(piece)
+            missing -= len(piece)
+            pieces.append(piece)
+        data = b''.join(pieces)
+        if not data:
+            # body was read to the end, so the next read starts a new pass,
+            # e.g. when the request is resent
+            self._parts = None
+        return data
+
+
+class StreamedDownload(ProgressBarMixin):
+    """Download of a binary response body to a file, in chunks.
+
+    Content is written to a `.part` file next to the target path, which is
+    renamed once the download is complete. If a `.part` file is left by an
+    interrupted download, the transfer is resumed with HTTP `Range` request,
+    if the server supports it; otherwise it starts over.
+
+    Attributes:
+        path (Path): Path of the downloaded file.
+        size (int): Size of the downloaded file in bytes.
+        sha256 (str): Hex digest of SHA-256 hash of the downloaded file.
+    """
+
+    def __init__(
+        self,
+        get_response: Callable[[int], 'Response'],
+        path: str | os.PathLike | None = None,
+        directory: str | os.PathLike | None = None,
+        chunk_size: int = CHUNK_SIZE,
+        resume: bool = True,
+        description: str = 'Downloading',
+        progress_bar: bool = True,
+        iter_content: Callable[['Response'], Iterable[bytes]] | None = None,
+    ) -> None:
+        """Initialize the download.
+
+        Args:
+            get_response (Callable): Function sending the request with
+                `stream=True`; it gets the offset (in bytes) from which the
+                content should be returned and returns the response.
+            path (str | PathLike, optional): Path where the file is saved.
+                If not provided, the name of the file is taken from
+                `Content-Disposition` header of the response and the file is
+                saved in `directory`.
+            directory (str | PathLike, optional): Directory where the file is
+                saved when `path` is not provided. Defaults to the current
+                working directory.
+            chunk_size (int, optional): Size of chunks in bytes. Defaults to
+                1 MiB.
+            resume (bool, optional): Whether to resume an interrupted download
+                of the same file. Defaults to True.
+            description (str, optional): Description of the progress bar.
+            progress_bar (bool, optional): Whether to display a progress bar,
+                if enabled in mstrio-py's `config`. Defaults to True.
+            iter_content (Callable, optional): Function returning chunks of
+                the file from the response, e.g. decoding an encoded body.
+                By default the body is written as it is. If provided, the
+                size of the file is not checked against response headers.
+        """
+        self._get_response = get_response
+        self._iter_content = iter_content
+        self._directory = Path(directory or os.getcwd())
+        self.path = Path(path) if path else None
+        self.chunk_size = chunk_size
+        self.resume = resume
+        self._description = description
+        self._show_progress_bar = progress_bar
+        self.size = 0
+        self.sha256 = None
+
+    @staticmethod
+    def _filename_from_response(response: 'Response') -> str | None:
+        disposition = response.headers.get('Content-Disposition', '')
+        if 'filename=' not in disposition:
+            return None
+        return disposition.split('filename=')[1].split(';')[0].strip().strip('"')
+
+    @staticmethod
+    def _is_encoded(response: 'Response') -> bool:
+        # sizes and ranges in headers of an encoded (e.g. gzip) response refer
+        # to the encoded bytes, while content is written after decoding
+        return response.headers.get('Content-Encoding', 'identity') != 'identity'
+
+    @classmethod
+    def _total_size(cls, response: 'Response', offset: int) -> int | None:
+        if cls._is_encoded(response):
+            return None
+        content_range = response.headers.get('Content-Range', '')
+        if '/' in content_range and not content_range.endswith('*'):
+            return int(content_range.rsplit('/', 1)[1])
+        if length := response.headers.get('Content-Length'):
+            return offset + int(length)
+        return None
+
+    def _part_path(self) -> Path:
+        return self.path.with_name(self.path.name + '.part')
+
+    def run(self) -> Path:
+        """Download the file.
+
+        Returns:
+            Path of the downloaded file.
+        """
+        offset = 0
+        if self.path and self.resume and self._part_path().exists():
+            offset = self._part_path().stat().st_size
+
+        response = self._get_response(offset)
+        try:
+            if self.path is None:
+                name = self._filename_from_response(response) or 'download.bin'
+                self.path = self._directory / name
+                if self.resume and offset == 0 and self._part_path().exists():
+                    # name became known only now, so the request is resent
+                    response.close()
+                    offset = self._part_path().stat().st_size
+                    response = self._get_response(offset)
+
+            if offset and (response.status_code != 206 or self._is_encoded(response)):
+                logger.debug(
+                    "Server did not accept the range request, download of "
+                    f"'{self.path}' starts over."
+                )
+                if response.status_code == 206:
+                    response.close()
+                    response = self._get_response(0)
+                offset = 0
+
+            self._write(response, offset)
+        finally:
+            response.close()
+        return self.path
+
+    def _write(self, response: 'Response', offset: int) -> None:
+        part_path = self._part_path()
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+        digest = sha256()
+
+        if offset:
+            # hash of the already downloaded part is needed for the whole file
+            with open(part_path, 'rb') as part:
+                while chunk := part.read(self.chunk_size):
+                    digest.update(chunk)
+
+        if self._iter_content is None:
+            total = self._total_size(response, offset)
+            chunks = response.iter_content(chunk_size=self.chunk_size)
+        else:
+            total, chunks = None, self._iter_content(response)
+        if self._show_progress_bar and _show_progress():
+            self._display_progress_bar(
+                desc=self._description,
+                total=total,
+                initial=offset,
+                unit='B',
+                unit_scale=True,
+                unit_divisor=1024,
+            )
+        try:
+            with open(part_path, 'r+b' if offset else 'wb') as file:
+                file.seek(offset)
+                file.truncate()
+                for chunk in chunks:
+                    file.write(chunk)
+                    digest.update(chunk)
+                    self._update_progress_bar_if_needed(update_increment=len(chunk))
+                size = file.tell()
+        finally:
+            if self._progress_bar is not None:
+                self._close_progress_bar()
+
+        if total is not None and size != total:
+            raise OSError(
+                f"Download of '{self.path}' is incomplete: {size} of {total} bytes "
+                "received. Run it again to resume."
+            )
+
+        shutil.move(part_path, self.path)
+        self.size, self.sha256 = size, digest.hexdigest()
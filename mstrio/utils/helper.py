@@ -1,18 +1,20 @@
+import gzip
 import inspect
+import json
 import logging
 import math
 import os
 import re
 import time
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from copy import deepcopy
 from datetime import datetime
 from enum import Enum
-from functools import reduce, wraps
+from functools import cache, lru_cache, reduce, wraps
 from json.decoder import JSONDecodeError
+from pathlib import Path
 from pprint import pformat
-from time import sleep
 from typing import TYPE_CHECKING, Any, TypeVar
 
 import humps
@@ -28,6 +30,7 @@ from mstrio.helpers import (
 from mstrio.types import ObjectSubTypes
 from mstrio.utils.dict_filter import filter_list_of_dicts
 from mstrio.utils.enum_helper import get_enum_val
+from mstrio.utils.poller import get_status_poller
 from mstrio.utils.sessions import FuturesSessionWithRenewal
 from mstrio.utils.time_helper import (
     DatetimeFormats,
@@ -36,6 +39,10 @@ from mstrio.utils.time_helper import (
 )
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from pandas import DataFrame
+
     from mstrio.connection import Connection
     from mstrio.modeling.expression import Expression
     from mstrio.object_management import SearchPattern  # noqa: F401
@@ -143,6 +150,18 @@ def normalize_enum_list(
     return [get_enum_val(value, enum_type) for value in value_list]
 
 
+# the same keys are converted over and over again for every object of a type,
+# so results of conversions are cached
+@lru_cache(maxsize=8192)
+def _decamelize_key(key: str) -> str:
+    return humps.decamelize(key)
+
+
+@lru_cache(maxsize=8192)
+def _camelize_key(key: str) -> str:
+    return humps.camelize(key)
+
+
 def camel_to_snake(
     response: dict | list,
     whitelist: list[str] = None,
@@ -154,7 +173,7 @@ def camel_to_snake(
 
     def convert_dict(source):
         return {
-            humps.decamelize(key): (
+            _decamelize_key(key): (
                 value
                 if not isinstance(value, dict) or key in whitelist
                 else convert_dict(value)
@@ -180,7 +199,7 @@ def snake_to_camel(
 
     def convert_dict(source):
         return {
-            humps.camelize(key): (
+            _camelize_key(key): (
                 value
                 if not isinstance(value, dict) or key in whitelist
                 else convert_dict(value)
@@ -422,6 +441,36 @@ def fallback_on_timeout(min_limit: int = 50):
     return decorate
 
 
+def write_json_atomic(
+    path: str | os.PathLike, data: Any, compress: bool = False, **kwargs
+) -> Path:
+    """Save data as JSON to a file, replacing the file atomically. The data is
+    written to a `.tmp` file next to it first, so an interrupted save never
+    leaves a corrupted file behind.
+
+    Args:
+        path (str | PathLike): Path of the file.
+        data (Any): Data serializable to JSON.
+        compress (bool, optional): Whether to compress the file with gzip.
+            Defaults to False.
+        **kwargs: Keyword arguments passed to `json.dump`, e.g. `indent`.
+
+    Returns:
+        Path of the saved file.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f'{path.name}.tmp')
+    opener = gzip.open if compress else open
+    try:
+        with opener(tmp_path, 'wt', encoding='utf-8') as file:
+            json.dump(data, file, **kwargs)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return path
+
+
 def get_parallel_number(total_chunks):
     """Returns the optimal number of threads to be used for downloading
     cubes/reports in parallel."""
@@ -587,15 +636,17 @@ def fetch_objects_async(
                 for offset in range(current_count, total_objects, chunk_size)
             ]
 
-        for f in futures:
-            response = f.result()
-            if not response.ok:
-                response_handler(response, error_msg, throw_error=False)
-                continue
-            objects = _prepare_objects(
-                response.json(), filters, dict_unpack_value, project_id
-            )
-            all_objects.extend(objects)
+            # results are collected before the session is closed, as closing
+            # it cancels requests which did not start yet
+            for f in futures:
+                response = f.result()
+                if not response.ok:
+                    response_handler(response, error_msg, throw_error=False)
+                    continue
+                objects = _prepare_objects(
+                    response.json(), filters, dict_unpack_value, project_id
+                )
+                all_objects.extend(objects)
     return all_objects
 
 
@@ -1039,6 +1090,28 @@ def get_temp_connection(
     return temp_conn
 
 
+_TO_DICT_HIDDEN_KEYS = frozenset(
+    {
+        '_fetched_attributes',
+        '_altered_properties',
+        '_connection',
+        'connection',
+        '_type',
+        '_WITH_MISSING_VALUE',
+        '_API_GETTERS',
+    }
+)
+# values dropped by `Dictable.to_dict()`, unless allowed for an attribute
+_EMPTY_VALUES = [[], {}, None]
+# types of values returned by `Dictable._unpack_objects()` without changes
+_PLAIN_TYPES = frozenset({str, int, float, bool})
+# compiled plans of `Dictable.to_dict()` and `Dictable.from_dict()`, see
+# `Dictable._get_to_dict_plan()` and `Dictable._get_from_dict_plan()`
+_TO_DICT_PLANS: dict[tuple, tuple] = {}
+_FROM_DICT_PLANS: dict[type, tuple[frozenset[str], dict[str, Callable]]] = {}
+_SERIALISATION_PLANS_LIMIT = 4096
+
+
 class Dictable:
     """The fundamental class in mstrio-py package. Includes support for
     converting an object to a dictionary, and creating an object from a
@@ -1119,51 +1192,81 @@ class Dictable:
                 By default, the dictionary keys are in camel case.
         """
 
-        hidden_keys = [
-            '_fetched_attributes',
-            '_altered_properties',
-            '_connection',
-            'connection',
-            '_type',
-            '_WITH_MISSING_VALUE',
-            '_API_GETTERS',
-        ]
-        whitelist_keys = whitelist_keys or []
-        cleaned_dict = self.__dict__.copy()
-        # TODO: add units for flag skip private keys
-        private_keys = [k for k in cleaned_dict if k.startswith('_')]
+        cls = type(self)
+        # FYI: read directly, not to trigger fetching of attributes by Entity
+        attributes = object.__getattribute__(self, '__dict__')
+        plan = cls._get_to_dict_plan(
+            tuple(attributes),
+            camel_case,
+            tuple(whitelist_keys) if whitelist_keys else (),
+            skip_private_keys,
+        )
 
-        keep_private: set[str] = getattr(self, "_API_GETTERS_KEEP_PRIVATE", set())
-        properties = get_object_properties(self) | keep_private
-        for prop in properties:
-            to_be_deleted = '_' + prop
-            cleaned_dict[prop] = cleaned_dict.pop(to_be_deleted, None)
+        result = {}
+        for source_key, key, result_key, allow_none, convert_nested in plan:
+            val = attributes.get(source_key)
+            if val is not None and type(val) not in _PLAIN_TYPES:
+                val = cls._unpack_objects(key, val, camel_case)
+            if not allow_none and val in _EMPTY_VALUES:
+                continue
+            if convert_nested and isinstance(val, dict):
+                val = snake_to_camel(val, whitelist=cls._KEEP_CAMEL_CASE)
+            result[result_key] = val
+        return result
+
+    @classmethod
+    def _get_to_dict_plan(
+        cls,
+        keys: tuple[str, ...],
+        camel_case: bool,
+        whitelist_keys: tuple[str, ...],
+        skip_private_keys: bool,
+    ) -> tuple[tuple[str, str, str, bool, bool], ...]:
+        """Get the plan of conversion of objects of the class with the given
+        attributes to a dict, compiling it on first use.
+
+        The plan is a tuple of `(attribute name, key, key in the result,
+        whether None is allowed, whether keys of dict value are converted to
+        camel case)` for every key of the result, in order of the result.
+        """
+        plan_key = (cls, keys, camel_case, whitelist_keys, skip_private_keys)
+        plan = _TO_DICT_PLANS.get(plan_key)
+        if plan is not None:
+            return plan
+
+        # properties are stored in private attributes, but returned under
+        # their public names, in place of the private ones
+        sources = {key: key for key in keys}
+        keep_private: set[str] = getattr(cls, "_API_GETTERS_KEEP_PRIVATE", set())
+        for prop in sorted(_get_class_properties(cls) | keep_private):
+            sources.pop('_' + prop, None)
+            sources[prop] = '_' + prop
 
         # TODO: add units for `whitelist_keys`
-        result = {
-            key: self._unpack_objects(key, val, camel_case)
-            for key, val in cleaned_dict.items()
-            if key not in hidden_keys and (not whitelist_keys or key in whitelist_keys)
-        }
-        result = delete_none_values(
-            result, whitelist_attributes=self._ALLOW_NONE_ATTRIBUTES, recursion=False
+        result_keys = sorted(
+            (
+                key
+                for key in sources
+                if key not in _TO_DICT_HIDDEN_KEYS
+                and (not whitelist_keys or key in whitelist_keys)
+                and not (skip_private_keys and key.startswith('_') and key in keys)
+            ),
+            key=key_fn_for_sort_object_properties,
         )
-        result = {
-            key: result[key]
-            for key in sorted(
-                [
-                    r
-                    for r in result.keys()
-                    if not skip_private_keys or r not in private_keys
-                ],
-                key=key_fn_for_sort_object_properties,
+        plan = tuple(
+            (
+                sources[key],
+                key,
+                _camelize_key(key) if camel_case else key,
+                key in cls._ALLOW_NONE_ATTRIBUTES,
+                camel_case and key not in cls._KEEP_CAMEL_CASE,
             )
-        }
-        return (
-            snake_to_camel(result, whitelist=self._KEEP_CAMEL_CASE)
-            if camel_case
-            else result
+            for key in result_keys
         )
+        if len(_TO_DICT_PLANS) >= _SERIALISATION_PLANS_LIMIT:
+            _TO_DICT_PLANS.clear()
+        _TO_DICT_PLANS[plan_key] = plan
+        return plan
 
     @classmethod
     def from_dict(
@@ -1203,13 +1306,67 @@ class Dictable:
         if connection is not None:
             object_source["connection"] = connection
 
+        if cls._dict_to_obj.__func__ is not Dictable._dict_to_obj.__func__:
+            args = {
+                key: cls._dict_to_obj(connection, val, key)
+                for key, val in object_source.items()
+                if key in cls.__init__.__code__.co_varnames
+            }
+            return cls(**args)
+
+        arg_names, converters = cls._get_from_dict_plan()
         args = {
-            key: cls._dict_to_obj(connection, val, key)
+            key: (converters[key](connection, val) if key in converters else val)
             for key, val in object_source.items()
-            if key in cls.__init__.__code__.co_varnames
+            if key in arg_names
         }
         return cls(**args)
 
+    @classmethod
+    def _get_from_dict_plan(cls) -> tuple[frozenset[str], dict[str, Callable]]:
+        """Get the plan of creation of objects of the class from dicts,
+        compiling it on first use.
+
+        The plan is a tuple of names of arguments of `__init__` and a dict of
+        functions converting values of keys from `_FROM_DICT_MAP`, taking
+        the connection and the value. Each function does what
+        `_dict_to_obj()` does for its key, without checking the type of
+        the mapping on every call.
+        """
+        plan = _FROM_DICT_PLANS.get(cls)
+        if plan is None:
+            plan = (
+                frozenset(cls.__init__.__code__.co_varnames),
+                {key: cls._compile_converter(key) for key in cls._FROM_DICT_MAP},
+            )
+            _FROM_DICT_PLANS[cls] = plan
+        return plan
+
+    @classmethod
+    def _compile_converter(cls, key: str) -> Callable[[Any, Any], Any]:
+        mapping = cls._FROM_DICT_MAP[key]
+        if isinstance(mapping, DatetimeFormats):
+            return lambda _, val: map_str_to_datetime(key, val, cls._FROM_DICT_MAP)
+        elif isinstance(mapping, type(Enum)):
+            return lambda _, val: mapping(val)
+        elif isinstance(mapping, type(Dictable)):
+            return lambda _, val: mapping.from_dict(val)
+        elif isinstance(mapping, list):
+            item_cls = mapping[0]
+            if isinstance(item_cls, list):
+                # for: List[List[handling_cls]]
+                return lambda _, val: [
+                    [item_cls[0].from_dict(item) for item in v] for v in val
+                ]
+            elif all(isinstance(v, type(Enum)) for v in mapping):
+                return lambda _, val: [item_cls(v) for v in val]
+            elif all(isinstance(v, type(Dictable)) for v in mapping):
+                return lambda _, val: [item_cls.from_dict(v) for v in val]
+            elif callable(item_cls):
+                return lambda connection, val: [item_cls(v, connection) for v in val]
+            return lambda _, val: None
+        return lambda connection, val: mapping(val, connection)
+
     @classmethod
     def bulk_from_dict(
         cls: type[T],
@@ -1240,15 +1397,115 @@ class Dictable:
         Returns:
             T: A list of objects of type T.
         """
-        return [
-            cls.from_dict(
-                source=source,
-                connection=connection,
-                to_snake_case=to_snake_case,
-                with_missing_value=with_missing_value,
-            )
-            for source in source_list
+        from_dict = cls.from_dict
+        if from_dict.__func__ is Dictable.from_dict.__func__:
+            return [
+                from_dict(
+                    source=source,
+                    connection=connection,
+                    to_snake_case=to_snake_case,
+                    with_missing_value=with_missing_value,
+                )
+                for source in source_list
+            ]
+
+        # overridden `from_dict` does not have to accept all arguments, so
+        # they are passed only if they differ from defaults
+        kwargs = {'connection': connection}
+        if not to_snake_case:
+            kwargs['to_snake_case'] = to_snake_case
+        if with_missing_value:
+            kwargs['with_missing_value'] = with_missing_value
+        return [from_dict(source=source, **kwargs) for source in source_list]
+
+    @classmethod
+    def bulk_to_columns(
+        cls,
+        objects: 'Iterable[Dictable]',
+        camel_case: bool = True,
+        to_dataframe: bool = False,
+    ) -> 'dict[str, list] | DataFrame':
+        """Converts multiple objects to a column-oriented structure in a single
+        pass. Every object is converted with `to_dict()` and its values are
+        appended to the columns of their keys, so all objects are never held
+        as a list of dicts.
+
+        Args:
+            objects (Iterable[Dictable]): Objects to be converted.
+            camel_case (bool, optional): Set to True if attribute names should
+                be converted from snake case to camel case. Defaults to True.
+            to_dataframe (bool, optional): If True, returns a `DataFrame` with
+                a row per object. Defaults to False.
+
+        Returns:
+            A dict of lists of values of every key, with None for objects
+            which do not have the key, or a `DataFrame`.
+        """
+        columns: dict[str, list] = {}
+        rows = 0
+        for obj in objects:
+            for key, val in obj.to_dict(camel_case).items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * rows
+                elif len(column) < rows:
+                    column.extend([None] * (rows - len(column)))
+                column.append(val)
+            rows += 1
+        for column in columns.values():
+            column.extend([None] * (rows - len(column)))
+
+        if to_dataframe:
+            from pandas import DataFrame
+
+            return DataFrame(columns, index=range(rows))
+        return columns
+
+    @classmethod
+    def bulk_from_columns(
+        cls: type[T],
+        columns: 'dict[str, list] | DataFrame',
+        connection: 'Connection | None' = None,
+        to_snake_case: bool = True,
+        with_missing_value: bool = False,
+    ) -> list[T]:
+        """Creates multiple objects from a column-oriented structure, e.g.
+        returned by `bulk_to_columns()`. Missing values (None or NaN) are
+        omitted, as they are not present in the output of `to_dict()`.
+
+        Args:
+            cls (T): Class (type) of the objects that should be created.
+            columns (dict[str, list] | DataFrame): Dict of lists of values of
+                every key, or a `DataFrame` with a row per object.
+            connection (Connection, optional): A MSTR Connection object.
+                Defaults to None.
+            to_snake_case (bool, optional): Set to True if attribute names
+                should be converted from camel case to snake case. Defaults to
+                True.
+            with_missing_value: (bool, optional): If True, class attributes
+                possible to fetch and missing in `source` will be set as
+                `MissingValue` objects.
+
+        Returns:
+            T: A list of objects of type T.
+        """
+        if not isinstance(columns, dict):
+            columns = {key: column.tolist() for key, column in columns.items()}
+        keys = list(columns)
+        source_list = [
+            {
+                key: val
+                for key, val in zip(keys, values)
+                if val is not None and not (isinstance(val, float) and math.isnan(val))
+            }
+            for values in zip(*columns.values())
         ]
+        return cls.bulk_from_dict(
+            source_list,
+            connection=connection,
+            to_snake_case=to_snake_case,
+            with_missing_value=with_missing_value,
+        )
 
     def __repr__(self) -> str:
         from mstrio.utils.entity import auto_match_args_entity
@@ -1419,10 +1676,14 @@ def get_object_properties(obj: object) -> set[str]:
         set[str]: Names of object properties in a set.
     """
 
-    return {
-        elem[0]
-        for elem in inspect.getmembers(obj.__class__, lambda x: isinstance(x, property))
-    }
+    return set(_get_class_properties(obj.__class__))
+
+
+@cache
+def _get_class_properties(cls: type) -> frozenset[str]:
+    return frozenset(
+        elem[0] for elem in inspect.getmembers(cls, lambda x: isinstance(x, property))
+    )
 
 
 def get_string_exp_body(expression: str) -> dict:
@@ -1474,6 +1735,54 @@ def deduplicated_name(name: str, existing_names: list[str]) -> str:
     return f"{name} ({i})"
 
 
+def poll_for_stable_status(
+    obj: 'EntityBase',
+    property: str,
+    not_stable_val: list,
+    timeout: int | None = 240,
+    interval: int | None = None,
+    callback: Callable[['Future'], None] | None = None,
+) -> 'Future':
+    """Poll a specific property of an object until it reaches a stable state,
+    without blocking.
+
+    Polling is done by the poller shared within mstrio-py, which fetches only
+    the given property and checks it with adaptive intervals.
+
+    Args:
+        obj (EntityBase): The object to monitor.
+        property (str): The property to check.
+        not_stable_val (list): List of values that indicate the property is not
+            stable.
+        timeout (int, optional): Maximum time to wait in seconds. Defaults to
+            240. If None, waits indefinitely.
+        interval (int, optional): Fixed time between checks in seconds. If not
+            provided, the interval is adaptive and limited by the value from
+            mstrio-py's `config`.
+        callback (Callable, optional): Function called with the future once
+            it is done.
+
+    Returns:
+        Future resolved with the stable value of the property, or with
+        `TimeoutError` if it was not reached within `timeout`.
+    """
+
+    def get_status():
+        try:
+            obj.fetch(property)
+        except ValueError:  # property has no dedicated getter
+            obj.fetch()
+        return getattr(obj, property)
+
+    return get_status_poller().submit(
+        get_status,
+        lambda value: value not in not_stable_val,
+        timeout=timeout,
+        interval=interval,
+        callback=callback,
+    )
+
+
 def wait_for_stable_status(
     obj: 'EntityBase',
     property: str,
@@ -1490,20 +1799,27 @@ def wait_for_stable_status(
             stable.
         timeout (int, optional): Maximum time to wait in seconds.
             Defaults to 240.
-        interval (int, optional): Time between checks in seconds. If not
-            provided, the value is taken from mstrio-py's `config`.
+        interval (int, optional): Fixed time between checks in seconds. If not
+            provided, the interval is adaptive and limited by the value from
+            mstrio-py's `config`.
 
     Returns:
         bool: True if stable state is reached False otherwise.
     """
-    start_time = datetime.now()
-    while (getattr(obj, property) in not_stable_val) and (
-        (datetime.now() - start_time).total_seconds() < timeout
-    ):
-        obj.fetch()
-        sleep(interval or config.delay_between_polling)
+    if getattr(obj, property) not in not_stable_val:
+        return True
 
-    return getattr(obj, property) not in not_stable_val
+    future = poll_for_stable_status(
+        obj, property, not_stable_val, timeout=timeout, interval=interval
+    )
+    try:
+        future.result()
+    except TimeoutError:
+        return False
+    except BaseException:
+        future.cancel()
+        raise
+    return True
 
 
 # TODO: consider moving to `resolvers.py`
@@ -1543,6 +1859,18 @@ def get_owner_id(
     if not user_identifier and not owner_name:
         return None
 
+    from mstrio.utils.resolvers import get_resolution_cache
+
+    # Users found before by the connection do not have to be fetched again
+    cache = get_resolution_cache(connection)
+    for kind, key in (
+        ('user_id', user_identifier),
+        ('username', user_identifier),
+        ('user_name', owner_name),
+    ):
+        if key and (cached_id := cache.get(kind, key)):
+            return cached_id
+
     # Get user and return ID if found
     if user := get_user_based_on_id_or_username(
         connection, user_identifier, user_identifier, owner_name
@@ -1597,12 +1925,29 @@ def get_user_based_on_id_or_username(
         User | None: User object if found, None otherwise.
     """
     from mstrio.users_and_groups import User
+    from mstrio.utils.resolvers import get_resolution_cache
+
+    cache = get_resolution_cache(connection)
+
+    def get_user(kind: str, key: str, **kwargs) -> User:
+        # IDs of users found before are fetched directly, without searching
+        if cached_id := cache.get(kind, key):
+            try:
+                with config.temp_verbose_disable():
+                    return User(connection=connection, id=cached_id)
+            except IServerError:
+                cache.invalidate(object_id=cached_id)
+        user = User(connection=connection, **kwargs)
+        cache.set(kind, key, user.id)
+        return user
 
     both_the_same = user_id == user_username
     if user_id:
         try:
             with config.temp_verbose_disable():
-                return User(connection=connection, id=user_id)
+                user = User(connection=connection, id=user_id)
+            cache.set('user_id', user_id, user.id)
+            return user
         except IServerError:
             if not both_the_same:
                 logger.warning(
@@ -1612,7 +1957,7 @@ def get_user_based_on_id_or_username(
     if user_username:
         try:
             with config.temp_verbose_disable():
-                return User(connection=connection, username=user_username)
+                return get_user('username', user_username, username=user_username)
         except ValueError:
             if not both_the_same:
                 logger.warning(
@@ -1626,7 +1971,7 @@ def get_user_based_on_id_or_username(
         )
     if user_name:
         try:
-            return User(connection=connection, name=user_name)
+            return get_user('user_name', user_name, name=user_name)
         except ValueError:
             if not both_the_same:
                 logger.warning(
@@ -1703,13 +2048,16 @@ def process_change_journal_comment(
             supported.
         comment (str, optional): Comment to process.
     """
-    from mstrio.utils.version_helper import meets_minimal_version
+    from mstrio.utils.version_helper import (
+        get_server_capabilities,
+        meets_minimal_version,
+    )
 
     if (
         comment is not None
         and min_version
         and not meets_minimal_version(min_version, '11.6.0100')
-        and connection.deployment_type == 'mcg'
+        and get_server_capabilities(connection).deployment_type == 'mcg'
     ):
         min_version = '11.6.0100'
 
@@ -1737,13 +2085,16 @@ def process_delete_change_journal_comment(
         str: Comment if the API version supports change journal comments,
             None otherwise.
     """
-    from mstrio.utils.version_helper import meets_minimal_version
+    from mstrio.utils.version_helper import (
+        get_server_capabilities,
+        meets_minimal_version,
+    )
 
     if (
         comment is not None
         and min_version
         and not meets_minimal_version(min_version, '11.6.0100')
-        and connection.deployment_type == 'mcg'
+        and get_server_capabilities(connection).deployment_type == 'mcg'
     ):
         min_version = '11.6.0100'
 
@@ -1769,13 +2120,16 @@ def add_journal_comment_to_operation_list(
             journal comments.
         comment (str, optional): Comment to process.
     """
-    from mstrio.utils.version_helper import meets_minimal_version
+    from mstrio.utils.version_helper import (
+        get_server_capabilities,
+        meets_minimal_version,
+    )
 
     if (
         comment is not None
         and min_version
         and not meets_minimal_version(min_version, '11.6.0100')
-        and connection.deployment_type == 'mcg'
+        and get_server_capabilities(connection).deployment_type == 'mcg'
     ):
         min_version = '11.6.0100'
 
@@ -0,0 +1,85 @@
+"""Lazy loading of package members (PEP 562).
+
+Package `__init__` modules keep their imports inside an `if TYPE_CHECKING:`
+block, so that type checkers and IDEs still see them, and attach module-level
+`__getattr__` and `__dir__` built by `attach_lazy_exports` from a static
+mapping of exported names to submodules. The mapping has to list the same
+names as the `if TYPE_CHECKING:` block. Submodules are imported only when one
+of their members is accessed for the first time.
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Sequence
+from typing import Any
+
+
+def _public_names(module) -> list[str]:
+    names = getattr(module, '__all__', None)
+    if names is None:
+        names = [name for name in vars(module) if not name.startswith('_')]
+    return list(names)
+
+
+def attach_lazy_exports(
+    package_name: str,
+    exports: dict[str, str],
+    star_modules: Sequence[str] = (),
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level `__getattr__` and `__dir__` for a package whose
+    members are declared in `if TYPE_CHECKING:` blocks of its `__init__`.
+
+    Names listed in `exports` are resolved by importing only the submodule
+    they come from. Other public names are looked up in `star_modules`, in
+    order of their declaration. Resolved members are cached in the package
+    namespace, so each of them is resolved only once.
+
+    Usage in a package `__init__` module:
+
+        >>> __getattr__, __dir__ = attach_lazy_exports(
+        ...     __name__, {'Cluster': '.cluster'}, star_modules=['.helpers']
+        ... )
+
+    Args:
+        package_name (str): Name of the package, usually `__name__`.
+        exports (dict[str, str]): Mapping of exported names to (relative)
+            names of modules in which they are defined.
+        star_modules (Sequence[str], optional): Modules imported with `*`,
+            in order of their declaration.
+    """
+
+    def _import(module: str):
+        return importlib.import_module(module, package_name)
+
+    def _all() -> list[str]:
+        names = dict.fromkeys(exports)
+        for star_module in star_modules:
+            names.update(dict.fromkeys(_public_names(_import(star_module))))
+        return list(names)
+
+    def _find_in_star_modules(name: str) -> Any:
+        if not name.startswith('_'):
+            for star_module in star_modules:
+                try:
+                    return getattr(_import(star_module), name)
+                except AttributeError:
+                    continue
+        raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+    def __getattr__(name: str) -> Any:
+        if name in exports:
+            value = getattr(_import(exports[name]), name)
+        elif name == '__all__':
+            value = _all()
+        else:
+            value = _find_in_star_modules(name)
+
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(
+            set(vars(sys.modules[package_name])) | set(__getattr__('__all__'))
+        )
+
+    return __getattr__, __dir__
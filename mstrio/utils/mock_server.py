@@ -0,0 +1,1070 @@
+"""Local stand-in for the Strategy REST API, for load and scale testing.
+
+`MockIServer` is a lightweight HTTP server which answers the requests sent
+by mstrio for authentication, sessions, projects, objects, cubes, reports,
+users, folders, searches, user connections and exports of documents, with
+synthetic data of configurable size. A `FailureProfile` adds latency, slow
+chunks of cube and report data, throttling (429), unavailability (503) and
+session expiry, so that concurrency, paging and retries of mstrio can be
+load-tested end to end on a laptop, and its tuning knobs can be benchmarked
+reproducibly.
+
+Example:
+    >>> dataset = SyntheticDataset(rows=200_000, attributes=3, metrics=5)
+    >>> failures = FailureProfile(latency=0.01, throttle_rate=0.02)
+    >>> with MockIServer(datasets=[dataset], failures=failures) as server:
+    ...     conn = Connection(server.base_url, 'user', 'pass',
+    ...                       project_name=server.project_name)
+    ...     df = OlapCube(conn, id=dataset.id).to_dataframe()
+    ...     print(server.stats)
+"""
+
+import base64
+import json
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from mstrio.types import ObjectTypes
+
+logger = logging.getLogger(__name__)
+
+# ID of the root folder of every project
+_PROJECT_ROOT_FOLDER_ID = 'D43364C684E34A5F9B2F9AD7108F7828'
+
+# size in bytes of every exported document or visualization
+_EXPORT_SIZE = 64 * 1024
+_EXPORT_CONTENT_TYPES = {
+    'pdf': 'application/json',  # the file is encoded in base64 in JSON
+    'excel': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'csv': 'text/csv',
+    'mstr': 'application/octet-stream',
+}
+
+_IDS = ('{:032X}'.format(n) for n in range(1, 2**64))
+_ID_LOCK = threading.Lock()
+
+
+def _new_id() -> str:
+    with _ID_LOCK:
+        return next(_IDS)
+
+
+@dataclass
+class SyntheticDataset:
+    """Dataset with synthetic data served as a cube or a report.
+
+    The value of every cell is computed from its row, so datasets of any size
+    take no memory and every chunk of data can be checked.
+
+    Attributes:
+        rows (int): Number of rows.
+        attributes (int): Number of attributes.
+        metrics (int): Number of metrics.
+        forms (int): Number of forms of every attribute.
+        cardinality (int): Maximal number of elements of an attribute.
+        name (str): Name of the dataset.
+        type (ObjectTypes): `ObjectTypes.REPORT_DEFINITION` for a cube or
+            a report; `subtype` chooses between them.
+        subtype (int): 776 (OLAP cube), 779 (super cube) or 768 (grid report).
+        id (str): ID of the dataset.
+    """
+
+    rows: int = 10_000
+    attributes: int = 2
+    metrics: int = 3
+    forms: int = 1
+    cardinality: int = 1000
+    name: str = 'Synthetic Dataset'
+    type: ObjectTypes = ObjectTypes.REPORT_DEFINITION
+    subtype: int = 776
+    id: str = field(default_factory=_new_id)
+
+    def element(self, row: int, attribute: int) -> int:
+        """Index of the element of an attribute in a row."""
+        return (row // (attribute + 1)) % self.cardinality
+
+    def metric_value(self, row: int, metric: int) -> float:
+        """Value of a metric in a row."""
+        return round(((row + 1) * (metric + 3) % 100_003) / 100, 2)
+
+    def attribute_id(self, attribute: int) -> str:
+        return f'{self.id[:24]}A{attribute:07X}'
+
+    def metric_id(self, metric: int) -> str:
+        return f'{self.id[:24]}M{metric:07X}'
+
+
+@dataclass
+class SyntheticFolderTree:
+    """Tree of folders with synthetic objects, served in the root folder of
+    the project.
+
+    Attributes:
+        depth (int): Number of levels of folders below the root folder of
+            the tree.
+        breadth (int): Number of subfolders of every folder.
+        objects (int): Number of metrics in every folder.
+        name (str): Name of the root folder of the tree.
+        id (str): ID of the root folder of the tree.
+    """
+
+    depth: int = 3
+    breadth: int = 4
+    objects: int = 10
+    name: str = 'Public Objects'
+    id: str = field(default_factory=_new_id)
+
+
+@dataclass
+class FailureProfile:
+    """Latency and failures of a `MockIServer`.
+
+    Attributes:
+        latency (float): Time in seconds added to every response.
+        chunk_delay (float): Time in seconds added to every response with
+            a chunk of cube or report data.
+        bandwidth (float, optional): Bandwidth in bytes per second at which
+            chunks of cube or report data are sent.
+        throttle_rate (float): Fraction of requests answered with
+            429 Too Many Requests.
+        retry_after (int): Value of the `Retry-After` header of 429 responses.
+        unavailable_rate (float): Fraction of requests answered with
+            503 Service Unavailable.
+        session_timeout (int): Time in seconds after which an idle session
+            expires and its requests are answered with 401 Unauthorized.
+        include_auth (bool): Whether authentication requests can fail too.
+        seed (int, optional): Seed of the random failures, for reproducible
+            runs.
+    """
+
+    latency: float = 0.0
+    chunk_delay: float = 0.0
+    bandwidth: float | None = None
+    throttle_rate: float = 0.0
+    retry_after: int = 0
+    unavailable_rate: float = 0.0
+    session_timeout: int = 600
+    include_auth: bool = False
+    seed: int | None = None
+
+
+class _Error(Exception):
+    def __init__(self, status: int, code: str, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+class MockIServer:
+    """Local HTTP server imitating the Strategy REST API.
+
+    Requests are served in threads, like by the Library server, and each
+    request is counted in `stats`, so the number of requests and their
+    concurrency can be checked after a run. Every username and password is
+    accepted. Unsupported endpoints are answered with 404 Not Found.
+
+    Attributes:
+        base_url (str): URL to be passed to `Connection`.
+        datasets (dict[str, SyntheticDataset]): Served datasets by IDs.
+        failures (FailureProfile): Latency and failures of the server.
+        project_id (str): ID of the only project.
+        project_name (str): Name of the only project.
+        iserver_version (str): Reported version of the I-Server.
+        folders (SyntheticFolderTree, optional): Served tree of folders.
+        users (int): Number of synthetic users.
+        objects (int): Number of synthetic objects found by searches.
+        user_connections (int): Number of synthetic user connections.
+        stats (Counter): Numbers of requests by endpoint, numbers of
+            responses by status (e.g. `'status 429'`) and the maximal number
+            of concurrent requests (`'max in flight'`).
+    """
+
+    def __init__(
+        self,
+        datasets: list[SyntheticDataset] | None = None,
+        failures: FailureProfile | None = None,
+        folders: SyntheticFolderTree | None = None,
+        users: int = 1000,
+        objects: int = 1000,
+        user_connections: int = 100,
+        project_name: str = 'Mock Project',
+        iserver_version: str = '11.5.0600',
+        host: str = '127.0.0.1',
+        port: int = 0,
+    ) -> None:
+        """Initialize the server. It starts listening when it is entered with
+        the `with` statement or with `start()`.
+
+        Args:
+            datasets (list[SyntheticDataset], optional): Served datasets.
+            failures (FailureProfile, optional): Latency and failures of the
+                server. By default, there are none.
+            folders (SyntheticFolderTree, optional): Served tree of folders.
+                Its objects can be found by searches in the tree and changed
+                with `add_object()` and `delete_object()`.
+            users (int, optional): Number of synthetic users. Defaults to 1000.
+            objects (int, optional): Number of synthetic metrics found by
+                searches. Defaults to 1000.
+            user_connections (int, optional): Number of synthetic user
+                connections. Defaults to 100.
+            project_name (str, optional): Name of the only project.
+            iserver_version (str, optional): Reported version of the I-Server.
+            host (str, optional): Host to listen on. Defaults to localhost.
+            port (int, optional): Port to listen on. By default, a free port.
+        """
+        self.datasets = {dataset.id: dataset for dataset in datasets or []}
+        self.failures = failures or FailureProfile()
+        self.users = users
+        self.objects = objects
+        self.user_connections = user_connections
+        self.project_id = _new_id()
+        self.project_name = project_name
+        self.iserver_version = iserver_version
+        self.stats: Counter = Counter()
+        self._address = (host, port)
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._random = random.Random(self.failures.seed)
+        self._in_flight = 0
+        self._sessions: dict[str, float] = {}
+        self._instances: dict[str, str] = {}
+        self._searches: dict[str, dict] = {}
+        # objects of the folder tree by IDs and IDs of contents of folders
+        self._tree: dict[str, dict] = {}
+        self._contents: dict[str, list[str]] = {}
+        if folders is not None:
+            self._build_tree(folders)
+        self._routes: list[tuple[str, str, re.Pattern, Callable]] = [
+            (method, route, _compile(route), handler)
+            for method, route, handler in [
+                ('POST', '/auth/login', self._login),
+                ('POST', '/auth/logout', self._logout),
+                ('GET', '/status', self._status),
+                ('GET', '/sessions', self._session),
+                ('PUT', '/sessions', self._session),
+                ('GET', '/sessions/userInfo', self._user_info),
+                ('GET', '/sessions/privileges', self._privileges),
+                ('GET', '/projects', self._projects),
+                ('GET', '/projects/{id}', self._project),
+                ('GET', '/objects/{id}', self._object),
+                ('GET', '/datasets/{id}', self._dataset_tables),
+                ('GET', '/v2/cubes/{id}', self._dataset_definition),
+                ('POST', '/v2/cubes/{id}/instances', self._run),
+                ('GET', '/v2/cubes/{id}/instances/{iid}', self._chunk),
+                ('GET', '/v2/reports/{id}', self._dataset_definition),
+                ('POST', '/v2/reports/{id}/instances', self._run),
+                ('GET', '/v2/reports/{id}/instances/{iid}', self._chunk),
+                (
+                    'GET',
+                    '/v2/reports/{id}/instances/{iid}/pageBy/elements',
+                    self._page_by_elements,
+                ),
+                ('GET', '/folders/{id}', self._folder_contents),
+                ('GET', '/users', self._users),
+                ('GET', '/users/{id}', self._user),
+                ('GET', '/usergroups/{id}/members', self._users),
+                ('POST', '/metadataSearches/results', self._search),
+                ('GET', '/metadataSearches/results', self._search_results),
+                ('POST', '/v2/metadataSearches/results', self._search),
+                ('GET', '/v2/metadataSearches/results', self._search_results_v2),
+                ('GET', '/monitors/iServer/nodes', self._nodes),
+                ('GET', '/monitors/userConnections', self._connections),
+                ('POST', '/documents/{id}/instances', self._document_instance),
+                ('POST', '/dossiers/{id}/instances', self._document_instance),
+                (
+                    'DELETE',
+                    '/documents/{id}/instances/{iid}',
+                    self._delete_document_instance,
+                ),
+                (
+                    'POST',
+                    '/documents/{id}/instances/{iid}/{format}',
+                    self._document_export,
+                ),
+                (
+                    'POST',
+                    '/documents/{id}/instances/{iid}/visualizations/{key}/{format}',
+                    self._document_export,
+                ),
+            ]
+        ]
+
+    def __enter__(self) -> 'MockIServer':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return (
+            f"MockIServer(base_url={self.base_url!r}, "
+            f"datasets={len(self.datasets)}, requests={self.stats['requests']})"
+        )
+
+    @property
+    def base_url(self) -> str:
+        address = self._server.server_address if self._server else self._address
+        return f'http://{address[0]}:{address[1]}/MicroStrategyLibrary'
+
+    def start(self) -> None:
+        """Start serving requests in a background thread."""
+        if self._server is not None:
+            return
+        server = self
+
+        class Handler(_RequestHandler):
+            mock = server
+
+        self._server = ThreadingHTTPServer(self._address, Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name='MockIServer', daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Mock I-Server listening on {self.base_url}")
+
+    def stop(self) -> None:
+        """Stop serving requests."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def add_dataset(self, dataset: SyntheticDataset) -> SyntheticDataset:
+        """Serve another dataset."""
+        self.datasets[dataset.id] = dataset
+        return dataset
+
+    def expire_sessions(self) -> None:
+        """Expire all sessions, as if they timed out."""
+        with self._lock:
+            self._sessions.clear()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats.clear()
+
+    def add_object(
+        self, parent_id: str, name: str, type: ObjectTypes = ObjectTypes.METRIC
+    ) -> str:
+        """Add an object (e.g. a folder) to a folder of the folder tree.
+
+        Returns:
+            ID of the new object.
+        """
+        with self._lock:
+            if parent_id not in self._contents:
+                raise ValueError(f"Folder {parent_id} not found.")
+            id = self._add_tree_object(parent_id, name, type, _now())
+            self._tree[parent_id]['dateModified'] = self._tree[id]['dateModified']
+        return id
+
+    def delete_object(self, id: str) -> None:
+        """Delete an object of the folder tree, with its contents."""
+        with self._lock:
+            parent_id = self._tree[id]['parentId']
+            self._contents[parent_id].remove(id)
+            self._tree[parent_id]['dateModified'] = _now()
+            removed = [id]
+            while removed:
+                current = removed.pop()
+                del self._tree[current]
+                removed.extend(self._contents.pop(current, []))
+
+    # request processing
+
+    def _handle(
+        self, method: str, url: str, headers: dict, body: bytes
+    ) -> tuple[int, dict, bytes]:
+        split = urlsplit(url)
+        path = split.path.removeprefix('/MicroStrategyLibrary')
+        params = {key: values[-1] for key, values in parse_qs(split.query).items()}
+        with self._lock:
+            self.stats['requests'] += 1
+            self._in_flight += 1
+            self.stats['max in flight'] = max(
+                self.stats['max in flight'], self._in_flight
+            )
+        try:
+            status, payload, extra_headers, delay = self._dispatch(
+                method, path, params, headers, body
+            )
+            if payload is None:
+                content = b''
+            elif isinstance(payload, bytes):
+                content = payload
+            else:
+                content = json.dumps(payload).encode('utf-8')
+            if self.failures.bandwidth and delay:
+                delay += len(content) / self.failures.bandwidth
+            if self.failures.latency or delay:
+                time.sleep(self.failures.latency + delay)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        with self._lock:
+            self.stats[f'status {status}'] += 1
+        response_headers = {'Content-Type': 'application/json', **extra_headers}
+        return status, response_headers, content
+
+    def _dispatch(
+        self, method: str, path: str, params: dict, headers: dict, body: bytes
+    ) -> tuple[int, dict | list | bytes | None, dict, float]:
+        for route_method, route, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if route_method == method and match:
+                break
+        else:
+            with self._lock:
+                self.stats[f'{method} unsupported'] += 1
+            return 404, _error('ERR004', f"Unsupported: {method} {path}"), {}, 0
+        is_auth = handler in (self._login, self._status)
+        with self._lock:
+            self.stats[f'{method} {route}'] += 1
+            draw = self._random.random()
+        profile = self.failures
+        try:
+            if not is_auth or profile.include_auth:
+                if draw < profile.throttle_rate:
+                    headers_429 = {'Retry-After': str(profile.retry_after)}
+                    return 429, _error('ERR001', 'Too many requests'), headers_429, 0
+                if draw < profile.throttle_rate + profile.unavailable_rate:
+                    return 503, _error('ERR001', 'Service unavailable'), {}, 0
+            if not is_auth:
+                self._check_session(headers.get('x-mstr-authtoken'))
+            request = _Request(method, params, headers, body, match.groupdict())
+            result = handler(request)
+        except _Error as err:
+            return err.status, _error(err.code, err.message), {}, 0
+        except Exception as err:
+            logger.exception(f"Mock I-Server failed to handle {method} {path}.")
+            return 500, _error('ERR001', str(err)), {}, 0
+        status, payload, extra_headers, delay = result + ({}, 0)[len(result) - 2 :]
+        return status, payload, extra_headers, delay
+
+    def _check_session(self, token: str | None) -> None:
+        now = time.monotonic()
+        with self._lock:
+            last_active = self._sessions.get(token)
+            if last_active is None or now - last_active > self.failures.session_timeout:
+                self._sessions.pop(token, None)
+                raise _Error(
+                    401,
+                    'ERR009',
+                    "The user's session has expired, please reauthenticate",
+                )
+            self._sessions[token] = now
+
+    def _build_tree(self, folders: SyntheticFolderTree) -> None:
+        created = '2024-01-01T00:00:00.000+0000'
+        self._tree[_PROJECT_ROOT_FOLDER_ID] = self._tree_object(
+            _PROJECT_ROOT_FOLDER_ID, self.project_name, ObjectTypes.FOLDER, created
+        )
+        self._contents[_PROJECT_ROOT_FOLDER_ID] = []
+        self._add_tree_object(
+            _PROJECT_ROOT_FOLDER_ID,
+            folders.name,
+            ObjectTypes.FOLDER,
+            created,
+            id=folders.id,
+        )
+        level = [folders.id]
+        for depth in range(folders.depth + 1):
+            next_level = []
+            for folder_id in level:
+                for i in range(folders.objects):
+                    self._add_tree_object(
+                        folder_id, f'Metric {i}', ObjectTypes.METRIC, created
+                    )
+                if depth < folders.depth:
+                    next_level.extend(
+                        self._add_tree_object(
+                            folder_id, f'Folder {i}', ObjectTypes.FOLDER, created
+                        )
+                        for i in range(folders.breadth)
+                    )
+            level = next_level
+
+    def _add_tree_object(
+        self,
+        parent_id: str,
+        name: str,
+        type: ObjectTypes,
+        modified: str,
+        id: str | None = None,
+    ) -> str:
+        id = id or _new_id()
+        self._tree[id] = self._tree_object(id, name, type, modified, parent_id)
+        self._contents[parent_id].append(id)
+        if type == ObjectTypes.FOLDER:
+            self._contents[id] = []
+        return id
+
+    def _tree_object(
+        self,
+        id: str,
+        name: str,
+        type: ObjectTypes,
+        modified: str,
+        parent_id: str | None = None,
+    ) -> dict:
+        return {
+            'id': id,
+            'name': name,
+            'type': type.value,
+            'subtype': 2048 if type == ObjectTypes.FOLDER else 1024,
+            'dateCreated': modified,
+            'dateModified': modified,
+            'version': id,
+            'acg': 255,
+            'owner': {'id': '54F3D26011D2896560009A8E67019608', 'name': 'Mock'},
+            'extType': 0,
+            'parentId': parent_id,
+        }
+
+    def _with_ancestors(self, id: str) -> dict:
+        item = self._tree[id]
+        ancestors = []
+        parent_id = item['parentId']
+        while parent_id is not None:
+            parent = self._tree[parent_id]
+            ancestors.append({'id': parent_id, 'name': parent['name']})
+            parent_id = parent['parentId']
+        levels = len(ancestors)
+        return {
+            **{key: value for key, value in item.items() if key != 'parentId'},
+            'ancestors': [
+                {**ancestor, 'level': level, 'isRoot': level == levels}
+                for level, ancestor in enumerate(ancestors, start=1)
+            ],
+            'projectId': self.project_id,
+        }
+
+    def _dataset(self, id: str) -> SyntheticDataset:
+        dataset = self.datasets.get(id)
+        if dataset is None:
+            raise _Error(404, 'ERR004', f"Dataset {id} not found.")
+        return dataset
+
+    # endpoints
+
+    def _login(self, request: '_Request'):
+        token = uuid.uuid4().hex
+        with self._lock:
+            self._sessions[token] = time.monotonic()
+        return 204, None, {'X-MSTR-AuthToken': token}
+
+    def _logout(self, request: '_Request'):
+        with self._lock:
+            self._sessions.pop(request.headers.get('x-mstr-authtoken'), None)
+        return 204, None
+
+    def _status(self, request: '_Request'):
+        return 200, {
+            'webVersion': self.iserver_version,
+            'iServerVersion': self.iserver_version,
+            'deploymentType': 'mock',
+        }
+
+    def _session(self, request: '_Request'):
+        if request.method == 'PUT':
+            return 204, None
+        return 200, {
+            'timeout': self.failures.session_timeout,
+            'workingSet': 10,
+            'maxSearch': 3,
+        }
+
+    def _user_info(self, request: '_Request'):
+        return 200, {
+            'id': '54F3D26011D2896560009A8E67019608',
+            'fullName': 'Mock User',
+            'initials': 'MU',
+        }
+
+    def _privileges(self, request: '_Request'):
+        return 200, {'privileges': []}
+
+    def _project_info(self) -> dict:
+        return {
+            'id': self.project_id,
+            'name': self.project_name,
+            'alias': '',
+            'description': '',
+            'status': 0,
+            'nodes': [{'name': 'mock-node', 'projectStatus': 'loaded'}],
+        }
+
+    def _projects(self, request: '_Request'):
+        return 200, [self._project_info()]
+
+    def _project(self, request: '_Request'):
+        if request.path['id'] != self.project_id:
+            raise _Error(404, 'ERR004', f"Project {request.path['id']} not found.")
+        return 200, self._project_info()
+
+    def _object(self, request: '_Request'):
+        id = request.path['id']
+        if id in self.datasets:
+            dataset = self.datasets[id]
+            info = {
+                'name': dataset.name,
+                'type': dataset.type.value,
+                'subtype': dataset.subtype,
+            }
+        elif id in self._tree:
+            with self._lock:
+                return 200, self._with_ancestors(id)
+        elif id == self.project_id:
+            info = {
+                'name': self.project_name,
+                'type': ObjectTypes.PROJECT.value,
+                'subtype': 8448,
+            }
+        elif id.startswith('MOCKOBJ'):
+            info = {
+                'name': f'Metric {int(id[7:])}',
+                'type': ObjectTypes.METRIC.value,
+                'subtype': 1024,
+            }
+        else:
+            raise _Error(404, 'ERR004', f"Object {id} not found.")
+        return 200, {
+            'id': id,
+            **info,
+            'abbreviation': '',
+            'description': '',
+            'dateCreated': '2024-01-01T00:00:00.000+0000',
+            'dateModified': '2024-01-01T00:00:00.000+0000',
+            'version': id,
+            'owner': {'id': '54F3D26011D2896560009A8E67019608', 'name': 'Mock'},
+            'acg': 255,
+            'ancestors': [],
+            'hidden': False,
+            'extType': 0,
+            'projectId': self.project_id,
+        }
+
+    def _dataset_definition(self, request: '_Request'):
+        dataset = self._dataset(request.path['id'])
+        attributes = [
+            {
+                'id': dataset.attribute_id(i),
+                'name': f'Attribute {i}',
+                'type': 'Attribute',
+                'forms': [
+                    {'id': f'F{f}', 'name': f'Form {f}', 'dataType': 'Char'}
+                    for f in range(dataset.forms)
+                ],
+            }
+            for i in range(dataset.attributes)
+        ]
+        metrics = [
+            {
+                'id': dataset.metric_id(i),
+                'name': f'Metric {i}',
+                'type': 'Metric',
+                'dataType': 'Double',
+            }
+            for i in range(dataset.metrics)
+        ]
+        grid = {
+            'crossTab': False,
+            'metricsPosition': {'axis': 'columns', 'index': 0},
+            'rows': [{**attribute, 'type': 'attribute'} for attribute in attributes],
+            'columns': [self._metric_column(dataset)] if dataset.metrics else [],
+            'pageBy': [],
+            'subtotals': {'defined': False, 'visible': False},
+        }
+        return 200, {
+            'id': dataset.id,
+            'name': dataset.name,
+            'definition': {
+                'grid': grid,
+                'availableObjects': {
+                    'attributes': attributes,
+                    'metrics': metrics,
+                    'consolidations': [],
+                },
+            },
+        }
+
+    def _dataset_tables(self, request: '_Request'):
+        dataset = self._dataset(request.path['id'])
+        table = f'{dataset.name} Table'
+        columns = [f'Attribute {i}' for i in range(dataset.attributes)] + [
+            f'Metric {i}' for i in range(dataset.metrics)
+        ]
+        return 200, {
+            'id': dataset.id,
+            'name': dataset.name,
+            'result': {
+                'definition': {
+                    'availableObjects': {
+                        'tables': [{'id': dataset.id, 'name': table}],
+                        'columns': [
+                            {'tableName': table, 'columnName': column}
+                            for column in columns
+                        ],
+                    }
+                }
+            },
+        }
+
+    def _run(self, request: '_Request'):
+        dataset = self._dataset(request.path['id'])
+        instance_id = uuid.uuid4().hex.upper()
+        with self._lock:
+            self._instances[instance_id] = dataset.id
+        return self._page(dataset, instance_id, request)
+
+    def _chunk(self, request: '_Request'):
+        dataset = self._dataset(request.path['id'])
+        with self._lock:
+            known = self._instances.get(request.path['iid']) == dataset.id
+        if not known:
+            raise _Error(404, 'ERR004', "Instance not found or expired.")
+        return self._page(dataset, request.path['iid'], request)
+
+    def _page_by_elements(self, request: '_Request'):
+        self._dataset(request.path['id'])
+        return 200, {'pageBy': [], 'validPageByElements': {'items': []}}
+
+    def _page(self, dataset: SyntheticDataset, instance_id: str, request: '_Request'):
+        offset = int(request.params.get('offset', 0))
+        limit = int(request.params.get('limit', 5000))
+        if limit < 0:
+            limit = dataset.rows
+        rows = range(offset, min(offset + limit, dataset.rows))
+        # like the I-Server, a page lists only elements which occur in it
+        attribute_rows = []
+        headers = []
+        for attribute in range(dataset.attributes):
+            elements = sorted({dataset.element(row, attribute) for row in rows})
+            index = {element: i for i, element in enumerate(elements)}
+            headers.append([index[dataset.element(row, attribute)] for row in rows])
+            attribute_rows.append(
+                {
+                    'name': f'Attribute {attribute}',
+                    'id': dataset.attribute_id(attribute),
+                    'type': 'attribute',
+                    'forms': [
+                        {'id': f'F{f}', 'name': f'Form {f}', 'dataType': 'Char'}
+                        for f in range(dataset.forms)
+                    ],
+                    'elements': [
+                        {
+                            'formValues': [
+                                f'A{attribute}F{f} {element}'
+                                for f in range(dataset.forms)
+                            ],
+                            'id': f'h{element};{dataset.attribute_id(attribute)}',
+                        }
+                        for element in elements
+                    ],
+                }
+            )
+        payload = {
+            'id': dataset.id,
+            'name': dataset.name,
+            'instanceId': instance_id,
+            'status': 1,
+            'definition': {
+                'grid': {
+                    'crossTab': False,
+                    'metricsPosition': {'axis': 'columns', 'index': 0},
+                    'rows': attribute_rows,
+                    'columns': (
+                        [self._metric_column(dataset)] if dataset.metrics else []
+                    ),
+                }
+            },
+            'data': {
+                'paging': {
+                    'total': dataset.rows,
+                    'current': len(rows),
+                    'offset': offset,
+                    'limit': limit,
+                },
+                'headers': {
+                    'rows': [list(row) for row in zip(*headers)] if headers else [],
+                    'columns': [list(range(dataset.metrics))],
+                },
+                'metricValues': {
+                    'raw': [
+                        [dataset.metric_value(row, m) for m in range(dataset.metrics)]
+                        for row in rows
+                    ],
+                },
+            },
+        }
+        return 200, payload, {}, self.failures.chunk_delay
+
+    @staticmethod
+    def _metric_column(dataset: SyntheticDataset) -> dict:
+        return {
+            'name': 'Metrics',
+            'id': '00000000000000000000000000000000',
+            'type': 'templateMetrics',
+            'elements': [
+                {'name': f'Metric {m}', 'id': dataset.metric_id(m), 'type': 'metric'}
+                for m in range(dataset.metrics)
+            ],
+        }
+
+    def _paged(self, request: '_Request', total: int, item: Callable[[int], dict]):
+        offset = int(request.params.get('offset', 0))
+        limit = int(request.params.get('limit', -1))
+        end = total if limit < 0 else min(offset + limit, total)
+        items = [item(i) for i in range(offset, end)]
+        return items, {'x-mstr-total-count': str(total)}
+
+    def _user_dict(self, i: int) -> dict:
+        return {
+            'id': f'MOCKUSER{i:024d}',
+            'name': f'User {i}',
+            'username': f'user{i}',
+            'abbreviation': f'user{i}',
+            'fullName': f'User {i}',
+            'type': ObjectTypes.USER.value,
+            'subtype': 8704,
+            'enabled': True,
+        }
+
+    def _folder_contents(self, request: '_Request'):
+        with self._lock:
+            contents = self._contents.get(request.path['id'])
+            if contents is None:
+                raise _Error(404, 'ERR004', f"Folder {request.path['id']} not found.")
+            items, headers = self._paged(
+                request,
+                len(contents),
+                lambda i: {
+                    key: value
+                    for key, value in self._tree[contents[i]].items()
+                    if key != 'parentId'
+                },
+            )
+        return 200, items, headers
+
+    def _users(self, request: '_Request'):
+        items, headers = self._paged(request, self.users, self._user_dict)
+        return 200, items, headers
+
+    def _user(self, request: '_Request'):
+        id = request.path['id']
+        number = id.removeprefix('MOCKUSER')
+        if not number.isdigit() or int(number) >= self.users:
+            raise _Error(404, 'ERR004', f"User {id} not found.")
+        return 200, self._user_dict(int(number))
+
+    def _object_dict(self, i: int) -> dict:
+        return {
+            'id': f'MOCKOBJ{i:025d}',
+            'name': f'Metric {i}',
+            'type': ObjectTypes.METRIC.value,
+            'subtype': 1024,
+            'dateCreated': '2024-01-01T00:00:00.000+0000',
+            'dateModified': '2024-01-01T00:00:00.000+0000',
+            'version': f'MOCKOBJ{i:025d}',
+            'acg': 255,
+            'owner': {'id': '54F3D26011D2896560009A8E67019608', 'name': 'Mock'},
+            'ancestors': [],
+            'extType': 0,
+            'projectId': self.project_id,
+        }
+
+    def _search(self, request: '_Request'):
+        search_id = uuid.uuid4().hex.upper()
+        search = dict(request.params)
+        with self._lock:
+            if search.get('root') in self._tree:
+                # searches in the folder tree find its objects, by modification
+                search['found'] = self._search_tree(search)
+            self._searches[search_id] = search
+        return 200, {'id': search_id}
+
+    def _search_tree(self, search: dict) -> list[str]:
+        begin = search.get('beginModificationTime')
+        begin = _parse_time(begin) if begin else None
+        type = int(search['type']) if search.get('type') else None
+        found = []
+        queue = list(self._contents.get(search['root'], []))
+        while queue:
+            id = queue.pop()
+            item = self._tree[id]
+            queue.extend(self._contents.get(id, []))
+            if type is not None and type not in (item['type'], item['subtype']):
+                continue
+            if begin is not None and _parse_time(item['dateModified']) < begin:
+                continue
+            found.append(id)
+        return found
+
+    def _found(self, request: '_Request') -> tuple[int, Callable[[int], dict]]:
+        with self._lock:
+            search = self._searches.get(request.params.get('searchId'))
+        if search is None:
+            raise _Error(404, 'ERR004', "Search not found.")
+        if 'found' not in search:
+            return self.objects, self._object_dict
+        found = [id for id in search['found'] if id in self._tree]
+
+        def item(i: int) -> dict:
+            with self._lock:
+                return self._with_ancestors(found[i])
+
+        return len(found), item
+
+    def _search_results(self, request: '_Request'):
+        total, item = self._found(request)
+        items, headers = self._paged(request, total, item)
+        return 200, items, headers
+
+    def _search_results_v2(self, request: '_Request'):
+        total, item = self._found(request)
+        items, _ = self._paged(request, total, item)
+        return 200, {'totalItems': total, 'result': items}
+
+    def _nodes(self, request: '_Request'):
+        return 200, {
+            'nodes': [
+                {
+                    'name': 'mock-node',
+                    'address': '127.0.0.1',
+                    'status': 'running',
+                    'load': 0,
+                    'projects': [
+                        {
+                            'id': self.project_id,
+                            'name': self.project_name,
+                            'status': 'loaded',
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def _connections(self, request: '_Request'):
+        def connection(i: int) -> dict:
+            return {
+                'id': f'MOCKCONN{i:024d}',
+                'parentId': f'MOCKCONN{i:024d}',
+                'username': f'user{i % max(self.users, 1)}',
+                'nodeName': 'mock-node',
+                'projectName': self.project_name,
+                'projectId': self.project_id,
+                'applicationType': 'DSSPython',
+            }
+
+        items, headers = self._paged(request, self.user_connections, connection)
+        return 200, {'userConnections': items}, headers
+
+    def _document_instance(self, request: '_Request'):
+        instance_id = uuid.uuid4().hex.upper()
+        with self._lock:
+            self._instances[instance_id] = request.path['id']
+        return 200, {'mid': instance_id, 'status': 1}
+
+    def _delete_document_instance(self, request: '_Request'):
+        with self._lock:
+            self._instances.pop(request.path['iid'], None)
+        return 204, None
+
+    def _document_export(self, request: '_Request'):
+        with self._lock:
+            known = self._instances.get(request.path['iid']) == request.path['id']
+        if not known:
+            raise _Error(404, 'ERR004', "Instance not found or expired.")
+        export_format = request.path['format']
+        if export_format not in _EXPORT_CONTENT_TYPES:
+            raise _Error(404, 'ERR004', f"Unsupported export to {export_format}.")
+        # content depends only on the exported object, so files can be checked
+        name = f"{request.path['id']} {request.path.get('key') or ''}".strip()
+        header = {
+            'pdf': b'%PDF-1.4\n',
+            'excel': b'PK\x03\x04',
+            'csv': b'"Attribute","Metric"\n',
+            'mstr': b'MSTR',
+        }[export_format]
+        line = f'{name} exported to {export_format}\n'.encode('utf-8')
+        content = (header + line * (_EXPORT_SIZE // len(line) + 1))[:_EXPORT_SIZE]
+        headers = {'Content-Type': _EXPORT_CONTENT_TYPES[export_format]}
+        if export_format == 'pdf':
+            return 200, {'data': base64.b64encode(content).decode('ascii')}, headers
+        return 200, content, headers
+
+
+@dataclass
+class _Request:
+    method: str
+    params: dict
+    headers: dict
+    body: bytes
+    path: dict
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    mock: MockIServer
+    protocol_version = 'HTTP/1.1'
+    # headers and body are sent in one write; separate small writes are
+    # delayed by the Nagle algorithm on keep-alive connections
+    wbufsize = -1
+
+    def _serve(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        headers = {key.lower(): value for key, value in self.headers.items()}
+        status, response_headers, content = self.mock._handle(
+            self.command, self.path, headers, body
+        )
+        self.send_response(status)
+        for key, value in response_headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _serve
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format, *args)
+
+
+def _now() -> str:
+    now = datetime.now(timezone.utc)
+    return now.strftime('%Y-%m-%dT%H:%M:%S.') + f'{now.microsecond // 1000:03d}+0000'
+
+
+def _parse_time(value: str) -> datetime:
+    if value.endswith('Z'):
+        return datetime.strptime(value, '%Y-%m-%dT%H:%M:%SZ').replace(
+            tzinfo=timezone.utc
+        )
+    return datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%f%z')
+
+
+def _compile(route: str) -> re.Pattern:
+    pattern = re.sub(r'\{(\w+)\}', r'(?P<\1>[^/]+)', route)
+    return re.compile(f'^/api{pattern}/?$')
+
+
+def _error(code: str, message: str) -> dict:
+    return {'code': code, 'message': message, 'ticketId': uuid.uuid4().hex}
@@ -12,16 +12,19 @@ def all_nodes_async(
     error_msg: str,
     unpack_value: str | None = None,
     limit: int | None = None,
+    node_names: list[str] | None = None,
     **kwargs,
 ):
-    """Return list of objects fetched async using wrappers in monitors.py"""
+    """Return list of objects fetched async using wrappers in monitors.py
+
+    If `node_names` are provided, they are used directly instead of resolving
+    running nodes of the cluster with an additional request.
+    """
 
     node = kwargs.get('node_name')
-    if not node:
-        nodes_response = monitors.get_node_info(connection).json()
-        all_nodes = nodes_response['nodes']
-        node_names = [node['name'] for node in all_nodes if node['status'] == 'running']
-    else:
+    if not node and not node_names:
+        node_names = get_running_node_names(connection)
+    elif not node_names:
         from mstrio.server.node import Node
 
         node = node.name if isinstance(node, Node) else node
@@ -64,3 +67,11 @@ def all_nodes_async(
     if limit:
         objects = objects[:limit]
     return objects
+
+
+def get_running_node_names(connection) -> list[str]:
+    """Return names of all running nodes of the cluster."""
+    nodes_response = monitors.get_node_info(connection).json()
+    return [
+        node['name'] for node in nodes_response['nodes'] if node['status'] == 'running'
+    ]
@@ -1,100 +1,116 @@
-import sys
+import importlib
 from enum import Enum
+from functools import cache
 from typing import TYPE_CHECKING
 
-from mstrio.access_and_security.security_role import SecurityRole  # noqa: F401
-from mstrio.datasources import DatasourceConnection  # noqa: F401
-from mstrio.datasources import DatasourceInstance, DatasourceLogin  # noqa: F401
-from mstrio.datasources.driver import Driver  # noqa: F401
-from mstrio.distribution_services.device.device import Device  # noqa: F401
-from mstrio.distribution_services.event import Event  # noqa: F401
-from mstrio.distribution_services.schedule import Schedule  # noqa: F401
-from mstrio.distribution_services.transmitter.transmitter import (  # noqa: F401
-    Transmitter,
-)
-from mstrio.modeling.custom_group import CustomGroup  # noqa: F401
-from mstrio.modeling.filter import Filter  # noqa: F401
-from mstrio.modeling.metric import Metric  # noqa: F401
-from mstrio.modeling.schema import (  # noqa: F401
-    Attribute,
-    Fact,
-    LogicalTable,
-    Transformation,
-    UserHierarchy,
-)
-from mstrio.modeling.schema.attribute.attribute_form import AttributeForm  # noqa: F401
-from mstrio.modeling.schema.table.physical_table import PhysicalTable  # noqa: F401
-from mstrio.modeling.security_filter import SecurityFilter  # noqa: F401
-from mstrio.object_management.folder import Folder  # noqa: F401
-from mstrio.object_management.object import Object
-from mstrio.object_management.search_operations import SearchObject  # noqa: F401
-from mstrio.object_management.shortcut import Shortcut  # noqa: F401
-from mstrio.project_objects import Document, Report  # noqa: F401
-from mstrio.project_objects.agents import Agent  # noqa: F401
-from mstrio.project_objects.applications import Application  # noqa: F401
-from mstrio.project_objects.content_group import ContentGroup  # noqa: F401
-from mstrio.project_objects.datasets import OlapCube, SuperCube  # noqa: F401
-from mstrio.project_objects.palette import Palette  # noqa: F401
-from mstrio.python_execution import Script  # noqa F401
-from mstrio.server import Project  # noqa: F401
-from mstrio.server.language import Language  # noqa: F401
-from mstrio.server.tenant import Tenant  # noqa: F401
 from mstrio.types import ObjectSubTypes, ObjectTypes
-from mstrio.users_and_groups import User, UserGroup  # noqa: F401
 
 if TYPE_CHECKING:
     from mstrio.connection import Connection
 
 
+# Classes are imported only when an object of a given type is mapped for the
+# first time, so importing this module does not import all of mstrio.
+_CLASS_MODULES = {
+    'Agent': 'mstrio.project_objects.agents',
+    'Application': 'mstrio.project_objects.applications',
+    'Attribute': 'mstrio.modeling.schema.attribute.attribute',
+    'AttributeForm': 'mstrio.modeling.schema.attribute.attribute_form',
+    'ContentGroup': 'mstrio.project_objects.content_group',
+    'CustomGroup': 'mstrio.modeling.custom_group',
+    'DatasourceConnection': 'mstrio.datasources.datasource_connection',
+    'DatasourceInstance': 'mstrio.datasources.datasource_instance',
+    'DatasourceLogin': 'mstrio.datasources.datasource_login',
+    'Device': 'mstrio.distribution_services.device.device',
+    'Document': 'mstrio.project_objects.document',
+    'Driver': 'mstrio.datasources.driver',
+    'Event': 'mstrio.distribution_services.event',
+    'Fact': 'mstrio.modeling.schema.fact.fact',
+    'Filter': 'mstrio.modeling.filter.filter',
+    'Folder': 'mstrio.object_management.folder',
+    'Language': 'mstrio.server.language',
+    'LogicalTable': 'mstrio.modeling.schema.table.logical_table',
+    'Metric': 'mstrio.modeling.metric.metric',
+    'Object': 'mstrio.object_management.object',
+    'OlapCube': 'mstrio.project_objects.datasets.olap_cube',
+    'Palette': 'mstrio.project_objects.palette',
+    'PhysicalTable': 'mstrio.modeling.schema.table.physical_table',
+    'Project': 'mstrio.server.project',
+    'Report': 'mstrio.project_objects.report',
+    'Schedule': 'mstrio.distribution_services.schedule.schedule',
+    'Script': 'mstrio.python_execution.script',
+    'SearchObject': 'mstrio.object_management.search_operations',
+    'SecurityFilter': 'mstrio.modeling.security_filter.security_filter',
+    'SecurityRole': 'mstrio.access_and_security.security_role',
+    'Shortcut': 'mstrio.object_management.shortcut',
+    'SuperCube': 'mstrio.project_objects.datasets.super_cube',
+    'Tenant': 'mstrio.server.tenant',
+    'Transformation': 'mstrio.modeling.schema.transformation.transformation',
+    'Transmitter': 'mstrio.distribution_services.transmitter.transmitter',
+    'User': 'mstrio.users_and_groups.user',
+    'UserGroup': 'mstrio.users_and_groups.user_group',
+    'UserHierarchy': 'mstrio.modeling.schema.user_hierarchy.user_hierarchy',
+}
+
+
 class TypeObjectMapping(Enum):
-    Filter = ObjectTypes.FILTER  # noqa: F811
-    Report = ObjectTypes.REPORT_DEFINITION  # noqa: F811
-    Metric = ObjectTypes.METRIC  # noqa: F811
-    Folder = ObjectTypes.FOLDER  # noqa: F811
-    Device = ObjectTypes.SUBSCRIPTION_DEVICE  # noqa: F811
-    Attribute = ObjectTypes.ATTRIBUTE  # noqa: F811
-    Fact = ObjectTypes.FACT  # noqa: F811
-    UserHierarchy = ObjectTypes.DIMENSION  # noqa: F811
-    LogicalTable = ObjectTypes.TABLE  # noqa: F811
-    Shortcut = ObjectTypes.SHORTCUT_TYPE  # noqa: F811
-    AttributeForm = ObjectTypes.ATTRIBUTE_FORM  # noqa: F811
-    DatasourceInstance = ObjectTypes.DBROLE  # noqa: F811
-    DatasourceLogin = ObjectTypes.DBLOGIN  # noqa: F811
-    DatasourceConnection = ObjectTypes.DBCONNECTION  # noqa: F811
-    Project = ObjectTypes.PROJECT  # noqa: F811
-    User = ObjectTypes.USER  # noqa: F811
-    UserGroup = ObjectTypes.USERGROUP  # noqa: F811
-    Transmitter = ObjectTypes.SUBSCRIPTION_TRANSMITTER  # noqa: F811
-    SearchObject = ObjectTypes.SEARCH  # noqa: F811
-    Transformation = ObjectTypes.ROLE  # noqa: F811
-    SecurityRole = ObjectTypes.SECURITY_ROLE  # noqa: F811
-    Language = ObjectTypes.LOCALE  # noqa: F811
-    Event = ObjectTypes.SCHEDULE_EVENT  # noqa: F811
-    Schedule = ObjectTypes.SCHEDULE_TRIGGER  # noqa: F811
-    PhysicalTable = ObjectTypes.DBTABLE  # noqa: F811
-    Document = ObjectTypes.DOCUMENT_DEFINITION  # noqa: F811
-    SecurityFilter = ObjectTypes.SECURITY_FILTER  # noqa: F811
-    ContentGroup = ObjectTypes.CONTENT_BUNDLE  # noqa: F811
-    Application = ObjectTypes.APPLICATION  # noqa: F811
-    Driver = ObjectTypes.DRIVER  # noqa: F811
-    Palette = ObjectTypes.PALETTE  # noqa: F811
-    Script = ObjectTypes.SCRIPT  # noqa: F811
+    Filter = ObjectTypes.FILTER
+    Report = ObjectTypes.REPORT_DEFINITION
+    Metric = ObjectTypes.METRIC
+    Folder = ObjectTypes.FOLDER
+    Device = ObjectTypes.SUBSCRIPTION_DEVICE
+    Attribute = ObjectTypes.ATTRIBUTE
+    Fact = ObjectTypes.FACT
+    UserHierarchy = ObjectTypes.DIMENSION
+    LogicalTable = ObjectTypes.TABLE
+    Shortcut = ObjectTypes.SHORTCUT_TYPE
+    AttributeForm = ObjectTypes.ATTRIBUTE_FORM
+    DatasourceInstance = ObjectTypes.DBROLE
+    DatasourceLogin = ObjectTypes.DBLOGIN
+    DatasourceConnection = ObjectTypes.DBCONNECTION
+    Project = ObjectTypes.PROJECT
+    User = ObjectTypes.USER
+    UserGroup = ObjectTypes.USERGROUP
+    Transmitter = ObjectTypes.SUBSCRIPTION_TRANSMITTER
+    SearchObject = ObjectTypes.SEARCH
+    Transformation = ObjectTypes.ROLE
+    SecurityRole = ObjectTypes.SECURITY_ROLE
+    Language = ObjectTypes.LOCALE
+    Event = ObjectTypes.SCHEDULE_EVENT
+    Schedule = ObjectTypes.SCHEDULE_TRIGGER
+    PhysicalTable = ObjectTypes.DBTABLE
+    Document = ObjectTypes.DOCUMENT_DEFINITION
+    SecurityFilter = ObjectTypes.SECURITY_FILTER
+    ContentGroup = ObjectTypes.CONTENT_BUNDLE
+    Application = ObjectTypes.APPLICATION
+    Driver = ObjectTypes.DRIVER
+    Palette = ObjectTypes.PALETTE
+    Script = ObjectTypes.SCRIPT
 
 
 class SubTypeObjectMapping(Enum):
-    Filter = ObjectSubTypes.FILTER  # noqa: F811
-    CustomGroup = ObjectSubTypes.CUSTOM_GROUP  # noqa: F811
-    OlapCube = ObjectSubTypes.OLAP_CUBE  # noqa: F811
-    SuperCube = ObjectSubTypes.SUPER_CUBE  # noqa: F811
-    User = ObjectSubTypes.USER  # noqa: F811
-    UserGroup = ObjectSubTypes.USER_GROUP  # noqa: F811
-    Agent = ObjectSubTypes.DOCUMENT_AGENT  # noqa: F811
-    AgentUniversal = ObjectSubTypes.DOCUMENT_AGENT_UNIVERSAL  # noqa: F811
-    Tenant = ObjectSubTypes.TENANT  # noqa: F811
+    Filter = ObjectSubTypes.FILTER
+    CustomGroup = ObjectSubTypes.CUSTOM_GROUP
+    OlapCube = ObjectSubTypes.OLAP_CUBE
+    SuperCube = ObjectSubTypes.SUPER_CUBE
+    User = ObjectSubTypes.USER
+    UserGroup = ObjectSubTypes.USER_GROUP
+    Agent = ObjectSubTypes.DOCUMENT_AGENT
+    AgentUniversal = ObjectSubTypes.DOCUMENT_AGENT_UNIVERSAL
+    Tenant = ObjectSubTypes.TENANT
+
+
+@cache
+def __str_to_class(classname: str) -> type:
+    module = importlib.import_module(_CLASS_MODULES[classname])
+    return getattr(module, classname)
 
 
-def __str_to_class(classname):
-    return getattr(sys.modules[__name__], classname)
+def __getattr__(name: str) -> type:
+    # keeps `from mstrio.utils.object_mapping import <class>` working
+    if name in _CLASS_MODULES:
+        return __str_to_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def map_to_object(
@@ -130,7 +146,7 @@ def map_to_object(
     elif object_type in [v.value for v in TypeObjectMapping]:
         return __str_to_class(TypeObjectMapping(object_type).name)
     else:
-        return Object
+        return __str_to_class('Object')
 
 
 def map_object(connection: "Connection", obj: dict):
@@ -0,0 +1,246 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from mstrio import config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PollTask:
+    get_status: Callable[[], Any]
+    is_done: Callable[[Any], bool]
+    future: Future
+    interval: float
+    backoff: float
+    deadline: float | None = None
+    polls: int = field(default=0, init=False)
+
+
+class StatusPoller:
+    """Shared poller of long-running operations on the I-Server.
+
+    Instead of every waiting method sleeping in its own loop, operations are
+    registered in one scheduler which polls each of them when its next check
+    is due. Status checks are executed in a small thread pool, so hundreds of
+    operations can be tracked at once, and the interval between checks of
+    a single operation grows exponentially from `min_interval` up to
+    `max_interval`, unless a fixed interval is given for it.
+
+    Every registered operation is represented by a `concurrent.futures.Future`
+    resolved with the last status once it is final. Use `Future.result()` to
+    wait for it or `Future.add_done_callback()` to be notified. Cancelling
+    the future stops the polling.
+
+    Attributes:
+        max_workers (int): Maximum number of status checks run at once.
+        min_interval (float): Time in seconds before the second check of an
+            operation with adaptive interval.
+        backoff (float): Factor by which the adaptive interval grows after
+            every check.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        min_interval: float = 0.5,
+        max_interval: float | None = None,
+        backoff: float = 1.5,
+    ) -> None:
+        """Initialize the poller. The scheduler thread is started when the
+        first operation is submitted.
+
+        Args:
+            max_workers (int, optional): Maximum number of status checks run
+                at once. Defaults to 8.
+            min_interval (float, optional): Time in seconds before the second
+                check of an operation with adaptive interval. Defaults to 0.5.
+            max_interval (float, optional): Upper bound of the adaptive
+                interval in seconds. If not provided, the value of
+                `config.delay_between_polling` is used.
+            backoff (float, optional): Factor by which the adaptive interval
+                grows after every check. Defaults to 1.5.
+        """
+        self.max_workers = max_workers
+        self.min_interval = min_interval
+        self.backoff = backoff
+        self._max_interval = max_interval
+        self._queue: list[tuple[float, int, _PollTask]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._executor: ThreadPoolExecutor | None = None
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    @property
+    def max_interval(self) -> float:
+        """Upper bound of the adaptive interval in seconds."""
+        if self._max_interval is None:
+            return config.delay_between_polling
+        return self._max_interval
+
+    @property
+    def pending(self) -> int:
+        """Number of operations which are still being polled."""
+        with self._condition:
+            return sum(not task.future.done() for _, _, task in self._queue)
+
+    def submit(
+        self,
+        get_status: Callable[[], Any],
+        is_done: Callable[[Any], bool],
+        timeout: float | None = None,
+        interval: float | None = None,
+        callback: Callable[[Future], None] | None = None,
+    ) -> Future:
+        """Register an operation to be polled until its status is final.
+
+        The first check is done right away.
+
+        Args:
+            get_status (Callable): Function without arguments returning
+                the current status of the operation. It should fetch only
+                the status, as it is called on every check.
+            is_done (Callable): Function returning True if the status given
+                to it is final.
+            timeout (float, optional): Time in seconds after which polling
+                stops and the future is resolved with `TimeoutError`. Waits
+                indefinitely if not provided.
+            interval (float, optional): Fixed time in seconds between checks.
+                If not provided, the interval is adaptive.
+            callback (Callable, optional): Function called with the future
+                once it is done.
+
+        Returns:
+            Future resolved with the final status or with the exception
+            raised by `get_status` or `is_done`.
+        """
+        future = Future()
+        if callback:
+            future.add_done_callback(callback)
+
+        task = _PollTask(
+            get_status=get_status,
+            is_done=is_done,
+            future=future,
+            interval=interval or self.min_interval,
+            backoff=1 if interval else self.backoff,
+            deadline=time.monotonic() + timeout if timeout is not None else None,
+        )
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot submit an operation to a closed poller.")
+            self._start()
+            self._schedule(task, time.monotonic())
+        return future
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        """Stop the poller.
+
+        Args:
+            cancel_pending (bool, optional): Whether to cancel the futures of
+                operations which are still polled. Defaults to True.
+        """
+        with self._condition:
+            self._closed = True
+            tasks = [task for _, _, task in self._queue]
+            self._queue.clear()
+            self._condition.notify_all()
+        if cancel_pending:
+            for task in tasks:
+                task.future.cancel()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix='mstrio-poller'
+            )
+            self._thread = threading.Thread(
+                target=self._run, name='mstrio-poller-scheduler', daemon=True
+            )
+            self._thread.start()
+
+    def _schedule(self, task: _PollTask, due: float) -> None:
+        heapq.heappush(self._queue, (due, next(self._counter), task))
+        self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and (
+                    not self._queue or self._queue[0][0] > time.monotonic()
+                ):
+                    timeout = (
+                        self._queue[0][0] - time.monotonic() if self._queue else None
+                    )
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+                now = time.monotonic()
+                due_tasks = []
+                while self._queue and self._queue[0][0] <= now:
+                    due_tasks.append(heapq.heappop(self._queue)[2])
+
+            for task in due_tasks:
+                if not task.future.cancelled():
+                    self._executor.submit(self._check, task)
+
+    def _check(self, task: _PollTask) -> None:
+        task.polls += 1
+        try:
+            status = task.get_status()
+            done = task.is_done(status)
+        except BaseException as err:  # NOSONAR: pass everything to the future
+            self._resolve(task, exception=err)
+            return
+
+        now = time.monotonic()
+        if done:
+            self._resolve(task, result=status)
+        elif task.deadline is not None and now >= task.deadline:
+            self._resolve(
+                task,
+                exception=TimeoutError(
+                    f"Operation did not finish after {task.polls} status checks."
+                ),
+            )
+        else:
+            due = now + task.interval
+            if task.deadline is not None:
+                due = min(due, task.deadline)
+            task.interval = min(task.interval * task.backoff, self.max_interval)
+            with self._condition:
+                if not self._closed:
+                    self._schedule(task, due)
+
+    @staticmethod
+    def _resolve(task: _PollTask, result: Any = None, exception=None) -> None:
+        # FYI: returns False if the future was cancelled in the meantime
+        if not task.future.set_running_or_notify_cancel():
+            return
+        if exception is not None:
+            task.future.set_exception(exception)
+        else:
+            task.future.set_result(result)
+
+
+_default_poller: StatusPoller | None = None
+_default_poller_lock = threading.Lock()
+
+
+def get_status_poller() -> StatusPoller:
+    """Get the poller shared by all waiting methods of mstrio-py."""
+    global _default_poller
+    with _default_poller_lock:
+        if _default_poller is None:
+            _default_poller = StatusPoller()
+        return _default_poller
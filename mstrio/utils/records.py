@@ -0,0 +1,169 @@
+import keyword
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mstrio.connection import Connection
+    from mstrio.utils.entity import EntityBase
+
+
+class Record:
+    """Compact, read-only representation of an object returned by a list or
+    search function.
+
+    Records are created instead of dicts or objects when a list function is
+    called with `to_records=True`. A record type with `__slots__` is
+    generated once for every class of objects and list of keys, so a record
+    keeps only references to its values, without a dict of attributes per
+    object or the lazy fetching machinery of `Entity`. Values are accessible
+    as attributes named like the keys of the dict returned with
+    `to_dictionary=True`.
+
+    Records can be converted back to a dict with `to_dict()` or upgraded to
+    a full object with `to_entity()`.
+    """
+
+    __slots__ = ('_connection',)
+
+    _FIELDS: tuple[str, ...] = ()
+    _KEYS: tuple[str, ...] = ()
+    _ENTITY_CLASS: 'type[EntityBase] | None' = None
+
+    def __init__(self, source: dict, connection: 'Connection | None' = None) -> None:
+        """Initialize the record with values of its keys from `source`."""
+        setter = object.__setattr__
+        setter(self, '_connection', connection)
+        for field, key in zip(self._FIELDS, self._KEYS):
+            setter(self, field, source.get(key))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"'{type(self).__name__}' record is read-only.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"'{type(self).__name__}' record is read-only.")
+
+    def __repr__(self) -> str:
+        values = ', '.join(
+            f'{field}={getattr(self, field)!r}' for field in self._FIELDS
+        )
+        return f'{type(self).__name__}({values})'
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Record):
+            return NotImplemented
+        return self._ENTITY_CLASS is other._ENTITY_CLASS and (
+            self.to_dict() == other.to_dict()
+        )
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return _restore_record, (self._ENTITY_CLASS, self.to_dict())
+
+    def to_dict(self) -> dict:
+        """Get the dict the record was created from."""
+        return {
+            key: getattr(self, field) for field, key in zip(self._FIELDS, self._KEYS)
+        }
+
+    def to_entity(self, connection: 'Connection | None' = None) -> 'EntityBase':
+        """Upgrade the record to a full object of its class.
+
+        Args:
+            connection (Connection, optional): Strategy connection object
+                returned by `connection.Connection()`. Defaults to the
+                connection used to list the record.
+
+        Returns:
+            Object of the class of the record, created from its values without
+            any request to the server.
+        """
+        connection = connection or self._connection
+        if self._ENTITY_CLASS is None:
+            from mstrio.utils.object_mapping import map_object
+
+            return map_object(connection, self.to_dict())
+        return self._ENTITY_CLASS.from_dict(
+            source=self.to_dict(), connection=connection
+        )
+
+
+def _field_name(key: str) -> str:
+    if key.isidentifier() and not keyword.iskeyword(key) and not key.startswith('_'):
+        if not hasattr(Record, key):
+            return key
+    # FYI: keys clashing with names of attributes of records or not being
+    # valid identifiers are available with a trailing underscore
+    field = ''.join(char if char.isalnum() else '_' for char in key).strip('_')
+    if not field or field[0].isdigit():
+        field = 'f_' + field
+    return field + '_'
+
+
+@lru_cache(maxsize=1024)
+def get_record_type(
+    keys: tuple[str, ...], entity_class: 'type[EntityBase] | None' = None
+) -> type[Record]:
+    """Get the record type for objects with the given keys, generating it
+    on first use.
+
+    Args:
+        keys (tuple[str, ...]): Keys of dicts represented by records.
+        entity_class (type[EntityBase], optional): Class of objects to which
+            records are upgraded with `to_entity()`. If not provided, the class
+            is determined by `type` and `subtype` of every record.
+
+    Returns:
+        Subclass of `Record` with a slot for every key.
+    """
+    fields = tuple(_field_name(key) for key in keys)
+    name = f'{entity_class.__name__ if entity_class else "Object"}Record'
+    return type(
+        name,
+        (Record,),
+        {
+            '__slots__': fields,
+            '__module__': __name__,
+            '_FIELDS': fields,
+            '_KEYS': keys,
+            '_ENTITY_CLASS': entity_class,
+        },
+    )
+
+
+def make_records(
+    objects: Iterable[dict],
+    connection: 'Connection | None' = None,
+    entity_class: 'type[EntityBase] | None' = None,
+) -> list[Record]:
+    """Convert dicts representing objects to read-only records.
+
+    Dicts with the same keys share a record type, so the cost of generating
+    a type is paid once per distinct list of keys.
+
+    Args:
+        objects (Iterable[dict]): Dicts representing objects, e.g. returned by
+            a list function with `to_dictionary=True`.
+        connection (Connection, optional): Strategy connection object used to
+            upgrade records with `to_entity()`.
+        entity_class (type[EntityBase], optional): Class of objects to which
+            records are upgraded. If not provided, the class is determined by
+            `type` and `subtype` of every object.
+
+    Returns:
+        List of records, in order of `objects`.
+    """
+    record_types: dict[tuple, type[Record]] = {}
+    records = []
+    for obj in objects:
+        keys = tuple(obj)
+        record_type = record_types.get(keys)
+        if record_type is None:
+            record_type = record_types[keys] = get_record_type(keys, entity_class)
+        records.append(record_type(obj, connection))
+    return records
+
+
+def _restore_record(entity_class: 'type[EntityBase] | None', source: dict) -> Record:
+    return get_record_type(tuple(source), entity_class)(source)
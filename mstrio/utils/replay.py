@@ -0,0 +1,390 @@
+"""Record and replay of HTTP traffic between mstrio and the I-Server.
+
+`HttpRecorder` saves every request sent and response received by
+connections created inside of it (including requests sent concurrently with
+`FuturesSessionWithRenewal`) to a cassette file. `HttpReplayer` serves
+responses from a cassette instead of the I-Server, optionally with simulated
+latency and bandwidth, so code using mstrio can be run and benchmarked
+offline, quickly and reproducibly.
+
+Example:
+    >>> with HttpRecorder('cube.jsonl'):
+    ...     conn = Connection(base_url, username, password, project_name=name)
+    ...     OlapCube(conn, id=cube_id).to_dataframe()
+    >>> with HttpReplayer('cube.jsonl', latency=0.02):
+    ...     conn = Connection(base_url, username, password, project_name=name)
+    ...     OlapCube(conn, id=cube_id).to_dataframe()  # no I-Server needed
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.exceptions import ConnectionError
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+if TYPE_CHECKING:
+    from mstrio.connection import Connection
+
+logger = logging.getLogger(__name__)
+
+# response headers which are not needed to replay a response
+_SKIPPED_HEADERS = frozenset({'set-cookie', 'content-encoding', 'transfer-encoding'})
+# headers and fields of JSON bodies with credentials, compared in lowercase
+_SECRET_HEADERS = frozenset({'x-mstr-authtoken', 'x-mstr-identitytoken'})
+_SECRET_FIELDS = frozenset(
+    {
+        'authtoken',
+        'identitytoken',
+        'token',
+        'accesstoken',
+        'refreshtoken',
+        'password',
+        'oldpassword',
+        'newpassword',
+    }
+)
+REDACTED = '<redacted>'
+
+_active_transport: 'HttpRecorder | HttpReplayer | None' = None
+_active_lock = threading.Lock()
+
+
+class ReplayError(ConnectionError):
+    """Raised when a request sent during a replay has no recorded response."""
+
+
+def wrap_adapter(adapter: HTTPAdapter) -> BaseAdapter:
+    """Wrap an adapter of a new session with the active recorder or replayer,
+    if there is one. Used by `Connection` when it configures its session.
+    """
+    transport = _active_transport
+    return transport.wrap(adapter) if transport is not None else adapter
+
+
+def _redact(value):
+    """Replace values of credential fields in parsed JSON with `REDACTED`."""
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if key.lower() in _SECRET_FIELDS else _redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact(item) for item in value]
+    return value
+
+
+def _redact_body(body: bytes) -> bytes:
+    """Body with credential fields redacted, if it is JSON with any of them.
+    Other bodies are returned unchanged."""
+    if not body or body.lstrip()[:1] not in (b'{', b'['):
+        return body
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    redacted = _redact(data)
+    if redacted == data:
+        return body
+    return json.dumps(redacted, separators=(',', ':')).encode('utf-8')
+
+
+def _request_key(request: PreparedRequest) -> tuple[str, str, str]:
+    """Key of a request independent of the host of the I-Server, so that
+    a cassette can be replayed with any base URL. Credentials in the body
+    are redacted before it is hashed, so they cannot be recovered from the
+    cassette and replays do not depend on them."""
+    url = urlsplit(request.url)
+    query = urlencode(sorted(parse_qsl(url.query, keep_blank_values=True)))
+    body = request.body or b''
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    body = _redact_body(body)
+    body_hash = hashlib.sha256(body).hexdigest()[:16] if body else ''
+    return request.method, f'{url.path}?{query}' if query else url.path, body_hash
+
+
+def _open(path: Path, mode: str):
+    if path.suffix == '.gz':
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return path.open(mode, encoding='utf-8')
+
+
+class _Transport(ABC):
+    def __enter__(self):
+        global _active_transport
+        with _active_lock:
+            if _active_transport is not None:
+                raise RuntimeError("Another recorder or replayer is already active.")
+            _active_transport = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        global _active_transport
+        with _active_lock:
+            _active_transport = None
+
+    @abstractmethod
+    def wrap(self, adapter: HTTPAdapter) -> BaseAdapter:
+        """Wrap an adapter of a session to record or replay its requests."""
+
+    def mount(self, connection: 'Connection') -> None:
+        """Record or replay requests of an existing connection.
+
+        Note:
+            Connections created inside the `with` block are handled
+            automatically, including their authentication requests.
+        """
+        for prefix, adapter in list(connection._session.adapters.items()):
+            if not isinstance(adapter, (_RecordingAdapter, _ReplayAdapter)):
+                connection._session.mount(prefix, self.wrap(adapter))
+
+
+class HttpRecorder(_Transport):
+    """Records HTTP traffic of connections to a cassette file.
+
+    Every interaction is saved as a line of JSON with the method, path,
+    query and a hash of the body of the request and the status, headers,
+    body and duration of the response. Request headers and bodies, which
+    may contain credentials, are not saved. Authentication and identity
+    tokens in response headers and token and password fields of JSON bodies
+    are replaced with `REDACTED`. Files with the `.gz` suffix are compressed.
+
+    Attributes:
+        path (Path): Path to the cassette file.
+        count (int): Number of recorded interactions.
+    """
+
+    def __init__(self, path: str | os.PathLike, append: bool = False) -> None:
+        """Initialize the recorder.
+
+        Args:
+            path (str | os.PathLike): Path to the cassette file.
+            append (bool, optional): If True, interactions are appended to an
+                existing cassette. By default the cassette is overwritten.
+        """
+        self.path = Path(path)
+        self.append = append
+        self.count = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'HttpRecorder':
+        super().__enter__()
+        self._file = _open(self.path, 'a' if self.append else 'w')
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        super().__exit__(exc_type, exc_value, traceback)
+        with self._lock:
+            self._file.close()
+            self._file = None
+        logger.info(f"Recorded {self.count} interaction(s) to '{self.path}'.")
+
+    def wrap(self, adapter: HTTPAdapter) -> BaseAdapter:
+        return _RecordingAdapter(self, adapter)
+
+    def _record(self, request: PreparedRequest, response: Response) -> None:
+        method, url, body_hash = _request_key(request)
+        content = _redact_body(response.content)
+        try:
+            body, encoding = content.decode('utf-8'), 'text'
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode('ascii'), 'base64'
+        interaction = {
+            'method': method,
+            'url': url,
+            'body_hash': body_hash,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {
+                key: REDACTED if key.lower() in _SECRET_HEADERS else value
+                for key, value in response.headers.items()
+                if key.lower() not in _SKIPPED_HEADERS
+            },
+            'body': body,
+            'encoding': encoding,
+            'elapsed': response.elapsed.total_seconds(),
+        }
+        line = json.dumps(interaction, separators=(',', ':'))
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + '\n')
+            self.count += 1
+
+
+class HttpReplayer(_Transport):
+    """Replays HTTP traffic recorded by `HttpRecorder` instead of sending
+    requests to the I-Server.
+
+    A request is answered with a recorded response to a request with the
+    same method, path, query and body; if there is none, to a request with
+    the same method, path and query. Responses to repeated requests are
+    replayed in the recorded order, and the last of them is repeated when
+    they run out, so a recorded scenario can be replayed many times.
+
+    Attributes:
+        path (Path): Path to the cassette file.
+        latency (float): Simulated latency of every response, in seconds.
+        bandwidth (float, optional): Simulated bandwidth, in bytes per second.
+        time_scale (float, optional): If set, every response takes its
+            recorded duration multiplied by this factor, instead of `latency`.
+        strict (bool): Whether requests without a recorded response raise
+            `ReplayError`, or are answered with 404 Not Found.
+        hits (int): Number of requests answered with recorded responses.
+        misses (list[str]): Requests without a recorded response.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        latency: float = 0.0,
+        bandwidth: float | None = None,
+        time_scale: float | None = None,
+        strict: bool = True,
+    ) -> None:
+        """Load the cassette.
+
+        Args:
+            path (str | os.PathLike): Path to the cassette file.
+            latency (float, optional): Simulated latency of every response, in
+                seconds. Defaults to 0.
+            bandwidth (float, optional): Simulated bandwidth, in bytes per
+                second. By default bodies are returned instantly.
+            time_scale (float, optional): If set, every response takes its
+                recorded duration multiplied by this factor, e.g. 1 for the
+                recorded timing or 0.1 for ten times faster.
+            strict (bool, optional): If True (default), requests without
+                a recorded response raise `ReplayError`; otherwise they get
+                a 404 Not Found response.
+        """
+        self.path = Path(path)
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.time_scale = time_scale
+        self.strict = strict
+        self.hits = 0
+        self.misses: list[str] = []
+        self._lock = threading.Lock()
+        self._exact: dict[tuple, deque] = defaultdict(deque)
+        self._loose: dict[tuple, deque] = defaultdict(deque)
+        with _open(self.path, 'r') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                interaction = json.loads(line)
+                key = (interaction['method'], interaction['url'])
+                self._exact[key + (interaction['body_hash'],)].append(interaction)
+                self._loose[key].append(interaction)
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        super().__exit__(exc_type, exc_value, traceback)
+        if self.misses:
+            logger.warning(
+                f"{len(self.misses)} request(s) had no recorded response, e.g. "
+                f"{self.misses[0]}."
+            )
+
+    def wrap(self, adapter: HTTPAdapter) -> BaseAdapter:
+        return _ReplayAdapter(self)
+
+    def _respond(self, request: PreparedRequest) -> Response:
+        method, url, body_hash = _request_key(request)
+        with self._lock:
+            interaction = self._next(self._exact.get((method, url, body_hash)))
+            if interaction is None:
+                interaction = self._next(self._loose.get((method, url)))
+            if interaction is None:
+                self.misses.append(f'{method} {url}')
+            else:
+                self.hits += 1
+        if interaction is None:
+            if self.strict:
+                raise ReplayError(
+                    f"No recorded response to {method} {url}.", request=request
+                )
+            interaction = {
+                'status': 404,
+                'reason': 'Not Found',
+                'headers': {'Content-Type': 'application/json'},
+                'body': json.dumps({'code': 'ERR004', 'message': 'Not recorded'}),
+                'encoding': 'text',
+                'elapsed': 0.0,
+            }
+        return self._build_response(request, interaction)
+
+    @staticmethod
+    def _next(interactions: deque | None) -> dict | None:
+        if not interactions:
+            return None
+        if len(interactions) > 1:
+            return interactions.popleft()
+        return interactions[0]
+
+    def _build_response(self, request: PreparedRequest, interaction: dict) -> Response:
+        if interaction['encoding'] == 'base64':
+            content = base64.b64decode(interaction['body'])
+        else:
+            content = interaction['body'].encode('utf-8')
+        if self.time_scale is not None:
+            delay = interaction['elapsed'] * self.time_scale
+        else:
+            delay = self.latency
+            if self.bandwidth:
+                delay += len(content) / self.bandwidth
+        if delay > 0:
+            time.sleep(delay)
+
+        response = Response()
+        response.status_code = interaction['status']
+        response.reason = interaction.get('reason')
+        response.headers = CaseInsensitiveDict(interaction['headers'])
+        response.headers['Content-Length'] = str(len(content))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = content
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(seconds=delay)
+        return response
+
+
+class _RecordingAdapter(BaseAdapter):
+    def __init__(self, recorder: HttpRecorder, adapter: HTTPAdapter) -> None:
+        super().__init__()
+        self.recorder = recorder
+        self.adapter = adapter
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        response = self.adapter.send(request, **kwargs)
+        self.recorder._record(request, response)
+        return response
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+class _ReplayAdapter(BaseAdapter):
+    def __init__(self, replayer: HttpReplayer) -> None:
+        super().__init__()
+        self.replayer = replayer
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        return self.replayer._respond(request)
+
+    def close(self) -> None:
+        pass
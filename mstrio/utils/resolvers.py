@@ -1,8 +1,13 @@
+import threading
+import time
 import typing as t
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from enum import auto
 
 from mstrio import config
 from mstrio.api import projects as projects_api
 from mstrio.helpers import IServerError
+from mstrio.utils.enum_helper import AutoName, get_enum_val
 
 if t.TYPE_CHECKING:
     from mstrio.connection import Connection
@@ -28,6 +33,7 @@ def _get_id_from_params_set(
     ),
     fallback_value: str | None = None,
     property_name: str = 'name',
+    cache_scope: 'tuple[Connection, str, str | None] | None' = None,
 ) -> str | None:
     """
     Utility function to get an object's ID from a set of parameters.
@@ -61,6 +67,12 @@ def _get_id_from_params_set(
         If an `object_listing_method` is provided as generator, it will accept
         first valid object as the one to return.
 
+    Note:
+        If `cache_scope` is provided, IDs resolved from `property_name` are
+        remembered in the resolution cache of the connection. When the listing
+        method returns a list, IDs of all uniquely named objects in it are
+        remembered at once, so other names are resolved without listing again.
+
     Args:
         object: An instance of the `object_class` or its ID or name.
         object_id: ID of the object.
@@ -70,6 +82,9 @@ def _get_id_from_params_set(
             the given type OR a Generator of them.
         fallback_value: A value to return if none of the parameters are set.
         property_name: The name of the property to use for matching.
+        cache_scope: A tuple of a connection, a type of resolved objects and
+            an optional scope (e.g. project ID) under which resolved IDs are
+            cached. If `None`, nothing is cached.
 
     Returns:
         The ID of the object if found, otherwise the `fallback_value`.
@@ -86,6 +101,7 @@ def _get_id_from_params_set(
             object_listing_method=object_listing_method,
             fallback_value=fallback_value,
             property_name=property_name,
+            cache_scope=cache_scope,
         )
     if object_id is not None:
         from mstrio.utils.helper import is_valid_str_id
@@ -100,11 +116,19 @@ def _get_id_from_params_set(
             object_listing_method=object_listing_method,
             fallback_value=fallback_value,
             property_name=property_name,
+            cache_scope=cache_scope,
         )
     if object_prop is not None:
         if property_name == 'name':
             assert object_prop, "Property 'name' cannot be empty."
 
+        cache = None
+        if cache_scope is not None:
+            conn, kind, scope = cache_scope
+            cache = get_resolution_cache(conn)
+            if (cached_id := cache.get(kind, object_prop, scope)) is not None:
+                return cached_id
+
         items = object_listing_method()
 
         assert isinstance(items, (list, tuple, t.Generator)), (
@@ -125,6 +149,12 @@ def _get_id_from_params_set(
             )
 
             valid_objects = [obj for obj in items if get_prop_val(obj) == object_prop]
+            if cache is not None:
+                cache.update(
+                    kind,
+                    _index_unique_names(items, get_prop_val),
+                    scope,
+                )
         else:
             try:
                 valid_objects = next(  # first find the first valid item...
@@ -149,7 +179,10 @@ def _get_id_from_params_set(
         )
 
         itm = valid_objects[0]
-        return itm.id if isinstance(itm, object_class) else itm.get('id')
+        ret = itm.id if isinstance(itm, object_class) else itm.get('id')
+        if cache is not None:
+            cache.set(kind, object_prop, ret, scope)
+        return ret
 
     return fallback_value
 
@@ -196,6 +229,7 @@ def get_project_id_from_params_set(
             fallback_value=(
                 conn.project_id if not no_fallback_from_connection and conn else None
             ),
+            cache_scope=(conn, 'project', None) if conn else None,
         )
     except AssertionError as err:
         raise ValueError(err) from err
@@ -308,7 +342,12 @@ def get_folder_id_from_params_set(
     ):
         path = folder
 
+    cache = get_resolution_cache(conn)
+
     if path is not None:
+        path_key = _normalize_folder_path(path)
+        if (ret := cache.get('folder_path', path_key)) is not None:
+            return ret
         with conn.temporary_project_change(project=project):
             ret = None
             try:
@@ -319,6 +358,8 @@ def get_folder_id_from_params_set(
                         return None
                 else:
                     raise err
+            if ret:
+                cache.set('folder_path', path_key, ret)
 
             if assert_id_exists and not ret:
                 apply_not_found_but_expected_flow()
@@ -328,10 +369,13 @@ def get_folder_id_from_params_set(
     # PATH logic flow is done at this point, we assume we have
     # class, id or name here
     try:
+        proj_id = get_project_id_from_params_set(
+            conn, project, assert_id_exists=False, no_fallback_from_connection=True
+        )
 
         def listing_gen():
             root_folders = list_folders(
-                conn, project=project, to_dictionary=False, include_subfolders=False
+                conn, project=proj_id, to_dictionary=False, include_subfolders=False
             )
             yield from Folder.traverse_folders(root_folders)
 
@@ -341,6 +385,7 @@ def get_folder_id_from_params_set(
             folder_name,
             Folder,
             listing_gen,
+            cache_scope=(conn, 'folder', proj_id),
         )
     except AssertionError as err:
         raise ValueError(err) from err
@@ -348,7 +393,7 @@ def get_folder_id_from_params_set(
     if assert_id_exists:
         if not ret:
             apply_not_found_but_expected_flow()
-        else:
+        elif cache.get('folder_id', ret, proj_id) is None:
             with (
                 config.temp_verbose_disable(),
                 conn.temporary_project_change(project or conn.project_id),
@@ -356,7 +401,9 @@ def get_folder_id_from_params_set(
                 try:
                     Folder(conn, id=ret)
                 except IServerError:
+                    cache.invalidate(object_id=ret)
                     apply_not_found_but_expected_flow()
+            cache.set('folder_id', ret, ret, proj_id)
 
     return ret
 
@@ -499,6 +546,7 @@ def get_tenant_id_from_params_set(
             Tenant,
             lambda: list_tenants(conn, to_dictionary=True),
             fallback_value=None,
+            cache_scope=(conn, 'tenant', None),
         )
     except AssertionError as err:
         raise ValueError(err) from err
@@ -750,3 +798,293 @@ def validate_owner_key_in_filters(filters_kwargs: dict[str, t.Any]) -> None:
 
 
 # --- END: FILTERS KWARGS Resolvers ---
+
+
+# --- RESOLUTION CACHE ---
+class ResolvableType(AutoName):
+    """Types of objects whose IDs can be resolved with `resolve_ids()`."""
+
+    PROJECT = auto()
+    TENANT = auto()
+    FOLDER = auto()
+    USERNAME = auto()
+    USER_NAME = auto()
+
+
+class ResolutionCache:
+    """Cache of IDs of objects resolved from their names, kept by each
+    connection.
+
+    IDs are remembered for `config.resolution_cache_ttl` seconds, as set at
+    the time they are read. Entries of
+    objects deleted or renamed with mstrio are invalidated automatically;
+    changes done elsewhere are picked up when entries expire or after
+    `invalidate()` is called.
+    """
+
+    def __init__(self) -> None:
+        # (kind, scope, key) -> (time of caching, ID)
+        self._entries: dict[tuple[str, str | None, str], tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, kind: str, key: str, scope: str | None = None) -> str | None:
+        """Get the ID cached under `key`, or None if it is missing or expired."""
+        entry = self._entries.get((kind, scope, key))
+        if entry is None:
+            return None
+        stored, value = entry
+        ttl = config.resolution_cache_ttl
+        if ttl is not None and time.monotonic() - stored >= ttl:
+            with self._lock:
+                self._entries.pop((kind, scope, key), None)
+            return None
+        return value
+
+    def set(self, kind: str, key: str, value: str, scope: str | None = None) -> None:
+        """Cache the ID `value` under `key`."""
+        self.update(kind, {key: value}, scope)
+
+    def update(
+        self, kind: str, values: dict[str, str], scope: str | None = None
+    ) -> None:
+        """Cache many IDs at once, by their keys."""
+        ttl = config.resolution_cache_ttl
+        if ttl is not None and ttl <= 0:
+            return
+        stored = time.monotonic()
+        with self._lock:
+            for key, value in values.items():
+                self._entries[(kind, scope, key)] = (stored, value)
+
+    def invalidate(
+        self,
+        kind: str | None = None,
+        key: str | None = None,
+        scope: str | None = None,
+        object_id: str | None = None,
+    ) -> int:
+        """Remove cached IDs matching all of the given criteria. Without any
+        criteria, the whole cache is cleared.
+
+        Args:
+            kind (str, optional): Type of resolved objects, e.g. 'project'.
+            key (str, optional): Name (or other key) the ID is cached under.
+            scope (str, optional): Scope of the cached ID, e.g. project ID
+                for folders.
+            object_id (str, optional): Cached ID itself, e.g. of a deleted
+                object.
+
+        Returns:
+            Number of removed entries.
+        """
+        with self._lock:
+            matching = [
+                entry_key
+                for entry_key, (_, value) in self._entries.items()
+                if (kind is None or entry_key[0] == kind)
+                and (scope is None or entry_key[1] == scope)
+                and (key is None or entry_key[2] == key)
+                and (object_id is None or value == object_id)
+            ]
+            for entry_key in matching:
+                del self._entries[entry_key]
+        return len(matching)
+
+
+_resolution_cache_lock = threading.Lock()
+
+
+def get_resolution_cache(connection: 'Connection') -> ResolutionCache:
+    """Get the resolution cache of a connection, creating it if needed.
+
+    Args:
+        connection (Connection): Strategy connection object.
+
+    Returns:
+        ResolutionCache of the connection.
+    """
+    from mstrio.connection import Connection
+
+    if not isinstance(connection, Connection):
+        # objects standing in for a connection are not cached for
+        return ResolutionCache()
+    if connection._resolution_cache is None:
+        with _resolution_cache_lock:
+            if connection._resolution_cache is None:
+                connection._resolution_cache = ResolutionCache()
+    return connection._resolution_cache
+
+
+def invalidate_resolution_cache(
+    connection: 'Connection',
+    object_type: ResolvableType | str | None = None,
+    name: str | None = None,
+    object_id: str | None = None,
+) -> int:
+    """Forget IDs resolved from names by a connection, e.g. after objects
+    were renamed or deleted outside of mstrio.
+
+    Args:
+        connection (Connection): Strategy connection object.
+        object_type (ResolvableType | str, optional): Type of objects to
+            forget. By default all types.
+        name (str, optional): Name of an object to forget.
+        object_id (str, optional): ID of an object to forget.
+
+    Returns:
+        Number of forgotten IDs.
+    """
+    kind = get_enum_val(object_type, ResolvableType) if object_type else None
+    return get_resolution_cache(connection).invalidate(
+        kind=kind, key=name, object_id=object_id
+    )
+
+
+def resolve_ids(
+    connection: 'Connection',
+    object_type: ResolvableType | str,
+    names: t.Iterable[str],
+    project: 'Project | str | None' = None,
+    assert_ids_exist: bool = False,
+) -> dict[str, str | None]:
+    """Resolve IDs of many objects of one type from their names at once.
+
+    Names already resolved by the connection are taken from its resolution
+    cache. Projects and tenants are resolved with a single listing, folders
+    with a single traversal of the folder tree and users with concurrent
+    searches. Resolved IDs are cached for later calls of this and other
+    resolvers.
+
+    Args:
+        connection (Connection): Strategy connection object.
+        object_type (ResolvableType | str): Type of the objects.
+            `ResolvableType.USERNAME` resolves users by their usernames and
+            `ResolvableType.USER_NAME` by their names.
+        names (Iterable[str]): Names of the objects.
+        project (Project | str, optional): Project object or ID or name in
+            which folders are resolved. By default configuration-level
+            folders are resolved. Used only for folders.
+        assert_ids_exist (bool, optional): If True, raise `ValueError` if any
+            of the names could not be resolved.
+
+    Returns:
+        Dictionary of IDs by names. Names which were not found or are not
+        unique map to None.
+
+    Examples:
+        >>> resolve_ids(conn, ResolvableType.USERNAME, ['jsmith', 'adoe'])
+        {'jsmith': '8D6797814A5D6FB2A0D6E094E5B8D5A3', 'adoe': None}
+    """
+    kind = get_enum_val(object_type, ResolvableType)
+    scope = None
+    if kind == ResolvableType.FOLDER.value:
+        scope = get_project_id_from_params_set(
+            connection,
+            project,
+            assert_id_exists=False,
+            no_fallback_from_connection=True,
+        )
+    cache = get_resolution_cache(connection)
+    resolved = {name: cache.get(kind, name, scope) for name in names}
+    missing = [name for name, object_id in resolved.items() if object_id is None]
+
+    if missing:
+        if kind == ResolvableType.FOLDER.value:
+            found = _find_folder_ids(connection, scope, missing)
+        elif kind in (ResolvableType.USERNAME.value, ResolvableType.USER_NAME.value):
+            found = _find_user_ids(connection, kind, missing)
+        else:
+            found = _list_ids(connection, kind)
+        found = {name: found[name] for name in missing if name in found}
+        cache.update(kind, found, scope)
+        resolved.update(found)
+
+    if assert_ids_exist and (unresolved := [n for n, i in resolved.items() if not i]):
+        from mstrio.utils.helper import exception_handler
+
+        exception_handler(
+            f"Could not uniquely identify {kind} objects by names: {unresolved}.",
+            exception_type=ValueError,
+        )
+    return resolved
+
+
+def _index_unique_names(
+    items: list, get_name: t.Callable[[t.Any], str | None]
+) -> dict[str, str]:
+    """Index IDs of objects by their names, skipping ambiguous names."""
+    index = {}
+    duplicates = set()
+    for item in items:
+        name = get_name(item)
+        if name is None or name in duplicates:
+            continue
+        if name in index:
+            duplicates.add(name)
+            del index[name]
+            continue
+        index[name] = item.get('id') if isinstance(item, dict) else item.id
+    return index
+
+
+def _normalize_folder_path(path: FolderPathType) -> str:
+    parts = path.strip('/').split('/') if isinstance(path, str) else path
+    return '/'.join(parts)
+
+
+def _list_ids(connection: 'Connection', kind: str) -> dict[str, str]:
+    if kind == ResolvableType.PROJECT.value:
+        items = projects_api.get_projects(connection).json()
+    else:
+        from mstrio.server.tenant import list_tenants
+
+        items = list_tenants(connection, to_dictionary=True)
+    return _index_unique_names(items, lambda item: item.get('name'))
+
+
+def _find_folder_ids(
+    connection: 'Connection', project_id: str | None, names: list[str]
+) -> dict[str, str]:
+    from mstrio.object_management.folder import Folder, list_folders
+
+    # the first folder found with a name wins, as in single resolution
+    remaining = set(names)
+    found = {}
+    root_folders = list_folders(
+        connection, project=project_id, to_dictionary=False, include_subfolders=False
+    )
+    for folder in Folder.traverse_folders(root_folders):
+        if folder.name in remaining:
+            found[folder.name] = folder.id
+            remaining.discard(folder.name)
+            if not remaining:
+                break
+    return found
+
+
+def _find_user_ids(
+    connection: 'Connection', kind: str, names: list[str]
+) -> dict[str, str]:
+    from mstrio.users_and_groups.user import User
+    from mstrio.utils.helper import get_parallel_number
+
+    def search(name: str) -> list[str]:
+        if kind == ResolvableType.USERNAME.value:
+            return User._get_user_ids(
+                connection, abbreviation_begins=name, abbreviation=name
+            )
+        return User._get_user_ids(connection, name_begins=name, name=name)
+
+    with ThreadPoolExecutor(max_workers=get_parallel_number(len(names))) as executor:
+        futures = {executor.submit(search, name): name for name in names}
+        found = {}
+        for future in as_completed(futures):
+            if len(ids := future.result()) == 1:
+                found[futures[future]] = ids[0]
+    return found
+
+
+# --- END: RESOLUTION CACHE ---
@@ -1,5 +1,8 @@
+from collections.abc import Iterator
+from contextlib import ExitStack
 from typing import TYPE_CHECKING
 
+from mstrio import config
 from mstrio.api import change_journal as change_journal_api
 from mstrio.utils.helper import camel_to_snake
 
@@ -60,3 +63,45 @@ def get_change_journals_loop(
         return all_entries[:limit]
 
     return all_entries
+
+
+def iter_change_journals_pages(
+    connection: 'Connection',
+    search_id: str,
+    offset: int = 0,
+    page_size: int = 100,
+    fields: str | None = None,
+    without_project: bool = False,
+) -> Iterator[list[dict]]:
+    """Lazily fetch change journal search results page by page.
+
+    Only a single page is kept in memory at a time, so this function can be
+    used to process searches of any size.
+
+    Args:
+        connection: Connection object to Strategy environment.
+        search_id: ID of the change journal search to retrieve results for.
+        offset: Starting offset for pagination.
+        page_size: Maximum number of results fetched with a single request.
+        fields: Comma-separated list of fields to include in response.
+        without_project: Whether results are fetched with no project selected
+            in the connection, like the search is created. The project is
+            deselected only for every request, not while a page is processed.
+
+    Yields:
+        Lists of change journal entry dictionaries, one list per page.
+    """
+    while True:
+        with ExitStack() as stack:
+            if without_project:
+                stack.enter_context(config.temp_verbose_disable())
+                stack.enter_context(connection.temporary_project_change(project=None))
+            response = change_journal_api.get_change_journal_search_results(
+                connection, search_id, offset, page_size, fields
+            )
+        entries = camel_to_snake(response.json().get('changeJournalEntries', []))
+        if entries:
+            yield entries
+        if len(entries) < page_size:
+            return
+        offset += page_size
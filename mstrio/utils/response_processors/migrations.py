@@ -24,3 +24,19 @@ def get(connection: Connection, id: str) -> dict:
     renamed_data = rename_dict_keys(data, REST_ATTRIBUTES_MAP)
     renamed_data['name'] = renamed_data['package_info']['name']
     return renamed_data
+
+
+def get_status_info(connection: Connection, id: str, info: str) -> dict | None:
+    """Get a single status section of a migration, without package content.
+
+    Args:
+        connection: Strategy REST API connection object
+        id: ID of the Migration
+        info: Name of the section in REST API format: `packageInfo`,
+            `importInfo` or `validation`
+
+    Returns:
+        dict representing the section or None if the migration has none
+    """
+    data = migrations_api.get_migration(connection, migration_id=id, fields=info)
+    return data.json().get(info)
@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING
 
 from mstrio.api import monitors as monitors_api
+from mstrio.utils.helper import get_parallel_number, response_handler
+from mstrio.utils.sessions import FuturesSessionWithRenewal
 
 if TYPE_CHECKING:
     from mstrio.connection import Connection
@@ -69,6 +71,103 @@ def get_contents_caches_loop(
         caches = response.json()
         all_caches += caches.get('contentCaches')
 
+    return _unpack_contents_caches(all_caches)
+
+
+def get_contents_caches_concurrently(
+    connection: 'Connection',
+    project_nodes: dict[str, list[str]],
+    limit_per_request: int = 1000,
+    max_workers: int | None = None,
+    **filters,
+) -> list[dict]:
+    """Fetch content caches of all given projects from all given nodes
+    concurrently.
+
+    First page for every (project, node) pair is requested at once. Remaining
+    pages are scheduled as soon as the total count for the pair is known.
+    Every returned cache dictionary is extended with `projectId` and `node`
+    keys. All pages are awaited before an error is raised, so that a partial
+    inventory is never returned silently.
+
+    Args:
+        connection: Connection object to Strategy environment.
+        project_nodes: Mapping of IDs of projects from which caches will be
+            fetched to names of nodes on which the caches will be searched.
+        limit_per_request: Number of caches fetched with a single request.
+        max_workers: Maximum number of concurrent requests. If not provided,
+            it is calculated based on the number of (project, node) pairs.
+        **filters: Filters applied on the server side, accepted by
+            `get_contents_caches` API wrapper, e.g. `status`, `content_type`,
+            `size` or `owner`.
+
+    Returns:
+        List of content cache dictionaries.
+
+    Raises:
+        IServerError | HTTPError: If any page could not be fetched.
+    """
+    error_msg = "Error getting content caches."
+    pairs = [
+        (project_id, node)
+        for project_id, nodes in project_nodes.items()
+        for node in nodes
+    ]
+    all_caches = []
+    failed = []
+    requested = len(pairs)
+    with FuturesSessionWithRenewal(
+        connection=connection,
+        max_workers=max_workers or get_parallel_number(len(pairs)),
+    ) as session:
+
+        def request_page(project_id, node, offset):
+            return monitors_api.get_contents_caches_async(
+                session,
+                project_id,
+                node,
+                offset=offset,
+                limit=limit_per_request,
+                **filters,
+            )
+
+        def collect(response, project_id, node) -> dict:
+            if not response.ok:
+                failed.append(response)
+                return {}
+            content = response.json()
+            all_caches.extend(
+                {**cache, 'projectId': project_id, 'node': node}
+                for cache in _unpack_contents_caches(content.get('contentCaches', []))
+            )
+            return content
+
+        first_pages = {pair: request_page(*pair, 0) for pair in pairs}
+        next_pages = []
+        for (project_id, node), future in first_pages.items():
+            content = collect(future.result(), project_id, node)
+            total = content.get('total') or 0
+            next_pages.extend(
+                ((project_id, node), request_page(project_id, node, offset))
+                for offset in range(limit_per_request, total, limit_per_request)
+            )
+        requested += len(next_pages)
+        for (project_id, node), future in next_pages:
+            collect(future.result(), project_id, node)
+
+    if failed:
+        for response in failed[1:]:
+            response_handler(response, error_msg, throw_error=False)
+        response_handler(
+            failed[0],
+            f"{error_msg} {len(failed)} of {requested} page(s) could not be "
+            "fetched.",
+        )
+        failed[0].raise_for_status()
+    return all_caches
+
+
+def _unpack_contents_caches(all_caches: list[dict]) -> list[dict]:
     # On input, each cache is a 1-element list containing a dict
     # with cache data under a base64-encoded key
     all_caches = [
@@ -1,6 +1,8 @@
 import inspect
 import logging
-from functools import wraps
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
 from inspect import getattr_static, getmembers
 
 from packaging.version import Version as PackageVersion
@@ -12,6 +14,96 @@ from mstrio.helpers import VersionException
 
 logger = logging.getLogger(__name__)
 
+# minimal I-Server versions of features checked when a connection is created
+# or on paths executed many times, e.g. for every chunk of data
+SERVER_FEATURES = {
+    'report_subtotals': '11.2.0100',
+    'instance_fields': '11.2.0200',
+    'application_login': '11.3.1200',
+    'python_application_type': '11.5.0600',
+}
+
+# version strings are literals repeated across the code, so each is parsed once
+_parse_version = lru_cache(maxsize=1024)(ver_parser)
+
+
+@dataclass
+class ServerCapabilities:
+    """Versions and features of the server of a connection, computed once per
+    connection, so that checks of versions do not parse them again.
+
+    Attributes:
+        iserver_version (Version, optional): Parsed version of the I-Server.
+        deployment_type (str, optional): Type of the deployment.
+        features (dict[str, bool]): Whether the server supports every feature
+            of `SERVER_FEATURES`.
+    """
+
+    iserver_version: PackageVersion | None
+    deployment_type: str | None
+    features: dict[str, bool] = field(default_factory=dict)
+    _checked: dict[PackageVersion, bool] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_connection(cls, connection: 'Connection') -> 'ServerCapabilities':
+        version = connection.iserver_version
+        capabilities = cls(
+            iserver_version=_parse_version(version) if version else None,
+            deployment_type=connection.deployment_type,
+        )
+        capabilities.features = {
+            name: capabilities.meets(minimal)
+            for name, minimal in SERVER_FEATURES.items()
+        }
+        return capabilities
+
+    def meets(self, minimal_version: str | PackageVersion) -> bool:
+        """Check if the I-Server version is greater or equal to the given
+        version. If the I-Server version is unknown, True is returned."""
+        minimal = (
+            minimal_version
+            if isinstance(minimal_version, PackageVersion)
+            else _parse_version(minimal_version)
+        )
+        result = self._checked.get(minimal)
+        if result is None:
+            result = meets_minimal_version(self.iserver_version, minimal)
+            self._checked[minimal] = result
+        return result
+
+    def supports(self, feature: str) -> bool:
+        """Check if the server supports a feature of `SERVER_FEATURES`."""
+        return self.features[feature]
+
+
+_capabilities_lock = threading.Lock()
+
+
+def get_server_capabilities(connection: 'Connection') -> ServerCapabilities:
+    """Get versions and features of the server of a connection.
+
+    They are computed once per connection and recomputed only when the status
+    of the server is read again, e.g. after reconnecting.
+
+    Args:
+        connection (Connection): Strategy REST API connection object
+
+    Returns:
+        ServerCapabilities of the server.
+    """
+    capabilities = getattr(connection, '_capabilities', None)
+    if isinstance(capabilities, ServerCapabilities):
+        return capabilities
+    if not isinstance(connection, Connection):
+        # objects standing in for a connection may change at any time
+        return ServerCapabilities.from_connection(connection)
+    with _capabilities_lock:
+        if getattr(connection, '_capabilities', None) is None:
+            connection._capabilities = ServerCapabilities.from_connection(connection)
+        return connection._capabilities
+
 
 def meets_minimal_version(
     tested_version: str | PackageVersion | None,
@@ -45,12 +137,12 @@ def meets_minimal_version(
     to_test = (
         tested_version
         if isinstance(tested_version, PackageVersion)
-        else ver_parser(tested_version)
+        else _parse_version(tested_version)
     )
     minimal = (
         minimal_version
         if isinstance(minimal_version, PackageVersion)
-        else ver_parser(minimal_version)
+        else _parse_version(minimal_version)
     )
 
     return to_test >= minimal
@@ -65,13 +157,19 @@ def method_version_handler(version):
     version at which the functionality becomes applicable.
     """
 
+    minimal = _parse_version(version)
+
     def wrapper(function, cls=None):
         @wraps(function)
         def inner(*args, **kwargs):
+            # the connection is usually passed as a keyword or as the first
+            # argument, so other arguments are scanned only as a last resort
             if conn := kwargs.get('connection'):
                 connection_obj = conn
-            elif conn := [arg for arg in args if isinstance(arg, Connection)]:
-                connection_obj = conn[0]
+            elif args and isinstance(args[0], Connection):
+                connection_obj = args[0]
+            elif conn := next((a for a in args if isinstance(a, Connection)), None):
+                connection_obj = conn
             elif cls:
                 raise TypeError(
                     f"{function.__name__}() missing required argument: 'connection'"
@@ -83,8 +181,8 @@ def method_version_handler(version):
 
             # `connection_obj` may be empty during lazy typehint evaluation
             # in python 3.14
-            if connection_obj and not meets_minimal_version(
-                connection_obj.iserver_version, version
+            if connection_obj and not get_server_capabilities(connection_obj).meets(
+                minimal
             ):
                 raise VersionException(
                     f"Environments must run IServer version {version} or newer. "
@@ -159,4 +257,4 @@ def is_server_min_version(connection: 'Connection', version_str: str) -> bool:
             or if it cannot be checked.
         False if iServer version is lower than given version.
     """
-    return meets_minimal_version(connection.iserver_version, version_str)
+    return get_server_capabilities(connection).meets(version_str)
@@ -3,14 +3,16 @@ from collections import UserDict
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import auto
-
-from pandas import DataFrame
+from typing import TYPE_CHECKING
 
 from mstrio import config
 from mstrio.utils.enum_helper import AutoName
 from mstrio.utils.helper import Dictable
 from mstrio.utils.version_helper import class_version_handler
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 logger = logging.getLogger(__name__)
 
 
@@ -243,7 +245,7 @@ class ModelVldbMixin:
         groups: list[int] | list[str] | None = None,
         to_dictionary: bool = False,
         to_dataframe: bool = False,
-    ) -> dict[str, VldbSetting] | DataFrame:
+    ) -> 'dict[str, VldbSetting] | DataFrame':
         """List VLDB settings according to given parameters.
 
         Args:
@@ -309,6 +311,8 @@ class ModelVldbMixin:
             }
 
         if to_dataframe:
+            from pandas import DataFrame
+
             return DataFrame(vldb_settings)
         else:
             return vldb_settings
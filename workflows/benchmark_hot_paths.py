@@ -0,0 +1,112 @@
+"""Benchmark the most used paths of mstrio offline, with recorded traffic.
+This script will not work without replacing parameters with real values.
+
+Every scenario is recorded once against the I-Server into a cassette file.
+Then it is replayed from the cassette, without the I-Server, a few times with
+the same simulated latency and bandwidth, so that timings depend only on the
+client side and can be compared between versions of mstrio.
+
+1. Connect to the environment using data from Workstation while recording
+   traffic of every scenario (skipped for scenarios already recorded)
+2. Replay every scenario a few times and measure its duration
+3. Print the minimum and median duration of every scenario
+"""
+
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from mstrio.connection import get_connection
+from mstrio.object_management import Translation
+from mstrio.object_management.search_operations import full_search
+from mstrio.project_objects.datasets import OlapCube, SuperCube
+from mstrio.project_objects.report import Report
+from mstrio.types import ObjectTypes
+from mstrio.users_and_groups import list_user_groups
+from mstrio.utils.replay import HttpRecorder, HttpReplayer
+
+# Define variables which can be later used in a script
+PROJECT_NAME = 'MicroStrategy Tutorial'  # Project to connect to
+CUBE_ID = '42FF415D4E162846C87D4FAD8B26BF4E'
+REPORT_ID = '<report_id>'
+SUPER_CUBE_ID = '<super_cube_id>'  # super cube with a table named 'BENCHMARK'
+CASSETTES_DIR = Path('benchmark_cassettes')
+REPEATS = 5
+LATENCY = 0.02  # seconds per response
+BANDWIDTH = 50 * 1024 * 1024  # bytes per second
+
+
+def cube_to_dataframe(conn):
+    OlapCube(conn, id=CUBE_ID).to_dataframe()
+
+
+def report_to_dataframe(conn):
+    Report(conn, id=REPORT_ID).to_dataframe()
+
+
+def fetch_objects_async(conn):
+    list_user_groups(conn)
+
+
+def search(conn):
+    full_search(conn, project=conn.project_id, object_types=ObjectTypes.METRIC)
+
+
+def super_cube_update(conn):
+    cube = SuperCube(conn, id=SUPER_CUBE_ID)
+    data = cube.to_dataframe()
+    cube.add_table(name='BENCHMARK', data_frame=data, update_policy='replace')
+    cube.update(chunksize=1000)
+
+
+def translations_export(conn):
+    metrics = full_search(
+        conn,
+        project=conn.project_id,
+        object_types=ObjectTypes.METRIC,
+        to_dictionary=False,
+        limit=50,
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        Translation.to_csv_from_list(
+            connection=conn,
+            object_list=metrics,
+            file_path=str(Path(directory) / 'translations.csv'),
+        )
+
+
+SCENARIOS = [
+    cube_to_dataframe,
+    report_to_dataframe,
+    fetch_objects_async,
+    search,
+    super_cube_update,
+    translations_export,
+]
+
+CASSETTES_DIR.mkdir(exist_ok=True)
+
+# Record every scenario which was not recorded yet. The connection is created
+# inside of the recorder, so that authentication is recorded as well.
+for scenario in SCENARIOS:
+    cassette = CASSETTES_DIR / f'{scenario.__name__}.jsonl.gz'
+    if not cassette.exists():
+        with HttpRecorder(cassette) as recorder:
+            scenario(get_connection(connectionData, project_name=PROJECT_NAME))
+        print(f"Recorded {recorder.count} requests of {scenario.__name__}")
+
+# Replay every scenario and measure its duration
+for scenario in SCENARIOS:
+    cassette = CASSETTES_DIR / f'{scenario.__name__}.jsonl.gz'
+    durations = []
+    for _ in range(REPEATS):
+        with HttpReplayer(cassette, latency=LATENCY, bandwidth=BANDWIDTH):
+            conn = get_connection(connectionData, project_name=PROJECT_NAME)
+            start = time.perf_counter()
+            scenario(conn)
+            durations.append(time.perf_counter() - start)
+    print(
+        f"{scenario.__name__}: min {min(durations):.3f} s, "
+        f"median {statistics.median(durations):.3f} s"
+    )
@@ -0,0 +1,99 @@
+"""Check import time of mstrio for regressions with `python -X importtime`.
+This script does not need a connection to the I-Server.
+
+Importing `mstrio.connection` or any aggregating package must not import
+heavy dependencies, and members of packages are imported lazily from their
+submodules. Every module below is imported a few times in a fresh interpreter
+and the best cumulative import time is compared with its budget.
+
+1. Import every module in a fresh interpreter with `-X importtime`
+2. Print the best cumulative import time of every module and fail if it is
+   over the budget or if any of the heavy dependencies was imported
+3. Check that every member declared in the `if TYPE_CHECKING:` block of
+   a lazily loaded package is also exported by the package at runtime
+"""
+
+import ast
+import importlib
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import mstrio
+
+# Define variables which can be later used in a script
+BUDGETS_MS = {  # maximum cumulative import time of a module in milliseconds
+    'mstrio.connection': 400,
+    'mstrio.server': 100,
+    'mstrio.users_and_groups': 100,
+    'mstrio.object_management': 100,
+    'mstrio.project_objects': 300,
+    'mstrio.modeling': 100,
+}
+HEAVY_DEPENDENCIES = ['pandas', 'numpy', 'tqdm']
+REPEATS = 5
+
+IMPORT_TIME_LINE = re.compile(r'import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)')
+
+
+def measure(module: str) -> tuple[float, set[str]]:
+    """Return cumulative import time of `module` in milliseconds and names of
+    all modules imported with it."""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    cumulative, imported = 0.0, set()
+    for match in IMPORT_TIME_LINE.finditer(stderr):
+        microseconds, _, name = match.groups()
+        imported.add(name)
+        if name == module:
+            cumulative = int(microseconds) / 1000
+    return cumulative, imported
+
+
+def type_checking_imports(init_file: Path) -> dict[str, str]:
+    """Map names imported explicitly in `if TYPE_CHECKING:` blocks of
+    a package `__init__` file to the modules they are imported from."""
+    names = {}
+    for node in ast.parse(init_file.read_text(encoding='utf-8')).body:
+        if not (isinstance(node, ast.If) and 'TYPE_CHECKING' in ast.unparse(node.test)):
+            continue
+        for statement in ast.walk(node):
+            if isinstance(statement, ast.ImportFrom):
+                module = '.' * statement.level + (statement.module or '')
+                for alias in statement.names:
+                    if alias.name != '*':
+                        names.setdefault(alias.asname or alias.name, module)
+    return names
+
+
+failures = []
+
+for module, budget in BUDGETS_MS.items():
+    results = [measure(module) for _ in range(REPEATS)]
+    best = min(cumulative for cumulative, _ in results)
+    heavy = sorted(set(HEAVY_DEPENDENCIES) & results[0][1])
+    print(f"{module}: {best:.0f} ms (budget {budget} ms)")
+    if best > budget:
+        failures.append(f"{module} imports in {best:.0f} ms, over {budget} ms")
+    if heavy:
+        failures.append(f"{module} imports {', '.join(heavy)}")
+
+# Every member declared for type checkers has to be exported lazily as well
+package_dir = Path(mstrio.__file__).parent
+for init_file in sorted(package_dir.rglob('__init__.py')):
+    if 'attach_lazy_exports(' not in init_file.read_text(encoding='utf-8'):
+        continue
+    relative = init_file.parent.relative_to(package_dir.parent)
+    package = importlib.import_module('.'.join(relative.parts))
+    for name, module in type_checking_imports(init_file).items():
+        source = importlib.import_module(module, package.__name__)
+        if getattr(package, name, None) is not getattr(source, name):
+            failures.append(f"{package.__name__}.{name} is not exported")
+
+print('\n'.join(failures) or 'No import time regressions.')
+sys.exit(1 if failures else 0)
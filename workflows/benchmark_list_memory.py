@@ -0,0 +1,43 @@
+"""Compare peak memory of the three modes of loading lists of objects: full
+objects, dictionaries (`to_dictionary=True`) and read-only records
+(`to_records=True`). This script does not need a real environment; it lists
+users of a local mock I-Server.
+
+1. Start a mock I-Server with many users and connect to it
+2. List all users in every mode while tracing memory allocations
+3. Print the duration, peak memory and memory kept per user of every mode
+"""
+
+import gc
+import time
+import tracemalloc
+
+from mstrio.connection import Connection
+from mstrio.users_and_groups import list_users
+from mstrio.utils.mock_server import MockIServer
+
+# Define variables which can be later used in a script
+USERS = 10_000
+MODES = {
+    'objects': {},
+    'dictionaries': {'to_dictionary': True},
+    'records': {'to_records': True},
+}
+
+with MockIServer(users=USERS) as server:
+    conn = Connection(
+        server.base_url, 'user', 'password', project_name=server.project_name
+    )
+    for mode, kwargs in MODES.items():
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        users = list_users(conn, **kwargs)
+        duration = time.perf_counter() - start
+        kept, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{mode}: {len(users)} users in {duration:.2f} s, peak "
+            f"{peak / 2**20:.1f} MiB, kept {kept / len(users):.0f} B per user"
+        )
+        del users
@@ -0,0 +1,126 @@
+"""Benchmark serialisation of users, metrics and subscriptions to and from
+dictionaries and columns. This script does not need a real environment; it
+connects to a local mock I-Server and builds objects from synthetic data.
+
+1. Start a mock I-Server and connect to it
+2. Build synthetic REST API dictionaries of users, metrics and subscriptions
+3. Measure conversions from dictionaries to objects, from objects to
+   dictionaries and to and from columns, a few times each
+4. Print the minimum and median duration of every conversion
+"""
+
+import statistics
+import time
+
+from mstrio.connection import Connection
+from mstrio.distribution_services.subscription import Subscription
+from mstrio.modeling.metric import Metric
+from mstrio.users_and_groups import User
+from mstrio.utils.mock_server import MockIServer
+
+# Define variables which can be later used in a script
+OBJECTS = 2000  # number of objects of every type
+REPEATS = 3
+DATE = '2023-01-01T10:00:00.000+0000'
+
+
+def owner(i):
+    return {'id': f'{i % 50:032X}', 'name': f'Owner {i % 50}'}
+
+
+USERS = [
+    {
+        'id': f'{i:032X}',
+        'name': f'User {i}',
+        'type': 34,
+        'subtype': 8704,
+        'abbreviation': f'user{i}',
+        'dateCreated': DATE,
+        'dateModified': DATE,
+        'version': f'{i:032X}',
+        'owner': owner(i),
+        'acg': 255,
+        'username': f'user{i}',
+        'fullName': f'User {i}',
+        'enabled': True,
+        'passwordModifiable': True,
+        'standardAuth': True,
+        'initials': 'U',
+        'ancestors': [{'name': 'Users', 'id': 'A' * 32, 'level': 1}],
+        'hidden': False,
+    }
+    for i in range(OBJECTS)
+]
+METRICS = [
+    {
+        'id': f'{i:032X}',
+        'name': f'Metric {i}',
+        'type': 4,
+        'subtype': 1024,
+        'dateCreated': DATE,
+        'dateModified': DATE,
+        'version': f'{i:032X}',
+        'owner': owner(i),
+        'acg': 255,
+        'description': f'Description of metric {i}',
+        'hidden': False,
+        'ancestors': [{'name': 'Metrics', 'id': 'B' * 32, 'level': 1}],
+    }
+    for i in range(OBJECTS)
+]
+SUBSCRIPTIONS = [
+    {
+        'id': f'{i:032X}',
+        'name': f'Subscription {i}',
+        'owner': owner(i),
+        'editable': True,
+        'dateCreated': DATE,
+        'dateModified': DATE,
+        'allowDeliveryChanges': True,
+        'allowPersonalizationChanges': True,
+        'allowUnsubscribe': True,
+        'delivery': {
+            'mode': 'EMAIL',
+            'email': {'subject': 'Report', 'message': 'Hi', 'sendContentAs': 'data'},
+        },
+        'recipients': [{'id': 'C' * 32, 'name': 'Recipient', 'type': 'user'}],
+        'contents': [{'id': 'D' * 32, 'type': 'report', 'name': 'Report'}],
+        'schedules': [{'id': 'E' * 32, 'name': 'Schedule'}],
+    }
+    for i in range(OBJECTS)
+]
+
+
+def measure(description, func):
+    durations = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+    print(
+        f"{description}: min {min(durations):.3f} s, "
+        f"median {statistics.median(durations):.3f} s"
+    )
+    return result
+
+
+with MockIServer() as server:
+    conn = Connection(
+        server.base_url, 'user', 'password', project_name=server.project_name
+    )
+    for cls, source in [
+        (User, USERS),
+        (Metric, METRICS),
+        (Subscription, SUBSCRIPTIONS),
+    ]:
+        name = cls.__name__
+        objects = measure(
+            f"{name}.bulk_from_dict", lambda: cls.bulk_from_dict(source, conn)
+        )
+        measure(f"{name}.to_dict", lambda: [obj.to_dict() for obj in objects])
+        columns = measure(
+            f"{name}.bulk_to_columns", lambda: cls.bulk_to_columns(objects)
+        )
+        measure(
+            f"{name}.bulk_from_columns", lambda: cls.bulk_from_columns(columns, conn)
+        )
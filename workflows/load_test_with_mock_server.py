@@ -0,0 +1,72 @@
+"""Load test mstrio against a local mock I-Server, without a real environment.
+The mock server serves synthetic datasets and can add latency, slow chunks,
+throttling (429), unavailability (503) and session expiry, so that tuning
+knobs of mstrio can be compared reproducibly.
+
+1. Start a mock I-Server with a synthetic cube of 500,000 rows
+2. Download the cube with different chunk sizes and compare durations
+3. List 50,000 users while some requests are throttled or fail
+4. Export many documents to PDF and Excel files concurrently and check that
+   the saved files are valid
+5. Print statistics of the requests served by the mock I-Server
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from mstrio.connection import Connection
+from mstrio.project_objects import Document, ExportFormat, ExportTarget
+from mstrio.project_objects.datasets import OlapCube
+from mstrio.users_and_groups import list_users
+from mstrio.utils.mock_server import FailureProfile, MockIServer, SyntheticDataset
+
+# Define variables which can be later used in a script
+CUBE = SyntheticDataset(rows=500_000, attributes=3, metrics=5, name='Sales')
+CHUNK_SIZES = [5_000, 20_000, 50_000]
+SLOW_NETWORK = FailureProfile(latency=0.01, chunk_delay=0.2, bandwidth=20e6)
+FLAKY_SERVER = FailureProfile(throttle_rate=0.05, unavailable_rate=0.02, seed=42)
+DOCUMENTS = [f'{i:032X}' for i in range(1, 201)]
+
+# Download the cube with different chunk sizes over a slow network
+with MockIServer(datasets=[CUBE], failures=SLOW_NETWORK) as server:
+    conn = Connection(
+        server.base_url, 'user', 'password', project_name=server.project_name
+    )
+    for limit in CHUNK_SIZES:
+        start = time.perf_counter()
+        OlapCube(conn, id=CUBE.id, progress_bar=False).to_dataframe(limit=limit)
+        print(f"Chunks of {limit} rows: {time.perf_counter() - start:.2f} s")
+    print(server.stats)
+
+# List users while some requests are throttled or fail; mstrio retries them
+with MockIServer(users=50_000, failures=FLAKY_SERVER) as server:
+    conn = Connection(
+        server.base_url, 'user', 'password', project_name=server.project_name
+    )
+    start = time.perf_counter()
+    users = list_users(conn, to_dictionary=True)
+    print(f"Listed {len(users)} users in {time.perf_counter() - start:.2f} s")
+    print(server.stats)
+
+# Export documents to PDF and Excel files; PDF files are sent by the REST API
+# encoded in base64 in JSON, so check that they are decoded when saved
+with MockIServer() as server, tempfile.TemporaryDirectory() as directory:
+    conn = Connection(
+        server.base_url, 'user', 'password', project_name=server.project_name
+    )
+    targets = [
+        ExportTarget(document_id, export_format)
+        for document_id in DOCUMENTS
+        for export_format in (ExportFormat.PDF, ExportFormat.EXCEL)
+    ]
+    start = time.perf_counter()
+    results = Document.bulk_export(conn, targets, directory=directory, max_workers=8)
+    print(f"Exported {len(results)} files in {time.perf_counter() - start:.2f} s")
+    signatures = {ExportFormat.PDF: b'%PDF', ExportFormat.EXCEL: b'PK'}
+    for result in results:
+        with open(result.path, 'rb') as file:
+            signature = signatures[result.export_format]
+            assert file.read(len(signature)) == signature, result.path
+        assert Path(result.path).stat().st_size == result.size, result.path
+    print(server.stats)
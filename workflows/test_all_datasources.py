@@ -2,7 +2,7 @@
 
 from mstrio import config
 from mstrio.connection import get_connection, Connection
-from mstrio.datasources import list_datasource_instances, DatasourceConnection
+from mstrio.datasources import connectivity_statistics, test_datasource_connectivity
 
 config.verbose = False
 
@@ -15,30 +15,33 @@ if not config.verbose:
 logger = config.logger
 
 
-def test_all_datasources(conn: Connection, show_embedded: bool = False) -> None:
-    datasources = list_datasource_instances(connection=conn)
+def test_all_datasources(
+    conn: Connection, show_embedded: bool = False, timeout: float = 30
+) -> None:
+    # connections shared by many datasources are tested once, concurrently
+    results = test_datasource_connectivity(conn, timeout=timeout)
 
-    for ds in datasources:
-        if isinstance(ds.datasource_connection, DatasourceConnection):
-            try:
-                test_results = ds.datasource_connection.test_connection()
-                logger.info(
-                    f"{'Success' if test_results else 'Failure'}  {ds.name}; DBC: "
-                    f"'{ds.datasource_connection.name}'; DBL: "
-                    f"'{ds.datasource_connection.datasource_login.name}' "
-                    f"({ds.datasource_connection.datasource_login.username})"
-                )
-            except Exception as e:
-                logger.error(
-                    f"[Error]: {ds.name}; DBC: '{ds.datasource_connection.name}': "
-                    f"{str(e) if config.verbose else str(e).splitlines()[0]}"
-                )
-        else:
+    for row in results.itertuples():
+        if row.status == 'not_tested':
             if show_embedded:
                 logger.info(
-                    f"[Warning]: No test {ds.name}; Embedded connection, test "
-                    "not available"
+                    f"[Warning]: No test {row.datasource_name}; Embedded "
+                    "connection, test not available"
                 )
+        elif row.error:
+            logger.error(
+                f"[Error]: {row.datasource_name}; DBC: '{row.connection_name}': "
+                f"{row.error}"
+            )
+        else:
+            logger.info(
+                f"{'Success' if row.status == 'succeeded' else 'Failure'}  "
+                f"{row.datasource_name}; DBC: '{row.connection_name}'; "
+                f"DBL: '{row.login}' ({row.latency:.2f} s)"
+            )
+
+    # latency statistics per DBMS, e.g. for a health dashboard
+    logger.info(connectivity_statistics(results, by='dbms'))
 
 
 conn = get_connection(connectionData)